@@ -1,5 +1,5 @@
 import secrets
-from typing import Self
+from typing import Literal, Self
 
 from pydantic import Field, model_validator, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -22,9 +22,56 @@ class Config(BaseSettings):
     POSTGRES_PORT: str | None = None
     POSTGRES_DB: str | None = None
 
+    DB_POOL_SIZE: int = Field(default=5, gt=0)
+    DB_MAX_OVERFLOW: int = Field(default=10, ge=0)
+    DB_POOL_TIMEOUT_SECONDS: float = Field(default=30, gt=0)
+    DB_POOL_RECYCLE_SECONDS: int = Field(default=1800, gt=0)
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_WARMUP: int = Field(default=5, ge=0)
+    DB_CONNECT_TIMEOUT_SECONDS: float = Field(default=10, gt=0)
+    DB_STATEMENT_TIMEOUT_MS: int | None = Field(default=None, gt=0)
+    DB_STATEMENT_CACHE_SIZE: int | None = Field(default=None, ge=0)
+    DB_PGBOUNCER: bool = False
+
+    DB_REPLICA_URLS: list[str] = Field(default_factory=list)
+    DB_REPLICA_MAX_LAG_SECONDS: float = Field(default=5, gt=0)
+    DB_REPLICA_LAG_CHECK_SECONDS: float = Field(default=2, gt=0)
+    DB_REPLICA_STICKY_SECONDS: float = Field(default=10, ge=0)
+
     SECRET_KEY: str = Field(default_factory=lambda: secrets.token_urlsafe(16))
     ALGORITHM: str = "HS256"
 
+    TOMBSTONE_RETENTION_DAYS: int = Field(default=30, gt=0)
+
+    RESULT_CACHE_BACKEND: Literal["memory", "postgres", "disabled"] = "memory"
+    RESULT_CACHE_MAX_ENTRIES: int = Field(default=1024, gt=0)
+
+    IDEMPOTENCY_BACKEND: Literal["memory", "postgres"] = "memory"
+    IDEMPOTENCY_TTL_HOURS: int = Field(default=24, gt=0)
+    IDEMPOTENCY_LEASE_SECONDS: int = Field(default=30, gt=0)
+
+    LIVE_UPDATES_CHANNEL: str = "live_updates"
+    LIVE_UPDATES_HEARTBEAT_SECONDS: int = Field(default=15, gt=0)
+
+    LOGIN_RATE_LIMIT_BACKEND: Literal["memory", "postgres", "disabled"] = "memory"
+    LOGIN_RATE_LIMIT_IP_BURST: int = Field(default=20, gt=0)
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: int = Field(default=10, gt=0)
+    LOGIN_RATE_LIMIT_USERNAME_BURST: int = Field(default=5, gt=0)
+    LOGIN_RATE_LIMIT_USERNAME_PER_MINUTE: int = Field(default=2, gt=0)
+
+    ADMISSION_MAX_IN_FLIGHT: int = Field(default=64, gt=0)
+    ADMISSION_AUTH_MAX_IN_FLIGHT: int = Field(default=8, gt=0)
+    ADMISSION_READ_MAX_IN_FLIGHT: int = Field(default=32, gt=0)
+    ADMISSION_WRITE_MAX_IN_FLIGHT: int = Field(default=16, gt=0)
+    ADMISSION_CALCULATION_MAX_IN_FLIGHT: int = Field(default=8, gt=0)
+    ADMISSION_MAX_QUEUE: int = Field(default=64, ge=0)
+    ADMISSION_MAX_WAIT_MS: int = Field(default=2000, ge=0)
+
+    EQUITY_HISTORY_BACKEND: Literal["python", "sql", "snapshot"] = "python"
+
+    SCENARIO_WORKERS: int | None = Field(default=None, gt=0)
+    SCENARIO_SHARD_SIZE: int = Field(default=1000, gt=0)
+
     model_config = SettingsConfigDict(
         env_file=ROOTDIR / ".env",
         env_file_encoding="utf-8",
@@ -51,6 +98,25 @@ class Config(BaseSettings):
             f"{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @model_validator(mode="after")
+    def check_database_pool(self) -> Self:
+        if self.DB_POOL_WARMUP > self.DB_POOL_SIZE + self.DB_MAX_OVERFLOW:
+            raise ValueError(
+                "DB_POOL_WARMUP cannot exceed DB_POOL_SIZE + DB_MAX_OVERFLOW"
+            )
+        if self.DB_PGBOUNCER and self.DB_STATEMENT_CACHE_SIZE:
+            raise ValueError(
+                "Prepared statements do not survive PgBouncer transaction "
+                "pooling, DB_STATEMENT_CACHE_SIZE must be 0 or unset"
+            )
+        if self.DB_REPLICA_STICKY_SECONDS < self.DB_REPLICA_MAX_LAG_SECONDS:
+            raise ValueError(
+                "A user's own writes may not have reached the replicas yet, "
+                "DB_REPLICA_STICKY_SECONDS cannot be below "
+                "DB_REPLICA_MAX_LAG_SECONDS"
+            )
+        return self
+
     @model_validator(mode="after")
     def check_mutually_exclusive(self) -> Self:
         if None not in [self.APP_DATABASE_URL, self.MIGRATION_DATABASE_URL]:
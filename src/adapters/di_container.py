@@ -1,17 +1,81 @@
 import os
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 
+from sqlalchemy import make_url
+
+from src.adapters.config import get_config
+from src.adapters.outbound.database.engine import get_session_maker
 from src.adapters.outbound.email_sender.console_email_sender import ConsoleEmailSender
 from src.adapters.outbound.email_sender.smtp_email_sender import SMTPEmailSender
+from src.adapters.outbound.idempotency.in_memory_idempotency_store import (
+    InMemoryIdempotencyStore,
+)
+from src.adapters.outbound.idempotency.postgres_idempotency_store import (
+    PostgresIdempotencyStore,
+)
+from src.adapters.outbound.live_updates.postgres_live_updates import (
+    PostgresLiveUpdateListener,
+    PostgresLiveUpdatePublisher,
+)
+from src.adapters.outbound.rate_limiter.in_memory_rate_limiter import (
+    InMemoryRateLimiter,
+)
+from src.adapters.outbound.rate_limiter.postgres_rate_limiter import (
+    PostgresRateLimiter,
+)
+from src.adapters.outbound.repositories.bond import SQLAlchemyBondRepository
+from src.adapters.outbound.repositories.bondholder import (
+    SQLAlchemyBondHolderRepository,
+)
+from src.adapters.outbound.repositories.portfolio_snapshot import (
+    SQLAlchemyPortfolioSnapshotRepository,
+)
+from src.adapters.outbound.repositories.reference_rate import (
+    SQLAlchemyReferenceRateRepository,
+)
+from src.adapters.outbound.result_cache.in_memory_result_cache import (
+    InMemoryResultCache,
+)
+from src.adapters.outbound.result_cache.postgres_result_cache import (
+    PostgresResultCache,
+)
+from src.application.events.handlers.cache.invalidate_result_cache import (
+    InvalidateResultCacheHandler,
+)
 from src.application.events.handlers.email.bh_deleted_info_email import (
     BondHolderDeletedEmailHandler,
 )
 from src.application.events.handlers.email.welcome_email import (
     SendWelcomeEmailHandler,
 )
+from src.application.events.handlers.snapshot.refresh_portfolio_snapshot import (
+    RefreshPortfolioSnapshotHandler,
+)
+from src.application.cache.single_flight import SingleFlight
+from src.application.dto.bondholder import BondHolderDTO
+from src.application.dto.calculations import MonthlyIncomeResponseDTO
+from src.application.dto.data import EquityDTO
+from src.application.live_updates import LiveUpdateHub
+from src.application.login_throttle import LoginThrottle
+from src.application.use_cases.data.portfolio_snapshot import (
+    RefreshPortfolioSnapshotUseCase,
+)
 from src.application.events.event_publisher import EventPublisher
 from src.domain.events import UserCreated
-from src.domain.events.bondholder_events import BondHolderDeletedEvent
+from src.domain.events.bondholder_events import (
+    HOLDING_EVENTS,
+    BondHolderDeletedEvent,
+)
 from src.domain.ports.services.email_sender import EmailSender
+from src.domain.ports.services.idempotency_store import IdempotencyStore
+from src.domain.ports.services.live_update_publisher import LiveUpdatePublisher
+from src.domain.ports.services.rate_limiter import RateLimiter
+from src.domain.ports.services.result_cache import ResultCache
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.services.portfolio_valuation import PortfolioValuationService
+from src.domain.value_objects.rate_limit import RateLimit
 
 
 def get_email_sender() -> EmailSender:
@@ -35,6 +99,173 @@ def get_email_sender() -> EmailSender:
         return ConsoleEmailSender()
 
 
+_result_cache: ResultCache | None = None
+
+# DTO cached under each UseCaseResultCache namespace, used to decode
+# entries of the shared PostgresResultCache.
+RESULT_CACHE_TYPES: dict[str, type] = {
+    "equity": EquityDTO,
+    "income": MonthlyIncomeResponseDTO,
+}
+
+
+def get_result_cache() -> ResultCache | None:
+    """
+    Fetch the process-wide ResultCache selected by RESULT_CACHE_BACKEND.
+
+    memory: per-worker LRU (InMemoryResultCache)
+    postgres: LRU shared by all workers (PostgresResultCache)
+    disabled: None, results are always recomputed
+    """
+    global _result_cache
+    config = get_config()
+    if _result_cache is None and config.RESULT_CACHE_BACKEND != "disabled":
+        if config.RESULT_CACHE_BACKEND == "postgres":
+            _result_cache = PostgresResultCache(
+                session_maker=get_session_maker(),
+                max_entries=config.RESULT_CACHE_MAX_ENTRIES,
+                value_types=RESULT_CACHE_TYPES,
+            )
+        else:
+            _result_cache = InMemoryResultCache(
+                max_entries=config.RESULT_CACHE_MAX_ENTRIES
+            )
+    return _result_cache
+
+
+_idempotency_store: IdempotencyStore | None = None
+
+# DTO returned by each IdempotentExecution operation, used to decode the
+# results replayed by PostgresIdempotencyStore.
+IDEMPOTENCY_RESULT_TYPES: dict[str, type] = {"bondholder_create": BondHolderDTO}
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """
+    Fetch the process-wide IdempotencyStore selected by IDEMPOTENCY_BACKEND.
+
+    memory: per-worker store, for development (InMemoryIdempotencyStore)
+    postgres: store shared by all workers (PostgresIdempotencyStore)
+    """
+    global _idempotency_store
+    if _idempotency_store is None:
+        if get_config().IDEMPOTENCY_BACKEND == "postgres":
+            _idempotency_store = PostgresIdempotencyStore(
+                session_maker=get_session_maker(),
+                result_types=IDEMPOTENCY_RESULT_TYPES,
+            )
+        else:
+            _idempotency_store = InMemoryIdempotencyStore()
+    return _idempotency_store
+
+
+_login_throttle: LoginThrottle | None = None
+
+
+def get_login_throttle() -> LoginThrottle | None:
+    """
+    Fetch the process-wide LoginThrottle selected by LOGIN_RATE_LIMIT_BACKEND.
+
+    memory: buckets of each worker (InMemoryRateLimiter)
+    postgres: buckets shared by all workers (PostgresRateLimiter)
+    disabled: None, login attempts are not limited
+    """
+    global _login_throttle
+    config = get_config()
+    if _login_throttle is None and config.LOGIN_RATE_LIMIT_BACKEND != "disabled":
+        limiter: RateLimiter
+        if config.LOGIN_RATE_LIMIT_BACKEND == "postgres":
+            limiter = PostgresRateLimiter(session_maker=get_session_maker())
+        else:
+            limiter = InMemoryRateLimiter()
+        _login_throttle = LoginThrottle(
+            limiter=limiter,
+            per_ip=RateLimit(
+                burst=config.LOGIN_RATE_LIMIT_IP_BURST,
+                per_minute=config.LOGIN_RATE_LIMIT_IP_PER_MINUTE,
+            ),
+            per_username=RateLimit(
+                burst=config.LOGIN_RATE_LIMIT_USERNAME_BURST,
+                per_minute=config.LOGIN_RATE_LIMIT_USERNAME_PER_MINUTE,
+            ),
+        )
+    return _login_throttle
+
+
+_single_flights: dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """Fetch the process-wide SingleFlight that coalesces calls of ``name``."""
+    if name not in _single_flights:
+        _single_flights[name] = SingleFlight(name)
+    return _single_flights[name]
+
+
+_scenario_executor: ProcessPoolExecutor | None = None
+
+
+def get_scenario_executor() -> ProcessPoolExecutor:
+    """
+    Fetch the process-wide pool running rate scenario simulations.
+
+    Created on first use with SCENARIO_WORKERS processes (CPU count when
+    unset) and closed by ``shutdown_scenario_executor``.
+    """
+    global _scenario_executor
+    if _scenario_executor is None:
+        _scenario_executor = ProcessPoolExecutor(
+            max_workers=get_config().SCENARIO_WORKERS
+        )
+    return _scenario_executor
+
+
+def shutdown_scenario_executor() -> None:
+    global _scenario_executor
+    if _scenario_executor is not None:
+        _scenario_executor.shutdown(cancel_futures=True)
+        _scenario_executor = None
+
+
+def get_live_update_publisher() -> LiveUpdatePublisher:
+    return PostgresLiveUpdatePublisher(
+        session_maker=get_session_maker(), channel=get_config().LIVE_UPDATES_CHANNEL
+    )
+
+
+def setup_live_update_listener(hub: LiveUpdateHub) -> PostgresLiveUpdateListener:
+    """
+    Build the worker's listener feeding ``hub`` from LIVE_UPDATES_CHANNEL.
+
+    It connects on its own, outside the session pool, with the application's
+    credentials.
+    """
+    config = get_config()
+    dsn = make_url(config.database_app_url).set(drivername="postgresql")
+    return PostgresLiveUpdateListener(
+        dsn=dsn.render_as_string(hide_password=False),
+        channel=config.LIVE_UPDATES_CHANNEL,
+        on_update=hub.dispatch,
+    )
+
+
+@asynccontextmanager
+async def portfolio_snapshot_refresh() -> AsyncIterator[RefreshPortfolioSnapshotUseCase]:
+    """Provide a RefreshPortfolioSnapshotUseCase bound to a session of its own."""
+    async with get_session_maker()() as session:
+        yield RefreshPortfolioSnapshotUseCase(
+            bondholder_repo=SQLAlchemyBondHolderRepository(session),
+            bond_repo=SQLAlchemyBondRepository(session),
+            reference_rate_repo=SQLAlchemyReferenceRateRepository(session),
+            snapshot_repo=SQLAlchemyPortfolioSnapshotRepository(session),
+            valuation_service=PortfolioValuationService(BondHolderIncomeCalculator()),
+            update_publisher=get_live_update_publisher(),
+        )
+
+
+_snapshot_handler: RefreshPortfolioSnapshotHandler | None = None
+
+
 def setup_event_publisher() -> EventPublisher:
     publisher = EventPublisher()
     email_sender = get_email_sender()
@@ -44,9 +275,27 @@ def setup_event_publisher() -> EventPublisher:
     publisher.subscribe(UserCreated, welcome_email_handler.handle)
     publisher.subscribe(BondHolderDeletedEvent, bh_deleted_email_handler.handle)
 
+    global _snapshot_handler
+    # Also the source of portfolio_revalued live updates, which other
+    # backends therefore do not send.
+    if get_config().EQUITY_HISTORY_BACKEND == "snapshot":
+        _snapshot_handler = RefreshPortfolioSnapshotHandler(portfolio_snapshot_refresh)
+        publisher.subscribe_batch(HOLDING_EVENTS, _snapshot_handler.handle_all)
+
+    result_cache = get_result_cache()
+    if result_cache is not None:
+        invalidate_handler = InvalidateResultCacheHandler(result_cache)
+        publisher.subscribe_batch(HOLDING_EVENTS, invalidate_handler.handle_all)
+
     return publisher
 
 
+async def finish_snapshot_refreshes() -> None:
+    """Wait for the portfolio snapshot refreshes still running in the background."""
+    if _snapshot_handler is not None:
+        await _snapshot_handler.join()
+
+
 _event_publisher: EventPublisher | None = None
 
 
@@ -0,0 +1,265 @@
+import asyncio
+import json
+import math
+from collections import deque
+from dataclasses import dataclass, field
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.adapters.config import Config, get_config
+from src.application.metrics import Metrics, get_metrics
+
+RETRY_AFTER_HEADER = "Retry-After"
+
+# Never limited: probes, preflights and long-lived event streams, which would
+# hold a slot for as long as the client stays connected.
+_EXEMPT_PATHS = ("/health", "/metrics", "/api/live")
+
+_READ_METHODS = frozenset({"GET", "HEAD"})
+
+_SHED_BODY = json.dumps({"detail": "Server is busy, retry later"}).encode()
+
+
+@dataclass(frozen=True, slots=True)
+class AdmissionLimit:
+    """How many requests of a class run at once and how many may wait.
+
+    Args:
+        max_in_flight (int): Requests running at the same time.
+        max_queue (int): Requests waiting for a slot; more are shed at once.
+        max_wait (float): Seconds a request waits for a slot before it is
+            shed.
+    """
+
+    max_in_flight: int
+    max_queue: int
+    max_wait: float
+
+
+@dataclass(frozen=True, slots=True)
+class AdmissionPolicy:
+    """Limits of each route class and of the whole worker.
+
+    Args:
+        worker (AdmissionLimit): Applies to every admitted request, after
+            its class limit.
+        classes (dict[str, AdmissionLimit]): Limit per route class.
+        routes (tuple[tuple[str | None, str, str], ...]): Method (None for
+            any), path prefix and class, the first match deciding. Other
+            requests are ``read`` for GET and HEAD and ``write`` otherwise.
+    """
+
+    worker: AdmissionLimit
+    classes: dict[str, AdmissionLimit]
+    routes: tuple[tuple[str | None, str, str], ...] = field(
+        default=(
+            ("POST", "/api/login", "auth"),
+            # Registration hashes the password like a login does.
+            ("POST", "/api/users", "auth"),
+            (None, "/api/calculations", "calculation"),
+        )
+    )
+
+    @classmethod
+    def from_config(cls, config: Config) -> "AdmissionPolicy":
+        max_wait = config.ADMISSION_MAX_WAIT_MS / 1000
+
+        def limit(max_in_flight: int) -> AdmissionLimit:
+            return AdmissionLimit(
+                max_in_flight=max_in_flight,
+                max_queue=config.ADMISSION_MAX_QUEUE,
+                max_wait=max_wait,
+            )
+
+        return cls(
+            worker=limit(config.ADMISSION_MAX_IN_FLIGHT),
+            classes={
+                "auth": limit(config.ADMISSION_AUTH_MAX_IN_FLIGHT),
+                "read": limit(config.ADMISSION_READ_MAX_IN_FLIGHT),
+                "write": limit(config.ADMISSION_WRITE_MAX_IN_FLIGHT),
+                "calculation": limit(config.ADMISSION_CALCULATION_MAX_IN_FLIGHT),
+            },
+        )
+
+    def classify(self, method: str, path: str) -> str | None:
+        """Route class of a request, or None if it is not limited."""
+        if method == "OPTIONS" or path.startswith(_EXEMPT_PATHS):
+            return None
+        for route_method, prefix, route_class in self.routes:
+            if route_method in (None, method) and path.startswith(prefix):
+                return route_class
+        return "read" if method in _READ_METHODS else "write"
+
+
+class AdmissionGate:
+    """
+    Counting semaphore with a bounded FIFO queue and a deadline per waiter.
+
+    A released slot passes straight to the oldest waiter, so a newcomer
+    never overtakes the queue.
+    """
+
+    def __init__(self, limit: AdmissionLimit) -> None:
+        self.limit: AdmissionLimit = limit
+        self.in_flight: int = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def full(self) -> bool:
+        """Whether a request arriving now would be turned away at once."""
+        return (
+            self.in_flight >= self.limit.max_in_flight
+            and len(self._waiters) >= self.limit.max_queue
+        )
+
+    async def acquire(self, deadline: float) -> bool:
+        """
+        Take a slot, waiting until ``deadline`` (event loop time) at most.
+
+        Returns:
+            Whether a slot was taken; False when the queue is full or the
+            deadline passed
+        """
+        if self.in_flight < self.limit.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            return True
+        if len(self._waiters) >= self.limit.max_queue:
+            return False
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        try:
+            async with asyncio.timeout_at(deadline):
+                await waiter
+            return True
+        except TimeoutError:
+            return self._abandon(waiter)
+        except asyncio.CancelledError:
+            if self._abandon(waiter):
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # The slot changes hands, in_flight stays the same.
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def _abandon(self, waiter: asyncio.Future[None]) -> bool:
+        """Leave the queue; True if a slot was handed over meanwhile."""
+        if waiter.done() and not waiter.cancelled():
+            return True
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        return False
+
+
+class AdmissionMiddleware:
+    """
+    Limits the requests a worker runs at once, per route class and overall.
+
+    A request first waits for a slot of its class (auth, read, write or
+    calculation), then for one of the worker, in arrival order. Requests
+    finding the queue full, or still waiting when their class's wait runs
+    out, are shed with a 503 and a Retry-After, before touching the session
+    pool. Bursts thus queue briefly and fail fast instead of timing out all
+    together.
+
+    Per class, the metrics count admitted and shed requests and summarize
+    the time spent queueing.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policy: AdmissionPolicy | None = None,
+        metrics: Metrics | None = None,
+    ) -> None:
+        self.app = app
+        self._policy = policy
+        self.metrics = metrics or get_metrics()
+        self._gates: dict[str, AdmissionGate] = {}
+        self._worker_gate: AdmissionGate | None = None
+
+    @property
+    def policy(self) -> AdmissionPolicy:
+        # Built on first use, once the configuration is loaded.
+        if self._policy is None:
+            self._policy = AdmissionPolicy.from_config(get_config())
+        return self._policy
+
+    def gate(self, route_class: str) -> AdmissionGate:
+        if route_class not in self._gates:
+            self._gates[route_class] = AdmissionGate(self.policy.classes[route_class])
+        return self._gates[route_class]
+
+    @property
+    def worker_gate(self) -> AdmissionGate:
+        if self._worker_gate is None:
+            self._worker_gate = AdmissionGate(self.policy.worker)
+        return self._worker_gate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        route_class = self.policy.classify(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        prefix = f"admission.{route_class}"
+        gate, worker_gate = self.gate(route_class), self.worker_gate
+        loop = asyncio.get_running_loop()
+        arrived = loop.time()
+        deadline = arrived + gate.limit.max_wait
+        if not await self._acquire(gate, deadline, prefix):
+            await self._shed(send, gate.limit)
+            return
+        try:
+            if not await self._acquire(worker_gate, deadline, prefix):
+                await self._shed(send, gate.limit)
+                return
+            try:
+                self.metrics.increment(f"{prefix}.admitted")
+                self.metrics.observe(
+                    f"{prefix}.queue_wait_ms", (loop.time() - arrived) * 1000
+                )
+                await self.app(scope, receive, send)
+            finally:
+                worker_gate.release()
+        finally:
+            gate.release()
+
+    async def _acquire(self, gate: AdmissionGate, deadline: float, prefix: str) -> bool:
+        if gate.full:
+            self.metrics.increment(f"{prefix}.shed_queue_full")
+            return False
+        if not await gate.acquire(deadline):
+            self.metrics.increment(f"{prefix}.shed_deadline")
+            return False
+        return True
+
+    async def _shed(self, send: Send, limit: AdmissionLimit) -> None:
+        retry_after = max(1, math.ceil(limit.max_wait))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(_SHED_BODY)).encode()),
+                    (RETRY_AFTER_HEADER.lower().encode(), str(retry_after).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": _SHED_BODY})
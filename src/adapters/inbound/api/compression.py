@@ -0,0 +1,212 @@
+import time
+import zlib
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.metrics import Metrics, get_metrics
+
+ACCEPT_ENCODING_HEADER = "Accept-Encoding"
+
+# Window bits selecting the container: gzip (RFC 1952) and zlib, which is
+# what HTTP calls deflate (RFC 1950).
+_WBITS = {"gzip": zlib.MAX_WBITS | 16, "deflate": zlib.MAX_WBITS}
+
+_UNCOMPRESSED_STATUSES = frozenset({204, 206, 304})
+
+
+@dataclass(frozen=True, slots=True)
+class CompressionPolicy:
+    """What gets compressed and how hard.
+
+    Args:
+        minimum_size (int): Smallest complete body worth compressing, in bytes.
+            Streamed bodies are always compressed since their size is unknown.
+        levels (Mapping[str, int]): zlib level per media type. Responses of
+            other media types are sent as they are.
+    """
+
+    minimum_size: int = 1024
+    levels: Mapping[str, int] = field(
+        default_factory=lambda: {
+            "application/json": 6,
+            # Streamed line by line, so kept cheap to not delay each record.
+            "application/x-ndjson": 1,
+            # Already compact; only the repeated keys are left to squeeze.
+            "application/msgpack": 1,
+            "text/plain": 6,
+            "text/csv": 6,
+            "text/html": 6,
+        }
+    )
+
+
+def choose_encoding(accept_encoding: str | None) -> str | None:
+    """
+    Pick gzip or deflate from an ``Accept-Encoding`` header.
+
+    Returns:
+        The supported coding with the highest quality, gzip winning ties,
+        or None when the client accepts neither.
+    """
+    if not accept_encoding:
+        return None
+    qualities: dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, *params = coding.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.strip().lower()] = quality
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in _WBITS:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with gzip or deflate, as negotiated with the client.
+
+    Complete bodies below the policy's minimum size go out as they are.
+    Streamed bodies are compressed chunk by chunk with a sync flush after
+    each one, so every NDJSON record reaches the client as soon as it is
+    produced. Strong ETags are weakened, the compressed bytes being a
+    different representation.
+
+    Each compressed response records, per encoding, the bytes in and out,
+    their ratio and the CPU time spent compressing in the metrics.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policy: CompressionPolicy | None = None,
+        metrics: Metrics | None = None,
+    ) -> None:
+        self.app = app
+        self.policy = policy or CompressionPolicy()
+        self.metrics = metrics or get_metrics()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get(ACCEPT_ENCODING_HEADER))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(send, encoding, self.policy, self.metrics)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Rewrites the messages of one response as they are sent."""
+
+    def __init__(
+        self, send: Send, encoding: str, policy: CompressionPolicy, metrics: Metrics
+    ) -> None:
+        self._send = send
+        self._encoding = encoding
+        self._policy = policy
+        self._metrics = metrics
+        self._start: Message | None = None
+        self._compressor: zlib.Compress | None = None
+        self._passthrough = False
+        self._bytes_in = 0
+        self._bytes_out = 0
+        self._cpu_seconds = 0.0
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+        elif message["type"] == "http.response.start":
+            self._start = message
+            self._passthrough = not self._select(message)
+            if self._passthrough:
+                await self._send(message)
+        elif message["type"] == "http.response.body":
+            await self._send_body(message)
+        else:
+            await self._send(message)
+
+    def _select(self, start: Message) -> bool:
+        """Whether the response is one to compress; sets ``_compressor`` if so."""
+        headers = MutableHeaders(raw=start["headers"])
+        if start["status"] in _UNCOMPRESSED_STATUSES or "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        level = self._policy.levels.get(media_type)
+        if level is None:
+            return False
+        headers.add_vary_header(ACCEPT_ENCODING_HEADER)
+        self._compressor = zlib.compressobj(
+            level, zlib.DEFLATED, _WBITS[self._encoding]
+        )
+        return True
+
+    async def _send_body(self, message: Message) -> None:
+        compressor = self._compressor
+        if compressor is None:
+            raise RuntimeError("Response body sent before the response start")
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        start, self._start = self._start, None
+        if start is None:
+            compressed = self._compress(compressor, body, finish=not more_body)
+        elif not more_body and len(body) < self._policy.minimum_size:
+            self._passthrough = True
+            await self._send(start)
+            await self._send(message)
+            return
+        else:
+            compressed = self._compress(compressor, body, finish=not more_body)
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = self._encoding
+            if more_body:
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(compressed))
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            await self._send(start)
+
+        if not more_body:
+            self._record()
+        await self._send(
+            {"type": "http.response.body", "body": compressed, "more_body": more_body}
+        )
+
+    def _compress(
+        self, compressor: "zlib.Compress", body: bytes, finish: bool
+    ) -> bytes:
+        began = time.thread_time()
+        compressed = compressor.compress(body) + compressor.flush(
+            zlib.Z_FINISH if finish else zlib.Z_SYNC_FLUSH
+        )
+        self._cpu_seconds += time.thread_time() - began
+        self._bytes_in += len(body)
+        self._bytes_out += len(compressed)
+        return compressed
+
+    def _record(self) -> None:
+        metrics = self._metrics
+        prefix = f"compression.{self._encoding}"
+        metrics.increment(f"{prefix}.responses")
+        metrics.increment(f"{prefix}.bytes_in", self._bytes_in)
+        metrics.increment(f"{prefix}.bytes_out", self._bytes_out)
+        if self._bytes_in:
+            metrics.observe(f"{prefix}.ratio", self._bytes_out / self._bytes_in)
+        metrics.observe(f"{prefix}.cpu_ms", self._cpu_seconds * 1000)
@@ -1,13 +1,90 @@
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
 
 from src.adapters.config import get_config, Config
-from src.adapters.outbound.database.engine import get_session
-
+from src.adapters.inbound.api.read_your_writes import LAST_WRITE_COOKIE, wrote_recently
+from src.adapters.outbound.database.engine import (
+    get_replica_router,
+    get_session,
+    get_session_maker,
+)
+from src.application.cache.single_flight import Detached
 
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 ConfigDep = Annotated[Config, Depends(get_config)]
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login/token")
+
+
+def primary_session_maker() -> sessionmaker:
+    return get_session_maker()
+
+
+PrimarySessionMakerDep = Annotated[sessionmaker, Depends(primary_session_maker)]
+
+
+async def replica_session_maker(
+    request: Request, config: ConfigDep
+) -> sessionmaker | None:
+    """
+    Replica the request reads from, None when reads must go to the primary.
+
+    Stays on the primary when no replica is configured or recent enough, and
+    for clients that wrote within DB_REPLICA_STICKY_SECONDS, so they read
+    their own changes. Resolved once per request, so every read of it goes
+    to the same server.
+    """
+    router = get_replica_router()
+    if router is None or wrote_recently(
+        request.cookies.get(LAST_WRITE_COOKIE), config.DB_REPLICA_STICKY_SECONDS
+    ):
+        return None
+    return await router.session_maker()
+
+
+ReplicaSessionMakerDep = Annotated[sessionmaker | None, Depends(replica_session_maker)]
+
+
+async def read_session(
+    session: SessionDep, replica: ReplicaSessionMakerDep
+) -> AsyncGenerator[AsyncSession, None]:
+    """Session for dependencies that only read, on a replica when one will do."""
+    if replica is None:
+        yield session
+        return
+    async with replica() as replica_session:
+        yield replica_session
+
+
+ReadSessionDep = Annotated[AsyncSession, Depends(read_session)]
+
+
+def own_session_maker(
+    primary: PrimarySessionMakerDep, replica: ReplicaSessionMakerDep
+) -> sessionmaker:
+    """Sessions tied to no request, for read-only work shared between requests.
+
+    They go to the server the request reads from, replica or primary.
+    """
+    return replica or primary
+
+
+OwnSessionMakerDep = Annotated[sessionmaker, Depends(own_session_maker)]
+
+
+def on_own_session[U](
+    session_maker: sessionmaker, build: Callable[[AsyncSession], U]
+) -> Detached[U]:
+    """Build a use case on a new session from ``session_maker``, closed on exit."""
+
+    @asynccontextmanager
+    async def open_detached() -> AsyncIterator[U]:
+        async with session_maker() as session:
+            yield build(session)
+
+    return open_detached
@@ -0,0 +1,38 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.adapters.di_container import (
+    get_idempotency_store,
+    get_result_cache,
+    get_single_flight,
+)
+from src.application.cache.single_flight import SingleFlight
+from src.domain.ports.services.idempotency_store import IdempotencyStore
+from src.domain.ports.services.result_cache import ResultCache
+
+
+def result_cache() -> ResultCache | None:
+    return get_result_cache()
+
+
+ResultCacheDep = Annotated[ResultCache | None, Depends(result_cache)]
+
+
+def idempotency_store() -> IdempotencyStore:
+    return get_idempotency_store()
+
+
+IdempotencyStoreDep = Annotated[IdempotencyStore, Depends(idempotency_store)]
+
+
+def equity_single_flight() -> SingleFlight:
+    return get_single_flight("equity")
+
+
+def income_single_flight() -> SingleFlight:
+    return get_single_flight("income")
+
+
+def bondholder_page_single_flight() -> SingleFlight:
+    return get_single_flight("bondholder_page")
@@ -0,0 +1,78 @@
+from datetime import date
+from typing import Annotated
+
+from fastapi import Depends, Request, Response
+
+from src.adapters.inbound.api.dependencies.current_user_deps import CurrentUserDep
+from src.adapters.inbound.api.dependencies.repo_deps import ReadVersionRepoDep
+from src.adapters.inbound.api.etag import (
+    CACHE_CONTROL,
+    ETAG_HEADER,
+    IF_NONE_MATCH_HEADER,
+    NotModified,
+    compute_etag,
+    etag_matches,
+)
+from src.adapters.inbound.api.serialization import ACCEPT_HEADER, negotiate_media_type
+from src.domain.value_objects.resource_versions import ResourceVersions
+
+
+async def portfolio_versions(
+    user: CurrentUserDep, version_repo: ReadVersionRepoDep
+) -> ResourceVersions:
+    """Versions of the data the request's portfolio view is derived from.
+
+    Loaded once per request, for the ETag and the use case alike.
+    """
+    return await version_repo.get_versions(user_id=user.id)
+
+
+PortfolioVersionsDep = Annotated[ResourceVersions, Depends(portfolio_versions)]
+
+
+async def portfolio_etag(
+    request: Request,
+    response: Response,
+    user: CurrentUserDep,
+    versions: PortfolioVersionsDep,
+) -> str:
+    """
+    Tag a portfolio view and stop the request early if the client is current.
+
+    Declared as a route dependency so it is resolved before the endpoint's
+    use case runs.
+
+    Raises:
+        NotModified: If ``If-None-Match`` matches the current ETag.
+    """
+    etag = compute_etag(
+        user_id=user.id,
+        versions=versions,
+        today=date.today(),
+        path=request.url.path,
+        query=request.query_params.multi_items(),
+        media_type=negotiate_media_type(request.headers.get(ACCEPT_HEADER)),
+    )
+    if etag_matches(request.headers.get(IF_NONE_MATCH_HEADER), etag):
+        raise NotModified(etag)
+    response.headers[ETAG_HEADER] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return etag
+
+
+async def seeded_portfolio_etag(
+    request: Request,
+    response: Response,
+    user: CurrentUserDep,
+    versions: PortfolioVersionsDep,
+) -> str | None:
+    """
+    ``portfolio_etag`` for views drawn at random unless the request seeds them.
+
+    Without a ``seed`` query parameter the view differs on every request,
+    so it goes out without an ETag rather than being answered 304 with
+    output that could not be reproduced.
+    """
+    if request.query_params.get("seed") is None:
+        return None
+    return await portfolio_etag(request, response, user, versions)
@@ -0,0 +1,12 @@
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from src.application.live_updates import LiveUpdateHub
+
+
+def get_live_update_hub(request: Request) -> LiveUpdateHub:
+    return request.app.state.live_update_hub
+
+
+LiveUpdateHubDep = Annotated[LiveUpdateHub, Depends(get_live_update_hub)]
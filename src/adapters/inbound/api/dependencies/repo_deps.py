@@ -2,13 +2,20 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from src.adapters.inbound.api.dependencies import SessionDep
+from src.adapters.inbound.api.dependencies import ReadSessionDep, SessionDep
 from src.adapters.outbound.repositories.bond import SQLAlchemyBondRepository
 from src.adapters.outbound.repositories.bondholder import (
     SQLAlchemyBondHolderRepository,
 )
+from src.adapters.outbound.repositories.equity_history import (
+    SQLAlchemyEquityHistoryRepository,
+)
+from src.adapters.outbound.repositories.portfolio_snapshot import (
+    SQLAlchemyPortfolioSnapshotRepository,
+)
 from src.adapters.outbound.repositories.user import SQLAlchemyUserRepository
 from src.adapters.outbound.repositories.reference_rate import SQLAlchemyReferenceRateRepository
+from src.adapters.outbound.repositories.version import SQLAlchemyVersionRepository
 
 def user_repository(session: SessionDep) -> SQLAlchemyUserRepository:
     return SQLAlchemyUserRepository(session)
@@ -26,6 +33,58 @@ def reference_rate_repository(session: SessionDep) -> SQLAlchemyReferenceRateRep
     return SQLAlchemyReferenceRateRepository(session)
 
 
+def version_repository(session: SessionDep) -> SQLAlchemyVersionRepository:
+    return SQLAlchemyVersionRepository(session)
+
+
+def equity_history_repository(
+    session: SessionDep,
+) -> SQLAlchemyEquityHistoryRepository:
+    return SQLAlchemyEquityHistoryRepository(session)
+
+
+def portfolio_snapshot_repository(
+    session: SessionDep,
+) -> SQLAlchemyPortfolioSnapshotRepository:
+    return SQLAlchemyPortfolioSnapshotRepository(session)
+
+
+# Repositories for use cases that only read, served by a replica when one is
+# configured and recent enough; see ``read_session``.
+
+
+def read_bond_repository(session: ReadSessionDep) -> SQLAlchemyBondRepository:
+    return SQLAlchemyBondRepository(session)
+
+
+def read_bondholder_repository(
+    session: ReadSessionDep,
+) -> SQLAlchemyBondHolderRepository:
+    return SQLAlchemyBondHolderRepository(session)
+
+
+def read_reference_rate_repository(
+    session: ReadSessionDep,
+) -> SQLAlchemyReferenceRateRepository:
+    return SQLAlchemyReferenceRateRepository(session)
+
+
+def read_version_repository(session: ReadSessionDep) -> SQLAlchemyVersionRepository:
+    return SQLAlchemyVersionRepository(session)
+
+
+def read_equity_history_repository(
+    session: ReadSessionDep,
+) -> SQLAlchemyEquityHistoryRepository:
+    return SQLAlchemyEquityHistoryRepository(session)
+
+
+def read_portfolio_snapshot_repository(
+    session: ReadSessionDep,
+) -> SQLAlchemyPortfolioSnapshotRepository:
+    return SQLAlchemyPortfolioSnapshotRepository(session)
+
+
 UserRepoDep = Annotated[SQLAlchemyUserRepository, Depends(user_repository)]
 BondRepoDep = Annotated[SQLAlchemyBondRepository, Depends(bond_repository)]
 BondHolderRepoDep = Annotated[
@@ -34,3 +93,27 @@ BondHolderRepoDep = Annotated[
 ReferenceRateRepoDep = Annotated[
     SQLAlchemyReferenceRateRepository, Depends(reference_rate_repository)
 ]
+VersionRepoDep = Annotated[SQLAlchemyVersionRepository, Depends(version_repository)]
+EquityHistoryRepoDep = Annotated[
+    SQLAlchemyEquityHistoryRepository, Depends(equity_history_repository)
+]
+PortfolioSnapshotRepoDep = Annotated[
+    SQLAlchemyPortfolioSnapshotRepository, Depends(portfolio_snapshot_repository)
+]
+
+ReadBondRepoDep = Annotated[SQLAlchemyBondRepository, Depends(read_bond_repository)]
+ReadBondHolderRepoDep = Annotated[
+    SQLAlchemyBondHolderRepository, Depends(read_bondholder_repository)
+]
+ReadReferenceRateRepoDep = Annotated[
+    SQLAlchemyReferenceRateRepository, Depends(read_reference_rate_repository)
+]
+ReadVersionRepoDep = Annotated[
+    SQLAlchemyVersionRepository, Depends(read_version_repository)
+]
+ReadEquityHistoryRepoDep = Annotated[
+    SQLAlchemyEquityHistoryRepository, Depends(read_equity_history_repository)
+]
+ReadPortfolioSnapshotRepoDep = Annotated[
+    SQLAlchemyPortfolioSnapshotRepository, Depends(read_portfolio_snapshot_repository)
+]
@@ -0,0 +1,42 @@
+from typing import Annotated, Any
+
+from fastapi import Depends, Request, Response
+from starlette import status
+
+from src.adapters.inbound.api.serialization import (
+    ACCEPT_HEADER,
+    DTOSerializer,
+    negotiate_media_type,
+)
+
+VARY_HEADER = "Vary"
+
+
+class ResponseRenderer:
+    """
+    Renders endpoint results in the representation negotiated with ``Accept``.
+
+    Carries over the headers that the endpoint and its dependencies set on the
+    injected response, such as the ETag or the pagination cursor.
+    """
+
+    def __init__(self, request: Request, response: Response) -> None:
+        self.media_type = negotiate_media_type(request.headers.get(ACCEPT_HEADER))
+        self.response = response
+        self.response.headers[VARY_HEADER] = ACCEPT_HEADER
+
+    def __call__(
+        self,
+        serializer: DTOSerializer,
+        value: Any,
+        status_code: int = status.HTTP_200_OK,
+    ) -> Response:
+        return serializer.response(
+            value,
+            response=self.response,
+            status_code=status_code,
+            media_type=self.media_type,
+        )
+
+
+RenderDep = Annotated[ResponseRenderer, Depends()]
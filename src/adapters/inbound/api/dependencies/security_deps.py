@@ -1,9 +1,11 @@
 from typing import Annotated
 
 from fastapi import Depends
+from src.adapters.di_container import get_login_throttle
 from src.adapters.inbound.api.dependencies import ConfigDep
 from src.adapters.outbound.security.bcrypt_hasher import BcryptPasswordHasher
 from src.adapters.outbound.security.jwt_token_handler import JWTTokenHandler
+from src.application.login_throttle import LoginThrottle
 
 
 def hasher() -> BcryptPasswordHasher:
@@ -14,5 +16,10 @@ def token_handler(config: ConfigDep) -> JWTTokenHandler:
     return JWTTokenHandler(config=config)
 
 
+def login_throttle() -> LoginThrottle | None:
+    return get_login_throttle()
+
+
 HasherDep = Annotated[BcryptPasswordHasher, Depends(hasher)]
 TokenHandlerDep = Annotated[JWTTokenHandler, Depends(token_handler)]
+LoginThrottleDep = Annotated[LoginThrottle | None, Depends(login_throttle)]
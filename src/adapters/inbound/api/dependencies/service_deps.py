@@ -7,6 +7,9 @@ from src.adapters.outbound.external_services.nbp.nbp_data_provider import NBPDat
 from src.adapters.outbound.external_services.nbp.parser import NBPXMLParser
 from src.domain.services.analytics.analytics_service import AnalyticsService
 from src.domain.services.bondholder_deletion_service import BondHolderDeletionService
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.services.payment_schedule import PaymentScheduleService
+from src.domain.services.portfolio_valuation import PortfolioValuationService
 
 
 def bh_deletion_service(
@@ -25,3 +28,11 @@ def nbp_data_provider_dep() -> NBPDataProvider:
 
 def analytics_service() -> AnalyticsService:
     return AnalyticsService()
+
+
+def portfolio_valuation_service() -> PortfolioValuationService:
+    return PortfolioValuationService(BondHolderIncomeCalculator())
+
+
+def payment_schedule_service() -> PaymentScheduleService:
+    return PaymentScheduleService(BondHolderIncomeCalculator())
@@ -1,13 +1,34 @@
+from datetime import timedelta
 from typing import Annotated
 
 from fastapi import Depends
 
+from src.adapters.inbound.api.dependencies import (
+    ConfigDep,
+    OwnSessionMakerDep,
+    on_own_session,
+)
+from src.adapters.inbound.api.dependencies.cache_deps import (
+    IdempotencyStoreDep,
+    bondholder_page_single_flight,
+)
+from src.adapters.inbound.api.dependencies.etag_deps import PortfolioVersionsDep
 from src.adapters.inbound.api.dependencies.event_publisher_deps import EventPublisherDep
 from src.adapters.inbound.api.dependencies.repo_deps import (
     BondHolderRepoDep,
     BondRepoDep,
+    ReadBondHolderRepoDep,
+    ReadBondRepoDep,
+    bond_repository,
+    bondholder_repository,
 )
 from src.adapters.inbound.api.dependencies.service_deps import bh_deletion_service
+from src.application.cache.single_flight import SingleFlight
+from src.application.idempotency import IdempotentExecution
+from src.application.use_cases.bondholder.bh_batch import BondHolderBatchUseCase
+from src.application.use_cases.bondholder.bh_changes import (
+    BondHolderGetChangesUseCase,
+)
 from src.application.use_cases.bondholder.bh_create import (
     BondHolderCreateUseCase,
 )
@@ -16,6 +37,7 @@ from src.application.use_cases.bondholder.bh_delete import (
 )
 from src.application.use_cases.bondholder.bh_get import (
     BondHolderGetAllUseCase,
+    BondHolderGetPageUseCase,
     BondHolderGetUseCase,
 )
 from src.application.use_cases.bondholder.bh_update_quantity import (
@@ -27,24 +49,49 @@ from src.domain.services.bondholder_deletion_service import BondHolderDeletionSe
 def update_bh_quantity_use_case(
     bond_repo: BondRepoDep,
     bondholder_repo: BondHolderRepoDep,
+    event_publisher: EventPublisherDep,
 ) -> UpdateBondHolderQuantityUseCase:
     return UpdateBondHolderQuantityUseCase(
-        bond_repo=bond_repo, bondholder_repo=bondholder_repo
+        bond_repo=bond_repo,
+        bondholder_repo=bondholder_repo,
+        event_publisher=event_publisher,
+    )
+
+
+def bh_batch_use_case(
+    bond_repo: BondRepoDep,
+    bondholder_repo: BondHolderRepoDep,
+    event_publisher: EventPublisherDep,
+) -> BondHolderBatchUseCase:
+    return BondHolderBatchUseCase(
+        bond_repo=bond_repo,
+        bondholder_repo=bondholder_repo,
+        event_publisher=event_publisher,
     )
 
 
 def bh_create_use_case(
     bond_repo: BondRepoDep,
     bondholder_repo: BondHolderRepoDep,
+    event_publisher: EventPublisherDep,
+    idempotency_store: IdempotencyStoreDep,
+    config: ConfigDep,
 ) -> BondHolderCreateUseCase:
     return BondHolderCreateUseCase(
         bond_repo=bond_repo,
         bondholder_repo=bondholder_repo,
+        event_publisher=event_publisher,
+        idempotency=IdempotentExecution(
+            store=idempotency_store,
+            operation="bondholder_create",
+            ttl=timedelta(hours=config.IDEMPOTENCY_TTL_HOURS),
+            lease=timedelta(seconds=config.IDEMPOTENCY_LEASE_SECONDS),
+        ),
     )
 
 
 def bh_get_use_case(
-    bond_repo: BondRepoDep, bondholder_repo: BondHolderRepoDep
+    bond_repo: ReadBondRepoDep, bondholder_repo: ReadBondHolderRepoDep
 ) -> BondHolderGetUseCase:
     return BondHolderGetUseCase(
         bond_repo=bond_repo,
@@ -53,7 +100,7 @@ def bh_get_use_case(
 
 
 def bh_get_all_use_case(
-    bond_repo: BondRepoDep, bondholder_repo: BondHolderRepoDep
+    bond_repo: ReadBondRepoDep, bondholder_repo: ReadBondHolderRepoDep
 ) -> BondHolderGetAllUseCase:
     return BondHolderGetAllUseCase(
         bond_repo=bond_repo,
@@ -61,6 +108,40 @@ def bh_get_all_use_case(
     )
 
 
+def bh_get_page_use_case(
+    bond_repo: ReadBondRepoDep,
+    bondholder_repo: ReadBondHolderRepoDep,
+    single_flight: Annotated[SingleFlight, Depends(bondholder_page_single_flight)],
+    session_maker: OwnSessionMakerDep,
+    versions: PortfolioVersionsDep,
+) -> BondHolderGetPageUseCase:
+    return BondHolderGetPageUseCase(
+        bond_repo=bond_repo,
+        bondholder_repo=bondholder_repo,
+        single_flight=single_flight,
+        versions=versions,
+        detached=on_own_session(
+            session_maker,
+            lambda session: BondHolderGetPageUseCase(
+                bond_repo=bond_repository(session),
+                bondholder_repo=bondholder_repository(session),
+            ),
+        ),
+    )
+
+
+def bh_get_changes_use_case(
+    bond_repo: BondRepoDep,
+    bondholder_repo: BondHolderRepoDep,
+    config: ConfigDep,
+) -> BondHolderGetChangesUseCase:
+    return BondHolderGetChangesUseCase(
+        bond_repo=bond_repo,
+        bondholder_repo=bondholder_repo,
+        tombstone_retention=timedelta(days=config.TOMBSTONE_RETENTION_DAYS),
+    )
+
+
 def bh_delete_use_case(
     bondholder_repo: BondHolderRepoDep,
     event_publisher: EventPublisherDep,
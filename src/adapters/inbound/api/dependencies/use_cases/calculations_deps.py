@@ -1,22 +1,139 @@
+from concurrent.futures import Executor
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.adapters.di_container import get_scenario_executor
+from src.adapters.inbound.api.dependencies import (
+    ConfigDep,
+    OwnSessionMakerDep,
+    on_own_session,
+)
+from src.adapters.inbound.api.dependencies.cache_deps import (
+    ResultCacheDep,
+    income_single_flight,
+)
+from src.adapters.inbound.api.dependencies.etag_deps import PortfolioVersionsDep
 from src.adapters.inbound.api.dependencies.repo_deps import (
-    BondRepoDep,
-    ReferenceRateRepoDep,
-    BondHolderRepoDep,
+    ReadBondRepoDep,
+    ReadReferenceRateRepoDep,
+    ReadBondHolderRepoDep,
+    ReadVersionRepoDep,
+    bond_repository,
+    bondholder_repository,
+    reference_rate_repository,
+    version_repository,
 )
+from src.application.cache.single_flight import Detached, SingleFlight
+from src.application.cache.use_case_result_cache import UseCaseResultCache
 from src.application.use_cases.calculations.calculate_income import (
     CalculateIncomeUseCase,
 )
+from src.application.use_cases.calculations.calculate_yield import (
+    CalculateYieldUseCase,
+)
+from src.application.use_cases.calculations.stress_test_income import (
+    StressTestIncomeUseCase,
+)
+from src.domain.ports.repositories.bond import BondRepository
+from src.domain.ports.repositories.bondholder import BondHolderRepository
+from src.domain.ports.repositories.reference_rate import ReferenceRateRepository
+from src.domain.ports.repositories.version import VersionRepository
+from src.domain.ports.services.result_cache import ResultCache
+from src.domain.services.analytics.rate_scenarios import RateScenarioService
+from src.domain.services.analytics.yield_analytics import YieldAnalyticsService
 from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.value_objects.resource_versions import ResourceVersions
 
 
-def get_calculate_income_use_case(
-    bond_repo: BondRepoDep,
-    reference_rate_repo: ReferenceRateRepoDep,
-    bondholder_repo: BondHolderRepoDep,
+def _calculate_income_use_case(
+    bond_repo: BondRepository,
+    reference_rate_repo: ReferenceRateRepository,
+    bondholder_repo: BondHolderRepository,
+    version_repo: VersionRepository,
+    cache: ResultCache | None,
+    single_flight: SingleFlight | None = None,
+    detached: Detached[CalculateIncomeUseCase] | None = None,
+    versions: ResourceVersions | None = None,
 ) -> CalculateIncomeUseCase:
     return CalculateIncomeUseCase(
         bh_income_calculator=BondHolderIncomeCalculator(),
         bondholder_repo=bondholder_repo,
         bond_repo=bond_repo,
         reference_rate_repo=reference_rate_repo,
+        result_cache=(
+            UseCaseResultCache(
+                cache=cache, version_repo=version_repo, namespace="income"
+            )
+            if cache is not None
+            else None
+        ),
+        single_flight=single_flight,
+        detached=detached,
+        versions=versions,
+    )
+
+
+def get_calculate_income_use_case(
+    bond_repo: ReadBondRepoDep,
+    reference_rate_repo: ReadReferenceRateRepoDep,
+    bondholder_repo: ReadBondHolderRepoDep,
+    version_repo: ReadVersionRepoDep,
+    cache: ResultCacheDep,
+    single_flight: Annotated[SingleFlight, Depends(income_single_flight)],
+    session_maker: OwnSessionMakerDep,
+    versions: PortfolioVersionsDep,
+) -> CalculateIncomeUseCase:
+    return _calculate_income_use_case(
+        bond_repo=bond_repo,
+        reference_rate_repo=reference_rate_repo,
+        bondholder_repo=bondholder_repo,
+        version_repo=version_repo,
+        cache=cache,
+        single_flight=single_flight,
+        versions=versions,
+        detached=on_own_session(
+            session_maker,
+            lambda session: _calculate_income_use_case(
+                bond_repo=bond_repository(session),
+                reference_rate_repo=reference_rate_repository(session),
+                bondholder_repo=bondholder_repository(session),
+                version_repo=version_repository(session),
+                cache=cache,
+            ),
+        ),
+    )
+
+
+def get_calculate_yield_use_case(
+    bond_repo: ReadBondRepoDep,
+    reference_rate_repo: ReadReferenceRateRepoDep,
+    bondholder_repo: ReadBondHolderRepoDep,
+) -> CalculateYieldUseCase:
+    return CalculateYieldUseCase(
+        yield_service=YieldAnalyticsService(BondHolderIncomeCalculator()),
+        bondholder_repo=bondholder_repo,
+        bond_repo=bond_repo,
+        reference_rate_repo=reference_rate_repo,
+    )
+
+
+def scenario_executor() -> Executor:
+    return get_scenario_executor()
+
+
+def get_stress_test_income_use_case(
+    bond_repo: ReadBondRepoDep,
+    reference_rate_repo: ReadReferenceRateRepoDep,
+    bondholder_repo: ReadBondHolderRepoDep,
+    executor: Annotated[Executor, Depends(scenario_executor)],
+    config: ConfigDep,
+) -> StressTestIncomeUseCase:
+    return StressTestIncomeUseCase(
+        scenario_service=RateScenarioService(BondHolderIncomeCalculator()),
+        bondholder_repo=bondholder_repo,
+        bond_repo=bond_repo,
+        reference_rate_repo=reference_rate_repo,
+        executor=executor,
+        shard_size=config.SCENARIO_SHARD_SIZE,
     )
@@ -2,20 +2,152 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from src.adapters.config import Config
+from src.adapters.inbound.api.dependencies import (
+    ConfigDep,
+    OwnSessionMakerDep,
+    on_own_session,
+)
+from src.adapters.inbound.api.dependencies.cache_deps import (
+    ResultCacheDep,
+    equity_single_flight,
+)
+from src.adapters.inbound.api.dependencies.etag_deps import PortfolioVersionsDep
 from src.adapters.inbound.api.dependencies.repo_deps import (
-    BondHolderRepoDep,
-    BondRepoDep,
+    ReadBondHolderRepoDep,
+    ReadBondRepoDep,
+    ReadEquityHistoryRepoDep,
+    ReadPortfolioSnapshotRepoDep,
+    ReadReferenceRateRepoDep,
+    ReadVersionRepoDep,
+    bond_repository,
+    bondholder_repository,
+    equity_history_repository,
+    portfolio_snapshot_repository,
+    reference_rate_repository,
+    version_repository,
 )
-from src.adapters.inbound.api.dependencies.service_deps import analytics_service
+from src.adapters.inbound.api.dependencies.service_deps import (
+    analytics_service,
+    payment_schedule_service,
+    portfolio_valuation_service,
+)
+from src.application.cache.single_flight import Detached, SingleFlight
+from src.application.cache.use_case_result_cache import UseCaseResultCache
 from src.application.use_cases.data.get_equity_history import GetEquityHistoryUseCase
+from src.application.use_cases.data.get_upcoming_payments import (
+    GetUpcomingPaymentsUseCase,
+)
+from src.domain.ports.repositories.bond import BondRepository
+from src.domain.ports.repositories.bondholder import BondHolderRepository
+from src.domain.ports.repositories.equity_history import EquityHistoryRepository
+from src.domain.ports.repositories.portfolio_snapshot import (
+    PortfolioSnapshotRepository,
+)
+from src.domain.ports.repositories.reference_rate import ReferenceRateRepository
+from src.domain.ports.repositories.version import VersionRepository
+from src.domain.ports.services.result_cache import ResultCache
 from src.domain.services.analytics.analytics_service import AnalyticsService
+from src.domain.services.payment_schedule import PaymentScheduleService
+from src.domain.services.portfolio_valuation import PortfolioValuationService
+from src.domain.value_objects.resource_versions import ResourceVersions
+
+
+def _equity_history_use_case(
+    bond_repo: BondRepository,
+    bondholder_repo: BondHolderRepository,
+    version_repo: VersionRepository,
+    history_repo: EquityHistoryRepository,
+    snapshot_repo: PortfolioSnapshotRepository,
+    reference_rate_repo: ReferenceRateRepository,
+    analytics_service: AnalyticsService,
+    valuation_service: PortfolioValuationService,
+    cache: ResultCache | None,
+    config: Config,
+    single_flight: SingleFlight | None = None,
+    detached: Detached[GetEquityHistoryUseCase] | None = None,
+    versions: ResourceVersions | None = None,
+) -> GetEquityHistoryUseCase:
+    return GetEquityHistoryUseCase(
+        bh_repo=bondholder_repo,
+        bond_repo=bond_repo,
+        service=analytics_service,
+        result_cache=(
+            UseCaseResultCache(
+                cache=cache, version_repo=version_repo, namespace="equity"
+            )
+            if cache is not None
+            else None
+        ),
+        single_flight=single_flight,
+        history_repo=history_repo if config.EQUITY_HISTORY_BACKEND == "sql" else None,
+        snapshot_repo=(
+            snapshot_repo if config.EQUITY_HISTORY_BACKEND == "snapshot" else None
+        ),
+        reference_rate_repo=reference_rate_repo,
+        valuation_service=valuation_service,
+        detached=detached,
+        versions=versions,
+    )
 
 
 def get_equity_history_use_case(
-    bond_repo: BondRepoDep,
-    bondholder_repo: BondHolderRepoDep,
+    bond_repo: ReadBondRepoDep,
+    bondholder_repo: ReadBondHolderRepoDep,
     analytics_service: Annotated[AnalyticsService, Depends(analytics_service)],
+    version_repo: ReadVersionRepoDep,
+    cache: ResultCacheDep,
+    single_flight: Annotated[SingleFlight, Depends(equity_single_flight)],
+    history_repo: ReadEquityHistoryRepoDep,
+    snapshot_repo: ReadPortfolioSnapshotRepoDep,
+    reference_rate_repo: ReadReferenceRateRepoDep,
+    valuation_service: Annotated[
+        PortfolioValuationService, Depends(portfolio_valuation_service)
+    ],
+    config: ConfigDep,
+    session_maker: OwnSessionMakerDep,
+    versions: PortfolioVersionsDep,
 ) -> GetEquityHistoryUseCase:
-    return GetEquityHistoryUseCase(
-        bh_repo=bondholder_repo, bond_repo=bond_repo, service=analytics_service
+    return _equity_history_use_case(
+        bond_repo=bond_repo,
+        bondholder_repo=bondholder_repo,
+        version_repo=version_repo,
+        history_repo=history_repo,
+        snapshot_repo=snapshot_repo,
+        reference_rate_repo=reference_rate_repo,
+        analytics_service=analytics_service,
+        valuation_service=valuation_service,
+        cache=cache,
+        config=config,
+        single_flight=single_flight,
+        versions=versions,
+        detached=on_own_session(
+            session_maker,
+            lambda session: _equity_history_use_case(
+                bond_repo=bond_repository(session),
+                bondholder_repo=bondholder_repository(session),
+                version_repo=version_repository(session),
+                history_repo=equity_history_repository(session),
+                snapshot_repo=portfolio_snapshot_repository(session),
+                reference_rate_repo=reference_rate_repository(session),
+                analytics_service=analytics_service,
+                valuation_service=valuation_service,
+                cache=cache,
+                config=config,
+            ),
+        ),
+    )
+
+
+def get_upcoming_payments_use_case(
+    bond_repo: ReadBondRepoDep,
+    bondholder_repo: ReadBondHolderRepoDep,
+    reference_rate_repo: ReadReferenceRateRepoDep,
+    service: Annotated[PaymentScheduleService, Depends(payment_schedule_service)],
+) -> GetUpcomingPaymentsUseCase:
+    return GetUpcomingPaymentsUseCase(
+        bh_repo=bondholder_repo,
+        bond_repo=bond_repo,
+        reference_rate_repo=reference_rate_repo,
+        service=service,
     )
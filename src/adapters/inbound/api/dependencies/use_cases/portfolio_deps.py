@@ -0,0 +1,28 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.adapters.inbound.api.dependencies.repo_deps import (
+    ReadBondHolderRepoDep,
+    ReadBondRepoDep,
+    ReadReferenceRateRepoDep,
+)
+from src.adapters.inbound.api.dependencies.service_deps import analytics_service
+from src.application.use_cases.portfolio.get_summary import GetPortfolioSummaryUseCase
+from src.domain.services.analytics.analytics_service import AnalyticsService
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+
+
+def get_portfolio_summary_use_case(
+    bond_repo: ReadBondRepoDep,
+    bondholder_repo: ReadBondHolderRepoDep,
+    reference_rate_repo: ReadReferenceRateRepoDep,
+    analytics_service: Annotated[AnalyticsService, Depends(analytics_service)],
+) -> GetPortfolioSummaryUseCase:
+    return GetPortfolioSummaryUseCase(
+        bh_repo=bondholder_repo,
+        bond_repo=bond_repo,
+        reference_rate_repo=reference_rate_repo,
+        income_calculator=BondHolderIncomeCalculator(),
+        analytics_service=analytics_service,
+    )
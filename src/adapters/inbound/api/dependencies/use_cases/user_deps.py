@@ -2,6 +2,7 @@ from src.adapters.inbound.api.dependencies.event_publisher_deps import EventPubl
 from src.adapters.inbound.api.dependencies.repo_deps import UserRepoDep
 from src.adapters.inbound.api.dependencies.security_deps import (
     HasherDep,
+    LoginThrottleDep,
     TokenHandlerDep,
 )
 from src.application.use_cases.user.auth import UserAuthUseCase
@@ -25,9 +26,13 @@ def user_login_use_case(
     user_repo: UserRepoDep,
     hasher: HasherDep,
     token_handler: TokenHandlerDep,
+    throttle: LoginThrottleDep,
 ) -> UserLoginUseCase:
     return UserLoginUseCase(
-        user_repo=user_repo, hasher=hasher, token_handler=token_handler
+        user_repo=user_repo,
+        hasher=hasher,
+        token_handler=token_handler,
+        throttle=throttle,
     )
 
 
@@ -0,0 +1,66 @@
+import hashlib
+from collections.abc import Iterable
+from datetime import date
+from uuid import UUID
+
+from src.adapters.inbound.api.serialization import JSON_MEDIA_TYPE
+from src.domain.value_objects.resource_versions import ResourceVersions
+
+ETAG_HEADER = "ETag"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+
+# Caches may store the response but must revalidate it on every use, which is
+# what makes the ETag useful for polling dashboards.
+CACHE_CONTROL = "private, no-cache"
+
+
+class NotModified(Exception):
+    """Raised to short-circuit a request whose cached representation is current."""
+
+    def __init__(self, etag: str) -> None:
+        super().__init__(etag)
+        self.etag = etag
+
+
+def compute_etag(
+    user_id: UUID,
+    versions: ResourceVersions,
+    today: date,
+    path: str,
+    query: Iterable[tuple[str, str]],
+    media_type: str = JSON_MEDIA_TYPE,
+) -> str:
+    """
+    Build a strong ETag for a portfolio view.
+
+    Everything the response is derived from goes into the hash: the data
+    versions, the current date (income and equity depend on it), the path,
+    the negotiated media type and the query parameters, sorted so their order
+    does not matter.
+    """
+    parts = [
+        str(user_id),
+        str(versions.portfolio),
+        str(versions.reference_rate),
+        today.isoformat(),
+        path,
+        media_type,
+        *(f"{key}={value}" for key, value in sorted(query)),
+    ]
+    digest = hashlib.sha256("\n".join(parts).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Evaluate an ``If-None-Match`` header against the current ETag.
+
+    Uses the weak comparison required for ``If-None-Match``, so a ``W/``
+    prefix added by an intermediary does not defeat revalidation.
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
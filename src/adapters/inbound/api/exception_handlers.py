@@ -1,10 +1,14 @@
 import logging
+import math
 from typing import Any
 
 from fastapi import Request
 from fastapi.exceptions import RequestValidationError
 from starlette import status
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
+
+from src.adapters.inbound.api.admission import RETRY_AFTER_HEADER
+from src.adapters.inbound.api.etag import CACHE_CONTROL, ETAG_HEADER, NotModified
 
 from src.adapters.outbound.exceptions import SQLAlchemyRepositoryError
 from src.domain.exceptions import (
@@ -14,6 +18,7 @@ from src.domain.exceptions import (
     DomainError,
     InvalidTokenError,
     NotFoundError,
+    RateLimitExceededError,
     ValidationError,
 )
 
@@ -28,6 +33,7 @@ async def domain_exception_handler(request: Request, exc: DomainError) -> JSONRe
         InvalidTokenError: status.HTTP_401_UNAUTHORIZED,
         AuthenticationError: status.HTTP_401_UNAUTHORIZED,
         AuthorizationError: status.HTTP_403_FORBIDDEN,
+        RateLimitExceededError: status.HTTP_429_TOO_MANY_REQUESTS,
     }
     status_code = status_code_map.get(type(exc), 400)
 
@@ -43,7 +49,12 @@ async def domain_exception_handler(request: Request, exc: DomainError) -> JSONRe
         log_context["query_params"] = request.url.query
 
     logger.warning("API request failed", extra=log_context)
-    return JSONResponse(status_code=status_code, content={"detail": str(exc)})
+    headers = None
+    if isinstance(exc, RateLimitExceededError):
+        headers = {RETRY_AFTER_HEADER: str(math.ceil(exc.retry_after))}
+    return JSONResponse(
+        status_code=status_code, content={"detail": str(exc)}, headers=headers
+    )
 
 
 async def repository_exception_handler(
@@ -65,6 +76,17 @@ async def repository_exception_handler(
     )
 
 
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={
+            ETAG_HEADER: exc.etag,
+            "Cache-Control": CACHE_CONTROL,
+            "Vary": "Accept",
+        },
+    )
+
+
 async def request_validation_exception_handler(
     request: Request,
     exc: RequestValidationError,
@@ -8,18 +8,43 @@ from fastapi.exceptions import RequestValidationError
 
 from starlette.middleware.cors import CORSMiddleware
 
-from src.adapters.di_container import setup_event_publisher
+from src.adapters.config import get_config
+from src.adapters.di_container import (
+    finish_snapshot_refreshes,
+    setup_event_publisher,
+    setup_live_update_listener,
+    shutdown_scenario_executor,
+)
+from src.adapters.inbound.api.admission import (
+    RETRY_AFTER_HEADER,
+    AdmissionMiddleware,
+)
+from src.adapters.inbound.api.compression import CompressionMiddleware
+from src.adapters.inbound.api.etag import ETAG_HEADER, NotModified
 from src.adapters.inbound.api.exception_handlers import (
     domain_exception_handler,
+    not_modified_handler,
     repository_exception_handler,
     request_validation_exception_handler,
 )
+from src.adapters.inbound.api.pagination import NEXT_CURSOR_HEADER
+from src.adapters.inbound.api.read_your_writes import ReadYourWritesMiddleware
 from src.adapters.inbound.api.routers.bonds import bond_router
 from src.adapters.inbound.api.routers.calculations import calculations_router
 from src.adapters.inbound.api.routers.auth import auth_router
 from src.adapters.inbound.api.routers.data import data_router
+from src.adapters.inbound.api.routers.live import live_router
+from src.adapters.inbound.api.routers.portfolio import portfolio_router
 from src.adapters.inbound.api.routers.users import users_router
+from src.adapters.outbound.database.engine import (
+    dispose_engine,
+    pool_stats,
+    replica_stats,
+    warm_up_pool,
+)
 from src.adapters.outbound.exceptions import SQLAlchemyRepositoryError
+from src.application.live_updates import LiveUpdateHub
+from src.application.metrics import get_metrics
 from src.domain.exceptions import DomainError
 from src.setup_logging import setup_logging
 
@@ -35,24 +60,44 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     logging.info("✅ Event Publisher initialized")
 
+    warmed = await warm_up_pool(get_config().DB_POOL_WARMUP)
+    logger.info(f"Database pool warmed up with {warmed} connections")
+
+    live_update_hub = LiveUpdateHub()
+    live_update_listener = setup_live_update_listener(live_update_hub)
+    await live_update_listener.start()
+    app.state.live_update_hub = live_update_hub
+
     yield
 
+    await live_update_listener.stop()
+    await finish_snapshot_refreshes()
+    shutdown_scenario_executor()
+    await dispose_engine()
+
 
 app: Final = FastAPI(lifespan=lifespan)
 
+app.add_middleware(ReadYourWritesMiddleware)
+# Innermost, so shed responses still get the CORS headers.
+app.add_middleware(AdmissionMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER, RETRY_AFTER_HEADER],
 )
+app.add_middleware(CompressionMiddleware)
 
 app.include_router(users_router, prefix="/api")
 app.include_router(bond_router, prefix="/api")
 app.include_router(auth_router, prefix="/api")
 app.include_router(calculations_router, prefix="/api")
 app.include_router(data_router, prefix="/api")
+app.include_router(portfolio_router, prefix="/api")
+app.include_router(live_router, prefix="/api")
 
 
 @app.get("/health")
@@ -61,6 +106,17 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """In-process counters of the worker that served the request"""
+    return {
+        **get_metrics().snapshot(),
+        "database_pool": pool_stats(),
+        "database_replicas": replica_stats(),
+    }
+
+
 app.add_exception_handler(DomainError, domain_exception_handler)  # type: ignore
 app.add_exception_handler(SQLAlchemyRepositoryError, repository_exception_handler)  # type: ignore
+app.add_exception_handler(NotModified, not_modified_handler)  # type: ignore
 app.add_exception_handler(RequestValidationError, request_validation_exception_handler)  # type: ignore
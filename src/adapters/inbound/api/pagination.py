@@ -0,0 +1,77 @@
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from uuid import UUID
+
+from src.domain.exceptions import ValidationError
+from src.domain.value_objects.bondholder_query import (
+    BondHolderCursor,
+    BondHolderSortField,
+    SortValue,
+)
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Page size when a cursor is sent without a limit.
+DEFAULT_PAGE_SIZE = 100
+
+_SORT_VALUE_PARSERS: dict[BondHolderSortField, Callable[[str], SortValue]] = {
+    BondHolderSortField.PURCHASE_DATE: date.fromisoformat,
+    BondHolderSortField.SERIES: str,
+    BondHolderSortField.QUANTITY: int,
+    BondHolderSortField.VALUE: Decimal,
+}
+
+
+def encode_cursor(
+    cursor: BondHolderCursor, sort_by: BondHolderSortField, descending: bool
+) -> str:
+    """
+    Serialize a keyset position into an opaque, URL-safe token.
+
+    The ordering is embedded so a token cannot be replayed against a listing
+    sorted differently, where its position would be meaningless.
+    """
+    payload = {
+        "s": sort_by.value,
+        "d": descending,
+        "v": str(cursor.sort_value),
+        "id": str(cursor.id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(
+    token: str, sort_by: BondHolderSortField, descending: bool
+) -> BondHolderCursor:
+    """
+    Parse a token produced by ``encode_cursor``.
+
+    Raises:
+        ValidationError: If the token is malformed or was issued for
+            another ordering.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        cursor_sort, cursor_descending = payload["s"], payload["d"]
+        cursor = BondHolderCursor(
+            sort_value=_SORT_VALUE_PARSERS[sort_by](payload["v"]),
+            id=UUID(payload["id"]),
+        )
+    except (
+        binascii.Error,
+        InvalidOperation,
+        KeyError,
+        TypeError,
+        ValueError,
+    ) as e:
+        raise ValidationError("Invalid cursor") from e
+
+    if cursor_sort != sort_by.value or cursor_descending != descending:
+        raise ValidationError("Cursor does not match the requested ordering")
+    return cursor
@@ -0,0 +1,93 @@
+import math
+import time
+from collections.abc import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.adapters.config import get_config
+
+LAST_WRITE_COOKIE = "last_write"
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def wrote_recently(
+    last_write: str | None,
+    sticky_seconds: float,
+    clock: Callable[[], float] = time.time,
+) -> bool:
+    """
+    Whether the client wrote within the last ``sticky_seconds``.
+
+    Args:
+        last_write: Value of the LAST_WRITE_COOKIE, in epoch milliseconds
+        sticky_seconds: How long after a write reads stay on the primary
+        clock: Current epoch time in seconds
+
+    Returns:
+        True if the write may not have reached the replicas yet
+    """
+    if not last_write:
+        return False
+    try:
+        written = int(last_write) / 1000
+    except ValueError:
+        return False
+    return clock() - written < sticky_seconds
+
+
+class ReadYourWritesMiddleware:
+    """
+    Marks clients that just changed data, so their reads skip the replicas.
+
+    Successful requests with a method other than GET, HEAD or OPTIONS get
+    the LAST_WRITE_COOKIE, holding the time of the write and expiring after
+    DB_REPLICA_STICKY_SECONDS. While it is sent back, read-only dependencies
+    use the primary, and a user sees their own changes even before they are
+    replicated. Nothing is set when no replica is configured.
+
+    A middleware rather than a dependency, as endpoints returning a Response
+    drop the cookies dependencies set.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sticky_seconds: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.app = app
+        self._sticky_seconds = sticky_seconds
+        self._clock = clock
+
+    @property
+    def sticky_seconds(self) -> float:
+        if self._sticky_seconds is not None:
+            return self._sticky_seconds
+        config = get_config()
+        return config.DB_REPLICA_STICKY_SECONDS if config.DB_REPLICA_URLS else 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in _SAFE_METHODS
+            or self.sticky_seconds <= 0
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def mark_write(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                message["headers"] = [*message.get("headers", []), self._cookie()]
+            await send(message)
+
+        await self.app(scope, receive, mark_write)
+
+    def _cookie(self) -> tuple[bytes, bytes]:
+        written = int(self._clock() * 1000)
+        max_age = math.ceil(self.sticky_seconds)
+        value = (
+            f"{LAST_WRITE_COOKIE}={written}; Max-Age={max_age}; Path=/; "
+            "HttpOnly; SameSite=Lax"
+        )
+        return b"set-cookie", value.encode("latin-1")
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from starlette import status
 
@@ -27,12 +27,14 @@ async def me(user: CurrentUserDep):
     "/login/token", response_model=TokenResponse, status_code=status.HTTP_200_OK
 )
 async def login(
+    request: Request,
     response: Response,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     use_case: Annotated[UserLoginUseCase, Depends(user_login_use_case)],
 ):
     try:
-        token_data = await use_case.execute(form_data)
+        client_ip = request.client.host if request.client else None
+        token_data = await use_case.execute(form_data, client_ip=client_ip)
         response.set_cookie(
             key="access_token",
             value=token_data.token,
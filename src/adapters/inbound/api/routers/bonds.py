@@ -1,13 +1,17 @@
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response
 from starlette import status
 
+from src.adapters.inbound.api.dependencies.etag_deps import portfolio_etag
 from src.adapters.inbound.api.dependencies.use_cases.bond_deps import (
+    bh_batch_use_case,
     bh_delete_use_case,
-    bh_get_all_use_case,
+    bh_get_changes_use_case,
+    bh_get_page_use_case,
     bh_get_use_case,
     update_bh_quantity_use_case,
     bh_create_use_case,
@@ -15,19 +19,42 @@ from src.adapters.inbound.api.dependencies.use_cases.bond_deps import (
 from src.adapters.inbound.api.dependencies.current_user_deps import (
     CurrentUserDep,
 )
+from src.adapters.inbound.api.dependencies.response_deps import RenderDep
+from src.adapters.inbound.api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+)
 from src.adapters.inbound.api.schemas.bondholder import (
+    BondHolderBatchRequest,
+    BondHolderBatchResponse,
     BondHolderChangeRequest,
+    BondHolderChangesResponse,
     BondHolderCreateRequest,
     BondHolderResponse,
 )
+from src.adapters.inbound.api.serialization import (
+    DTOSerializer,
+    negotiated_responses,
+)
 from src.application.dto.bond import BondCreateDTO
 from src.application.dto.bondholder import (
+    BondHolderBatchDTO,
+    BondHolderBatchResultDTO,
+    BondHolderChangesDTO,
+    BondHolderDTO,
     BondHolderUpdateQuantityDTO,
     BondHolderCreateDTO,
+    BondHolderQuantityChangeDTO,
 )
 from src.application.use_cases.bondholder.bh_update_quantity import (
     UpdateBondHolderQuantityUseCase,
 )
+from src.application.use_cases.bondholder.bh_batch import BondHolderBatchUseCase
+from src.application.use_cases.bondholder.bh_changes import (
+    BondHolderGetChangesUseCase,
+)
 from src.application.use_cases.bondholder.bh_create import (
     BondHolderCreateUseCase,
 )
@@ -35,24 +62,44 @@ from src.application.use_cases.bondholder.bh_delete import (
     BondHolderDeleteUseCase,
 )
 from src.application.use_cases.bondholder.bh_get import (
-    BondHolderGetAllUseCase,
+    BondHolderGetPageUseCase,
     BondHolderGetUseCase,
 )
 from src.domain.exceptions import NotFoundError
+from src.domain.value_objects.bondholder_query import (
+    BondHolderPageQuery,
+    BondHolderSortField,
+)
 
 bond_router = APIRouter(prefix="/bonds", tags=["bondholder"])
 
+_BONDHOLDER = DTOSerializer(BondHolderDTO, BondHolderResponse)
+_BONDHOLDER_LIST = DTOSerializer(BondHolderDTO, BondHolderResponse, many=True)
+_CHANGES = DTOSerializer(BondHolderChangesDTO, BondHolderChangesResponse)
+_BATCH = DTOSerializer(BondHolderBatchResultDTO, BondHolderBatchResponse)
+
 
 @bond_router.post(
     "",
     response_model=BondHolderResponse,
     status_code=status.HTTP_201_CREATED,
+    responses=negotiated_responses(status.HTTP_201_CREATED),
     description="Buy bonds. Create bond holder",
 )
 async def create_bond_purchase(
     bondholder_data: BondHolderCreateRequest,
     user: CurrentUserDep,
+    render: RenderDep,
     use_case: Annotated[BondHolderCreateUseCase, Depends(bh_create_use_case)],
+    idempotency_key: Annotated[
+        str | None,
+        Header(
+            alias="Idempotency-Key",
+            min_length=1,
+            max_length=255,
+            description="Retries with the same key return the first purchase.",
+        ),
+    ] = None,
 ):
     bondholder_dto = BondHolderCreateDTO(
         user_id=user.id,
@@ -67,66 +114,132 @@ async def create_bond_purchase(
         first_interest_period=bondholder_data.first_interest_period,
         reference_rate_margin=Decimal(bondholder_data.reference_rate_margin),
     )
-    response_dto = await use_case.execute(bondholder_dto, bond_dto)
-    return BondHolderResponse(
-        id=response_dto.id,
-        quantity=response_dto.quantity,
-        purchase_date=response_dto.purchase_date,
-        last_update=response_dto.last_update,
-        bond_id=response_dto.bond_id,
-        series=response_dto.series,
-        nominal_value=float(response_dto.nominal_value),
-        maturity_period=response_dto.maturity_period,
-        initial_interest_rate=float(response_dto.initial_interest_rate),
-        first_interest_period=response_dto.first_interest_period,
-        reference_rate_margin=float(response_dto.reference_rate_margin),
-    )
+    response_dto = await use_case.execute(bondholder_dto, bond_dto, idempotency_key)
+    return render(_BONDHOLDER, response_dto, status_code=status.HTTP_201_CREATED)
 
 
 @bond_router.get(
     "",
     response_model=list[BondHolderResponse],
     status_code=status.HTTP_200_OK,
-    description="Get all bonds as combined bond and bond holder data",
+    dependencies=[Depends(portfolio_etag)],
+    responses=negotiated_responses(),
+    description=(
+        "Get bonds as combined bond and bond holder data. All holdings are "
+        "returned unless a limit is given; pages then continue with the keyset "
+        f"cursor returned in the {NEXT_CURSOR_HEADER} header."
+    ),
 )
 async def get_all_bonds(
+    response: Response,
+    render: RenderDep,
     user: CurrentUserDep,
-    use_case: Annotated[BondHolderGetAllUseCase, Depends(bh_get_all_use_case)],
+    use_case: Annotated[BondHolderGetPageUseCase, Depends(bh_get_page_use_case)],
+    limit: Annotated[
+        int | None, Query(ge=1, le=500, description="Page size, all if unset.")
+    ] = None,
+    cursor: Annotated[
+        str | None, Query(description="Cursor from the previous page.")
+    ] = None,
+    sort_by: BondHolderSortField = BondHolderSortField.PURCHASE_DATE,
+    order: Literal["asc", "desc"] = "desc",
+    series_prefix: Annotated[str | None, Query(min_length=1)] = None,
+    purchased_from: date | None = None,
+    purchased_to: date | None = None,
 ):
-    return await use_case.execute(user=user)
+    descending = order == "desc"
+    if limit is None and cursor:
+        limit = DEFAULT_PAGE_SIZE
+    query = BondHolderPageQuery(
+        limit=limit,
+        sort_by=sort_by,
+        descending=descending,
+        after=decode_cursor(cursor, sort_by, descending) if cursor else None,
+        series_prefix=series_prefix,
+        purchased_from=purchased_from,
+        purchased_to=purchased_to,
+    )
+    page = await use_case.execute(user=user, query=query)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            page.next_cursor, sort_by, descending
+        )
+    return render(_BONDHOLDER_LIST, page.items)
+
+
+@bond_router.get(
+    "/changes",
+    response_model=BondHolderChangesResponse,
+    status_code=status.HTTP_200_OK,
+    responses=negotiated_responses(),
+    description=(
+        "Get bond holders inserted, updated and deleted since the watermark "
+        "returned by the previous call"
+    ),
+)
+async def get_bond_changes(
+    user: CurrentUserDep,
+    render: RenderDep,
+    since: Annotated[
+        datetime, Query(description="Watermark returned by the previous sync.")
+    ],
+    use_case: Annotated[
+        BondHolderGetChangesUseCase, Depends(bh_get_changes_use_case)
+    ],
+):
+    changes = await use_case.execute(user=user, since=since)
+    return render(_CHANGES, changes)
+
+
+@bond_router.post(
+    "/batch",
+    response_model=BondHolderBatchResponse,
+    status_code=status.HTTP_200_OK,
+    responses=negotiated_responses(),
+    description=(
+        "Change quantities of and delete several bond holders at once. Either "
+        "all changes are applied or, if any bond holder is not found, none is"
+    ),
+)
+async def apply_bond_batch(
+    batch: BondHolderBatchRequest,
+    user: CurrentUserDep,
+    render: RenderDep,
+    use_case: Annotated[BondHolderBatchUseCase, Depends(bh_batch_use_case)],
+):
+    dto = BondHolderBatchDTO(
+        user=user,
+        quantity_changes=[
+            BondHolderQuantityChangeDTO(id=change.id, new_quantity=change.new_quantity)
+            for change in batch.quantity_changes
+        ],
+        deletions=batch.deletions,
+    )
+    return render(_BATCH, await use_case.execute(dto=dto))
 
 
 @bond_router.get(
     "/{purchase_id}",
     response_model=BondHolderResponse,
     status_code=status.HTTP_200_OK,
+    responses=negotiated_responses(),
     description="Get combined bond and bond holder data",
 )
 async def get_bond(
     user: CurrentUserDep,
+    render: RenderDep,
     purchase_id: UUID,
     use_case: Annotated[BondHolderGetUseCase, Depends(bh_get_use_case)],
 ):
     dto = await use_case.execute(bondholder_id=purchase_id, user=user)
-    return BondHolderResponse(
-        id=dto.id,
-        quantity=dto.quantity,
-        purchase_date=dto.purchase_date,
-        last_update=dto.last_update,
-        bond_id=dto.bond_id,
-        series=dto.series,
-        nominal_value=float(dto.nominal_value),
-        maturity_period=dto.maturity_period,
-        initial_interest_rate=float(dto.initial_interest_rate),
-        first_interest_period=dto.first_interest_period,
-        reference_rate_margin=float(dto.reference_rate_margin),
-    )
+    return render(_BONDHOLDER, dto)
 
 
 @bond_router.patch(
     "/{purchase_id}/quantity",
     response_model=BondHolderResponse,
     status_code=status.HTTP_200_OK,
+    responses=negotiated_responses(),
     description="Change bond quantity in bond holder",
 )
 async def update_purchase_quantity(
@@ -136,13 +249,14 @@ async def update_purchase_quantity(
         UpdateBondHolderQuantityUseCase, Depends(update_bh_quantity_use_case)
     ],
     user: CurrentUserDep,
+    render: RenderDep,
 ):
     dto = BondHolderUpdateQuantityDTO(
         id=purchase_id,
         user=user,
         new_quantity=bond_data.new_quantity,
     )
-    return await use_case.execute(dto=dto)
+    return render(_BONDHOLDER, await use_case.execute(dto=dto))
 
 
 @bond_router.delete(
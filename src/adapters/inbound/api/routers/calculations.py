@@ -4,21 +4,147 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 
 from src.adapters.inbound.api.dependencies.current_user_deps import CurrentUserDep
+from src.adapters.inbound.api.dependencies.etag_deps import (
+    portfolio_etag,
+    seeded_portfolio_etag,
+)
+from src.adapters.inbound.api.dependencies.response_deps import RenderDep
 from src.adapters.inbound.api.dependencies.use_cases.calculations_deps import (
     get_calculate_income_use_case,
+    get_calculate_yield_use_case,
+    get_stress_test_income_use_case,
+)
+from src.adapters.inbound.api.schemas.calculations import (
+    IncomeBandResponse,
+    MonthIncomeResponse,
+    StressTestResponse,
+    YieldResponse,
+)
+from src.adapters.inbound.api.serialization import (
+    DTOSerializer,
+    negotiated_responses,
 )
-from src.adapters.inbound.api.schemas.calculations import MonthIncomeResponse
+from src.application.dto.calculations import MonthlyIncomeResponseDTO, YieldResponseDTO
 from src.application.use_cases.calculations.calculate_income import (
     CalculateIncomeUseCase,
 )
+from src.application.use_cases.calculations.calculate_yield import (
+    CalculateYieldUseCase,
+)
+from src.application.use_cases.calculations.stress_test_income import (
+    StressTestIncomeUseCase,
+)
+from src.domain.value_objects.rate_scenario import (
+    MAX_HORIZON_MONTHS,
+    MAX_PATHS,
+    RateScenarioQuery,
+)
 
 calculations_router = APIRouter(prefix="/calculations", tags=["Calculations"])
 
+_MONTH_INCOME = DTOSerializer(MonthlyIncomeResponseDTO, MonthIncomeResponse)
+_YIELD = DTOSerializer(YieldResponseDTO, YieldResponse)
+_STRESS_TEST = DTOSerializer(StressTestResponse, StressTestResponse)
 
-@calculations_router.post("/month-income", response_model=MonthIncomeResponse)
+
+@calculations_router.get(
+    "/month-income",
+    response_model=MonthIncomeResponse,
+    dependencies=[Depends(portfolio_etag)],
+    responses=negotiated_responses(),
+)
+@calculations_router.post(
+    "/month-income",
+    response_model=MonthIncomeResponse,
+    responses=negotiated_responses(),
+)
 async def calculate_income(
+    render: RenderDep,
     user_dto: CurrentUserDep,
     use_case: Annotated[CalculateIncomeUseCase, Depends(get_calculate_income_use_case)],
     target_date: Annotated[date, Query(description="Date for income calculation.")] = date.today(),
 ):
-    return await use_case.execute(user=user_dto, target_date=target_date)
+    dto = await use_case.execute(user=user_dto, target_date=target_date)
+    return render(_MONTH_INCOME, dto)
+
+
+@calculations_router.get(
+    "/yield",
+    response_model=YieldResponse,
+    dependencies=[Depends(portfolio_etag)],
+    responses=negotiated_responses(),
+)
+async def calculate_yield(
+    render: RenderDep,
+    user_dto: CurrentUserDep,
+    use_case: Annotated[CalculateYieldUseCase, Depends(get_calculate_yield_use_case)],
+):
+    """
+    Returns the expected net IRR of every holding and of the whole portfolio.
+
+    - Holdings are assumed to be kept to maturity
+    - Rates are effective annual percentages
+    - Variable-rate coupons past the known rate history use the latest rate
+    """
+    dto = await use_case.execute(user=user_dto, today=date.today())
+    return render(_YIELD, dto)
+
+
+@calculations_router.get(
+    "/stress-test",
+    response_model=StressTestResponse,
+    dependencies=[Depends(seeded_portfolio_etag)],
+    responses=negotiated_responses(),
+)
+async def stress_test_income(
+    render: RenderDep,
+    user_dto: CurrentUserDep,
+    use_case: Annotated[
+        StressTestIncomeUseCase, Depends(get_stress_test_income_use_case)
+    ],
+    shock_bp: Annotated[
+        list[int] | None,
+        Query(description="Parallel shift of the reference rate, repeatable."),
+    ] = None,
+    paths: Annotated[
+        int, Query(ge=0, le=MAX_PATHS, description="Number of random-walk paths.")
+    ] = 0,
+    volatility_bp: Annotated[
+        int, Query(ge=0, le=1000, description="Monthly random-walk step deviation.")
+    ] = 25,
+    horizon: Annotated[
+        int, Query(ge=1, le=MAX_HORIZON_MONTHS, description="Months to project.")
+    ] = 12,
+    seed: Annotated[int | None, Query(description="Random-walk seed.")] = None,
+):
+    """
+    Projects monthly income under reference rate scenarios.
+
+    - Either shock_bp (one constant path per shift) or paths (random walks)
+    - Paths start from the latest reference rate
+    - Percentile bands of net income per month
+    """
+    scenario = RateScenarioQuery(
+        horizon_months=horizon,
+        shocks_bp=tuple(shock_bp or ()),
+        paths=paths,
+        volatility_bp=volatility_bp,
+        seed=seed,
+    )
+    dto = await use_case.execute(user=user_dto, scenario=scenario, today=date.today())
+    result = StressTestResponse(
+        base_rate=dto.base_rate,
+        paths=dto.paths,
+        bands=[
+            IncomeBandResponse(
+                month=band.month,
+                p5=band.percentiles[5],
+                p25=band.percentiles[25],
+                p50=band.percentiles[50],
+                p75=band.percentiles[75],
+                p95=band.percentiles[95],
+            )
+            for band in dto.bands
+        ],
+    )
+    return render(_STRESS_TEST, result)
@@ -1,27 +1,105 @@
-from typing import Annotated
+from datetime import date
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from src.adapters.inbound.api.dependencies.current_user_deps import CurrentUserDep
+from src.adapters.inbound.api.dependencies.etag_deps import portfolio_etag
+from src.adapters.inbound.api.dependencies.response_deps import RenderDep
 from src.adapters.inbound.api.dependencies.use_cases.data_deps import (
     get_equity_history_use_case,
+    get_upcoming_payments_use_case,
 )
-from src.adapters.inbound.api.schemas.data import EquityResponse
+from src.adapters.inbound.api.schemas.data import (
+    EquityResponse,
+    UpcomingPaymentsResponse,
+)
+from src.adapters.inbound.api.serialization import (
+    DTOSerializer,
+    negotiated_responses,
+)
+from src.application.dto.data import EquityDTO, UpcomingPaymentsDTO
 from src.application.use_cases.data.get_equity_history import GetEquityHistoryUseCase
+from src.application.use_cases.data.get_upcoming_payments import (
+    GetUpcomingPaymentsUseCase,
+)
+from src.domain.value_objects.equity_history_query import (
+    DEFAULT_MAX_POINTS,
+    EquityHistoryQuery,
+)
 
 data_router = APIRouter(prefix="/data", tags=["Data"])
 
+_EQUITY = DTOSerializer(EquityDTO, EquityResponse, attributes={"equity": "data"})
+_UPCOMING_PAYMENTS = DTOSerializer(UpcomingPaymentsDTO, UpcomingPaymentsResponse)
 
-@data_router.get("/equity", response_model=EquityResponse)
+
+@data_router.get(
+    "/equity",
+    response_model=EquityResponse,
+    dependencies=[Depends(portfolio_etag)],
+    responses=negotiated_responses(),
+)
 async def get_equity(
+    render: RenderDep,
     user_dto: CurrentUserDep,
     use_case: Annotated[GetEquityHistoryUseCase, Depends(get_equity_history_use_case)],
+    from_: Annotated[
+        date | None, Query(alias="from", description="First day of the range.")
+    ] = None,
+    to: Annotated[date | None, Query(description="Last day of the range.")] = None,
+    max_points: Annotated[
+        int | None, Query(ge=3, le=5000, description="Upper bound on points.")
+    ] = None,
+    valuation: Annotated[
+        Literal["face", "accrued"] | None,
+        Query(description="accrued adds interest accrued since the last coupon."),
+    ] = None,
 ):
     """
     Returns portfolio equity over time.
 
     - Time series of portfolio value
     - Ordered by date ascending
+    - With any of from/to/max_points/valuation: daily values in the range,
+      downsampled to at most max_points with LTTB
+    """
+    query = None
+    if any(param is not None for param in (from_, to, max_points, valuation)):
+        query = EquityHistoryQuery(
+            start=from_,
+            end=to,
+            max_points=max_points or DEFAULT_MAX_POINTS,
+            include_accrued=valuation == "accrued",
+        )
+    dto = await use_case.execute(user=user_dto, query=query)
+    return render(_EQUITY, dto)
+
+
+@data_router.get(
+    "/payments/upcoming",
+    response_model=UpcomingPaymentsResponse,
+    dependencies=[Depends(portfolio_etag)],
+    responses=negotiated_responses(),
+)
+async def get_upcoming_payments(
+    render: RenderDep,
+    user_dto: CurrentUserDep,
+    use_case: Annotated[
+        GetUpcomingPaymentsUseCase, Depends(get_upcoming_payments_use_case)
+    ],
+    limit: Annotated[
+        int, Query(ge=1, le=1000, description="Number of payments to return.")
+    ] = 5,
+    after: Annotated[
+        date | None, Query(description="List payments after this day, today by default.")
+    ] = None,
+):
+    """
+    Returns the next coupon payments across the portfolio.
+
+    - Ordered by payment date ascending
+    - Variable-rate coupons are priced at the latest reference rate
     """
-    dto = await use_case.execute(user=user_dto)
-    return EquityResponse(equity=dto.data)
+    dto = await use_case.execute(user=user_dto, limit=limit, after=after)
+    return render(_UPCOMING_PAYMENTS, dto)
@@ -0,0 +1,95 @@
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from src.adapters.inbound.api.dependencies import ConfigDep, SessionDep
+from src.adapters.inbound.api.dependencies.current_user_deps import CurrentUserDep
+from src.adapters.inbound.api.dependencies.live_update_deps import LiveUpdateHubDep
+from src.adapters.inbound.api.schemas.live import (
+    PortfolioRevaluedEvent,
+    RateChangedEvent,
+)
+from src.adapters.inbound.api.serialization import DTOSerializer
+from src.application.live_updates import LiveUpdateHub
+from src.domain.value_objects.live_update import (
+    PortfolioRevalued,
+    ReferenceRateChanged,
+)
+
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+# Reconnection delay suggested to the client, in milliseconds.
+RETRY_MS = 5000
+
+live_router = APIRouter(prefix="/live", tags=["Live"])
+
+_EVENTS = {
+    ReferenceRateChanged: (
+        b"rate_changed",
+        DTOSerializer(ReferenceRateChanged, RateChangedEvent),
+    ),
+    PortfolioRevalued: (
+        b"portfolio_revalued",
+        DTOSerializer(PortfolioRevalued, PortfolioRevaluedEvent),
+    ),
+}
+
+
+async def _event_stream(
+    hub: LiveUpdateHub, user_id: UUID, heartbeat: float
+) -> AsyncIterator[bytes]:
+    subscription = hub.subscribe(user_id)
+    try:
+        yield b"retry: %d\n\n" % RETRY_MS
+        while True:
+            updates = await subscription.next(timeout=heartbeat)
+            if not updates:
+                # Keeps proxies from closing the idle connection and lets the
+                # server notice clients that went away.
+                yield b": heartbeat\n\n"
+                continue
+            frames = []
+            for update in updates:
+                name, serializer = _EVENTS[type(update)]
+                frames.append(
+                    b"event: %s\ndata: %s\n\n" % (name, serializer.to_json(update))
+                )
+            yield b"".join(frames)
+    finally:
+        hub.unsubscribe(subscription)
+
+
+@live_router.get(
+    "/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {EVENT_STREAM_MEDIA_TYPE: {}}}},
+)
+async def stream_live_updates(
+    user: CurrentUserDep,
+    hub: LiveUpdateHubDep,
+    session: SessionDep,
+    config: ConfigDep,
+):
+    """
+    Server-sent events of changes affecting the dashboard.
+
+    - ``rate_changed``: a new reference rate was published
+    - ``portfolio_revalued``: the user's equity and monthly income, with
+      their change since the previous valuation; sent only with the
+      ``snapshot`` equity history backend, whose snapshot refreshes value
+      the portfolio
+
+    Updates a slow client could not take yet are merged, so it receives the
+    latest values instead of a backlog. A comment is sent when nothing
+    happened for a while. Missed updates are not replayed on reconnection.
+    """
+    # The stream outlives the request and needs no database: hand the
+    # connection used for authentication back to the pool now.
+    await session.close()
+    return StreamingResponse(
+        _event_stream(hub, user.id, config.LIVE_UPDATES_HEARTBEAT_SECONDS),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
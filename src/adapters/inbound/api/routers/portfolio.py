@@ -0,0 +1,53 @@
+from datetime import date
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from src.adapters.inbound.api.dependencies.current_user_deps import CurrentUserDep
+from src.adapters.inbound.api.dependencies.etag_deps import portfolio_etag
+from src.adapters.inbound.api.dependencies.response_deps import RenderDep
+from src.adapters.inbound.api.dependencies.use_cases.portfolio_deps import (
+    get_portfolio_summary_use_case,
+)
+from src.adapters.inbound.api.schemas.portfolio import PortfolioSummaryResponse
+from src.adapters.inbound.api.serialization import (
+    DTOSerializer,
+    negotiated_responses,
+)
+from src.application.dto.portfolio import PortfolioSummaryDTO
+from src.application.use_cases.portfolio.get_summary import GetPortfolioSummaryUseCase
+from src.domain.value_objects.equity_history_query import DEFAULT_MAX_POINTS
+
+portfolio_router = APIRouter(prefix="/portfolio", tags=["Portfolio"])
+
+_SUMMARY = DTOSerializer(PortfolioSummaryDTO, PortfolioSummaryResponse)
+
+
+@portfolio_router.get(
+    "/summary",
+    response_model=PortfolioSummaryResponse,
+    dependencies=[Depends(portfolio_etag)],
+    responses=negotiated_responses(),
+)
+async def get_portfolio_summary(
+    render: RenderDep,
+    user_dto: CurrentUserDep,
+    use_case: Annotated[
+        GetPortfolioSummaryUseCase, Depends(get_portfolio_summary_use_case)
+    ],
+    max_points: Annotated[
+        int, Query(ge=3, le=5000, description="Upper bound on equity points.")
+    ] = DEFAULT_MAX_POINTS,
+):
+    """
+    Returns everything the dashboard shows in one response.
+
+    - Holdings with their bond terms
+    - Income of the current month per holding
+    - Quantity, face value and month income per series
+    - Equity curve downsampled to at most max_points with LTTB
+    """
+    dto = await use_case.execute(
+        user=user_dto, target_date=date.today(), max_points=max_points
+    )
+    return render(_SUMMARY, dto)
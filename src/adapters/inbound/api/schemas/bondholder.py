@@ -21,3 +21,33 @@ class BondHolderChangeRequest(BaseModel):
 class BondHolderCreateRequest(BondBase):
     quantity: int = Field(..., gt=0, description="Number of bonds")
     purchase_date: date
+
+
+class BondHolderChangesResponse(BaseModel):
+    watermark: datetime
+    inserted: list[BondHolderResponse]
+    updated: list[BondHolderResponse]
+    deleted: list[UUID]
+    full_resync: bool = Field(
+        False, description="Watermark is too old, re-download the full list"
+    )
+
+
+BATCH_MAX_ITEMS = 500
+
+
+class BondHolderQuantityChange(BaseModel):
+    id: UUID
+    new_quantity: int = Field(..., gt=0, description="New quantity")
+
+
+class BondHolderBatchRequest(BaseModel):
+    quantity_changes: list[BondHolderQuantityChange] = Field(
+        default_factory=list, max_length=BATCH_MAX_ITEMS
+    )
+    deletions: list[UUID] = Field(default_factory=list, max_length=BATCH_MAX_ITEMS)
+
+
+class BondHolderBatchResponse(BaseModel):
+    updated: list[BondHolderResponse]
+    deleted: list[UUID]
@@ -1,3 +1,4 @@
+from datetime import date
 from decimal import Decimal
 from uuid import UUID
 from pydantic import BaseModel
@@ -5,3 +6,29 @@ from pydantic import BaseModel
 
 class MonthIncomeResponse(BaseModel):
     data: dict[UUID, Decimal]
+
+
+class HoldingYieldResponse(BaseModel):
+    bondholder_id: UUID
+    series: str
+    irr: Decimal | None
+
+
+class YieldResponse(BaseModel):
+    holdings: list[HoldingYieldResponse]
+    portfolio_irr: Decimal | None
+
+
+class IncomeBandResponse(BaseModel):
+    month: date
+    p5: Decimal
+    p25: Decimal
+    p50: Decimal
+    p75: Decimal
+    p95: Decimal
+
+
+class StressTestResponse(BaseModel):
+    base_rate: Decimal
+    paths: int
+    bands: list[IncomeBandResponse]
@@ -1,8 +1,19 @@
-
 from datetime import date
 from decimal import Decimal
+from uuid import UUID
 from pydantic import BaseModel
 
 
 class EquityResponse(BaseModel):
     equity: list[tuple[date, Decimal]]
+
+
+class UpcomingPaymentResponse(BaseModel):
+    payment_date: date
+    bondholder_id: UUID
+    series: str
+    amount: Decimal | None
+
+
+class UpcomingPaymentsResponse(BaseModel):
+    payments: list[UpcomingPaymentResponse]
@@ -0,0 +1,17 @@
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class RateChangedEvent(BaseModel):
+    value: Decimal
+    effective_date: date
+
+
+class PortfolioRevaluedEvent(BaseModel):
+    as_of: date
+    equity: Decimal
+    monthly_income: Decimal
+    equity_delta: Decimal
+    monthly_income_delta: Decimal
@@ -0,0 +1,20 @@
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+from pydantic import BaseModel
+
+from src.adapters.inbound.api.schemas.bondholder import BondHolderResponse
+
+
+class SeriesTotalsResponse(BaseModel):
+    series: str
+    quantity: int
+    face_value: Decimal
+    month_income: Decimal | None
+
+
+class PortfolioSummaryResponse(BaseModel):
+    holdings: list[BondHolderResponse]
+    month_income: dict[UUID, Decimal]
+    totals: list[SeriesTotalsResponse]
+    equity: list[tuple[date, Decimal]]
@@ -0,0 +1,189 @@
+from collections.abc import Mapping
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin, get_type_hints
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import CoreSchema, SchemaSerializer, core_schema
+from starlette import status
+
+from src.adapters.inbound.api import msgpack_codec
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+ACCEPT_HEADER = "Accept"
+
+_MSGPACK_MEDIA_TYPES = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack"})
+_JSON_MEDIA_RANGES = frozenset({JSON_MEDIA_TYPE, "application/*", "*/*"})
+
+# Schemas expose money and rates as floats while DTOs carry Decimals.
+_AS_FLOAT = core_schema.any_schema(
+    serialization=core_schema.plain_serializer_function_ser_schema(
+        float, return_schema=core_schema.float_schema()
+    )
+)
+
+
+class DTOSerializer:
+    """
+    Serializes DTOs straight to JSON or MessagePack in the shape of a
+    response schema.
+
+    Building a response model, or returning a DTO against ``response_model``,
+    makes FastAPI validate every field before encoding it, although the data
+    comes from our own use cases. The serializer is built once from the
+    schema's fields and reads the DTO attributes directly, producing the same
+    JSON without a validation pass. Passing the schema itself as ``dto_type``
+    serializes instances of the response model instead.
+
+    Args:
+        dto_type: Dataclass returned by the use case
+        schema: Response model the output must match
+        many: Serialize a list of DTOs instead of a single one
+        attributes: DTO attribute of each schema field named differently
+    """
+
+    def __init__(
+        self,
+        dto_type: type,
+        schema: type[BaseModel],
+        many: bool = False,
+        attributes: Mapping[str, str] | None = None,
+    ) -> None:
+        if dto_type is schema:
+            serialization = schema.__pydantic_core_schema__
+        else:
+            serialization = _dataclass_schema(dto_type, schema, attributes or {})
+        if many:
+            serialization = core_schema.list_schema(serialization)
+        self._serializer = SchemaSerializer(serialization)
+
+    def to_json(self, value: Any) -> bytes:
+        return self._serializer.to_json(value, by_alias=True)
+
+    def to_msgpack(self, value: Any) -> bytes:
+        return msgpack_codec.packb(self._serializer.to_python(value, by_alias=True))
+
+    def response(
+        self,
+        value: Any,
+        response: Response | None = None,
+        status_code: int = status.HTTP_200_OK,
+        media_type: str = JSON_MEDIA_TYPE,
+    ) -> Response:
+        """
+        Build a response of ``value``.
+
+        Args:
+            value: DTO, or list of DTOs, to serialize
+            response: Response injected into the endpoint, whose headers (set
+                by the endpoint or its dependencies) are carried over
+            status_code: Status of the response
+            media_type: JSON_MEDIA_TYPE or MSGPACK_MEDIA_TYPE
+
+        Returns:
+            Response FastAPI sends as is
+        """
+        if media_type == MSGPACK_MEDIA_TYPE:
+            content = self.to_msgpack(value)
+        else:
+            content = self.to_json(value)
+        rendered = Response(
+            content=content, status_code=status_code, media_type=media_type
+        )
+        if response is not None:
+            rendered.headers.raw.extend(response.headers.raw)
+        return rendered
+
+
+def negotiate_media_type(accept: str | None) -> str:
+    """
+    Pick the representation of a response from an ``Accept`` header.
+
+    MessagePack is chosen when the client lists it with a quality at least as
+    high as JSON's; anything else, including no header, gets JSON.
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+    json_quality = msgpack_quality = 0.0
+    for media_range in accept.split(","):
+        media_type, *params = media_range.split(";")
+        media_type = media_type.strip().lower()
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type in _MSGPACK_MEDIA_TYPES:
+            msgpack_quality = max(msgpack_quality, quality)
+        elif media_type in _JSON_MEDIA_RANGES:
+            json_quality = max(json_quality, quality)
+    if msgpack_quality > 0 and msgpack_quality >= json_quality:
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def negotiated_responses(
+    status_code: int = status.HTTP_200_OK,
+) -> dict[int | str, dict[str, Any]]:
+    """OpenAPI ``responses`` documenting the MessagePack alternative to JSON."""
+    return {
+        status_code: {
+            "content": {
+                MSGPACK_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}}
+            },
+            "description": (
+                f"JSON by default; {MSGPACK_MEDIA_TYPE} when requested with "
+                "Accept. MessagePack uses extension types for decimals (1), "
+                "dates (2) and UUIDs (3), and timestamps for datetimes."
+            ),
+        }
+    }
+
+
+def _dataclass_schema(
+    dto_type: type, schema: type[BaseModel], attributes: Mapping[str, str]
+) -> CoreSchema:
+    """Serialization schema reading the schema's fields, in order, from a DTO."""
+    hints = get_type_hints(dto_type)
+    fields = [
+        core_schema.dataclass_field(
+            attributes.get(name, name),
+            _field_schema(field.annotation, hints[attributes.get(name, name)]),
+            serialization_alias=name if name in attributes else None,
+        )
+        for name, field in schema.model_fields.items()
+    ]
+    return core_schema.dataclass_schema(
+        dto_type,
+        core_schema.dataclass_args_schema(dto_type.__name__, fields),
+        [field["name"] for field in fields],
+        slots=hasattr(dto_type, "__slots__"),
+    )
+
+
+def _field_schema(annotation: Any, dto_annotation: Any) -> CoreSchema:
+    if annotation is float:
+        return _AS_FLOAT
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _dataclass_schema(dto_annotation, annotation, {})
+    origin = get_origin(annotation)
+    if origin is list:
+        (item,) = get_args(annotation)
+        (dto_item,) = get_args(dto_annotation)
+        return core_schema.list_schema(_field_schema(item, dto_item))
+    if origin in (Union, UnionType) and NoneType in get_args(annotation):
+        return core_schema.nullable_schema(
+            _field_schema(_non_null(annotation), _non_null(dto_annotation))
+        )
+    return TypeAdapter(annotation).core_schema
+
+
+def _non_null(annotation: Any) -> Any:
+    if get_origin(annotation) not in (Union, UnionType):
+        return annotation
+    args = [arg for arg in get_args(annotation) if arg is not NoneType]
+    return args[0] if len(args) == 1 else annotation
@@ -1,20 +1,54 @@
 import logging
+from datetime import timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.config import Config, get_config
-from src.adapters.outbound.database.engine import get_session
+from src.adapters.outbound.database.engine import (
+    dispose_engine,
+    get_session,
+    get_session_maker,
+)
 from src.adapters.outbound.external_services.nbp.fetcher import NBPXMLFetcher
 from src.adapters.outbound.external_services.nbp.nbp_data_provider import (
     NBPDataProvider,
 )
 from src.adapters.outbound.external_services.nbp.parser import NBPXMLParser
+from src.adapters.outbound.idempotency.postgres_idempotency_store import (
+    PostgresIdempotencyStore,
+)
+from src.adapters.outbound.live_updates.postgres_live_updates import (
+    PostgresLiveUpdatePublisher,
+)
+from src.adapters.outbound.rate_limiter.postgres_rate_limiter import (
+    PostgresRateLimiter,
+)
+from src.adapters.outbound.repositories.bond import SQLAlchemyBondRepository
+from src.adapters.outbound.repositories.bondholder import (
+    SQLAlchemyBondHolderRepository,
+)
+from src.adapters.outbound.repositories.portfolio_snapshot import (
+    SQLAlchemyPortfolioSnapshotRepository,
+)
 from src.adapters.outbound.repositories.reference_rate import (
     SQLAlchemyReferenceRateRepository,
 )
+from src.application.use_cases.bondholder.bh_changes import (
+    PurgeBondHolderTombstonesUseCase,
+)
+from src.application.use_cases.data.portfolio_snapshot import (
+    RefreshPortfolioSnapshotUseCase,
+    RefreshStalePortfolioSnapshotsUseCase,
+    RevaluePortfolioSnapshotsUseCase,
+)
 from src.application.use_cases.reference_rate.update import UpdateReferenceRateUseCase
 from src.domain.ports.repositories.reference_rate import ReferenceRateRepository
+from src.domain.ports.services.idempotency_store import IdempotencyStore
+from src.domain.ports.services.live_update_publisher import LiveUpdatePublisher
+from src.domain.ports.services.rate_limiter import RateLimiter
 from src.domain.ports.services.reference_rate_provider import ReferenceRateProvider
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.services.portfolio_valuation import PortfolioValuationService
 
 logger = logging.getLogger(__name__)
 
@@ -70,15 +104,86 @@ class SchedulerContainer:
         provider = self.get_nbp_provider()
 
         use_case = UpdateReferenceRateUseCase(
-            reference_rate_repo=repository, rate_provider=provider
+            reference_rate_repo=repository,
+            rate_provider=provider,
+            update_publisher=self.get_live_update_publisher(),
         )
 
         logger.debug("Created UpdateReferenceRateUseCase with all dependencies")
         return use_case
 
+    async def get_purge_tombstones_use_case(
+        self,
+    ) -> PurgeBondHolderTombstonesUseCase:
+        repository = SQLAlchemyBondHolderRepository(session=await self._get_session())
+        retention = timedelta(days=self.get_config().TOMBSTONE_RETENTION_DAYS)
+
+        use_case = PurgeBondHolderTombstonesUseCase(
+            bondholder_repo=repository, tombstone_retention=retention
+        )
+
+        logger.debug("Created PurgeBondHolderTombstonesUseCase with all dependencies")
+        return use_case
+
+    def _get_refresh_portfolio_snapshot_use_case(
+        self, session: AsyncSession
+    ) -> RefreshPortfolioSnapshotUseCase:
+        return RefreshPortfolioSnapshotUseCase(
+            bondholder_repo=SQLAlchemyBondHolderRepository(session=session),
+            bond_repo=SQLAlchemyBondRepository(session=session),
+            reference_rate_repo=self.get_reference_rate_repository(session),
+            snapshot_repo=SQLAlchemyPortfolioSnapshotRepository(session=session),
+            valuation_service=PortfolioValuationService(BondHolderIncomeCalculator()),
+            update_publisher=self.get_live_update_publisher(),
+        )
+
+    async def get_refresh_portfolio_snapshots_use_case(
+        self,
+    ) -> RefreshStalePortfolioSnapshotsUseCase:
+        session = await self._get_session()
+        use_case = RefreshStalePortfolioSnapshotsUseCase(
+            snapshot_repo=SQLAlchemyPortfolioSnapshotRepository(session=session),
+            refresh_use_case=self._get_refresh_portfolio_snapshot_use_case(session),
+        )
+
+        logger.debug(
+            "Created RefreshStalePortfolioSnapshotsUseCase with all dependencies"
+        )
+        return use_case
+
+    async def get_revalue_portfolio_snapshots_use_case(
+        self,
+    ) -> RevaluePortfolioSnapshotsUseCase:
+        session = await self._get_session()
+        use_case = RevaluePortfolioSnapshotsUseCase(
+            snapshot_repo=SQLAlchemyPortfolioSnapshotRepository(session=session),
+            refresh_use_case=self._get_refresh_portfolio_snapshot_use_case(session),
+        )
+
+        logger.debug("Created RevaluePortfolioSnapshotsUseCase with all dependencies")
+        return use_case
+
+    def get_live_update_publisher(self) -> LiveUpdatePublisher:
+        return PostgresLiveUpdatePublisher(
+            session_maker=get_session_maker(),
+            channel=self.get_config().LIVE_UPDATES_CHANNEL,
+        )
+
+    @staticmethod
+    def get_idempotency_store() -> IdempotencyStore:
+        # Only purges expired records, so it never decodes a result.
+        return PostgresIdempotencyStore(
+            session_maker=get_session_maker(), result_types={}
+        )
+
+    @staticmethod
+    def get_rate_limiter() -> RateLimiter:
+        return PostgresRateLimiter(session_maker=get_session_maker())
+
     async def cleanup(self) -> None:
         if self._nbp_fetcher:
             await self._nbp_fetcher.close()
             logger.info("Closed NBP fetcher HTTP client")
+        await dispose_engine()
 
         logger.info("Scheduler DI Container cleaned up")
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import signal
 import sys
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, time, timedelta
 
 from src.adapters.inbound.scheduler.apscheduler import APScheduler
 from src.adapters.inbound.scheduler.scheduler_container import SchedulerContainer
@@ -39,8 +39,44 @@ async def main():
                 ),
             },
         )
+        if result.rate_changed and snapshots_enabled:
+            revalue = await container.get_revalue_portfolio_snapshots_use_case()
+            revalued = await revalue.execute(
+                from_date=result.effective_date, today=date.today()
+            )
+            logger.info(f"Revalued portfolios of {revalued} users")
         return result
 
+    async def purge_bondholder_tombstones_task():
+        """Drop deletion tombstones older than the delta sync retention."""
+        use_case = await container.get_purge_tombstones_use_case()
+        purged = await use_case.execute(now=datetime.now(UTC))
+        logger.info(f"Purged {purged} bondholder tombstones")
+        return purged
+
+    async def purge_idempotency_records_task():
+        """Drop expired idempotency claims and results."""
+        store = container.get_idempotency_store()
+        purged = await store.purge_expired(now=datetime.now(UTC))
+        logger.info(f"Purged {purged} idempotency records")
+        return purged
+
+    async def purge_rate_limit_buckets_task():
+        """Drop login rate limit buckets left unused for a day."""
+        limiter = container.get_rate_limiter()
+        purged = await limiter.purge_idle(
+            idle_since=datetime.now(UTC) - timedelta(days=1)
+        )
+        logger.info(f"Purged {purged} rate limit buckets")
+        return purged
+
+    async def refresh_portfolio_snapshots_task():
+        """Extend daily portfolio snapshots of every user up to today."""
+        use_case = await container.get_refresh_portfolio_snapshots_use_case()
+        refreshed = await use_case.execute(today=date.today())
+        logger.info(f"Refreshed portfolio snapshots of {refreshed} users")
+        return refreshed
+
     logger.info("=" * 60)
     logger.info("Starting Scheduler Worker")
     logger.info("=" * 60)
@@ -51,6 +87,11 @@ async def main():
     container = SchedulerContainer()
     logger.info("✅ DI Container initialized")
 
+    # Snapshots are only kept current by holding changes with the snapshot
+    # backend; other backends never read them, and revaluing them would
+    # announce deltas against stale baselines.
+    snapshots_enabled = container.get_config().EQUITY_HISTORY_BACKEND == "snapshot"
+
     scheduler = APScheduler(container=container)
 
     scheduler.schedule_every_n_days(
@@ -59,6 +100,37 @@ async def main():
         task_id="nbp_reference_rate_updater",
     )
 
+    scheduler.schedule_every_n_days(
+        use_case_factory=purge_bondholder_tombstones_task,
+        days=1,
+        task_id="bondholder_tombstone_purge",
+        run_time=time(3, 0),
+    )
+
+    if snapshots_enabled:
+        scheduler.schedule_every_n_days(
+            use_case_factory=refresh_portfolio_snapshots_task,
+            days=1,
+            task_id="portfolio_snapshot_refresh",
+            run_time=time(0, 30),
+        )
+
+    if container.get_config().IDEMPOTENCY_BACKEND == "postgres":
+        scheduler.schedule_every_n_days(
+            use_case_factory=purge_idempotency_records_task,
+            days=1,
+            task_id="idempotency_record_purge",
+            run_time=time(3, 15),
+        )
+
+    if container.get_config().LOGIN_RATE_LIMIT_BACKEND == "postgres":
+        scheduler.schedule_every_n_days(
+            use_case_factory=purge_rate_limit_buckets_task,
+            days=1,
+            task_id="rate_limit_bucket_purge",
+            run_time=time(3, 30),
+        )
+
     scheduler.add_job(
         func=health_check_task,
         trigger="interval",
@@ -1,20 +1,76 @@
+import asyncio
+import logging
 from collections.abc import AsyncGenerator
-from typing import Optional
+from typing import Any, Optional
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from src.adapters.config import get_config
+from src.adapters.config import Config, get_config
+from src.adapters.outbound.database.replicas import ReplicaRouter
+from src.application.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
 
 _engine: Optional[AsyncEngine] = None
 _session_maker: Optional[sessionmaker] = None
+_replica_router: ReplicaRouter | None = None
+
+
+def engine_options(config: Config) -> dict[str, Any]:
+    """
+    Keyword arguments of ``create_async_engine`` for the DB_* settings.
+
+    Under DB_PGBOUNCER, statements are not cached and get unique names, as a
+    transaction-pooled server connection may differ from one query to the
+    next. The statement timeout is set per connection at startup, which
+    PgBouncer forwards only when told to via ``ignore_startup_parameters``
+    or ``track_extra_parameters``.
+    """
+    statement_cache_size = config.DB_STATEMENT_CACHE_SIZE
+    if statement_cache_size is None:
+        statement_cache_size = 0 if config.DB_PGBOUNCER else 100
+    connect_args: dict[str, Any] = {
+        "timeout": config.DB_CONNECT_TIMEOUT_SECONDS,
+        # asyncpg's own cache, and SQLAlchemy's one on top of it.
+        "statement_cache_size": statement_cache_size,
+        "prepared_statement_cache_size": statement_cache_size,
+    }
+    if config.DB_PGBOUNCER:
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+    if config.DB_STATEMENT_TIMEOUT_MS is not None:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(config.DB_STATEMENT_TIMEOUT_MS)
+        }
+    return {
+        "echo": False,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": config.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+
+def _count_connects(dbapi_connection: Any, connection_record: Any) -> None:
+    get_metrics().increment("database_pool.connects")
 
 
 def get_engine() -> AsyncEngine:
     global _engine
     if _engine is None:
         config = get_config()
-        _engine = create_async_engine(config.database_app_url, echo=False, future=True)
+        _engine = create_async_engine(config.database_app_url, **engine_options(config))
+        event.listen(_engine.sync_engine, "connect", _count_connects)
     return _engine
 
 
@@ -31,7 +87,87 @@ def get_session_maker() -> sessionmaker:
     return _session_maker
 
 
+def get_replica_router() -> ReplicaRouter | None:
+    """
+    Router over the DB_REPLICA_URLS replicas, None if there are none.
+
+    A replica session reads one snapshot for the whole request, so pages and
+    totals agree even while replication moves on.
+    """
+    global _replica_router
+    config = get_config()
+    if _replica_router is None and config.DB_REPLICA_URLS:
+        options = engine_options(config)
+        engines = [
+            create_async_engine(url, isolation_level="REPEATABLE READ", **options)
+            for url in config.DB_REPLICA_URLS
+        ]
+        for engine in engines:
+            event.listen(engine.sync_engine, "connect", _count_connects)
+        _replica_router = ReplicaRouter(
+            engines,
+            max_lag=config.DB_REPLICA_MAX_LAG_SECONDS,
+            check_interval=config.DB_REPLICA_LAG_CHECK_SECONDS,
+        )
+    return _replica_router
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     session_maker = get_session_maker()
     async with session_maker() as async_session:
         yield async_session
+
+
+async def warm_up_pool(connections: int) -> int:
+    """
+    Open pool connections ahead of the first requests.
+
+    The connections are checked out together, so each is a distinct one,
+    and then returned to the pool. Failures are only logged: the pool
+    then connects on demand as it would have anyway.
+
+    Returns:
+        Number of connections opened
+    """
+    if connections <= 0:
+        return 0
+    engine = get_engine()
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    opened = [conn for conn in results if isinstance(conn, AsyncConnection)]
+    await asyncio.gather(*(conn.close() for conn in opened))
+    if len(opened) < connections:
+        failure = next(r for r in results if isinstance(r, BaseException))
+        logger.warning("Database pool warm-up failed", exc_info=failure)
+    return len(opened)
+
+
+def pool_stats() -> dict[str, int]:
+    """Connections of the worker's pool: idle, in use and beyond its size."""
+    if _engine is None or not isinstance(_engine.pool, QueuePool):
+        return {}
+    pool = _engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+    }
+
+
+def replica_stats() -> dict[str, float | None]:
+    """Seconds each replica is behind as last measured, None if unknown."""
+    if _replica_router is None:
+        return {}
+    return _replica_router.stats()
+
+
+async def dispose_engine() -> None:
+    global _engine, _session_maker, _replica_router
+    if _engine is not None:
+        await _engine.dispose()
+    if _replica_router is not None:
+        await _replica_router.dispose()
+    _engine, _session_maker, _replica_router = None, None, None
@@ -0,0 +1,39 @@
+"""Add portfolio snapshot table
+
+Revision ID: a7c4e91f3d58
+Revises: f1b3d85e2c49
+Create Date: 2026-10-19 18:05:32.118604
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c4e91f3d58"
+down_revision: Union[str, Sequence[str], None] = "f1b3d85e2c49"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "portfoliosnapshot",
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("snapshot_date", sa.Date(), nullable=False),
+        sa.Column("face_value", sa.Numeric(), nullable=False),
+        sa.Column("accrued_interest", sa.Numeric(), nullable=False),
+        sa.Column("monthly_income", sa.Numeric(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "user_id", "snapshot_date", name=op.f("pk_portfoliosnapshot")
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("portfoliosnapshot")
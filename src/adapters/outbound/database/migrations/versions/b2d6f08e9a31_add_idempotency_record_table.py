@@ -0,0 +1,42 @@
+"""Add idempotency record table
+
+Revision ID: b2d6f08e9a31
+Revises: a7c4e91f3d58
+Create Date: 2026-10-19 19:12:47.530218
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d6f08e9a31"
+down_revision: Union[str, Sequence[str], None] = "a7c4e91f3d58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "idempotencyrecord",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("fingerprint", sa.String(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("result", sa.LargeBinary(), nullable=True),
+        sa.PrimaryKeyConstraint("key", name=op.f("pk_idempotencyrecord")),
+    )
+    op.create_index(
+        "ix_idempotencyrecord_expires_at",
+        "idempotencyrecord",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_idempotencyrecord_expires_at", table_name="idempotencyrecord")
+    op.drop_table("idempotencyrecord")
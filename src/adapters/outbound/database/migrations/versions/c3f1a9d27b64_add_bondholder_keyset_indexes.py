@@ -0,0 +1,48 @@
+"""Add bondholder keyset pagination indexes
+
+Revision ID: c3f1a9d27b64
+Revises: a4d468b4e4f2
+Create Date: 2026-10-19 09:12:41.203518
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f1a9d27b64"
+down_revision: Union[str, Sequence[str], None] = "a4d468b4e4f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_bondholder_user_id_purchase_date_id",
+        "bondholder",
+        ["user_id", "purchase_date", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_bondholder_user_id_quantity_id",
+        "bondholder",
+        ["user_id", "quantity", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_bond_series_pattern",
+        "bond",
+        ["series"],
+        unique=False,
+        postgresql_ops={"series": "varchar_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_bond_series_pattern", table_name="bond")
+    op.drop_index("ix_bondholder_user_id_quantity_id", table_name="bondholder")
+    op.drop_index("ix_bondholder_user_id_purchase_date_id", table_name="bondholder")
@@ -0,0 +1,42 @@
+"""Add rate limit bucket table
+
+Revision ID: c6e8a1f4b297
+Revises: b2d6f08e9a31
+Create Date: 2026-10-19 21:04:18.226941
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c6e8a1f4b297"
+down_revision: Union[str, Sequence[str], None] = "b2d6f08e9a31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "ratelimitbucket",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("tokens", sa.Double(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("key", name=op.f("pk_ratelimitbucket")),
+        prefixes=["UNLOGGED"],
+    )
+    op.create_index(
+        "ix_ratelimitbucket_updated_at",
+        "ratelimitbucket",
+        ["updated_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_ratelimitbucket_updated_at", table_name="ratelimitbucket")
+    op.drop_table("ratelimitbucket")
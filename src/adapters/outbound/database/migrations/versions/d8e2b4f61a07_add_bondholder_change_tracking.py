@@ -0,0 +1,73 @@
+"""Add bondholder change tracking for delta sync
+
+Revision ID: d8e2b4f61a07
+Revises: c3f1a9d27b64
+Create Date: 2026-10-19 13:40:05.118224
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d8e2b4f61a07"
+down_revision: Union[str, Sequence[str], None] = "c3f1a9d27b64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "bondholder",
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_bondholder_user_id_created_at",
+        "bondholder",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_bondholder_user_id_last_update",
+        "bondholder",
+        ["user_id", "last_update"],
+        unique=False,
+    )
+    op.create_table(
+        "bondholdertombstone",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_bondholdertombstone")),
+    )
+    op.create_index(
+        "ix_bondholdertombstone_user_id_deleted_at",
+        "bondholdertombstone",
+        ["user_id", "deleted_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_bondholdertombstone_user_id_deleted_at", table_name="bondholdertombstone"
+    )
+    op.drop_table("bondholdertombstone")
+    op.drop_index("ix_bondholder_user_id_last_update", table_name="bondholder")
+    op.drop_index("ix_bondholder_user_id_created_at", table_name="bondholder")
+    op.drop_column("bondholder", "created_at")
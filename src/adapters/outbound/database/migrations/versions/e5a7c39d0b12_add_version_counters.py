@@ -0,0 +1,34 @@
+"""Add version counters
+
+Revision ID: e5a7c39d0b12
+Revises: d8e2b4f61a07
+Create Date: 2026-10-19 15:02:47.530918
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a7c39d0b12"
+down_revision: Union[str, Sequence[str], None] = "d8e2b4f61a07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "versioncounter",
+        sa.Column("scope", sa.String(), nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", name=op.f("pk_versioncounter")),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("versioncounter")
@@ -0,0 +1,53 @@
+"""Add unlogged result cache table
+
+Revision ID: f1b3d85e2c49
+Revises: e5a7c39d0b12
+Create Date: 2026-10-19 16:21:10.774301
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f1b3d85e2c49"
+down_revision: Union[str, Sequence[str], None] = "e5a7c39d0b12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "resultcacheentry",
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("value", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "accessed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("key", name=op.f("pk_resultcacheentry")),
+        prefixes=["UNLOGGED"],
+    )
+    op.create_index(
+        "ix_resultcacheentry_user_id", "resultcacheentry", ["user_id"], unique=False
+    )
+    op.create_index(
+        "ix_resultcacheentry_accessed_at",
+        "resultcacheentry",
+        ["accessed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_resultcacheentry_accessed_at", table_name="resultcacheentry")
+    op.drop_index("ix_resultcacheentry_user_id", table_name="resultcacheentry")
+    op.drop_table("resultcacheentry")
@@ -2,7 +2,15 @@ from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy import (
+    DateTime,
+    Double,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    func,
+)
 from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column
 
 from src.adapters.outbound.database.base import Base
@@ -16,6 +24,14 @@ class User(MappedAsDataclass, Base):
 
 
 class Bond(MappedAsDataclass, Base):
+    __table_args__ = (
+        Index(
+            "ix_bond_series_pattern",
+            "series",
+            postgresql_ops={"series": "varchar_pattern_ops"},
+        ),
+    )
+
     id: Mapped[UUID] = mapped_column(primary_key=True)
     nominal_value: Mapped[Decimal]
     series: Mapped[str] = mapped_column(unique=True, index=True)
@@ -26,6 +42,15 @@ class Bond(MappedAsDataclass, Base):
 
 
 class BondHolder(MappedAsDataclass, Base):
+    __table_args__ = (
+        Index(
+            "ix_bondholder_user_id_purchase_date_id", "user_id", "purchase_date", "id"
+        ),
+        Index("ix_bondholder_user_id_quantity_id", "user_id", "quantity", "id"),
+        Index("ix_bondholder_user_id_created_at", "user_id", "created_at"),
+        Index("ix_bondholder_user_id_last_update", "user_id", "last_update"),
+    )
+
     id: Mapped[UUID] = mapped_column(primary_key=True)
     user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"))
     bond_id: Mapped[UUID] = mapped_column(ForeignKey("bond.id"))
@@ -34,6 +59,23 @@ class BondHolder(MappedAsDataclass, Base):
     last_update: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), onupdate=func.now()
     )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), init=False
+    )
+
+
+class BondHolderTombstone(MappedAsDataclass, Base):
+    """Marks a hard-deleted bondholder so delta sync can report the deletion."""
+
+    __table_args__ = (
+        Index("ix_bondholdertombstone_user_id_deleted_at", "user_id", "deleted_at"),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    user_id: Mapped[UUID]
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), init=False
+    )
 
 
 class ReferenceRate(MappedAsDataclass, Base):
@@ -41,3 +83,61 @@ class ReferenceRate(MappedAsDataclass, Base):
     value: Mapped[Decimal]
     start_date: Mapped[date]
     end_date: Mapped[date | None] = mapped_column(nullable=True)
+
+
+class VersionCounter(MappedAsDataclass, Base):
+    """Monotonic change counter of one data scope, see repositories.version."""
+
+    scope: Mapped[str] = mapped_column(primary_key=True)
+    value: Mapped[int]
+
+
+class ResultCacheEntry(MappedAsDataclass, Base):
+    """Shared result cache entry, see result_cache.postgres_result_cache."""
+
+    __table_args__ = (
+        Index("ix_resultcacheentry_user_id", "user_id"),
+        Index("ix_resultcacheentry_accessed_at", "accessed_at"),
+        {"prefixes": ["UNLOGGED"]},
+    )
+
+    key: Mapped[str] = mapped_column(primary_key=True)
+    user_id: Mapped[UUID]
+    value: Mapped[bytes] = mapped_column(LargeBinary)
+    accessed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), init=False
+    )
+
+
+class IdempotencyRecord(MappedAsDataclass, Base):
+    """Request recorded under an idempotency key, see idempotency.postgres."""
+
+    __table_args__ = (Index("ix_idempotencyrecord_expires_at", "expires_at"),)
+
+    key: Mapped[str] = mapped_column(primary_key=True)
+    fingerprint: Mapped[str]
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    result: Mapped[bytes | None] = mapped_column(LargeBinary, default=None)
+
+
+class RateLimitBucket(MappedAsDataclass, Base):
+    """Shared token bucket, see rate_limiter.postgres_rate_limiter."""
+
+    __table_args__ = (
+        Index("ix_ratelimitbucket_updated_at", "updated_at"),
+        {"prefixes": ["UNLOGGED"]},
+    )
+
+    key: Mapped[str] = mapped_column(primary_key=True)
+    tokens: Mapped[float] = mapped_column(Double)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class PortfolioSnapshot(MappedAsDataclass, Base):
+    """Daily valuation read model, see repositories.portfolio_snapshot."""
+
+    user_id: Mapped[UUID] = mapped_column(primary_key=True)
+    snapshot_date: Mapped[date] = mapped_column(primary_key=True)
+    face_value: Mapped[Decimal]
+    accrued_interest: Mapped[Decimal]
+    monthly_income: Mapped[Decimal]
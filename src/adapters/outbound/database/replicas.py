@@ -0,0 +1,147 @@
+import asyncio
+import itertools
+import logging
+import math
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.application.metrics import Metrics, get_metrics
+
+logger = logging.getLogger(__name__)
+
+# Seconds the standby is behind, 0 when it has replayed all it received or
+# is not a standby at all; NULL before it replayed anything.
+_LAG_QUERY = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+    " END"
+)
+
+
+@dataclass(slots=True)
+class Replica:
+    """A read replica and its replication lag as last measured.
+
+    Args:
+        name (str): Address of the replica, without credentials, for logs.
+        engine (AsyncEngine): Engine connected to the replica.
+        session_maker (sessionmaker[AsyncSession]): Sessions on ``engine``.
+        lag (float): Seconds behind the primary; infinite until measured or
+            when unreachable.
+    """
+
+    name: str
+    engine: AsyncEngine
+    session_maker: sessionmaker[AsyncSession]
+    lag: float = math.inf
+
+
+class ReplicaRouter:
+    """
+    Spreads read-only sessions over replicas in turn.
+
+    Replicas more than ``max_lag`` seconds behind, or unreachable, are
+    skipped, and the caller falls back to the primary when none is left.
+    Lag is measured on all replicas at once, at most every
+    ``check_interval`` seconds, by the request that finds it outdated.
+
+    The metrics count reads sent to replicas and fallbacks to the primary.
+    """
+
+    PROBE_TIMEOUT = 1.0
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        max_lag: float,
+        check_interval: float,
+        metrics: Metrics | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.replicas: list[Replica] = [
+            Replica(
+                name=engine.url.render_as_string(hide_password=True),
+                engine=engine,
+                session_maker=sessionmaker(
+                    engine,
+                    expire_on_commit=False,
+                    autoflush=False,
+                    class_=AsyncSession,
+                ),
+            )
+            for engine in engines
+        ]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.metrics = metrics or get_metrics()
+        self._clock = clock
+        self._turn = itertools.count()
+        self._next_check = -math.inf
+        self._refreshing: asyncio.Task[None] | None = None
+
+    async def session_maker(self) -> sessionmaker[AsyncSession] | None:
+        """
+        Pick the replica to read from.
+
+        Returns:
+            Session maker of the next replica recent enough, or None if
+            reads must go to the primary
+        """
+        if self._clock() >= self._next_check:
+            await self.refresh()
+        healthy = [r for r in self.replicas if r.lag <= self.max_lag]
+        if not healthy:
+            self.metrics.increment("database_replica.fallbacks")
+            return None
+        self.metrics.increment("database_replica.reads")
+        return healthy[next(self._turn) % len(healthy)].session_maker
+
+    async def refresh(self) -> None:
+        """Measure the lag of every replica, joining a measurement under way."""
+        if self._refreshing is None:
+            self._next_check = self._clock() + self.check_interval
+            self._refreshing = asyncio.create_task(self._measure())
+            self._refreshing.add_done_callback(self._measured)
+        await asyncio.shield(self._refreshing)
+
+    def stats(self) -> dict[str, float | None]:
+        """Lag of each replica, None if unknown."""
+        return {r.name: r.lag if math.isfinite(r.lag) else None for r in self.replicas}
+
+    async def dispose(self) -> None:
+        await asyncio.gather(*(r.engine.dispose() for r in self.replicas))
+
+    async def _measure(self) -> None:
+        lags = await asyncio.gather(*(self._probe(r) for r in self.replicas))
+        for replica, lag in zip(self.replicas, lags, strict=True):
+            if lag > self.max_lag >= replica.lag:
+                logger.warning(
+                    "Replica behind, reading from others",
+                    extra={"replica": replica.name, "lag": lag},
+                )
+            replica.lag = lag
+
+    def _measured(self, task: asyncio.Task[None]) -> None:
+        self._refreshing = None
+
+    async def _probe(self, replica: Replica) -> float:
+        try:
+            async with asyncio.timeout(self.PROBE_TIMEOUT):
+                async with replica.engine.connect() as conn:
+                    lag = await conn.scalar(_LAG_QUERY)
+        except (SQLAlchemyError, OSError, TimeoutError):
+            logger.warning(
+                "Replica lag check failed",
+                extra={"replica": replica.name},
+                exc_info=True,
+            )
+            return math.inf
+        return math.inf if lag is None else float(lag)
@@ -0,0 +1,90 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from src.domain.ports.services.idempotency_store import IdempotencyStore
+from src.domain.value_objects.idempotency import IdempotencyKey, IdempotencyRecord
+
+
+@dataclass(slots=True)
+class _Entry:
+    fingerprint: str
+    expires_at: datetime
+    completed: bool = False
+    result: Any = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def record(self) -> IdempotencyRecord:
+        return IdempotencyRecord(
+            fingerprint=self.fingerprint, completed=self.completed, result=self.result
+        )
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """
+    Per-process store, for development and single-worker deployments.
+
+    Duplicates are only recognised when they reach the worker that saw the
+    first request. Waiters are woken as soon as the request finishes.
+    """
+
+    # Expired entries are dropped by a sweep every N claims.
+    SWEEP_EVERY = 256
+
+    def __init__(self) -> None:
+        self._entries: dict[IdempotencyKey, _Entry] = {}
+        self._claims_since_sweep: int = 0
+
+    async def claim(
+        self, key: IdempotencyKey, fingerprint: str, lease: timedelta
+    ) -> IdempotencyRecord | None:
+        now = datetime.now(UTC)
+        self._claims_since_sweep += 1
+        if self._claims_since_sweep >= self.SWEEP_EVERY:
+            await self.purge_expired(now)
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > now:
+            return entry.record()
+        if entry is not None:
+            entry.done.set()
+        self._entries[key] = _Entry(fingerprint=fingerprint, expires_at=now + lease)
+        return None
+
+    async def complete(self, key: IdempotencyKey, result: Any, ttl: timedelta) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry.completed = True
+        entry.result = result
+        entry.expires_at = datetime.now(UTC) + ttl
+        entry.done.set()
+
+    async def release(self, key: IdempotencyKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry.done.set()
+
+    async def wait(
+        self, key: IdempotencyKey, timeout: float
+    ) -> IdempotencyRecord | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        try:
+            await asyncio.wait_for(entry.done.wait(), timeout)
+        except TimeoutError:
+            return entry.record()
+        if self._entries.get(key) is not entry:
+            return None
+        return entry.record()
+
+    async def purge_expired(self, now: datetime) -> int:
+        expired = [k for k, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            self._entries.pop(key).done.set()
+        self._claims_since_sweep = 0
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.outbound.database.models import (
+    IdempotencyRecord as IdempotencyRecordModel,
+)
+from src.adapters.outbound.exceptions import SQLAlchemyRepositoryError
+from src.domain.ports.services.idempotency_store import IdempotencyStore
+from src.domain.value_objects.idempotency import IdempotencyKey, IdempotencyRecord
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresIdempotencyStore(IdempotencyStore):
+    """
+    Store shared by all workers through a table.
+
+    A claim is a row without a result; an expired row, whether a finished
+    request or the claim of a crashed one, is taken over by the next claim
+    in the same statement. Waiting polls the row with a growing interval.
+    Results are stored as JSON and decoded with the DTO type registered for
+    the key's operation.
+
+    Claiming fails loudly, as going ahead without it could duplicate the
+    request. Completing and releasing only log errors: the request is done
+    and its claim expires with the lease.
+    """
+
+    POLL_INTERVAL = 0.05
+    MAX_POLL_INTERVAL = 0.5
+
+    def __init__(
+        self,
+        session_maker: sessionmaker[AsyncSession],
+        result_types: Mapping[str, type],
+    ) -> None:
+        self._session_maker = session_maker
+        self._adapters: dict[str, TypeAdapter[Any]] = {
+            operation: TypeAdapter(result_type)
+            for operation, result_type in result_types.items()
+        }
+
+    async def claim(
+        self, key: IdempotencyKey, fingerprint: str, lease: timedelta
+    ) -> IdempotencyRecord | None:
+        stmt = insert(IdempotencyRecordModel).values(
+            key=str(key), fingerprint=fingerprint, expires_at=func.now() + lease
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IdempotencyRecordModel.key],
+            set_={
+                "fingerprint": stmt.excluded.fingerprint,
+                "expires_at": stmt.excluded.expires_at,
+                "result": None,
+            },
+            where=IdempotencyRecordModel.expires_at <= func.now(),
+        ).returning(IdempotencyRecordModel.key)
+        try:
+            async with self._session_maker() as session:
+                claimed = (await session.execute(stmt)).scalar_one_or_none()
+                await session.commit()
+                if claimed is not None:
+                    return None
+                record = await self._get(session, key)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to claim idempotency key") from e
+        # Expired and taken over by someone else between the two statements.
+        return record or IdempotencyRecord(fingerprint=fingerprint, completed=False)
+
+    async def complete(self, key: IdempotencyKey, result: Any, ttl: timedelta) -> None:
+        adapter = self._adapters.get(key.operation)
+        if adapter is None:
+            logger.warning("No result type registered for %r", key.operation)
+            return
+        stmt = (
+            update(IdempotencyRecordModel)
+            .where(IdempotencyRecordModel.key == str(key))
+            .values(result=adapter.dump_json(result), expires_at=func.now() + ttl)
+        )
+        try:
+            async with self._session_maker() as session:
+                await session.execute(stmt)
+                await session.commit()
+        except SQLAlchemyError:
+            logger.warning("Idempotency result write failed", exc_info=True)
+
+    async def release(self, key: IdempotencyKey) -> None:
+        stmt = delete(IdempotencyRecordModel).where(
+            IdempotencyRecordModel.key == str(key),
+            IdempotencyRecordModel.result.is_(None),
+        )
+        try:
+            async with self._session_maker() as session:
+                await session.execute(stmt)
+                await session.commit()
+        except SQLAlchemyError:
+            logger.warning("Idempotency claim release failed", exc_info=True)
+
+    async def wait(
+        self, key: IdempotencyKey, timeout: float
+    ) -> IdempotencyRecord | None:
+        deadline = time.monotonic() + timeout
+        interval = self.POLL_INTERVAL
+        while True:
+            try:
+                async with self._session_maker() as session:
+                    record = await self._get(session, key)
+            except SQLAlchemyError as e:
+                raise SQLAlchemyRepositoryError(
+                    "Failed to read idempotency record"
+                ) from e
+            remaining = deadline - time.monotonic()
+            if record is None or record.completed or remaining <= 0:
+                return record
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, self.MAX_POLL_INTERVAL)
+
+    async def purge_expired(self, now: datetime) -> int:
+        stmt = delete(IdempotencyRecordModel).where(
+            IdempotencyRecordModel.expires_at <= now
+        )
+        try:
+            async with self._session_maker() as session:
+                result = await session.execute(stmt)
+                await session.commit()
+                return result.rowcount
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError(
+                "Failed to purge idempotency records"
+            ) from e
+
+    async def _get(
+        self, session: AsyncSession, key: IdempotencyKey
+    ) -> IdempotencyRecord | None:
+        stmt = select(
+            IdempotencyRecordModel.fingerprint, IdempotencyRecordModel.result
+        ).where(
+            IdempotencyRecordModel.key == str(key),
+            IdempotencyRecordModel.expires_at > func.now(),
+        )
+        row = (await session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        if row.result is None:
+            return IdempotencyRecord(fingerprint=row.fingerprint, completed=False)
+        try:
+            result = self._adapters[key.operation].validate_json(row.result)
+        except (KeyError, ValidationError) as e:
+            raise SQLAlchemyRepositoryError(
+                "Stored idempotency result could not be decoded"
+            ) from e
+        return IdempotencyRecord(
+            fingerprint=row.fingerprint, completed=True, result=result
+        )
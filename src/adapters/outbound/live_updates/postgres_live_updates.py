@@ -0,0 +1,181 @@
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.application.metrics import Metrics, get_metrics
+from src.domain.ports.services.live_update_publisher import LiveUpdatePublisher
+from src.domain.value_objects.live_update import (
+    LiveUpdate,
+    PortfolioRevalued,
+    ReferenceRateChanged,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def encode_update(update: LiveUpdate) -> str:
+    """Encode an update as a NOTIFY payload."""
+    if isinstance(update, ReferenceRateChanged):
+        return json.dumps(
+            {
+                "type": "rate_changed",
+                "value": str(update.value),
+                "effective_date": update.effective_date.isoformat(),
+            }
+        )
+    return json.dumps(
+        {
+            "type": "portfolio_revalued",
+            "user_id": str(update.user_id),
+            "as_of": update.as_of.isoformat(),
+            "equity": str(update.equity),
+            "monthly_income": str(update.monthly_income),
+            "equity_delta": str(update.equity_delta),
+            "monthly_income_delta": str(update.monthly_income_delta),
+        }
+    )
+
+
+def decode_update(payload: str) -> LiveUpdate:
+    """Decode a NOTIFY payload; raises ValueError or KeyError if malformed."""
+    data = json.loads(payload)
+    if data["type"] == "rate_changed":
+        return ReferenceRateChanged(
+            value=Decimal(data["value"]),
+            effective_date=date.fromisoformat(data["effective_date"]),
+        )
+    if data["type"] == "portfolio_revalued":
+        return PortfolioRevalued(
+            user_id=UUID(data["user_id"]),
+            as_of=date.fromisoformat(data["as_of"]),
+            equity=Decimal(data["equity"]),
+            monthly_income=Decimal(data["monthly_income"]),
+            equity_delta=Decimal(data["equity_delta"]),
+            monthly_income_delta=Decimal(data["monthly_income_delta"]),
+        )
+    raise ValueError(f"Unknown live update type: {data['type']}")
+
+
+class PostgresLiveUpdatePublisher(LiveUpdatePublisher):
+    """
+    Publishes updates with ``pg_notify`` on a channel every worker listens to.
+
+    Failing to publish is logged and otherwise ignored, the change itself
+    being committed already.
+    """
+
+    def __init__(self, session_maker: sessionmaker[AsyncSession], channel: str) -> None:
+        self._session_maker = session_maker
+        self._channel = channel
+
+    async def publish(self, update: LiveUpdate) -> None:
+        stmt = select(func.pg_notify(self._channel, encode_update(update)))
+        try:
+            async with self._session_maker() as session:
+                await session.execute(stmt)
+                await session.commit()
+        except SQLAlchemyError:
+            logger.warning("Live update publish failed", exc_info=True)
+
+
+class PostgresLiveUpdateListener:
+    """
+    Listens on the live update channel for the whole worker.
+
+    Holds one connection of its own, outside the pool, however many clients
+    are connected, and hands every decoded update to ``on_update``. A lost
+    connection is reopened with a growing delay; updates published in
+    between are missed.
+
+    Args:
+        dsn: libpq connection string of the database
+        channel: Channel to LISTEN on
+        on_update: Called with each update, must not block
+        metrics: Registry of the received and malformed notification counts
+    """
+
+    RECONNECT_DELAY = 1.0
+    MAX_RECONNECT_DELAY = 30.0
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str,
+        on_update: Callable[[LiveUpdate], None],
+        metrics: Metrics | None = None,
+    ) -> None:
+        self._dsn = dsn
+        self._channel = channel
+        self._on_update = on_update
+        self._metrics: Metrics = metrics or get_metrics()
+        self._task: asyncio.Task[None] | None = None
+        self._listening = asyncio.Event()
+
+    @property
+    def listening(self) -> bool:
+        return self._listening.is_set()
+
+    async def start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def wait_listening(self, timeout: float) -> None:
+        await asyncio.wait_for(self._listening.wait(), timeout)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        delay = self.RECONNECT_DELAY
+        while True:
+            try:
+                await self._listen()
+                delay = self.RECONNECT_DELAY
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                logger.warning("Live update listener disconnected", exc_info=True)
+            self._metrics.increment("live_updates.listener.reconnects")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.MAX_RECONNECT_DELAY)
+
+    async def _listen(self) -> None:
+        """Listen until the connection is lost."""
+        lost = asyncio.Event()
+        connection = await asyncpg.connect(self._dsn)
+        try:
+            connection.add_termination_listener(lambda _: lost.set())
+            await connection.add_listener(self._channel, self._notified)
+            self._listening.set()
+            logger.info("Listening for live updates", extra={"channel": self._channel})
+            await lost.wait()
+        finally:
+            self._listening.clear()
+            await connection.close(timeout=5)
+
+    def _notified(
+        self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        self._metrics.increment("live_updates.listener.received")
+        try:
+            update = decode_update(payload)
+        except (ValueError, KeyError):
+            self._metrics.increment("live_updates.listener.malformed")
+            logger.warning("Malformed live update", extra={"payload": payload})
+            return
+        self._on_update(update)
@@ -0,0 +1,65 @@
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from src.domain.ports.services.rate_limiter import RateLimiter
+from src.domain.value_objects.rate_limit import RateLimit
+
+
+@dataclass(slots=True)
+class _Bucket:
+    tokens: float
+    updated_at: float
+    limit: RateLimit
+
+    def refill(self, now: float) -> float:
+        elapsed = now - self.updated_at
+        return min(self.limit.burst, self.tokens + elapsed * self.limit.per_second)
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """
+    Per-process buckets, so each worker enforces its limits on its own.
+
+    With N workers a key gets up to N times its limit, which still bounds
+    the work a burst can cause on any one of them.
+    """
+
+    # Full buckets, the same as missing ones, are dropped every N acquires.
+    SWEEP_EVERY = 1024
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._buckets: dict[str, _Bucket] = {}
+        self._acquires_since_sweep: int = 0
+
+    async def acquire(self, key: str, limit: RateLimit) -> float:
+        now = self._clock()
+        self._acquires_since_sweep += 1
+        if self._acquires_since_sweep >= self.SWEEP_EVERY:
+            self._sweep(now)
+        bucket = self._buckets.get(key)
+        tokens = bucket.refill(now) if bucket is not None else float(limit.burst)
+        if tokens < 1:
+            return (1 - tokens) / limit.per_second
+        self._buckets[key] = _Bucket(tokens=tokens - 1, updated_at=now, limit=limit)
+        return 0.0
+
+    async def purge_idle(self, idle_since: datetime) -> int:
+        idle_for = (datetime.now(UTC) - idle_since).total_seconds()
+        threshold = self._clock() - idle_for
+        idle = [k for k, b in self._buckets.items() if b.updated_at < threshold]
+        for key in idle:
+            del self._buckets[key]
+        return len(idle)
+
+    def _sweep(self, now: float) -> None:
+        self._acquires_since_sweep = 0
+        full = [
+            key
+            for key, bucket in self._buckets.items()
+            if bucket.refill(now) >= bucket.limit.burst
+        ]
+        for key in full:
+            del self._buckets[key]
@@ -0,0 +1,78 @@
+import logging
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, Double, cast, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.outbound.database.models import RateLimitBucket
+from src.adapters.outbound.exceptions import SQLAlchemyRepositoryError
+from src.domain.ports.services.rate_limiter import RateLimiter
+from src.domain.value_objects.rate_limit import RateLimit
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresRateLimiter(RateLimiter):
+    """
+    Buckets shared by all workers through an unlogged table.
+
+    A token is taken by a single upsert that refills the bucket by the time
+    elapsed and spends a token only if one is there, so concurrent requests
+    of all workers are counted exactly. A rejected request leaves the row
+    untouched and reads it once more to tell when to retry.
+
+    Errors only log and let the request through: losing the limit for a
+    while beats refusing every login.
+    """
+
+    def __init__(self, session_maker: sessionmaker[AsyncSession]) -> None:
+        self._session_maker = session_maker
+
+    async def acquire(self, key: str, limit: RateLimit) -> float:
+        refilled = self._refilled(limit)
+        stmt = insert(RateLimitBucket).values(
+            key=key, tokens=limit.burst - 1, updated_at=func.now()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RateLimitBucket.key],
+            set_={"tokens": refilled - 1, "updated_at": func.now()},
+            where=refilled >= 1,
+        ).returning(RateLimitBucket.key)
+        try:
+            async with self._session_maker() as session:
+                taken = (await session.execute(stmt)).scalar_one_or_none()
+                await session.commit()
+                if taken is not None:
+                    return 0.0
+                stmt = select(refilled).where(RateLimitBucket.key == key)
+                tokens = (await session.execute(stmt)).scalar_one_or_none()
+        except SQLAlchemyError:
+            logger.warning("Rate limit check failed", exc_info=True)
+            return 0.0
+        if tokens is None or tokens >= 1:
+            # Refilled or purged between the two statements.
+            return 0.0
+        return (1 - tokens) / limit.per_second
+
+    async def purge_idle(self, idle_since: datetime) -> int:
+        stmt = delete(RateLimitBucket).where(RateLimitBucket.updated_at < idle_since)
+        try:
+            async with self._session_maker() as session:
+                result = await session.execute(stmt)
+                await session.commit()
+                return result.rowcount
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to purge rate limit buckets") from e
+
+    @staticmethod
+    def _refilled(limit: RateLimit) -> ColumnElement[float]:
+        """Tokens in the stored bucket by now."""
+        elapsed = func.extract("epoch", func.now() - RateLimitBucket.updated_at)
+        return func.least(
+            literal(limit.burst, Double),
+            RateLimitBucket.tokens
+            + cast(elapsed, Double) * literal(limit.per_second, Double),
+        )
@@ -1,6 +1,26 @@
+from datetime import datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    Uuid,
+    any_,
+    bindparam,
+    column,
+    delete,
+    exists,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql.dml import ReturningUpdate
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,9 +29,24 @@ from src.adapters.outbound.exceptions import SQLAlchemyRepositoryError
 from src.domain.ports.repositories.bondholder import BondHolderRepository
 from src.domain.entities.bondholder import BondHolder as BondHolderEntity
 from src.adapters.outbound.database.models import BondHolder as BondHolderModel
+from src.adapters.outbound.database.models import Bond as BondModel
+from src.adapters.outbound.database.models import (
+    BondHolderTombstone as BondHolderTombstoneModel,
+)
+from src.adapters.outbound.repositories.version import bump_version, portfolio_scope
+from src.domain.value_objects.bondholder_changes import BondHolderChangeSet
+from src.domain.value_objects.bondholder_query import (
+    BondHolderPageQuery,
+    BondHolderSortField,
+)
 
 
 class SQLAlchemyBondHolderRepository(BondHolderRepository):
+    # A write transaction stamps rows with its start time but may commit after
+    # a concurrent sync has read. Handing out a slightly older watermark makes
+    # the next sync re-read that window instead of missing such rows.
+    WATERMARK_OVERLAP = timedelta(seconds=5)
+
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
@@ -24,10 +59,118 @@ class SQLAlchemyBondHolderRepository(BondHolderRepository):
         result = await self._session.execute(stmt)
         return [self._to_entity(model) for model in result.scalars().all()]
 
+    async def get_many_owned(
+        self, user_id: UUID, bondholder_ids: list[UUID], for_update: bool = False
+    ) -> list[BondHolderEntity]:
+        stmt = select(BondHolderModel).where(
+            BondHolderModel.id == self._any(bondholder_ids),
+            BondHolderModel.user_id == user_id,
+        )
+        if for_update:
+            stmt = stmt.with_for_update()
+        result = await self._session.execute(stmt)
+        return [self._to_entity(model) for model in result.scalars().all()]
+
+    @staticmethod
+    def _any(ids: list[UUID]) -> ColumnElement:
+        """``= ANY(:ids)`` with the ids bound as one array parameter."""
+        return any_(bindparam(None, list(ids), type_=ARRAY(Uuid)))
+
+    async def get_page(
+        self, user_id: UUID, query: BondHolderPageQuery
+    ) -> list[BondHolderEntity]:
+        stmt = self._page_statement(user_id=user_id, query=query)
+        result = await self._session.execute(stmt)
+        return [self._to_entity(model) for model in result.scalars().all()]
+
+    @staticmethod
+    def _sort_column(sort_by: BondHolderSortField) -> ColumnElement:
+        columns: dict[BondHolderSortField, ColumnElement] = {
+            BondHolderSortField.PURCHASE_DATE: BondHolderModel.purchase_date,
+            BondHolderSortField.SERIES: BondModel.series,
+            BondHolderSortField.QUANTITY: BondHolderModel.quantity,
+            BondHolderSortField.VALUE: BondHolderModel.quantity
+            * BondModel.nominal_value,
+        }
+        return columns[sort_by]
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+    def _page_statement(
+        self, user_id: UUID, query: BondHolderPageQuery
+    ) -> Select[tuple[BondHolderModel]]:
+        sort_column = self._sort_column(query.sort_by)
+        stmt = (
+            select(BondHolderModel)
+            .join(BondModel, BondModel.id == BondHolderModel.bond_id)
+            .where(BondHolderModel.user_id == user_id)
+        )
+        if query.series_prefix:
+            stmt = stmt.where(
+                BondModel.series.like(
+                    self._escape_like(query.series_prefix) + "%", escape="/"
+                )
+            )
+        if query.purchased_from:
+            stmt = stmt.where(BondHolderModel.purchase_date >= query.purchased_from)
+        if query.purchased_to:
+            stmt = stmt.where(BondHolderModel.purchase_date <= query.purchased_to)
+        if query.after:
+            key = tuple_(sort_column, BondHolderModel.id)
+            position = tuple_(query.after.sort_value, query.after.id)
+            stmt = stmt.where(key < position if query.descending else key > position)
+
+        if query.descending:
+            stmt = stmt.order_by(sort_column.desc(), BondHolderModel.id.desc())
+        else:
+            stmt = stmt.order_by(sort_column.asc(), BondHolderModel.id.asc())
+        return stmt.limit(query.limit)
+
+    async def get_changes(self, user_id: UUID, since: datetime) -> BondHolderChangeSet:
+        now = (await self._session.execute(select(func.now()))).scalar_one()
+
+        changed_stmt = select(BondHolderModel).where(
+            BondHolderModel.user_id == user_id,
+            or_(
+                BondHolderModel.created_at > since,
+                BondHolderModel.last_update > since,
+            ),
+        )
+        changed = (await self._session.execute(changed_stmt)).scalars().all()
+
+        deleted_stmt = select(BondHolderTombstoneModel.id).where(
+            BondHolderTombstoneModel.user_id == user_id,
+            BondHolderTombstoneModel.deleted_at > since,
+        )
+        deleted = (await self._session.execute(deleted_stmt)).scalars().all()
+
+        return BondHolderChangeSet(
+            watermark=max(since, now - self.WATERMARK_OVERLAP),
+            inserted=[self._to_entity(m) for m in changed if m.created_at > since],
+            updated=[self._to_entity(m) for m in changed if m.created_at <= since],
+            deleted=list(deleted),
+        )
+
+    async def purge_tombstones(self, before: datetime) -> int:
+        try:
+            stmt = delete(BondHolderTombstoneModel).where(
+                BondHolderTombstoneModel.deleted_at < before
+            )
+            result = await self._session.execute(stmt)
+            await self._session.commit()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            error_msg = "Failed to purge bondholder tombstones"
+            await self._session.rollback()
+            raise SQLAlchemyRepositoryError(error_msg) from e
+
     async def write(self, entity: BondHolderEntity) -> BondHolderEntity:
         try:
             model = self._to_model(entity)
             self._session.add(model)
+            await self._session.execute(bump_version(portfolio_scope(model.user_id)))
             await self._session.commit()
             await self._session.refresh(model)
             return self._to_entity(model)
@@ -46,6 +189,7 @@ class SQLAlchemyBondHolderRepository(BondHolderRepository):
             if not model:
                 raise NotFoundError("BondHolder not found")
             self._update_model(model, entity)
+            await self._session.execute(bump_version(portfolio_scope(model.user_id)))
             await self._session.commit()
             await self._session.refresh(model)
             return self._to_entity(model)
@@ -59,12 +203,94 @@ class SQLAlchemyBondHolderRepository(BondHolderRepository):
             model = await self._session.get(BondHolderModel, bondholder_id)
             if model:
                 await self._session.delete(model)
+                self._session.add(
+                    BondHolderTombstoneModel(id=model.id, user_id=model.user_id)
+                )
+                await self._session.execute(
+                    bump_version(portfolio_scope(model.user_id))
+                )
                 await self._session.commit()
         except SQLAlchemyError as e:
             error_msg = "Failed to delete bondholder"
             await self._session.rollback()
             raise SQLAlchemyRepositoryError(error_msg) from e
 
+    async def apply_batch(
+        self,
+        user_id: UUID,
+        updated: list[BondHolderEntity],
+        deleted: list[BondHolderEntity],
+    ) -> list[BondHolderEntity]:
+        try:
+            models: list[BondHolderModel] = []
+            if updated:
+                result = await self._session.execute(
+                    self._batch_update_statement(user_id, updated)
+                )
+                models = list(result.scalars().all())
+            deleted_ids: list[UUID] = []
+            if deleted:
+                deleted_ids = await self._batch_delete(user_id, deleted)
+            if len(models) != len(updated) or len(deleted_ids) != len(deleted):
+                await self._session.rollback()
+                raise NotFoundError("BondHolder not found")
+            await self._session.execute(bump_version(portfolio_scope(user_id)))
+            await self._session.commit()
+            return [self._to_entity(model) for model in models]
+        except SQLAlchemyError as e:
+            error_msg = "Failed to apply BondHolder batch"
+            await self._session.rollback()
+            raise SQLAlchemyRepositoryError(error_msg) from e
+
+    @staticmethod
+    def _batch_update_statement(
+        user_id: UUID, updated: list[BondHolderEntity]
+    ) -> ReturningUpdate[tuple[BondHolderModel]]:
+        """One ``UPDATE ... FROM (VALUES ...)`` writing every new quantity."""
+        changes = values(
+            column("id", Uuid), column("quantity", Integer), name="changes"
+        ).data([(entity.id, entity.quantity) for entity in updated])
+        return (
+            update(BondHolderModel)
+            .where(
+                BondHolderModel.id == changes.c.id,
+                BondHolderModel.user_id == user_id,
+            )
+            .values(quantity=changes.c.quantity)
+            .returning(BondHolderModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+
+    async def _batch_delete(
+        self, user_id: UUID, deleted: list[BondHolderEntity]
+    ) -> list[UUID]:
+        """Delete holders, tombstone them and drop bonds nobody holds anymore."""
+        result = await self._session.execute(
+            delete(BondHolderModel)
+            .where(
+                BondHolderModel.id == self._any([entity.id for entity in deleted]),
+                BondHolderModel.user_id == user_id,
+            )
+            .returning(BondHolderModel.id)
+        )
+        deleted_ids = list(result.scalars().all())
+        if not deleted_ids:
+            return deleted_ids
+        await self._session.execute(
+            insert(BondHolderTombstoneModel),
+            [
+                {"id": bondholder_id, "user_id": user_id}
+                for bondholder_id in deleted_ids
+            ],
+        )
+        await self._session.execute(
+            delete(BondModel).where(
+                BondModel.id == self._any([entity.bond_id for entity in deleted]),
+                ~exists().where(BondHolderModel.bond_id == BondModel.id),
+            )
+        )
+        return deleted_ids
+
     async def count_by_bond_id(self, bond_id: UUID) -> int:
         stmt = (
             select(func.count())
@@ -0,0 +1,125 @@
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Select,
+    case,
+    cast,
+    false,
+    func,
+    literal,
+    select,
+    true,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.outbound.database.models import Bond as BondModel
+from src.adapters.outbound.database.models import BondHolder as BondHolderModel
+from src.adapters.outbound.exceptions import SQLAlchemyRepositoryError
+from src.domain.ports.repositories.equity_history import EquityHistoryRepository
+from src.domain.services.analytics.analytics_service import AnalyticsService
+
+
+class SQLAlchemyEquityHistoryRepository(EquityHistoryRepository):
+    """
+    Builds the equity timeline in a single query.
+
+    Timeline points come from ``generate_series`` stepped by the interval
+    ``AnalyticsService`` would pick, and the running face value is a window
+    sum over purchases and maturities merged with those points, so only the
+    chart points leave the database.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_equity_history(
+        self, user_id: UUID, until: date
+    ) -> list[tuple[date, Decimal]]:
+        stmt = self._history_statement(user_id=user_id, until=until)
+        try:
+            result = await self._session.execute(stmt)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyRepositoryError("Failed to compute equity history") from e
+        return [(point, equity) for point, equity in result.all()]
+
+    @staticmethod
+    def _history_statement(user_id: UUID, until: date) -> Select[tuple[date, Decimal]]:
+        owned = (
+            select(
+                BondHolderModel.purchase_date,
+                BondModel.maturity_period,
+                (BondHolderModel.quantity * BondModel.nominal_value).label("amount"),
+            )
+            .join(BondModel, BondModel.id == BondHolderModel.bond_id)
+            .where(BondHolderModel.user_id == user_id)
+            .cte("owned")
+        )
+        # Face value counts from the purchase day to the maturity day; adding
+        # months clamps to the end of shorter months, as the domain does.
+        holdings = (
+            select(owned.c.purchase_date.label("day"), owned.c.amount)
+            .union_all(
+                select(
+                    cast(
+                        owned.c.purchase_date
+                        + func.make_interval(0, owned.c.maturity_period),
+                        Date,
+                    ),
+                    -owned.c.amount,
+                )
+            )
+            .cte("holdings")
+        )
+        until_param = literal(until, Date)
+        first_day = select(func.min(holdings.c.day).label("day")).cte("first_day")
+        span_days = until_param - first_day.c.day
+        step = case(
+            *(
+                (span_days <= threshold, literal(interval))
+                for threshold, interval in AnalyticsService.INTERVAL_THRESHOLDS
+            ),
+            else_=literal(AnalyticsService.DEFAULT_INTERVAL),
+        )
+        series = select(
+            cast(
+                func.generate_series(
+                    cast(first_day.c.day, DateTime), cast(until_param, DateTime), step
+                ),
+                Date,
+            ).label("day")
+        ).where(first_day.c.day.is_not(None))
+        last_point = select(until_param.label("day")).where(
+            first_day.c.day.is_not(None)
+        )
+        points = series.union(last_point).cte("points")
+
+        events = (
+            select(
+                holdings.c.day,
+                holdings.c.amount,
+                false().label("is_point"),
+            )
+            .union_all(
+                select(
+                    points.c.day,
+                    literal(Decimal(0)).label("amount"),
+                    true().label("is_point"),
+                )
+            )
+            .subquery("events")
+        )
+        running = select(
+            events.c.day,
+            events.c.is_point,
+            func.sum(events.c.amount).over(order_by=events.c.day).label("equity"),
+        ).subquery("running")
+        return (
+            select(running.c.day, running.c.equity)
+            .where(running.c.is_point)
+            .order_by(running.c.day)
+        )
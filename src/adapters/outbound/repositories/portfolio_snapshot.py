@@ -0,0 +1,116 @@
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, or_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.outbound.database.models import BondHolder as BondHolderModel
+from src.adapters.outbound.database.models import (
+    PortfolioSnapshot as PortfolioSnapshotModel,
+)
+from src.adapters.outbound.exceptions import SQLAlchemyRepositoryError
+from src.adapters.outbound.repositories.version import bump_version, portfolio_scope
+from src.domain.ports.repositories.portfolio_snapshot import (
+    PortfolioSnapshotRepository,
+)
+from src.domain.value_objects.portfolio_snapshot import PortfolioSnapshot
+
+
+class SQLAlchemyPortfolioSnapshotRepository(PortfolioSnapshotRepository):
+    # Snapshots are rewritten after the holdings change has committed, so
+    # results cached from the old snapshots in between must not stay valid:
+    # each rewrite bumps the portfolio version as well.
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_range(
+        self, user_id: UUID, end: date, start: date | None = None
+    ) -> list[PortfolioSnapshot]:
+        stmt = (
+            select(PortfolioSnapshotModel)
+            .where(
+                PortfolioSnapshotModel.user_id == user_id,
+                PortfolioSnapshotModel.snapshot_date <= end,
+            )
+            .order_by(PortfolioSnapshotModel.snapshot_date)
+        )
+        if start is not None:
+            stmt = stmt.where(PortfolioSnapshotModel.snapshot_date >= start)
+        result = await self._session.execute(stmt)
+        return [self._to_value(model) for model in result.scalars().all()]
+
+    async def get_latest(self, user_id: UUID, until: date) -> PortfolioSnapshot | None:
+        stmt = (
+            select(PortfolioSnapshotModel)
+            .where(
+                PortfolioSnapshotModel.user_id == user_id,
+                PortfolioSnapshotModel.snapshot_date <= until,
+            )
+            .order_by(PortfolioSnapshotModel.snapshot_date.desc())
+            .limit(1)
+        )
+        model = (await self._session.execute(stmt)).scalar_one_or_none()
+        return self._to_value(model) if model is not None else None
+
+    async def replace_from(
+        self, user_id: UUID, from_date: date, snapshots: list[PortfolioSnapshot]
+    ) -> None:
+        try:
+            await self._session.execute(
+                delete(PortfolioSnapshotModel).where(
+                    PortfolioSnapshotModel.user_id == user_id,
+                    PortfolioSnapshotModel.snapshot_date >= from_date,
+                )
+            )
+            if snapshots:
+                await self._session.execute(
+                    insert(PortfolioSnapshotModel),
+                    [self._to_row(snapshot) for snapshot in snapshots],
+                )
+            await self._session.execute(bump_version(portfolio_scope(user_id)))
+            await self._session.commit()
+        except SQLAlchemyError as e:
+            await self._session.rollback()
+            raise SQLAlchemyRepositoryError(
+                "Failed to replace portfolio snapshots"
+            ) from e
+
+    async def get_stale_users(self, as_of: date) -> list[tuple[UUID, date | None]]:
+        holders = select(BondHolderModel.user_id).distinct().subquery()
+        latest = (
+            select(
+                PortfolioSnapshotModel.user_id,
+                func.max(PortfolioSnapshotModel.snapshot_date).label("last_date"),
+            )
+            .group_by(PortfolioSnapshotModel.user_id)
+            .subquery()
+        )
+        stmt = (
+            select(holders.c.user_id, latest.c.last_date)
+            .outerjoin(latest, latest.c.user_id == holders.c.user_id)
+            .where(or_(latest.c.last_date.is_(None), latest.c.last_date < as_of))
+        )
+        result = await self._session.execute(stmt)
+        return [(user_id, last_date) for user_id, last_date in result.all()]
+
+    @staticmethod
+    def _to_value(model: PortfolioSnapshotModel) -> PortfolioSnapshot:
+        return PortfolioSnapshot(
+            user_id=model.user_id,
+            snapshot_date=model.snapshot_date,
+            face_value=model.face_value,
+            accrued_interest=model.accrued_interest,
+            monthly_income=model.monthly_income,
+        )
+
+    @staticmethod
+    def _to_row(snapshot: PortfolioSnapshot) -> dict:
+        return {
+            "user_id": snapshot.user_id,
+            "snapshot_date": snapshot.snapshot_date,
+            "face_value": snapshot.face_value,
+            "accrued_interest": snapshot.accrued_interest,
+            "monthly_income": snapshot.monthly_income,
+        }
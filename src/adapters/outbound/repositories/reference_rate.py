@@ -10,6 +10,10 @@ from src.adapters.outbound.exceptions import SQLAlchemyRepositoryError
 from src.domain.entities.reference_rate import ReferenceRate as ReferenceRateEntity
 from src.domain.ports.repositories.reference_rate import ReferenceRateRepository
 from src.adapters.outbound.database.models import ReferenceRate as ReferenceRateModel
+from src.adapters.outbound.repositories.version import (
+    REFERENCE_RATE_SCOPE,
+    bump_version,
+)
 
 
 class SQLAlchemyReferenceRateRepository(ReferenceRateRepository):
@@ -26,6 +30,7 @@ class SQLAlchemyReferenceRateRepository(ReferenceRateRepository):
         try:
             model = self._to_model(ref_rate)
             self._session.add(model)
+            await self._session.execute(bump_version(REFERENCE_RATE_SCOPE))
             await self._session.commit()
             await self._session.refresh(model)
             return self._to_entity(model)
@@ -67,6 +72,33 @@ class SQLAlchemyReferenceRateRepository(ReferenceRateRepository):
         result = result.scalar_one_or_none()
         return self._to_entity(result) if result else None
 
+    async def get_between(self, start: date, end: date) -> list[ReferenceRateEntity]:
+        """
+        Retrieve every reference rate valid on at least one day of a period.
+
+        Args:
+            start: First day of the period
+            end: Last day of the period
+
+        Returns:
+            ReferenceRate objects ordered by start_date
+        """
+        stmt = (
+            select(ReferenceRateModel)
+            .where(
+                and_(
+                    ReferenceRateModel.start_date <= end,
+                    or_(
+                        ReferenceRateModel.end_date >= start,
+                        ReferenceRateModel.end_date.is_(None),
+                    ),
+                )
+            )
+            .order_by(ReferenceRateModel.start_date)
+        )
+        result = await self._session.execute(stmt)
+        return [self._to_entity(model) for model in result.scalars().all()]
+
     async def get_latest(self) -> ReferenceRateEntity | None:
         """
         Retrieve the most recently added reference rate.
@@ -87,6 +119,7 @@ class SQLAlchemyReferenceRateRepository(ReferenceRateRepository):
         if not model:
             raise NotFoundError("ReferenceRate not found")
         self._update_model(model, ref_rate)
+        await self._session.execute(bump_version(REFERENCE_RATE_SCOPE))
         await self._session.commit()
         return self._to_entity(model)
 
@@ -0,0 +1,46 @@
+from uuid import UUID
+
+from sqlalchemy import Insert, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.outbound.database.models import VersionCounter as VersionCounterModel
+from src.domain.ports.repositories.version import VersionRepository
+from src.domain.value_objects.resource_versions import ResourceVersions
+
+REFERENCE_RATE_SCOPE = "reference_rate"
+
+
+def portfolio_scope(user_id: UUID) -> str:
+    return f"portfolio:{user_id}"
+
+
+def bump_version(scope: str) -> Insert:
+    """
+    Build an upsert incrementing the counter of ``scope``.
+
+    Repositories execute it in the same transaction as the write it
+    describes, so readers never see new data with an old version.
+    """
+    stmt = insert(VersionCounterModel).values(scope=scope, value=1)
+    return stmt.on_conflict_do_update(
+        index_elements=[VersionCounterModel.scope],
+        set_={"value": VersionCounterModel.value + 1},
+    )
+
+
+class SQLAlchemyVersionRepository(VersionRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_versions(self, user_id: UUID) -> ResourceVersions:
+        portfolio = portfolio_scope(user_id)
+        stmt = select(VersionCounterModel.scope, VersionCounterModel.value).where(
+            VersionCounterModel.scope.in_([portfolio, REFERENCE_RATE_SCOPE])
+        )
+        result = await self._session.execute(stmt)
+        values = {scope: value for scope, value in result.all()}
+        return ResourceVersions(
+            portfolio=values.get(portfolio, 0),
+            reference_rate=values.get(REFERENCE_RATE_SCOPE, 0),
+        )
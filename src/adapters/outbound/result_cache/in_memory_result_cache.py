@@ -0,0 +1,38 @@
+from collections import OrderedDict
+from typing import Any
+from uuid import UUID
+
+from src.domain.ports.services.result_cache import ResultCache
+from src.domain.value_objects.result_cache_key import ResultCacheKey
+
+
+class InMemoryResultCache(ResultCache):
+    """
+    Per-process LRU cache.
+
+    Fastest option, but every worker keeps and warms its own copy, and only
+    the worker that handled a write drops the affected entries early.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries: int = max_entries
+        self._entries: OrderedDict[ResultCacheKey, Any] = OrderedDict()
+
+    async def get(self, key: ResultCacheKey) -> Any | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: ResultCacheKey, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate_user(self, user_id: UUID) -> None:
+        for key in [k for k in self._entries if k.user_id == user_id]:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,122 @@
+import logging
+from collections.abc import Mapping
+from typing import Any
+from uuid import UUID
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.outbound.database.models import (
+    ResultCacheEntry as ResultCacheEntryModel,
+)
+from src.domain.ports.services.result_cache import ResultCache
+from src.domain.value_objects.result_cache_key import ResultCacheKey
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresResultCache(ResultCache):
+    """
+        LRU cache shared by all workers through an UNLOGGED table.
+
+        UNLOGGED skips the WAL, so writes are cheap and the table is emptied
+        after a crash, which is fine for a cache. Values are stored as JSON and
+    decoded with the DTO type registered for the key's namespace, so a row
+    written by anyone with table access can only ever yield that DTO.
+
+        The cache is an optimisation: database errors are logged and reported
+        as misses instead of failing the request.
+    """
+
+    # Trimming sorts the whole table, so it runs every N writes rather than
+    # on each one; the table may briefly exceed max_entries by that much.
+    PRUNE_EVERY = 64
+
+    def __init__(
+        self,
+        session_maker: sessionmaker[AsyncSession],
+        max_entries: int,
+        value_types: Mapping[str, type],
+    ) -> None:
+        self._session_maker = session_maker
+        self._max_entries: int = max_entries
+        self._adapters: dict[str, TypeAdapter[Any]] = {
+            namespace: TypeAdapter(value_type)
+            for namespace, value_type in value_types.items()
+        }
+        self._writes_since_prune: int = 0
+
+    async def get(self, key: ResultCacheKey) -> Any | None:
+        adapter = self._adapters.get(key.namespace)
+        if adapter is None:
+            return None
+        stmt = (
+            update(ResultCacheEntryModel)
+            .where(ResultCacheEntryModel.key == str(key))
+            .values(accessed_at=func.now())
+            .returning(ResultCacheEntryModel.value)
+        )
+        try:
+            async with self._session_maker() as session:
+                value = (await session.execute(stmt)).scalar_one_or_none()
+                await session.commit()
+        except SQLAlchemyError:
+            logger.warning("Result cache read failed", exc_info=True)
+            return None
+        if value is None:
+            return None
+        try:
+            return adapter.validate_json(value)
+        except ValidationError:
+            logger.warning("Result cache entry %s is not valid", key, exc_info=True)
+            return None
+
+    async def set(self, key: ResultCacheKey, value: Any) -> None:
+        adapter = self._adapters.get(key.namespace)
+        if adapter is None:
+            logger.warning("No result type registered for %r", key.namespace)
+            return
+        payload = adapter.dump_json(value)
+        stmt = insert(ResultCacheEntryModel).values(
+            key=str(key), user_id=key.user_id, value=payload
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ResultCacheEntryModel.key],
+            set_={"value": stmt.excluded.value, "accessed_at": func.now()},
+        )
+        try:
+            async with self._session_maker() as session:
+                await session.execute(stmt)
+                self._writes_since_prune += 1
+                if self._writes_since_prune >= self.PRUNE_EVERY:
+                    await session.execute(self._prune_statement())
+                    self._writes_since_prune = 0
+                await session.commit()
+        except SQLAlchemyError:
+            logger.warning("Result cache write failed", exc_info=True)
+
+    async def invalidate_user(self, user_id: UUID) -> None:
+        stmt = delete(ResultCacheEntryModel).where(
+            ResultCacheEntryModel.user_id == user_id
+        )
+        try:
+            async with self._session_maker() as session:
+                await session.execute(stmt)
+                await session.commit()
+        except SQLAlchemyError:
+            logger.warning("Result cache invalidation failed", exc_info=True)
+
+    def _prune_statement(self):
+        oldest = (
+            select(ResultCacheEntryModel.key)
+            .order_by(ResultCacheEntryModel.accessed_at.desc())
+            .offset(self._max_entries)
+            .scalar_subquery()
+        )
+        return delete(ResultCacheEntryModel).where(
+            ResultCacheEntryModel.key.in_(oldest)
+        )
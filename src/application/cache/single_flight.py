@@ -0,0 +1,55 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import AbstractAsyncContextManager
+from typing import Any, TypeVar
+
+from src.application.metrics import Metrics, get_metrics
+
+T = TypeVar("T")
+
+# Opens a copy of a use case whose repositories share no request-scoped
+# resource, e.g. on a database session of its own, and closes it on exit.
+type Detached[U] = Callable[[], AbstractAsyncContextManager[U]]
+
+
+class SingleFlight:
+    """
+    Shares one in-flight computation between identical concurrent calls.
+
+    The first caller for a key starts the computation; callers arriving
+    while it runs await the same task and get the same result or exception.
+    Nothing is kept once the task finishes, so this only deduplicates bursts
+    within one worker. Use a result cache to reuse finished results.
+
+    The task is shielded, so a cancelled caller does not abort the work
+    others are waiting for. It outlives the caller that started it, so it
+    must not use that caller's request-scoped resources, such as its
+    database session, which are closed when the caller goes away: callers
+    run the computation on a ``Detached`` copy of their use case.
+    """
+
+    def __init__(self, name: str, metrics: Metrics | None = None) -> None:
+        self._name: str = name
+        self._metrics: Metrics = metrics or get_metrics()
+        self._in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        self._metrics.increment(f"single_flight.{self._name}.calls")
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._metrics.increment(f"single_flight.{self._name}.coalesced")
+        else:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every waiter was cancelled.
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
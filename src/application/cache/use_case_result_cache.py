@@ -0,0 +1,60 @@
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import date
+from typing import TypeVar
+from uuid import UUID
+
+from src.application.metrics import Metrics, get_metrics
+from src.domain.ports.repositories.version import VersionRepository
+from src.domain.ports.services.result_cache import ResultCache
+from src.domain.value_objects.result_cache_key import ResultCacheKey
+
+logger = logging.getLogger(__name__)
+T = TypeVar("T")
+
+
+class UseCaseResultCache:
+    """
+    Memoizes a use case's results by the data versions they depend on.
+
+    Versions are read before computing. A write landing mid-computation thus
+    stores its result under the old versions, which no later read asks for,
+    so a cached result is never older than the versions in its key.
+    """
+
+    def __init__(
+        self,
+        cache: ResultCache,
+        version_repo: VersionRepository,
+        namespace: str,
+        metrics: Metrics | None = None,
+    ) -> None:
+        self._cache: ResultCache = cache
+        self._version_repo: VersionRepository = version_repo
+        self._namespace: str = namespace
+        self._metrics: Metrics = metrics or get_metrics()
+
+    async def get_or_compute(
+        self,
+        user_id: UUID,
+        target_date: date,
+        compute: Callable[[], Awaitable[T]],
+        variant: str = "",
+    ) -> T:
+        versions = await self._version_repo.get_versions(user_id=user_id)
+        key = ResultCacheKey(
+            namespace=self._namespace,
+            user_id=user_id,
+            versions=versions,
+            target_date=target_date,
+            variant=variant,
+        )
+        cached = await self._cache.get(key)
+        if cached is not None:
+            self._metrics.increment(f"result_cache.{self._namespace}.hit")
+            return cached
+
+        self._metrics.increment(f"result_cache.{self._namespace}.miss")
+        result = await compute()
+        await self._cache.set(key, result)
+        return result
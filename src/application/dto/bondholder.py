@@ -4,6 +4,7 @@ from decimal import Decimal
 from uuid import UUID
 
 from src.application.dto.user import UserDTO
+from src.domain.value_objects.bondholder_query import BondHolderCursor
 
 
 @dataclass(frozen=True, slots=True)
@@ -37,3 +38,37 @@ class BondHolderCreateDTO:
     user_id: UUID
     quantity: int
     purchase_date: date
+
+
+@dataclass(frozen=True, slots=True)
+class BondHolderPageDTO:
+    items: list[BondHolderDTO]
+    next_cursor: BondHolderCursor | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BondHolderChangesDTO:
+    watermark: datetime
+    inserted: list[BondHolderDTO]
+    updated: list[BondHolderDTO]
+    deleted: list[UUID]
+    full_resync: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class BondHolderQuantityChangeDTO:
+    id: UUID
+    new_quantity: int
+
+
+@dataclass(frozen=True, slots=True)
+class BondHolderBatchDTO:
+    user: UserDTO
+    quantity_changes: list[BondHolderQuantityChangeDTO]
+    deletions: list[UUID]
+
+
+@dataclass(frozen=True, slots=True)
+class BondHolderBatchResultDTO:
+    updated: list[BondHolderDTO]
+    deleted: list[UUID]
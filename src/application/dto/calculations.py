@@ -2,7 +2,23 @@ from dataclasses import dataclass
 from decimal import Decimal
 from uuid import UUID
 
+from src.domain.value_objects.rate_scenario import IncomeBand
+from src.domain.value_objects.yield_report import HoldingYield
+
 
 @dataclass(frozen=True, slots=True)
 class MonthlyIncomeResponseDTO:
     data: dict[UUID, Decimal]
+
+
+@dataclass(frozen=True, slots=True)
+class YieldResponseDTO:
+    holdings: list[HoldingYield]
+    portfolio_irr: Decimal | None
+
+
+@dataclass(frozen=True, slots=True)
+class StressTestDTO:
+    base_rate: Decimal
+    paths: int
+    bands: list[IncomeBand]
@@ -2,6 +2,13 @@ from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 
+from src.domain.value_objects.scheduled_payment import ScheduledPayment
+
 @dataclass(frozen=True, slots=True)
 class EquityDTO:
     data: list[tuple[date, Decimal]]
+
+
+@dataclass(frozen=True, slots=True)
+class UpcomingPaymentsDTO:
+    payments: list[ScheduledPayment]
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from src.application.dto.bondholder import BondHolderDTO
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesTotalsDTO:
+    series: str
+    quantity: int
+    face_value: Decimal
+    month_income: Decimal | None
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioSummaryDTO:
+    holdings: list[BondHolderDTO]
+    month_income: dict[UUID, Decimal]
+    totals: list[SeriesTotalsDTO]
+    equity: list[tuple[date, Decimal]]
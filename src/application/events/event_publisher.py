@@ -6,11 +6,15 @@ from src.domain.events import DomainEvent
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=DomainEvent)
+BatchHandler = Callable[[list[DomainEvent]], Coroutine[Any, Any, None]]
 
 
 class EventPublisher:
     def __init__(self) -> None:
         self._handlers: dict[Type[DomainEvent], list[Callable]] = {}
+        self._batch_handlers: list[
+            tuple[tuple[Type[DomainEvent], ...], BatchHandler]
+        ] = []
 
     def subscribe(
         self, event_type: Type[T], handler: Callable[[T], Coroutine[Any, Any, None]]
@@ -26,11 +30,37 @@ class EventPublisher:
             },
         )
 
+    def subscribe_batch(
+        self,
+        event_types: tuple[Type[T], ...],
+        handler: Callable[[list[T]], Coroutine[Any, Any, None]],
+    ) -> None:
+        """
+        Subscribe a handler to the events of several types at once.
+
+        The handler is called once per ``publish_all`` with every event of
+        those types published together, in order, so work that depends only
+        on e.g. the user can be done once for a whole batch of changes.
+        """
+        self._batch_handlers.append((event_types, handler))
+
+        logger.debug(
+            "Batch event handler subscribed",
+            extra={
+                "event_types": [event_type.__name__ for event_type in event_types],
+            },
+        )
+
     async def publish_all(self, events: list[DomainEvent]) -> None:
         for event in events:
-            await self.publish(event)
+            await self._publish_each(event)
+        await self._publish_batch(events)
 
     async def publish(self, event: DomainEvent) -> None:
+        await self._publish_each(event)
+        await self._publish_batch([event])
+
+    async def _publish_each(self, event: DomainEvent) -> None:
         event_type = type(event)
         if event_type not in self._handlers:
             logger.debug(
@@ -51,3 +81,20 @@ class EventPublisher:
                         "error": str(e),
                     },
                 )
+
+    async def _publish_batch(self, events: list[DomainEvent]) -> None:
+        for event_types, handler in self._batch_handlers:
+            batch = [event for event in events if type(event) in event_types]
+            if not batch:
+                continue
+            try:
+                await handler(batch)
+            except Exception as e:
+                logger.error(
+                    "Batch event handler failed",
+                    extra={
+                        "event_types": [type(event).__name__ for event in batch],
+                        "handler": handler.__name__,
+                        "error": str(e),
+                    },
+                )
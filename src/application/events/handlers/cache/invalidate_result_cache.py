@@ -0,0 +1,25 @@
+import logging
+
+from src.domain.events.bondholder_events import HoldingEvent
+from src.domain.ports.services.result_cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidateResultCacheHandler:
+    """Drops a user's cached results once their holdings change."""
+
+    def __init__(self, cache: ResultCache) -> None:
+        self._cache: ResultCache = cache
+
+    async def handle(self, event: HoldingEvent) -> None:
+        await self.handle_all([event])
+
+    async def handle_all(self, events: list[HoldingEvent]) -> None:
+        """Invalidate each user once however many of their holdings changed."""
+        for user_id in dict.fromkeys(event.user_id for event in events):
+            await self._cache.invalidate_user(user_id)
+            logger.debug(
+                "Result cache invalidated",
+                extra={"user_id": user_id, "events": len(events)},
+            )
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import date
+from uuid import UUID
+
+from src.application.use_cases.data.portfolio_snapshot import (
+    RefreshPortfolioSnapshotUseCase,
+)
+from src.domain.events.bondholder_events import HoldingEvent
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshPortfolioSnapshotHandler:
+    """Patches a user's snapshots from the purchase day of a changed holding.
+
+    A revaluation is too slow to hold up the write that caused it, so
+    ``handle_all`` only queues it and returns; one task per user runs the
+    refreshes in the background, folding changes that arrive meanwhile into
+    its next pass. ``join`` waits for them all.
+
+    Handlers outlive requests, so every refresh gets a use case bound to its
+    own session from ``use_case_factory``.
+    """
+
+    def __init__(
+        self,
+        use_case_factory: Callable[
+            [], AbstractAsyncContextManager[RefreshPortfolioSnapshotUseCase]
+        ],
+    ) -> None:
+        self._use_case_factory = use_case_factory
+        self._pending: dict[UUID, date] = {}
+        self._tasks: dict[UUID, asyncio.Task[None]] = {}
+
+    async def handle(self, event: HoldingEvent) -> None:
+        await self.handle_all([event])
+
+    async def handle_all(self, events: list[HoldingEvent]) -> None:
+        """Queue a refresh of each user from the earliest purchase day changed."""
+        for event in events:
+            earliest = self._pending.get(event.user_id, event.purchase_date)
+            self._pending[event.user_id] = min(earliest, event.purchase_date)
+            if event.user_id not in self._tasks:
+                task = asyncio.create_task(self._refresh(event.user_id))
+                self._tasks[event.user_id] = task
+
+    async def join(self) -> None:
+        """Wait until every queued refresh has run."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def _refresh(self, user_id: UUID) -> None:
+        try:
+            while (from_date := self._pending.pop(user_id, None)) is not None:
+                try:
+                    async with self._use_case_factory() as use_case:
+                        written = await use_case.execute(
+                            user_id=user_id, from_date=from_date, until=date.today()
+                        )
+                except Exception:
+                    logger.exception(
+                        "Portfolio snapshot refresh failed",
+                        extra={"user_id": user_id, "from_date": from_date},
+                    )
+                    continue
+                logger.debug(
+                    "Portfolio snapshot refreshed",
+                    extra={"user_id": user_id, "snapshots": written},
+                )
+        finally:
+            del self._tasks[user_id]
@@ -0,0 +1,88 @@
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import TypeVar
+from uuid import UUID
+
+from src.application.metrics import Metrics, get_metrics
+from src.domain.exceptions import ConflictError, ValidationError
+from src.domain.ports.services.idempotency_store import IdempotencyStore
+from src.domain.value_objects.idempotency import IdempotencyKey
+
+T = TypeVar("T")
+
+
+class IdempotentExecution:
+    """
+    Runs an operation at most once per client-supplied idempotency key.
+
+    The first request under a key runs the operation and stores its result
+    for ``ttl``. Retries get that result back without running it again;
+    duplicates arriving while it runs wait for it, up to the ``lease``.
+    A failed request releases its key so it can be retried. Reusing a key
+    with a different payload is rejected.
+    """
+
+    def __init__(
+        self,
+        store: IdempotencyStore,
+        operation: str,
+        ttl: timedelta,
+        lease: timedelta,
+        metrics: Metrics | None = None,
+    ) -> None:
+        self._store: IdempotencyStore = store
+        self._operation: str = operation
+        self._ttl: timedelta = ttl
+        self._lease: timedelta = lease
+        self._metrics: Metrics = metrics or get_metrics()
+
+    async def run(
+        self,
+        user_id: UUID,
+        key: str,
+        fingerprint: str,
+        execute: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Run ``execute`` unless a request with the same key already did.
+
+        Raises:
+            ValidationError: The key was used for a different payload
+            ConflictError: The earlier request is still running after
+                waiting for its lease
+        """
+        idempotency_key = IdempotencyKey(self._operation, user_id, key)
+        while True:
+            record = await self._store.claim(idempotency_key, fingerprint, self._lease)
+            if record is None:
+                return await self._execute(idempotency_key, execute)
+            if record.fingerprint != fingerprint:
+                raise ValidationError(
+                    "Idempotency key was already used for a different request"
+                )
+            if not record.completed:
+                self._metrics.increment(f"idempotency.{self._operation}.waited")
+                record = await self._store.wait(
+                    idempotency_key, self._lease.total_seconds()
+                )
+                if record is None:
+                    # Released by a failed request: claim it again.
+                    continue
+                if not record.completed:
+                    raise ConflictError(
+                        "A request with this idempotency key is still in progress"
+                    )
+            self._metrics.increment(f"idempotency.{self._operation}.replayed")
+            return record.result
+
+    async def _execute(
+        self, key: IdempotencyKey, execute: Callable[[], Awaitable[T]]
+    ) -> T:
+        try:
+            result = await execute()
+        except BaseException:
+            await self._store.release(key)
+            raise
+        await self._store.complete(key, result, self._ttl)
+        self._metrics.increment(f"idempotency.{self._operation}.executed")
+        return result
@@ -0,0 +1,93 @@
+import asyncio
+from uuid import UUID
+
+from src.application.metrics import Metrics, get_metrics
+from src.domain.value_objects.live_update import LiveUpdate
+
+
+class LiveUpdateSubscription:
+    """
+    Updates waiting to be sent to one connected client.
+
+    Only the latest update of each kind is kept: one arriving before the
+    client took the previous one is merged into it. A slow client thus gets
+    the current state, with the deltas summed, instead of a growing backlog,
+    and an idle one costs a couple of objects.
+    """
+
+    def __init__(self, user_id: UUID, metrics: Metrics) -> None:
+        self.user_id: UUID = user_id
+        self._metrics: Metrics = metrics
+        self._pending: dict[type, LiveUpdate] = {}
+        self._ready = asyncio.Event()
+
+    def offer(self, update: LiveUpdate) -> None:
+        kind = type(update)
+        pending = self._pending.get(kind)
+        if pending is not None:
+            update = pending.merged(update)
+            self._metrics.increment("live_updates.coalesced")
+        self._pending[kind] = update
+        self._ready.set()
+
+    async def next(self, timeout: float) -> list[LiveUpdate]:
+        """
+        Take the pending updates, waiting for one to arrive if none is.
+
+        Returns:
+            Updates in arrival order of their kind, or an empty list if none
+            arrived within ``timeout`` seconds
+        """
+        if not self._pending:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except TimeoutError:
+                return []
+        updates = list(self._pending.values())
+        self._pending.clear()
+        self._ready.clear()
+        return updates
+
+
+class LiveUpdateHub:
+    """
+    Fans updates out to the clients connected to this worker.
+
+    Updates without a user go to every subscription, the others only to the
+    subscriptions of their user. Dispatching never blocks on a client.
+    """
+
+    def __init__(self, metrics: Metrics | None = None) -> None:
+        self._metrics: Metrics = metrics or get_metrics()
+        self._by_user: dict[UUID, set[LiveUpdateSubscription]] = {}
+        self._count: int = 0
+
+    def subscribe(self, user_id: UUID) -> LiveUpdateSubscription:
+        subscription = LiveUpdateSubscription(user_id, self._metrics)
+        self._by_user.setdefault(user_id, set()).add(subscription)
+        self._count += 1
+        self._metrics.increment("live_updates.subscribed")
+        return subscription
+
+    def unsubscribe(self, subscription: LiveUpdateSubscription) -> None:
+        subscriptions = self._by_user.get(subscription.user_id)
+        if subscriptions is None or subscription not in subscriptions:
+            return
+        subscriptions.remove(subscription)
+        if not subscriptions:
+            del self._by_user[subscription.user_id]
+        self._count -= 1
+        self._metrics.increment("live_updates.unsubscribed")
+
+    def dispatch(self, update: LiveUpdate) -> None:
+        if update.user_id is None:
+            targets = [s for subs in self._by_user.values() for s in subs]
+        else:
+            targets = list(self._by_user.get(update.user_id, ()))
+        for subscription in targets:
+            subscription.offer(update)
+        self._metrics.increment("live_updates.dispatched")
+        self._metrics.increment("live_updates.delivered", len(targets))
+
+    def __len__(self) -> int:
+        return self._count
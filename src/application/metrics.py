@@ -0,0 +1,60 @@
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class _Summary:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+
+class Metrics:
+    """
+    In-process counters and value summaries.
+
+    Every worker keeps its own registry, so a snapshot describes one process.
+    Names are dotted, e.g. ``result_cache.income.hit``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = defaultdict(int)
+        self._summaries: dict[str, _Summary] = defaultdict(_Summary)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += value
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            summary = self._summaries[name]
+            summary.count += 1
+            summary.total += value
+            summary.max = max(summary.max, value)
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "summaries": {
+                    name: {"count": s.count, "sum": s.total, "max": s.max}
+                    for name, s in self._summaries.items()
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+
+
+_metrics: Metrics | None = None
+
+
+def get_metrics() -> Metrics:
+    global _metrics
+    if _metrics is None:
+        _metrics = Metrics()
+    return _metrics
@@ -0,0 +1,86 @@
+from src.application.dto.bondholder import (
+    BondHolderBatchDTO,
+    BondHolderBatchResultDTO,
+)
+from src.application.events.event_publisher import EventPublisher
+from src.application.use_cases.bondholder.base import BondHolderBaseUseCase
+from src.domain.entities.bondholder import BondHolder
+from src.domain.events import DomainEvent
+from src.domain.exceptions import NotFoundError, ValidationError
+from src.domain.ports.repositories.bond import BondRepository
+from src.domain.ports.repositories.bondholder import BondHolderRepository
+
+
+class BondHolderBatchUseCase(BondHolderBaseUseCase):
+    """
+    Change quantities of and delete several bondholders of a user at once.
+
+    All targets are loaded, authorized and locked with a single query, written
+    with set-based statements in one transaction and their events published
+    together. Either every change is applied or none is.
+    """
+
+    def __init__(
+        self,
+        bond_repo: BondRepository,
+        bondholder_repo: BondHolderRepository,
+        event_publisher: EventPublisher,
+    ) -> None:
+        self.bond_repo: BondRepository = bond_repo
+        self.bondholder_repo: BondHolderRepository = bondholder_repo
+        self.event_publisher: EventPublisher = event_publisher
+
+    async def execute(self, dto: BondHolderBatchDTO) -> BondHolderBatchResultDTO:
+        """
+        Raises:
+            ValidationError: If a bondholder is targeted more than once or a
+                quantity is invalid.
+            NotFoundError: If a bondholder does not exist or belongs to another
+                user; the two are not told apart.
+        """
+        quantities = {change.id: change.new_quantity for change in dto.quantity_changes}
+        deletions = set(dto.deletions)
+        if (
+            len(quantities) != len(dto.quantity_changes)
+            or len(deletions) != len(dto.deletions)
+            or not deletions.isdisjoint(quantities)
+        ):
+            raise ValidationError("Each bond holder can appear once in a batch")
+        if not quantities and not deletions:
+            return BondHolderBatchResultDTO(updated=[], deleted=[])
+
+        bondholders = await self.bondholder_repo.get_many_owned(
+            user_id=dto.user.id,
+            bondholder_ids=[*quantities, *dto.deletions],
+            for_update=True,
+        )
+        if len(bondholders) != len(quantities) + len(deletions):
+            raise NotFoundError("Bond holder not found")
+
+        updated: list[BondHolder] = []
+        deleted: list[BondHolder] = []
+        events: list[DomainEvent] = []
+        for bondholder in bondholders:
+            if bondholder.id in quantities:
+                bondholder.change_quantity(quantities[bondholder.id])
+                updated.append(bondholder)
+            else:
+                bondholder.mark_as_deleted(user_email=dto.user.email)
+                deleted.append(bondholder)
+            events.extend(bondholder.collect_events())
+
+        stored = await self.bondholder_repo.apply_batch(
+            user_id=dto.user.id, updated=updated, deleted=deleted
+        )
+        await self.event_publisher.publish_all(events)
+
+        bonds = await self.bond_repo.fetch_dict_from_bondholders(stored)
+        by_id = {bondholder.id: bondholder for bondholder in stored}
+        result = []
+        for bondholder_id in quantities:
+            bondholder = by_id[bondholder_id]
+            bond = bonds.get(bondholder.bond_id)
+            if not bond:
+                raise NotFoundError("Bond connected to BondHolder not found")
+            result.append(self.to_dto(bondholder=bondholder, bond=bond))
+        return BondHolderBatchResultDTO(updated=result, deleted=list(dto.deletions))
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from src.application.dto.bondholder import BondHolderChangesDTO, BondHolderDTO
+from src.application.dto.user import UserDTO
+from src.application.use_cases.bondholder.base import BondHolderBaseUseCase
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.ports.repositories.bond import BondRepository
+from src.domain.ports.repositories.bondholder import BondHolderRepository
+
+
+class BondHolderGetChangesUseCase(BondHolderBaseUseCase):
+    """
+    Return holdings inserted, updated and deleted since the client's watermark.
+
+    Deletion tombstones are kept only for ``tombstone_retention``. A watermark
+    older than that may miss deletions, so the client is told to re-download
+    the full list instead.
+    """
+
+    def __init__(
+        self,
+        bondholder_repo: BondHolderRepository,
+        bond_repo: BondRepository,
+        tombstone_retention: timedelta,
+    ) -> None:
+        self.bondholder_repo: BondHolderRepository = bondholder_repo
+        self.bond_repo: BondRepository = bond_repo
+        self.tombstone_retention: timedelta = tombstone_retention
+
+    async def execute(self, user: UserDTO, since: datetime) -> BondHolderChangesDTO:
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        changes = await self.bondholder_repo.get_changes(user_id=user.id, since=since)
+        full_resync = since < changes.watermark - self.tombstone_retention
+
+        changed = changes.inserted + changes.updated
+        bonds_dict = (
+            await self.bond_repo.fetch_dict_from_bondholders(bondholders=changed)
+            if changed
+            else {}
+        )
+        return BondHolderChangesDTO(
+            watermark=changes.watermark,
+            inserted=self._to_dto_list(changes.inserted, bonds_dict),
+            updated=self._to_dto_list(changes.updated, bonds_dict),
+            deleted=changes.deleted,
+            full_resync=full_resync,
+        )
+
+    def _to_dto_list(
+        self, bondholders: list[BondHolder], bonds_dict: dict[UUID, Bond]
+    ) -> list[BondHolderDTO]:
+        dto_list: list[BondHolderDTO] = []
+        for bh in bondholders:
+            bond = bonds_dict.get(bh.bond_id)
+            if bond:
+                dto_list.append(self.to_dto(bondholder=bh, bond=bond))
+        return dto_list
+
+
+class PurgeBondHolderTombstonesUseCase:
+    """Drop deletion tombstones that fell out of the delta sync window."""
+
+    def __init__(
+        self, bondholder_repo: BondHolderRepository, tombstone_retention: timedelta
+    ) -> None:
+        self._bondholder_repo: BondHolderRepository = bondholder_repo
+        self._tombstone_retention: timedelta = tombstone_retention
+
+    async def execute(self, now: datetime) -> int:
+        return await self._bondholder_repo.purge_tombstones(
+            before=now - self._tombstone_retention
+        )
@@ -1,5 +1,9 @@
+import hashlib
+
 from src.application.dto.bond import BondCreateDTO
 from src.application.dto.bondholder import BondHolderCreateDTO, BondHolderDTO
+from src.application.events.event_publisher import EventPublisher
+from src.application.idempotency import IdempotentExecution
 from src.application.use_cases.bondholder.base import BondHolderBaseUseCase
 from src.domain.entities.bondholder import BondHolder as BondHolderEntity
 from src.domain.ports.repositories.bond import BondRepository
@@ -11,15 +15,40 @@ class BondHolderCreateUseCase(BondHolderBaseUseCase):
     """
     Create BondHolder. Connect BondHolder to the existing Bond
     if Bond is not exist, otherwise create Bond.
+
+    Requests sent with an idempotency key are run once per key; retries get
+    the first request's result back.
     """
 
     def __init__(
-        self, bond_repo: BondRepository, bondholder_repo: BondHolderRepository
+        self,
+        bond_repo: BondRepository,
+        bondholder_repo: BondHolderRepository,
+        event_publisher: EventPublisher,
+        idempotency: IdempotentExecution | None = None,
     ) -> None:
         self.bond_repo: BondRepository = bond_repo
         self.bondholder_repo: BondHolderRepository = bondholder_repo
+        self.event_publisher: EventPublisher = event_publisher
+        self.idempotency: IdempotentExecution | None = idempotency
 
     async def execute(
+        self,
+        bh_dto: BondHolderCreateDTO,
+        b_dto: BondCreateDTO,
+        idempotency_key: str | None = None,
+    ) -> BondHolderDTO:
+        if idempotency_key is None or self.idempotency is None:
+            return await self._create(bh_dto, b_dto)
+        fingerprint = hashlib.sha256(repr((bh_dto, b_dto)).encode()).hexdigest()
+        return await self.idempotency.run(
+            user_id=bh_dto.user_id,
+            key=idempotency_key,
+            fingerprint=fingerprint,
+            execute=lambda: self._create(bh_dto, b_dto),
+        )
+
+    async def _create(
         self, bh_dto: BondHolderCreateDTO, b_dto: BondCreateDTO
     ) -> BondHolderDTO:
         bond = await self.bond_repo.get_by_series(b_dto.series)
@@ -30,9 +59,11 @@ class BondHolderCreateUseCase(BondHolderBaseUseCase):
                 quantity=bh_dto.quantity,
                 purchase_date=bh_dto.purchase_date,
             )
+            events = new_bh.collect_events()
             new_bh = await self.bondholder_repo.write(new_bh)
             if not new_bh:
                 raise
+            await self.event_publisher.publish_all(events)
             return self.to_dto(bondholder=new_bh, bond=bond)
 
         new_bond = BondEntity.create(
@@ -50,5 +81,7 @@ class BondHolderCreateUseCase(BondHolderBaseUseCase):
             quantity=bh_dto.quantity,
             purchase_date=bh_dto.purchase_date,
         )
+        events = new_bh.collect_events()
         new_bh = await self.bondholder_repo.write(new_bh)
+        await self.event_publisher.publish_all(events)
         return self.to_dto(bondholder=new_bh, bond=new_bond)
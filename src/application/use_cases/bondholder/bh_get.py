@@ -1,11 +1,23 @@
+from dataclasses import replace
+from typing import Self
 from uuid import UUID
 
-from src.application.dto.bondholder import BondHolderDTO
+from src.application.cache.single_flight import Detached, SingleFlight
+from src.application.dto.bondholder import BondHolderDTO, BondHolderPageDTO
 from src.application.dto.user import UserDTO
 from src.application.use_cases.bondholder.base import BondHolderBaseUseCase
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
 from src.domain.exceptions import NotFoundError, AuthorizationError
 from src.domain.ports.repositories.bond import BondRepository
 from src.domain.ports.repositories.bondholder import BondHolderRepository
+from src.domain.value_objects.bondholder_query import (
+    BondHolderCursor,
+    BondHolderPageQuery,
+    BondHolderSortField,
+    SortValue,
+)
+from src.domain.value_objects.resource_versions import ResourceVersions
 
 
 class BondHolderGetUseCase(BondHolderBaseUseCase):
@@ -48,3 +60,102 @@ class BondHolderGetAllUseCase(BondHolderBaseUseCase):
                 dto_list.append(self.to_dto(bondholder=bh, bond=bond))
 
         return sorted(dto_list, key=lambda h: h.purchase_date, reverse=True)
+
+
+class BondHolderGetPageUseCase(BondHolderBaseUseCase):
+    """Return one keyset page of the user's bondholders.
+
+    One extra row is requested from the repository to find out whether a
+    next page exists without a separate count query. Without a limit, all
+    rows are returned as one page.
+    """
+
+    def __init__(
+        self,
+        bondholder_repo: BondHolderRepository,
+        bond_repo: BondRepository,
+        single_flight: SingleFlight | None = None,
+        detached: Detached[Self] | None = None,
+        versions: ResourceVersions | None = None,
+    ) -> None:
+        self.bondholder_repo: BondHolderRepository = bondholder_repo
+        self.bond_repo: BondRepository = bond_repo
+        self.single_flight: SingleFlight | None = single_flight
+        self.detached: Detached[Self] | None = detached
+        self.versions: ResourceVersions | None = versions
+
+    async def execute(
+        self, user: UserDTO, query: BondHolderPageQuery
+    ) -> BondHolderPageDTO:
+        if self.single_flight is None:
+            return await self._fetch_page(user, query)
+        # Versions in the key keep a flight from spanning a write.
+        return await self.single_flight.do(
+            (user.id, query, self.versions), lambda: self._shared(user, query)
+        )
+
+    async def _shared(
+        self, user: UserDTO, query: BondHolderPageQuery
+    ) -> BondHolderPageDTO:
+        if self.detached is None:
+            return await self._fetch_page(user, query)
+        async with self.detached() as use_case:
+            return await use_case._fetch_page(user, query)
+
+    async def _fetch_page(
+        self, user: UserDTO, query: BondHolderPageQuery
+    ) -> BondHolderPageDTO:
+        if query.limit is not None:
+            query = replace(query, limit=query.limit + 1)
+        bondholders = await self.bondholder_repo.get_page(user_id=user.id, query=query)
+        if not bondholders:
+            return BondHolderPageDTO(items=[])
+        has_next = query.limit is not None and len(bondholders) >= query.limit
+        if has_next:
+            bondholders = bondholders[:-1]
+
+        bonds_dict = await self.bond_repo.fetch_dict_from_bondholders(
+            bondholders=bondholders
+        )
+        dto_list: list[BondHolderDTO] = []
+        for bh in bondholders:
+            bond = bonds_dict.get(bh.bond_id)
+            if bond:
+                dto_list.append(self.to_dto(bondholder=bh, bond=bond))
+
+        next_cursor = None
+        if has_next:
+            next_cursor = self._cursor(bondholders, bonds_dict, query.sort_by)
+        return BondHolderPageDTO(items=dto_list, next_cursor=next_cursor)
+
+    @classmethod
+    def _cursor(
+        cls,
+        bondholders: list[BondHolder],
+        bonds_dict: dict[UUID, Bond],
+        sort_by: BondHolderSortField,
+    ) -> BondHolderCursor | None:
+        """Position after the last row fetched, even if it was left out.
+
+        Sorting by series or value needs the bond, so a last row whose bond
+        vanished since the page was read yields to the one before it.
+        """
+        for bh in reversed(bondholders):
+            sort_value = cls._sort_value(bh, bonds_dict.get(bh.bond_id), sort_by)
+            if sort_value is not None:
+                return BondHolderCursor(sort_value=sort_value, id=bh.id)
+        return None
+
+    @staticmethod
+    def _sort_value(
+        bondholder: BondHolder, bond: Bond | None, sort_by: BondHolderSortField
+    ) -> SortValue | None:
+        match sort_by:
+            case BondHolderSortField.SERIES:
+                return bond.series if bond else None
+            case BondHolderSortField.QUANTITY:
+                return bondholder.quantity
+            case BondHolderSortField.VALUE:
+                return bondholder.quantity * bond.nominal_value if bond else None
+            case _:
+                return bondholder.purchase_date
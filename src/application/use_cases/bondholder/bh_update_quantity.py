@@ -1,4 +1,5 @@
 from src.application.dto.bondholder import BondHolderDTO, BondHolderUpdateQuantityDTO
+from src.application.events.event_publisher import EventPublisher
 from src.application.use_cases.bondholder.base import BondHolderBaseUseCase
 from src.domain.exceptions import AuthorizationError, NotFoundError
 from src.domain.ports.repositories.bond import BondRepository
@@ -12,9 +13,11 @@ class UpdateBondHolderQuantityUseCase(BondHolderBaseUseCase):
         self,
         bond_repo: BondRepository,
         bondholder_repo: BondHolderRepository,
+        event_publisher: EventPublisher,
     ) -> None:
         self.bond_repo: BondRepository = bond_repo
         self.bondholder_repo: BondHolderRepository = bondholder_repo
+        self.event_publisher: EventPublisher = event_publisher
 
     async def execute(self, dto: BondHolderUpdateQuantityDTO) -> BondHolderDTO:
         bondholder = await self.bondholder_repo.get_one(bondholder_id=dto.id)
@@ -23,7 +26,9 @@ class UpdateBondHolderQuantityUseCase(BondHolderBaseUseCase):
         if bondholder.user_id != dto.user.id:
             raise AuthorizationError("Permission denied")
         bondholder.change_quantity(dto.new_quantity)
+        events = bondholder.collect_events()
         bondholder = await self.bondholder_repo.update(bondholder)
+        await self.event_publisher.publish_all(events)
         bond = await self.bond_repo.get_one(bondholder.bond_id)
         if not bond:
             raise NotFoundError("Bond connected to BondHolder not found")
@@ -1,7 +1,10 @@
 from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
+from typing import Self
 from uuid import UUID
 
+from src.application.cache.single_flight import Detached, SingleFlight
+from src.application.cache.use_case_result_cache import UseCaseResultCache
 from src.application.dto.calculations import MonthlyIncomeResponseDTO
 from src.application.dto.user import UserDTO
 from src.application.use_cases.calculations.base import (
@@ -12,6 +15,7 @@ from src.domain.ports.repositories.bond import BondRepository
 from src.domain.ports.repositories.bondholder import BondHolderRepository
 from src.domain.ports.repositories.reference_rate import ReferenceRateRepository
 from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.value_objects.resource_versions import ResourceVersions
 
 
 class CalculateIncomeUseCase(CalculationsBaseUseCase):
@@ -21,14 +25,52 @@ class CalculateIncomeUseCase(CalculationsBaseUseCase):
         bondholder_repo: BondHolderRepository,
         bond_repo: BondRepository,
         reference_rate_repo: ReferenceRateRepository,
+        result_cache: UseCaseResultCache | None = None,
+        single_flight: SingleFlight | None = None,
+        detached: Detached[Self] | None = None,
+        versions: ResourceVersions | None = None,
     ) -> None:
         self.bh_income_calculator = bh_income_calculator
         self.bondholder_repo = bondholder_repo
         self.bond_repo = bond_repo
         self.ref_rate_repo = reference_rate_repo
+        self.result_cache = result_cache
+        self.single_flight = single_flight
+        self.detached = detached
+        self.versions = versions
 
     async def execute(
         self, user: UserDTO, target_date: date
+    ) -> MonthlyIncomeResponseDTO:
+        if self.single_flight is None:
+            return await self._cached(user, target_date)
+        # Versions in the key keep a flight from spanning a write.
+        return await self.single_flight.do(
+            (user.id, target_date, self.versions),
+            lambda: self._shared(user, target_date),
+        )
+
+    async def _shared(
+        self, user: UserDTO, target_date: date
+    ) -> MonthlyIncomeResponseDTO:
+        if self.detached is None:
+            return await self._cached(user, target_date)
+        async with self.detached() as use_case:
+            return await use_case._cached(user, target_date)
+
+    async def _cached(
+        self, user: UserDTO, target_date: date
+    ) -> MonthlyIncomeResponseDTO:
+        if self.result_cache is None:
+            return await self._compute(user, target_date)
+        return await self.result_cache.get_or_compute(
+            user_id=user.id,
+            target_date=target_date,
+            compute=lambda: self._compute(user, target_date),
+        )
+
+    async def _compute(
+        self, user: UserDTO, target_date: date
     ) -> MonthlyIncomeResponseDTO:
         bondholders = await self.bondholder_repo.get_all(user_id=user.id)
         if not bondholders:
@@ -0,0 +1,49 @@
+from datetime import date
+
+from src.application.dto.calculations import YieldResponseDTO
+from src.application.dto.user import UserDTO
+from src.application.use_cases.calculations.base import (
+    CalculationsBaseUseCase,
+)
+from src.domain.exceptions import NotFoundError
+from src.domain.ports.repositories.bond import BondRepository
+from src.domain.ports.repositories.bondholder import BondHolderRepository
+from src.domain.ports.repositories.reference_rate import ReferenceRateRepository
+from src.domain.services.analytics.yield_analytics import YieldAnalyticsService
+
+
+class CalculateYieldUseCase(CalculationsBaseUseCase):
+    def __init__(
+        self,
+        yield_service: YieldAnalyticsService,
+        bondholder_repo: BondHolderRepository,
+        bond_repo: BondRepository,
+        reference_rate_repo: ReferenceRateRepository,
+    ) -> None:
+        self.yield_service = yield_service
+        self.bondholder_repo = bondholder_repo
+        self.bond_repo = bond_repo
+        self.ref_rate_repo = reference_rate_repo
+
+    async def execute(self, user: UserDTO, today: date) -> YieldResponseDTO:
+        bondholders = await self.bondholder_repo.get_all(user_id=user.id)
+        if not bondholders:
+            raise NotFoundError("Bondholders not found.")
+        bonds_dict = await self.bond_repo.fetch_dict_from_bondholders(
+            bondholders=bondholders
+        )
+        reference_rates = await self.ref_rate_repo.get_between(
+            start=min(bh.purchase_date for bh in bondholders), end=today
+        )
+        if not reference_rates:
+            latest = await self.ref_rate_repo.get_latest()
+            if latest is None:
+                raise NotFoundError("Reference rate not found.")
+            reference_rates = [latest]
+        report = self.yield_service.analyze(
+            holdings=[(bh, bonds_dict[bh.bond_id]) for bh in bondholders],
+            reference_rates=reference_rates,
+        )
+        return YieldResponseDTO(
+            holdings=report.holdings, portfolio_irr=report.portfolio_irr
+        )
@@ -0,0 +1,117 @@
+import asyncio
+import random
+from concurrent.futures import Executor
+from datetime import date
+
+from src.application.dto.calculations import StressTestDTO
+from src.application.dto.user import UserDTO
+from src.application.use_cases.calculations.base import (
+    CalculationsBaseUseCase,
+)
+from src.domain.exceptions import NotFoundError
+from src.domain.ports.repositories.bond import BondRepository
+from src.domain.ports.repositories.bondholder import BondHolderRepository
+from src.domain.ports.repositories.reference_rate import ReferenceRateRepository
+from src.domain.services.analytics.rate_scenarios import (
+    IncomeSensitivity,
+    RateScenarioService,
+    percentile_bands,
+    project_income,
+    shock_paths,
+    simulate_random_walks,
+)
+from src.domain.value_objects.rate_scenario import RateScenarioQuery
+
+DEFAULT_SHARD_SIZE = 1000
+
+
+class StressTestIncomeUseCase(CalculationsBaseUseCase):
+    def __init__(
+        self,
+        scenario_service: RateScenarioService,
+        bondholder_repo: BondHolderRepository,
+        bond_repo: BondRepository,
+        reference_rate_repo: ReferenceRateRepository,
+        executor: Executor | None = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+    ) -> None:
+        self.scenario_service = scenario_service
+        self.bondholder_repo = bondholder_repo
+        self.bond_repo = bond_repo
+        self.ref_rate_repo = reference_rate_repo
+        self.executor = executor
+        self.shard_size = shard_size
+
+    async def execute(
+        self, user: UserDTO, scenario: RateScenarioQuery, today: date
+    ) -> StressTestDTO:
+        """
+        Project monthly income under the scenario's rate paths.
+
+        Paths start from the latest reference rate. Random walks are split
+        into shards of ``shard_size`` paths that run on ``executor`` (the
+        loop's default executor when None), so the event loop stays free
+        while they are simulated.
+
+        Returns:
+            Percentile bands of projected income per month.
+        """
+        bondholders = await self.bondholder_repo.get_all(user_id=user.id)
+        if not bondholders:
+            raise NotFoundError("Bondholders not found.")
+        reference_rate = await self.ref_rate_repo.get_latest()
+        if reference_rate is None:
+            raise NotFoundError("Reference rate not found.")
+        bonds_dict = await self.bond_repo.fetch_dict_from_bondholders(
+            bondholders=bondholders
+        )
+        sensitivity = self.scenario_service.sensitivity(
+            holdings=[(bh, bonds_dict[bh.bond_id]) for bh in bondholders],
+            start=today,
+            horizon_months=scenario.horizon_months,
+        )
+
+        base_rate = float(reference_rate.value)
+        if scenario.shocks_bp:
+            paths = shock_paths(base_rate, scenario.shocks_bp, scenario.horizon_months)
+            incomes = project_income(sensitivity, paths)
+        else:
+            incomes = await self._simulate(sensitivity, base_rate, scenario)
+
+        return StressTestDTO(
+            base_rate=reference_rate.value,
+            paths=len(incomes[0]),
+            bands=percentile_bands(sensitivity.months, incomes),
+        )
+
+    async def _simulate(
+        self,
+        sensitivity: IncomeSensitivity,
+        base_rate: float,
+        scenario: RateScenarioQuery,
+    ) -> list[list[float]]:
+        loop = asyncio.get_running_loop()
+        # bandit: B311 flags non-cryptographic randomness; the seed only
+        # varies simulated rate paths and protects nothing.
+        seed = (
+            scenario.seed
+            if scenario.seed is not None
+            else random.randrange(2**32)  # nosec B311
+        )
+        shards = [
+            loop.run_in_executor(
+                self.executor,
+                simulate_random_walks,
+                sensitivity,
+                base_rate,
+                min(self.shard_size, scenario.paths - offset),
+                scenario.volatility_bp,
+                seed + index,
+            )
+            for index, offset in enumerate(range(0, scenario.paths, self.shard_size))
+        ]
+        incomes: list[list[float]] = [[] for _ in sensitivity.months]
+        for shard in await asyncio.gather(*shards):
+            for month, values in zip(incomes, shard):
+                month.extend(values)
+        return incomes
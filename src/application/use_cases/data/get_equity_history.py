@@ -1,11 +1,26 @@
 from datetime import date
 from decimal import Decimal
+from typing import Self
+from uuid import UUID
 
+from src.application.cache.single_flight import Detached, SingleFlight
+from src.application.cache.use_case_result_cache import UseCaseResultCache
 from src.application.dto.data import EquityDTO
 from src.application.dto.user import UserDTO
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.exceptions import ValidationError
 from src.domain.ports.repositories.bond import BondRepository
 from src.domain.ports.repositories.bondholder import BondHolderRepository
+from src.domain.ports.repositories.equity_history import EquityHistoryRepository
+from src.domain.ports.repositories.portfolio_snapshot import (
+    PortfolioSnapshotRepository,
+)
+from src.domain.ports.repositories.reference_rate import ReferenceRateRepository
 from src.domain.services.analytics.analytics_service import AnalyticsService
+from src.domain.services.portfolio_valuation import PortfolioValuationService
+from src.domain.value_objects.equity_history_query import EquityHistoryQuery
+from src.domain.value_objects.resource_versions import ResourceVersions
 
 
 class GetEquityHistoryUseCase:
@@ -14,20 +29,160 @@ class GetEquityHistoryUseCase:
         bh_repo: BondHolderRepository,
         bond_repo: BondRepository,
         service: AnalyticsService,
+        result_cache: UseCaseResultCache | None = None,
+        single_flight: SingleFlight | None = None,
+        history_repo: EquityHistoryRepository | None = None,
+        snapshot_repo: PortfolioSnapshotRepository | None = None,
+        reference_rate_repo: ReferenceRateRepository | None = None,
+        valuation_service: PortfolioValuationService | None = None,
+        detached: Detached[Self] | None = None,
+        versions: ResourceVersions | None = None,
     ) -> None:
         self.bh_repo: BondHolderRepository = bh_repo
         self.bond_repo: BondRepository = bond_repo
         self.service: AnalyticsService = service
+        self.result_cache: UseCaseResultCache | None = result_cache
+        self.single_flight: SingleFlight | None = single_flight
+        self.history_repo: EquityHistoryRepository | None = history_repo
+        self.snapshot_repo: PortfolioSnapshotRepository | None = snapshot_repo
+        self.ref_rate_repo: ReferenceRateRepository | None = reference_rate_repo
+        self.valuation_service: PortfolioValuationService | None = valuation_service
+        self.detached: Detached[Self] | None = detached
+        self.versions: ResourceVersions | None = versions
 
-    async def execute(self, user: UserDTO) -> EquityDTO:
+    async def execute(
+        self, user: UserDTO, query: EquityHistoryQuery | None = None
+    ) -> EquityDTO:
+        if query is not None and query.start and query.end and query.start > query.end:
+            raise ValidationError("Start of the range must not be after its end")
+        if self.single_flight is None:
+            return await self._cached(user, query)
+        # Versions in the key keep a flight from spanning a write.
+        return await self.single_flight.do(
+            (user.id, query, self.versions), lambda: self._shared(user, query)
+        )
+
+    async def _shared(
+        self, user: UserDTO, query: EquityHistoryQuery | None
+    ) -> EquityDTO:
+        if self.detached is None:
+            return await self._cached(user, query)
+        async with self.detached() as use_case:
+            return await use_case._cached(user, query)
+
+    async def _cached(
+        self, user: UserDTO, query: EquityHistoryQuery | None
+    ) -> EquityDTO:
+        if self.result_cache is None:
+            return await self._compute(user, query)
+        return await self.result_cache.get_or_compute(
+            user_id=user.id,
+            target_date=date.today(),
+            compute=lambda: self._compute(user, query),
+            variant=(
+                ""
+                if query is None
+                else (
+                    f"{query.start}:{query.end}:{query.max_points}:"
+                    f"{int(query.include_accrued)}"
+                )
+            ),
+        )
+
+    async def _compute(
+        self, user: UserDTO, query: EquityHistoryQuery | None
+    ) -> EquityDTO:
+        if query is not None:
+            return await self._compute_window(user, query)
+        if self.snapshot_repo is not None:
+            snapshots = await self.snapshot_repo.get_range(
+                user_id=user.id, end=date.today()
+            )
+            # No snapshots yet: either nothing is held or the nightly job has
+            # not built them, so fall through to computing from holdings.
+            if snapshots:
+                history_data = self.service.get_equity_history_from_snapshots(
+                    face_values=[(s.snapshot_date, s.face_value) for s in snapshots]
+                )
+                return self._to_dto(data=history_data)
+        if self.history_repo is not None:
+            history_data = await self.history_repo.get_equity_history(
+                user_id=user.id, until=date.today()
+            )
+            return self._to_dto(data=history_data)
         bhs = await self.bh_repo.get_all(user_id=user.id)
         if not bhs:
             return self._to_dto(data=[])
         bonds_dict = await self.bond_repo.fetch_dict_from_bondholders(bondholders=bhs)
-        bondholder_data = [(bh, bonds_dict[bh.bond_id].nominal_value) for bh in bhs]
+        bondholder_data = [(bh, bonds_dict[bh.bond_id]) for bh in bhs]
         history_data = self.service.get_equity_history(bondholder_data=bondholder_data)
         return self._to_dto(data=history_data)
 
+    async def _compute_window(
+        self, user: UserDTO, query: EquityHistoryQuery
+    ) -> EquityDTO:
+        end = query.end or date.today()
+        daily = None
+        if self.snapshot_repo is not None:
+            snapshots = await self.snapshot_repo.get_range(
+                user_id=user.id, end=end, start=query.start
+            )
+            if snapshots:
+                daily = self.service.get_daily_equity_from_snapshots(
+                    face_values=[
+                        (
+                            s.snapshot_date,
+                            s.face_value
+                            + (s.accrued_interest if query.include_accrued else 0),
+                        )
+                        for s in snapshots
+                    ],
+                    start=query.start or snapshots[0].snapshot_date,
+                    end=end,
+                )
+        if daily is None:
+            bhs = await self.bh_repo.get_all(user_id=user.id)
+            if not bhs:
+                return self._to_dto(data=[])
+            bonds_dict = await self.bond_repo.fetch_dict_from_bondholders(
+                bondholders=bhs
+            )
+            start = query.start or min(bh.purchase_date for bh in bhs)
+            if query.include_accrued:
+                daily = await self._accrued_daily(user, bhs, bonds_dict, start, end)
+            else:
+                daily = self.service.get_daily_equity(
+                    bondholder_data=[(bh, bonds_dict[bh.bond_id]) for bh in bhs],
+                    start=start,
+                    end=end,
+                )
+        return self._to_dto(
+            data=self.service.downsample_lttb(daily, max_points=query.max_points)
+        )
+
+    async def _accrued_daily(
+        self,
+        user: UserDTO,
+        bhs: list[BondHolder],
+        bonds_dict: dict[UUID, Bond],
+        start: date,
+        end: date,
+    ) -> list[tuple[date, Decimal]]:
+        if self.ref_rate_repo is None or self.valuation_service is None:
+            raise ValidationError("Accrued interest valuation is not available")
+        # Coupons of periods started before the window still accrue into it.
+        rates = await self.ref_rate_repo.get_between(
+            start=min(bh.purchase_date for bh in bhs), end=end
+        )
+        snapshots = self.valuation_service.value_daily(
+            user_id=user.id,
+            holdings=[(bh, bonds_dict[bh.bond_id]) for bh in bhs],
+            reference_rates=rates,
+            start=start,
+            end=end,
+        )
+        return [(s.snapshot_date, s.face_value + s.accrued_interest) for s in snapshots]
+
     @staticmethod
     def _to_dto(data: list[tuple[date, Decimal]]) -> EquityDTO:
         return EquityDTO(data=data)
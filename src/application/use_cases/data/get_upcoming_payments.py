@@ -0,0 +1,49 @@
+from datetime import date
+
+from src.application.dto.data import UpcomingPaymentsDTO
+from src.application.dto.user import UserDTO
+from src.domain.exceptions import ValidationError
+from src.domain.ports.repositories.bond import BondRepository
+from src.domain.ports.repositories.bondholder import BondHolderRepository
+from src.domain.ports.repositories.reference_rate import ReferenceRateRepository
+from src.domain.services.payment_schedule import PaymentScheduleService
+
+
+class GetUpcomingPaymentsUseCase:
+    def __init__(
+        self,
+        bh_repo: BondHolderRepository,
+        bond_repo: BondRepository,
+        reference_rate_repo: ReferenceRateRepository,
+        service: PaymentScheduleService,
+    ) -> None:
+        self.bh_repo: BondHolderRepository = bh_repo
+        self.bond_repo: BondRepository = bond_repo
+        self.ref_rate_repo: ReferenceRateRepository = reference_rate_repo
+        self.service: PaymentScheduleService = service
+
+    async def execute(
+        self, user: UserDTO, limit: int, after: date | None = None
+    ) -> UpcomingPaymentsDTO:
+        """
+        Returns:
+            The next ``limit`` payments after ``after`` (today by default),
+            priced at the latest known reference rate.
+        """
+        if limit <= 0:
+            raise ValidationError("Limit must be positive")
+        bondholders = await self.bh_repo.get_all(user_id=user.id)
+        if not bondholders:
+            return UpcomingPaymentsDTO(payments=[])
+
+        bonds_dict = await self.bond_repo.fetch_dict_from_bondholders(
+            bondholders=bondholders
+        )
+        reference_rate = await self.ref_rate_repo.get_latest()
+        payments = self.service.upcoming(
+            holdings=[(bh, bonds_dict[bh.bond_id]) for bh in bondholders],
+            after=after or date.today(),
+            limit=limit,
+            reference_rate=reference_rate,
+        )
+        return UpcomingPaymentsDTO(payments=payments)
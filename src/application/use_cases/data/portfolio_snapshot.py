@@ -0,0 +1,154 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+from src.domain.ports.repositories.bond import BondRepository
+from src.domain.ports.repositories.bondholder import BondHolderRepository
+from src.domain.ports.repositories.portfolio_snapshot import (
+    PortfolioSnapshotRepository,
+)
+from src.domain.ports.repositories.reference_rate import ReferenceRateRepository
+from src.domain.ports.services.live_update_publisher import LiveUpdatePublisher
+from src.domain.services.portfolio_valuation import PortfolioValuationService
+from src.domain.value_objects.live_update import PortfolioRevalued
+from src.domain.value_objects.portfolio_snapshot import PortfolioSnapshot
+
+
+class RefreshPortfolioSnapshotUseCase:
+    """
+    Rewrite a user's daily snapshots from the first affected day forward.
+
+    With an ``update_publisher``, the new valuation of the last day is
+    announced to the user's connected clients along with its change.
+    """
+
+    def __init__(
+        self,
+        bondholder_repo: BondHolderRepository,
+        bond_repo: BondRepository,
+        reference_rate_repo: ReferenceRateRepository,
+        snapshot_repo: PortfolioSnapshotRepository,
+        valuation_service: PortfolioValuationService,
+        update_publisher: LiveUpdatePublisher | None = None,
+    ) -> None:
+        self.bondholder_repo: BondHolderRepository = bondholder_repo
+        self.bond_repo: BondRepository = bond_repo
+        self.ref_rate_repo: ReferenceRateRepository = reference_rate_repo
+        self.snapshot_repo: PortfolioSnapshotRepository = snapshot_repo
+        self.valuation_service: PortfolioValuationService = valuation_service
+        self.update_publisher: LiveUpdatePublisher | None = update_publisher
+
+    async def execute(self, user_id: UUID, from_date: date, until: date) -> int:
+        """
+        Returns:
+            Number of snapshots written.
+        """
+        previous = None
+        if self.update_publisher is not None:
+            previous = await self.snapshot_repo.get_latest(user_id=user_id, until=until)
+        bondholders = await self.bondholder_repo.get_all(user_id=user_id)
+        if not bondholders:
+            await self.snapshot_repo.replace_from(
+                user_id=user_id, from_date=date.min, snapshots=[]
+            )
+            await self._announce(user_id, until, previous, None)
+            return 0
+
+        first_purchase = min(bh.purchase_date for bh in bondholders)
+        start = max(from_date, first_purchase)
+        bonds_dict = await self.bond_repo.fetch_dict_from_bondholders(
+            bondholders=bondholders
+        )
+        # Coupons of periods started before ``start`` still accrue into it.
+        reference_rates = await self.ref_rate_repo.get_between(
+            start=first_purchase, end=until
+        )
+        snapshots = self.valuation_service.value_daily(
+            user_id=user_id,
+            holdings=[(bh, bonds_dict[bh.bond_id]) for bh in bondholders],
+            reference_rates=reference_rates,
+            start=start,
+            end=until,
+        )
+        await self.snapshot_repo.replace_from(
+            user_id=user_id, from_date=min(from_date, start), snapshots=snapshots
+        )
+        await self._announce(
+            user_id, until, previous, snapshots[-1] if snapshots else None
+        )
+        return len(snapshots)
+
+    async def _announce(
+        self,
+        user_id: UUID,
+        until: date,
+        previous: PortfolioSnapshot | None,
+        current: PortfolioSnapshot | None,
+    ) -> None:
+        if self.update_publisher is None or (previous is None and current is None):
+            return
+        zero = Decimal("0")
+        equity = current.face_value if current else zero
+        income = current.monthly_income if current else zero
+        previous_equity = previous.face_value if previous else zero
+        previous_income = previous.monthly_income if previous else zero
+        await self.update_publisher.publish(
+            PortfolioRevalued(
+                user_id=user_id,
+                as_of=current.snapshot_date if current else until,
+                equity=equity,
+                monthly_income=income,
+                equity_delta=equity - previous_equity,
+                monthly_income_delta=income - previous_income,
+            )
+        )
+
+
+class RefreshStalePortfolioSnapshotsUseCase:
+    """Extend every user's snapshots up to the given day."""
+
+    def __init__(
+        self,
+        snapshot_repo: PortfolioSnapshotRepository,
+        refresh_use_case: RefreshPortfolioSnapshotUseCase,
+    ) -> None:
+        self.snapshot_repo: PortfolioSnapshotRepository = snapshot_repo
+        self.refresh_use_case: RefreshPortfolioSnapshotUseCase = refresh_use_case
+
+    async def execute(self, today: date) -> int:
+        """
+        Returns:
+            Number of refreshed users.
+        """
+        stale = await self.snapshot_repo.get_stale_users(as_of=today)
+        for user_id, last_date in stale:
+            from_date = last_date + timedelta(days=1) if last_date else date.min
+            await self.refresh_use_case.execute(
+                user_id=user_id, from_date=from_date, until=today
+            )
+        return len(stale)
+
+
+class RevaluePortfolioSnapshotsUseCase:
+    """Rewrite every user's snapshots from the day a new reference rate applies."""
+
+    def __init__(
+        self,
+        snapshot_repo: PortfolioSnapshotRepository,
+        refresh_use_case: RefreshPortfolioSnapshotUseCase,
+    ) -> None:
+        self.snapshot_repo: PortfolioSnapshotRepository = snapshot_repo
+        self.refresh_use_case: RefreshPortfolioSnapshotUseCase = refresh_use_case
+
+    async def execute(self, from_date: date, today: date) -> int:
+        """
+        Returns:
+            Number of revalued users.
+        """
+        # Every holder's snapshots end before the last representable day.
+        holders = await self.snapshot_repo.get_stale_users(as_of=date.max)
+        for user_id, _ in holders:
+            await self.refresh_use_case.execute(
+                user_id=user_id, from_date=from_date, until=today
+            )
+        return len(holders)
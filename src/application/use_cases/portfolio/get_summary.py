@@ -0,0 +1,105 @@
+from collections import defaultdict
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+from uuid import UUID
+
+from src.application.dto.portfolio import PortfolioSummaryDTO, SeriesTotalsDTO
+from src.application.dto.user import UserDTO
+from src.application.use_cases.bondholder.base import BondHolderBaseUseCase
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.ports.repositories.bond import BondRepository
+from src.domain.ports.repositories.bondholder import BondHolderRepository
+from src.domain.ports.repositories.reference_rate import ReferenceRateRepository
+from src.domain.services.analytics.analytics_service import AnalyticsService
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+
+
+class GetPortfolioSummaryUseCase(BondHolderBaseUseCase):
+    """Build the dashboard view of a portfolio from a single load of holdings."""
+
+    def __init__(
+        self,
+        bh_repo: BondHolderRepository,
+        bond_repo: BondRepository,
+        reference_rate_repo: ReferenceRateRepository,
+        income_calculator: BondHolderIncomeCalculator,
+        analytics_service: AnalyticsService,
+    ) -> None:
+        self.bh_repo: BondHolderRepository = bh_repo
+        self.bond_repo: BondRepository = bond_repo
+        self.ref_rate_repo: ReferenceRateRepository = reference_rate_repo
+        self.income_calculator: BondHolderIncomeCalculator = income_calculator
+        self.analytics_service: AnalyticsService = analytics_service
+
+    async def execute(
+        self, user: UserDTO, target_date: date, max_points: int
+    ) -> PortfolioSummaryDTO:
+        """
+        Returns:
+            Holdings, their income for the month of ``target_date``, totals
+            per series and the equity curve up to ``target_date`` reduced to
+            at most ``max_points`` points. Income is left empty when no
+            reference rate is known for ``target_date``.
+        """
+        bondholders = await self.bh_repo.get_all(user_id=user.id)
+        if not bondholders:
+            return PortfolioSummaryDTO(
+                holdings=[], month_income={}, totals=[], equity=[]
+            )
+        bonds_dict = await self.bond_repo.fetch_dict_from_bondholders(
+            bondholders=bondholders
+        )
+        reference_rate = await self.ref_rate_repo.get_by_date(target_date=target_date)
+
+        month_income: dict[UUID, Decimal] = {}
+        if reference_rate is not None:
+            for bh in bondholders:
+                income = self.income_calculator.calculate_monthly_bh_income(
+                    bondholder=bh,
+                    bond=bonds_dict[bh.bond_id],
+                    reference_rate=reference_rate,
+                    day=target_date,
+                )
+                month_income[bh.id] = income.quantize(
+                    Decimal("0.01"), rounding=ROUND_HALF_UP
+                )
+
+        daily = self.analytics_service.get_daily_equity(
+            bondholder_data=[(bh, bonds_dict[bh.bond_id]) for bh in bondholders],
+            start=min(bh.purchase_date for bh in bondholders),
+            end=target_date,
+        )
+        return PortfolioSummaryDTO(
+            holdings=[self.to_dto(bh, bonds_dict[bh.bond_id]) for bh in bondholders],
+            month_income=month_income,
+            totals=self._series_totals(
+                bondholders, bonds_dict, month_income, reference_rate is not None
+            ),
+            equity=self.analytics_service.downsample_lttb(daily, max_points=max_points),
+        )
+
+    @staticmethod
+    def _series_totals(
+        bondholders: list[BondHolder],
+        bonds_dict: dict[UUID, Bond],
+        month_income: dict[UUID, Decimal],
+        with_income: bool,
+    ) -> list[SeriesTotalsDTO]:
+        quantity: dict[str, int] = defaultdict(int)
+        face_value: dict[str, Decimal] = defaultdict(Decimal)
+        income: dict[str, Decimal] = defaultdict(Decimal)
+        for bh in bondholders:
+            bond = bonds_dict[bh.bond_id]
+            quantity[bond.series] += bh.quantity
+            face_value[bond.series] += bh.quantity * bond.nominal_value
+            income[bond.series] += month_income.get(bh.id, Decimal(0))
+        return [
+            SeriesTotalsDTO(
+                series=series,
+                quantity=quantity[series],
+                face_value=face_value[series],
+                month_income=income[series] if with_income else None,
+            )
+            for series in sorted(quantity)
+        ]
@@ -4,8 +4,10 @@ from datetime import datetime
 from decimal import Decimal
 
 from src.domain.ports.repositories.reference_rate import ReferenceRateRepository
+from src.domain.ports.services.live_update_publisher import LiveUpdatePublisher
 from src.domain.ports.services.reference_rate_provider import ReferenceRateProvider
 from src.domain.entities.reference_rate import ReferenceRate as ReferenceRateEntity
+from src.domain.value_objects.live_update import ReferenceRateChanged
 
 
 class UpdateReferenceRateUseCase:
@@ -16,16 +18,19 @@ class UpdateReferenceRateUseCase:
     1. Fetch current rate from external provider
     2. Get latest rate from database
     3. Compare them
-    4. If different - save the new rate to DB
+    4. If different - save the new rate to DB and announce it to connected
+       clients, given an ``update_publisher``
     """
 
     def __init__(
         self,
         reference_rate_repo: ReferenceRateRepository,
         rate_provider: ReferenceRateProvider,
+        update_publisher: LiveUpdatePublisher | None = None,
     ) -> None:
         self._ref_rate_repo = reference_rate_repo
         self._rate_provider = rate_provider
+        self._update_publisher = update_publisher
 
     async def execute(self) -> "UpdateReferenceRatesResult":
         try:
@@ -55,6 +60,12 @@ class UpdateReferenceRateUseCase:
                 start_date=current_effective_date,
             )
             await self._ref_rate_repo.save(ref_rate=reference_rate)
+            if self._update_publisher is not None:
+                await self._update_publisher.publish(
+                    ReferenceRateChanged(
+                        value=current_rate_value, effective_date=current_effective_date
+                    )
+                )
             return UpdateReferenceRatesResult(
                 success=True,
                 rate_changed=True,
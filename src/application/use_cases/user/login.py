@@ -1,6 +1,7 @@
 from fastapi.security.oauth2 import OAuth2PasswordRequestForm
 
 from src.application.dto.token import TokenDTO
+from src.application.login_throttle import LoginThrottle
 from src.application.use_cases.user.base import UserBaseUseCase
 from src.domain.exceptions import AuthenticationError
 from src.domain.ports.repositories.user import UserRepository
@@ -14,12 +15,18 @@ class UserLoginUseCase(UserBaseUseCase):
         user_repo: UserRepository,
         hasher: PasswordHasher,
         token_handler: TokenHandler,
+        throttle: LoginThrottle | None = None,
     ) -> None:
         self.user_repo: UserRepository = user_repo
         self.hasher: PasswordHasher = hasher
         self.token_handler: TokenHandler = token_handler
+        self.throttle: LoginThrottle | None = throttle
 
-    async def execute(self, form_data: OAuth2PasswordRequestForm) -> TokenDTO:
+    async def execute(
+        self, form_data: OAuth2PasswordRequestForm, client_ip: str | None = None
+    ) -> TokenDTO:
+        if self.throttle is not None:
+            await self.throttle.check(client_ip, form_data.username)
         user = await self.user_repo.get_user_by_email(form_data.username)
         if not user or not user.verify_password(
             hasher=self.hasher, plain_password=form_data.password
@@ -1,11 +1,21 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from decimal import Decimal
+from functools import cache
 from uuid import UUID, uuid4
 
 from src.domain.exceptions import ValidationError
 
 
-@dataclass
+@cache
+def _type_checks(cls: type) -> tuple[tuple[str, type, str], ...]:
+    """Field names, types and error messages of an entity, built once per class."""
+    return tuple(
+        (f.name, f.type, f"{cls.__name__} {f.name} must be of type {f.type.__name__}.")
+        for f in fields(cls)
+    )
+
+
+@dataclass(slots=True)
 class Bond:
     """Represents the bondholder
 
@@ -59,10 +69,9 @@ class Bond:
         self._validate_initial_interest_rate()
 
     def _validate_types(self) -> None:
-        for field, f_type in self.__annotations__.items():
-            v = getattr(self, field)
-            if not isinstance(v, f_type):
-                raise ValidationError(f"Bond {field} must be of type {f_type.__name__}.")
+        for field, f_type, message in _type_checks(type(self)):
+            if not isinstance(getattr(self, field), f_type):
+                raise ValidationError(message)
 
     def _validate_nominal_value(self) -> None:
         if self.nominal_value <= 0:
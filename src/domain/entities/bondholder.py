@@ -1,14 +1,21 @@
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, date, timezone
 from typing import Self
 from uuid import UUID, uuid4
 
+from dateutil.relativedelta import relativedelta  # type: ignore [import-untyped]
+
 from src.domain.events.base import DomainEvent
-from src.domain.events.bondholder_events import BondHolderDeletedEvent
+from src.domain.events.bondholder_events import (
+    BondHolderCreatedEvent,
+    BondHolderDeletedEvent,
+    BondHolderQuantityChangedEvent,
+)
 from src.domain.exceptions import ValidationError
 
 
-@dataclass
+@dataclass(slots=True)
 class BondHolder:
     """Represents a user's ownership position in a specific bondholder.
 
@@ -34,7 +41,7 @@ class BondHolder:
     purchase_date: date
     last_update: datetime | None = None
 
-    _events: list[DomainEvent] = field(default_factory=list, init=False, repr=False)
+    _events: list[DomainEvent] | None = field(default=None, init=False, repr=False)
 
     @classmethod
     def create(
@@ -54,20 +61,35 @@ class BondHolder:
             last_update=last_update,
         )
         bh.validate()
+        bh._record(
+            BondHolderCreatedEvent(
+                bondholder_id=bh.id,
+                bond_id=bh.bond_id,
+                user_id=bh.user_id,
+                purchase_date=bh.purchase_date,
+                occurred_at=datetime.now(timezone.utc),
+            )
+        )
         return bh
 
     def collect_events(self) -> list[DomainEvent]:
-        events = self._events.copy()
-        self._events.clear()
+        events, self._events = self._events or [], None
         return events
 
+    def _record(self, event: DomainEvent) -> None:
+        """Queue an event, allocating the queue only once one is recorded."""
+        if self._events is None:
+            self._events = []
+        self._events.append(event)
+
     def mark_as_deleted(self, user_email: str) -> None:
-        self._events.append(
+        self._record(
             BondHolderDeletedEvent(
                 bondholder_id=self.id,
                 bond_id=self.bond_id,
                 user_id=self.user_id,
                 email=user_email,
+                purchase_date=self.purchase_date,
                 occurred_at=datetime.now(timezone.utc),
             )
         )
@@ -77,8 +99,53 @@ class BondHolder:
             raise ValidationError("Quantity must be an integer")
         if amount < 0:
             raise ValidationError("Quantity must be positive")
+        if amount != self.quantity:
+            self._record(
+                BondHolderQuantityChangedEvent(
+                    bondholder_id=self.id,
+                    user_id=self.user_id,
+                    old_quantity=self.quantity,
+                    new_quantity=amount,
+                    purchase_date=self.purchase_date,
+                    occurred_at=datetime.now(timezone.utc),
+                )
+            )
         self.quantity = amount
 
+    def maturity_date(self, maturity_period: int) -> date:
+        """Day the bonds are redeemed, ``maturity_period`` months after purchase.
+
+        Args:
+            maturity_period: Lifetime of the bond in months.
+        """
+        return self.purchase_date + relativedelta(months=maturity_period)
+
+    def payment_dates(
+        self, maturity_period: int, after: date | None = None
+    ) -> Iterator[date]:
+        """Lazily yields the coupon payment dates of this holding in order.
+
+        Coupons are paid monthly on the purchase day, the last one at
+        maturity. Payments up to ``after`` are skipped without being
+        generated.
+
+        Args:
+            maturity_period: Lifetime of the bond in months.
+            after: Only payments strictly after this day are yielded.
+        """
+        months = 1
+        if after is not None and after > self.purchase_date:
+            months = max(
+                (after.year - self.purchase_date.year) * 12
+                + after.month
+                - self.purchase_date.month,
+                1,
+            )
+        for months in range(months, maturity_period + 1):
+            payment_date = self.purchase_date + relativedelta(months=months)
+            if after is None or payment_date > after:
+                yield payment_date
+
     def validate(self) -> None:
         self._validate_quantity()
 
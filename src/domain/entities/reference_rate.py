@@ -5,7 +5,7 @@ from typing import Self
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class ReferenceRate:
     """
     Entity represents reference rate data used in floating-rate bond calculations.
@@ -9,7 +9,7 @@ from src.domain.ports.services.password_hasher import PasswordHasher
 from src.domain.services.password_policy import PasswordPolicy
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Represents the user
 
@@ -25,7 +25,7 @@ class User:
     hashed_password: str
     name: str | None
 
-    _events: list[DomainEvent] = field(default_factory=list, init=False, repr=False)
+    _events: list[DomainEvent] | None = field(default=None, init=False, repr=False)
 
     @classmethod
     def create(
@@ -40,7 +40,7 @@ class User:
 
         user = cls(id=uuid4(), email=email, hashed_password=hashed, name=name)
 
-        user._events.append(
+        user._record(
             UserCreated(
                 user_id=user.id,
                 email=str(email),
@@ -53,6 +53,11 @@ class User:
         return hasher.verify(plain_password, self.hashed_password)
 
     def collect_events(self) -> list[DomainEvent]:
-        events = self._events.copy()
-        self._events.clear()
+        events, self._events = self._events or [], None
         return events
+
+    def _record(self, event: DomainEvent) -> None:
+        """Queue an event, allocating the queue only once one is recorded."""
+        if self._events is None:
+            self._events = []
+        self._events.append(event)
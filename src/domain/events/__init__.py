@@ -1,4 +1,8 @@
-from src.domain.events.bondholder_events import BondHolderDeletedEvent
+from src.domain.events.bondholder_events import (
+    BondHolderCreatedEvent,
+    BondHolderDeletedEvent,
+    BondHolderQuantityChangedEvent,
+)
 from src.domain.events.user_events import UserCreated
 from src.domain.events.base import DomainEvent
 
@@ -6,5 +10,7 @@ from src.domain.events.base import DomainEvent
 __all__ = [
     "DomainEvent",
     "UserCreated",
+    "BondHolderCreatedEvent",
     "BondHolderDeletedEvent",
+    "BondHolderQuantityChangedEvent",
 ]
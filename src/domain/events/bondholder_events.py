@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import date
 from uuid import UUID
 
 from src.domain.events.base import DomainEvent
@@ -12,3 +13,37 @@ class BondHolderDeletedEvent(DomainEvent):
     bond_id: UUID
     user_id: UUID
     email: str
+    purchase_date: date
+
+
+@dataclass
+class BondHolderCreatedEvent(DomainEvent):
+    """Event: Bondholder was created"""
+
+    bondholder_id: UUID
+    bond_id: UUID
+    user_id: UUID
+    purchase_date: date
+
+
+@dataclass
+class BondHolderQuantityChangedEvent(DomainEvent):
+    """Event: Quantity of a bondholder was changed"""
+
+    bondholder_id: UUID
+    user_id: UUID
+    old_quantity: int
+    new_quantity: int
+    purchase_date: date
+
+
+HoldingEvent = (
+    BondHolderCreatedEvent | BondHolderQuantityChangedEvent | BondHolderDeletedEvent
+)
+"""Any event changing the holdings of a user."""
+
+HOLDING_EVENTS = (
+    BondHolderCreatedEvent,
+    BondHolderQuantityChangedEvent,
+    BondHolderDeletedEvent,
+)
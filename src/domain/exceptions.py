@@ -22,6 +22,14 @@ class AuthenticationError(DomainError):
     pass
 
 
+class RateLimitExceededError(DomainError):
+    """Raised when a client sends more requests than it is allowed"""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class AuthorizationError(DomainError):
     """Raised when user doesn't have permission to access resource"""
     pass
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.entities.bondholder import BondHolder
+from src.domain.value_objects.bondholder_changes import BondHolderChangeSet
+from src.domain.value_objects.bondholder_query import BondHolderPageQuery
 
 
 class BondHolderRepository(ABC):
@@ -20,6 +23,70 @@ class BondHolderRepository(ABC):
     async def get_all(self, user_id: UUID) -> list[BondHolder]:
         pass
 
+    @abstractmethod
+    async def get_many_owned(
+        self, user_id: UUID, bondholder_ids: list[UUID], for_update: bool = False
+    ) -> list[BondHolder]:
+        """Retrieves the given bondholders that belong to a user.
+
+        Args:
+            user_id: The owner the bondholders must belong to.
+            bondholder_ids: Identifiers of the bondholders.
+            for_update: Lock the rows until the transaction ends, so they
+                cannot change before a following write.
+
+        Returns:
+            The bondholders found; ids missing or owned by someone else are
+            left out.
+        """
+        pass
+
+    @abstractmethod
+    async def get_page(
+        self, user_id: UUID, query: BondHolderPageQuery
+    ) -> list[BondHolder]:
+        """Retrieves one keyset page of a user's bondholders.
+
+        Rows are ordered by ``query.sort_by`` with the bondholder id as a
+        tie-breaker, and start strictly after ``query.after`` when it is set.
+
+        Args:
+            user_id: The owner of the bondholders.
+            query: Page size, ordering, keyset position and filters.
+
+        Returns:
+            At most ``query.limit`` BondHolder objects, all of them when it
+            is None.
+        """
+        pass
+
+    @abstractmethod
+    async def get_changes(self, user_id: UUID, since: datetime) -> BondHolderChangeSet:
+        """Retrieves holdings inserted, updated or deleted after ``since``.
+
+        Deletions are read from tombstones recorded by ``delete``.
+
+        Args:
+            user_id: The owner of the bondholders.
+            since: Watermark returned by the previous sync.
+
+        Returns:
+            The changes together with the watermark for the next sync.
+        """
+        pass
+
+    @abstractmethod
+    async def purge_tombstones(self, before: datetime) -> int:
+        """Removes deletion tombstones recorded before the given moment.
+
+        Args:
+            before: Tombstones older than this are removed.
+
+        Returns:
+            Number of removed tombstones.
+        """
+        pass
+
     @abstractmethod
     async def write(self, entity: BondHolder) -> BondHolder:
         pass
@@ -32,6 +99,32 @@ class BondHolderRepository(ABC):
     async def delete(self, bondholder_id: UUID) -> None:
         pass
 
+    @abstractmethod
+    async def apply_batch(
+        self,
+        user_id: UUID,
+        updated: list[BondHolder],
+        deleted: list[BondHolder],
+    ) -> list[BondHolder]:
+        """Writes quantity changes and deletions of a user in one transaction.
+
+        Deletions record tombstones like ``delete`` and remove bonds no
+        longer held by anyone.
+
+        Args:
+            user_id: The owner of all the bondholders.
+            updated: Bondholders whose quantity is written.
+            deleted: Bondholders to remove.
+
+        Returns:
+            The updated bondholders as stored.
+
+        Raises:
+            NotFoundError: If any bondholder is missing or owned by someone
+                else, in which case nothing is written.
+        """
+        pass
+
     @abstractmethod
     async def count_by_bond_id(self, bond_id: UUID) -> int:
         pass
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+
+class EquityHistoryRepository(ABC):
+    """Abstract read model computing equity history inside the data store.
+
+    Implementations must return the same points as
+    ``AnalyticsService.get_equity_history`` for the same holdings, without
+    loading the holdings themselves.
+    """
+
+    @abstractmethod
+    async def get_equity_history(
+        self, user_id: UUID, until: date
+    ) -> list[tuple[date, Decimal]]:
+        """Retrieves the cumulative face value of a user's holdings over time.
+
+        Args:
+            user_id: The owner of the holdings.
+            until: Last point of the timeline, normally today.
+
+        Returns:
+            Chart points ordered by date, or an empty list when the user
+            holds nothing.
+        """
+        pass
@@ -0,0 +1,71 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from uuid import UUID
+
+from src.domain.value_objects.portfolio_snapshot import PortfolioSnapshot
+
+
+class PortfolioSnapshotRepository(ABC):
+    """Abstract repository for the daily portfolio snapshot read model.
+
+    Snapshots are derived from holdings, bonds and reference rates. They are
+    rewritten from the first affected day forward whenever those change.
+    """
+
+    @abstractmethod
+    async def get_range(
+        self, user_id: UUID, end: date, start: date | None = None
+    ) -> list[PortfolioSnapshot]:
+        """Retrieves a user's snapshots between two days.
+
+        Args:
+            user_id: The owner of the portfolio.
+            end: Last day to include.
+            start: First day to include. All earlier days when omitted.
+
+        Returns:
+            Snapshots ordered by date.
+        """
+        pass
+
+    @abstractmethod
+    async def get_latest(self, user_id: UUID, until: date) -> PortfolioSnapshot | None:
+        """Retrieves a user's last snapshot on or before a day.
+
+        Args:
+            user_id: The owner of the portfolio.
+            until: Last day to consider.
+
+        Returns:
+            The snapshot, or None when the user has none up to ``until``.
+        """
+        pass
+
+    @abstractmethod
+    async def replace_from(
+        self, user_id: UUID, from_date: date, snapshots: list[PortfolioSnapshot]
+    ) -> None:
+        """Replaces a user's snapshots starting at ``from_date``.
+
+        Existing snapshots on or after ``from_date`` are removed and the given
+        ones are stored in the same transaction.
+
+        Args:
+            user_id: The owner of the portfolio.
+            from_date: First day to rewrite.
+            snapshots: New snapshots, all on or after ``from_date``.
+        """
+        pass
+
+    @abstractmethod
+    async def get_stale_users(self, as_of: date) -> list[tuple[UUID, date | None]]:
+        """Retrieves users holding bonds whose snapshots end before ``as_of``.
+
+        Args:
+            as_of: Day every snapshot series should reach.
+
+        Returns:
+            Pairs of user id and the day of their latest snapshot, None when
+            no snapshot was stored yet.
+        """
+        pass
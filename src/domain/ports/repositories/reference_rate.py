@@ -20,6 +20,10 @@ class ReferenceRateRepository(ABC):
     async def get_by_date(self, target_date: date) -> ReferenceRate | None:
         pass
 
+    @abstractmethod
+    async def get_between(self, start: date, end: date) -> list[ReferenceRate]:
+        pass
+
     @abstractmethod
     async def get_latest(self) -> ReferenceRate | None:
         pass
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.domain.value_objects.resource_versions import ResourceVersions
+
+
+class VersionRepository(ABC):
+    """Abstract repository for data change counters.
+
+    Counters only ever grow, so comparing two reads tells whether anything
+    derived from the underlying data may have changed in between.
+    """
+
+    @abstractmethod
+    async def get_versions(self, user_id: UUID) -> ResourceVersions:
+        """Retrieves the current counters relevant to a user's portfolio.
+
+        Args:
+            user_id: The owner of the portfolio.
+
+        Returns:
+            Portfolio and reference rate versions. Counters that were never
+            bumped are reported as 0.
+        """
+        pass
@@ -0,0 +1,85 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any
+
+from src.domain.value_objects.idempotency import IdempotencyKey, IdempotencyRecord
+
+
+class IdempotencyStore(ABC):
+    """Records the outcome of requests sent with an idempotency key.
+
+    A key is first claimed, then either completed with the request's result
+    or released when the request fails, so a retry can run it again. Claims
+    and results expire, which frees keys of crashed requests and bounds the
+    store's size.
+    """
+
+    @abstractmethod
+    async def claim(
+        self, key: IdempotencyKey, fingerprint: str, lease: timedelta
+    ) -> IdempotencyRecord | None:
+        """
+        Start processing the request under a key, unless one already is.
+
+        Args:
+            key: Request identifier
+            fingerprint: Digest of the request's payload
+            lease: How long the claim holds if never completed or released
+
+        Returns:
+            None if the caller now owns the key and must complete or release
+            it, otherwise the record of the earlier request
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self, key: IdempotencyKey, result: Any, ttl: timedelta) -> None:
+        """
+        Store the result of a claimed request for retries to replay.
+
+        Args:
+            key: Request identifier
+            result: Result to replay
+            ttl: How long the result is kept
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, key: IdempotencyKey) -> None:
+        """
+        Give up a claim after the request failed.
+
+        Args:
+            key: Request identifier
+        """
+        pass
+
+    @abstractmethod
+    async def wait(
+        self, key: IdempotencyKey, timeout: float
+    ) -> IdempotencyRecord | None:
+        """
+        Wait for the request under a key to complete.
+
+        Args:
+            key: Request identifier
+            timeout: Seconds to wait at most
+
+        Returns:
+            The record, still not completed if the wait timed out, or None
+            if the claim was released or expired meanwhile
+        """
+        pass
+
+    @abstractmethod
+    async def purge_expired(self, now: datetime) -> int:
+        """
+        Remove expired claims and results.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Number of removed records
+        """
+        pass
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+from src.domain.value_objects.live_update import LiveUpdate
+
+
+class LiveUpdatePublisher(ABC):
+    """Announces updates to the clients connected to any worker."""
+
+    @abstractmethod
+    async def publish(self, update: LiveUpdate) -> None:
+        """
+        Announce an update. Delivery is best effort: clients connected
+        nowhere, or too slow to keep up, miss it.
+
+        Args:
+            update: Update to push
+        """
+        pass
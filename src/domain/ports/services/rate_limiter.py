@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.domain.value_objects.rate_limit import RateLimit
+
+
+class RateLimiter(ABC):
+    """Token buckets, one per key, each spending a token per request.
+
+    A bucket starts full and refills continuously up to its burst size, so
+    a key left idle long enough is as good as new.
+    """
+
+    @abstractmethod
+    async def acquire(self, key: str, limit: RateLimit) -> float:
+        """
+        Take a token from the bucket of a key.
+
+        Args:
+            key: What is limited, e.g. a client address
+            limit: Size and refill rate of the bucket
+
+        Returns:
+            0 if a token was taken, otherwise the seconds until one is back
+        """
+        pass
+
+    @abstractmethod
+    async def purge_idle(self, idle_since: datetime) -> int:
+        """
+        Remove buckets unused since a given time.
+
+        Args:
+            idle_since: Buckets last used before it are removed
+
+        Returns:
+            Number of removed buckets
+        """
+        pass
@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from typing import Any
+from uuid import UUID
+
+from src.domain.value_objects.result_cache_key import ResultCacheKey
+
+
+class ResultCache(ABC):
+    """Bounded store of computed results.
+
+    Keys embed the data versions a result was computed at, so an entry never
+    goes stale; invalidation only reclaims space early.
+    """
+
+    @abstractmethod
+    async def get(self, key: ResultCacheKey) -> Any | None:
+        """
+        Fetch a cached result and mark it as recently used.
+
+        Args:
+            key: Result identifier
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: ResultCacheKey, value: Any) -> None:
+        """
+        Store a result, evicting the least recently used entries when full.
+
+        Args:
+            key: Result identifier
+            value: Result to store
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate_user(self, user_id: UUID) -> None:
+        """
+        Drop every cached result of a user.
+
+        Args:
+            user_id: Owner of the results
+        """
+        pass
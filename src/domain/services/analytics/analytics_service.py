@@ -1,7 +1,9 @@
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 
+from src.domain.entities.bond import Bond
 from src.domain.entities.bondholder import BondHolder
+from src.domain.value_objects.money import Money
 
 
 class AnalyticsService:
@@ -14,14 +16,23 @@ class AnalyticsService:
     DEFAULT_INTERVAL = timedelta(days=30)
 
     def get_equity_history(
-        self, bondholder_data: list[tuple[BondHolder, Decimal]]
+        self, bondholder_data: list[tuple[BondHolder, Bond]]
     ) -> list[tuple[date, Decimal]]:
-        bh_face_value = {bh.id: fv for bh, fv in bondholder_data}
-        bondholders = [bh for bh, _ in bondholder_data]
+        """
+        Face value of a portfolio at chart points from the first purchase on.
 
-        sorted_bhs = sorted(bondholders, key=lambda x: x.purchase_date)
+        A holding counts from its purchase day until its maturity day, when
+        the face value is paid back.
 
-        first_date = sorted_bhs[0].purchase_date
+        Args:
+            bondholder_data: Bondholders paired with their bond.
+
+        Returns:
+            Equity per timeline point, up to today.
+        """
+        changes = sorted(self._face_value_changes(bondholder_data))
+
+        first_date = min(bh.purchase_date for bh, _ in bondholder_data)
         last_date = datetime.now().date()
 
         timeline = self._determine_time_interval(first_date, last_date)
@@ -29,20 +40,197 @@ class AnalyticsService:
 
         history_equity: list[tuple[date, Decimal]] = []
         current_equity = Decimal(0)
-        bh_index = 0
+        change_index = 0
 
         for date_point in points:
             while (
-                bh_index < len(sorted_bhs)
-                and sorted_bhs[bh_index].purchase_date <= date_point
+                change_index < len(changes) and changes[change_index][0] <= date_point
             ):
-                bh = sorted_bhs[bh_index]
-                current_equity += bh.quantity * bh_face_value[bh.id]
-                bh_index += 1
+                current_equity += changes[change_index][1]
+                change_index += 1
 
             history_equity.append((date_point, current_equity))
         return history_equity
 
+    def get_equity_history_from_snapshots(
+        self, face_values: list[tuple[date, Decimal]]
+    ) -> list[tuple[date, Decimal]]:
+        """
+        Pick chart points from daily face values of a portfolio.
+
+        Uses the same timeline as ``get_equity_history``. A point falling on a
+        day without a value reuses the latest earlier value.
+
+        Args:
+            face_values: Face value per day, ordered by date. The first entry
+                is the day of the first purchase.
+
+        Returns:
+            Equity per timeline point, up to today.
+        """
+        if not face_values:
+            return []
+        first_date = face_values[0][0]
+        last_date = datetime.now().date()
+
+        timeline = self._determine_time_interval(first_date, last_date)
+        points = self._find_timeline_points(first_date, last_date, timeline)
+
+        history_equity: list[tuple[date, Decimal]] = []
+        current_equity = Decimal(0)
+        value_index = 0
+
+        for date_point in points:
+            while (
+                value_index < len(face_values)
+                and face_values[value_index][0] <= date_point
+            ):
+                current_equity = face_values[value_index][1]
+                value_index += 1
+
+            history_equity.append((date_point, current_equity))
+        return history_equity
+
+    def get_daily_equity(
+        self,
+        bondholder_data: list[tuple[BondHolder, Bond]],
+        start: date,
+        end: date,
+    ) -> list[tuple[date, Decimal]]:
+        """
+        Compute equity on every day of a window.
+
+        Purchases and maturities are recorded as changes at their day offset
+        and turned into daily values with a single prefix sum, so the cost is
+        linear in the number of days plus holdings. Sums run on whole grosze.
+
+        Args:
+            bondholder_data: Bondholders paired with their bond.
+            start: First day of the window (inclusive).
+            end: Last day of the window (inclusive).
+
+        Returns:
+            Equity per day, ordered by date.
+        """
+        days = (end - start).days + 1
+        if days <= 0:
+            return []
+        changes = [0] * days
+        for day, amount in self._face_value_changes(bondholder_data):
+            offset = max((day - start).days, 0)
+            if offset < days:
+                changes[offset] += Money.from_decimal(amount).grosze
+        return self._prefix_sums(start, changes)
+
+    @staticmethod
+    def _face_value_changes(
+        bondholder_data: list[tuple[BondHolder, Bond]],
+    ) -> list[tuple[date, Decimal]]:
+        """Face value each holding adds on purchase and takes away at maturity."""
+        changes: list[tuple[date, Decimal]] = []
+        for bh, bond in bondholder_data:
+            face_value = bond.nominal_value * bh.quantity
+            changes.append((bh.purchase_date, face_value))
+            changes.append((bh.maturity_date(bond.maturity_period), -face_value))
+        return changes
+
+    def get_daily_equity_from_snapshots(
+        self,
+        face_values: list[tuple[date, Decimal]],
+        start: date,
+        end: date,
+    ) -> list[tuple[date, Decimal]]:
+        """
+        Expand daily face values to every day of a window.
+
+        Days without a value reuse the latest earlier one, days before the
+        first value are zero.
+
+        Args:
+            face_values: Face value per day, ordered by date.
+            start: First day of the window (inclusive).
+            end: Last day of the window (inclusive).
+
+        Returns:
+            Equity per day, ordered by date.
+        """
+        days = (end - start).days + 1
+        if days <= 0:
+            return []
+        changes = [0] * days
+        previous = 0
+        for day, face_value in face_values:
+            offset = max((day - start).days, 0)
+            if offset >= days:
+                break
+            grosze = Money.from_decimal(face_value).grosze
+            changes[offset] += grosze - previous
+            previous = grosze
+        return self._prefix_sums(start, changes)
+
+    @staticmethod
+    def downsample_lttb(
+        points: list[tuple[date, Decimal]], max_points: int
+    ) -> list[tuple[date, Decimal]]:
+        """
+        Reduce a series with Largest-Triangle-Three-Buckets.
+
+        The first and last points are kept. The points in between are split
+        into ``max_points - 2`` buckets and from each the point forming the
+        largest triangle with the previously kept point and the average of
+        the next bucket is kept, which preserves the visual shape of the
+        series.
+
+        Args:
+            points: Series ordered by date.
+            max_points: Number of points to keep, at least 3.
+
+        Returns:
+            At most ``max_points`` points of the original series.
+        """
+        n = len(points)
+        if n <= max_points or max_points < 3:
+            return list(points)
+
+        xs = [day.toordinal() for day, _ in points]
+        ys = [float(value) for _, value in points]
+        bucket_size = (n - 2) / (max_points - 2)
+
+        sampled = [points[0]]
+        kept = 0
+        for bucket in range(max_points - 2):
+            next_start = int((bucket + 1) * bucket_size) + 1
+            next_end = min(int((bucket + 2) * bucket_size) + 1, n)
+            avg_x = sum(xs[next_start:next_end]) / (next_end - next_start)
+            avg_y = sum(ys[next_start:next_end]) / (next_end - next_start)
+
+            bucket_start = int(bucket * bucket_size) + 1
+            bucket_end = int((bucket + 1) * bucket_size) + 1
+            kept_x, kept_y = xs[kept], ys[kept]
+            best, best_area = bucket_start, -1.0
+            for i in range(bucket_start, bucket_end):
+                area = abs(
+                    (kept_x - avg_x) * (ys[i] - kept_y)
+                    - (kept_x - xs[i]) * (avg_y - kept_y)
+                )
+                if area > best_area:
+                    best, best_area = i, area
+            sampled.append(points[best])
+            kept = best
+
+        sampled.append(points[-1])
+        return sampled
+
+    @staticmethod
+    def _prefix_sums(start: date, changes: list[int]) -> list[tuple[date, Decimal]]:
+        """Running totals of daily changes in grosze, as zloty amounts."""
+        result: list[tuple[date, Decimal]] = []
+        running = 0
+        for offset, change in enumerate(changes):
+            running += change
+            result.append((start + timedelta(days=offset), Money(running).to_decimal()))
+        return result
+
     def _determine_time_interval(self, first_date: date, last_date: date) -> timedelta:
         days = (last_date - first_date).days
         for threshold, interval in self.INTERVAL_THRESHOLDS:
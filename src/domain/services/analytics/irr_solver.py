@@ -0,0 +1,122 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+LOWER_BOUND = -0.99
+UPPER_BOUND = 10.0
+INITIAL_GUESS = 0.05
+
+
+@dataclass(slots=True)
+class CashFlowMatrix:
+    """Ragged matrix of cash flows, one row per investment.
+
+    Rows are stored back to back in flat columns, the way a sparse CSR
+    matrix is, so every solver iteration walks contiguous lists instead of
+    one object per flow.
+
+    Args:
+        times (list[float]): Flow times in years from the start of the row.
+        amounts (list[float]): Signed flow amounts, outflows negative.
+        offsets (list[int]): Index of the first flow of every row, followed
+            by the total number of flows.
+    """
+
+    times: list[float] = field(default_factory=list)
+    amounts: list[float] = field(default_factory=list)
+    offsets: list[int] = field(default_factory=lambda: [0])
+
+    def add_row(self, flows: list[tuple[float, float]]) -> int:
+        """Append a row of ``(time, amount)`` flows and return its index."""
+        for time, amount in flows:
+            self.times.append(time)
+            self.amounts.append(amount)
+        self.offsets.append(len(self.times))
+        return len(self.offsets) - 2
+
+    @property
+    def rows(self) -> int:
+        return len(self.offsets) - 1
+
+
+def solve_irr(
+    matrix: CashFlowMatrix, tol: float = 1e-10, max_iter: int = 100
+) -> list[float | None]:
+    """
+    Solve the internal rate of return of every row at once.
+
+    Each iteration evaluates the net present value and its derivative for
+    all unsolved rows in one pass over the flat columns, then takes a Newton
+    step per row. A row keeps a sign-changing bracket and falls back to
+    bisection whenever Newton would leave it, so convergence is guaranteed
+    once a root is bracketed. Solved rows drop out of later passes.
+
+    Args:
+        matrix: Cash flows, one row per investment
+        tol: Absolute tolerance on the rate
+        max_iter: Iteration cap per row
+
+    Returns:
+        Annual rate per row as a fraction, None when the flows have no rate
+        within (-99%, 1000%)
+    """
+    rows = matrix.rows
+    result: list[float | None] = [None] * rows
+    lower = [LOWER_BOUND] * rows
+    upper = [UPPER_BOUND] * rows
+    npv_lower, _ = _npv(matrix, range(rows), lower)
+    npv_upper, _ = _npv(matrix, range(rows), upper)
+
+    active = []
+    for row in range(rows):
+        if npv_lower[row] == 0:
+            result[row] = LOWER_BOUND
+        elif npv_upper[row] == 0:
+            result[row] = UPPER_BOUND
+        elif (npv_lower[row] > 0) != (npv_upper[row] > 0):
+            active.append(row)
+    lower_sign = [npv_lower[row] > 0 for row in range(rows)]
+    rate = [INITIAL_GUESS] * rows
+
+    for _ in range(max_iter):
+        if not active:
+            break
+        values, slopes = _npv(matrix, active, rate)
+        still_active = []
+        for row in active:
+            value, slope = values[row], slopes[row]
+            if value == 0:
+                result[row] = rate[row]
+                continue
+            if (value > 0) == lower_sign[row]:
+                lower[row] = rate[row]
+            else:
+                upper[row] = rate[row]
+            step = rate[row] - value / slope if slope else None
+            if step is None or not lower[row] < step < upper[row]:
+                step = (lower[row] + upper[row]) / 2
+            if abs(step - rate[row]) < tol or upper[row] - lower[row] < tol:
+                result[row] = step
+                continue
+            rate[row] = step
+            still_active.append(row)
+        active = still_active
+    return result
+
+
+def _npv(
+    matrix: CashFlowMatrix, rows: Iterable[int], rate: list[float]
+) -> tuple[dict[int, float], dict[int, float]]:
+    """Net present value and its derivative with respect to the rate, per row."""
+    times, amounts, offsets = matrix.times, matrix.amounts, matrix.offsets
+    values: dict[int, float] = {}
+    slopes: dict[int, float] = {}
+    for row in rows:
+        base = 1.0 + rate[row]
+        value = slope = 0.0
+        for i in range(offsets[row], offsets[row + 1]):
+            discounted = amounts[i] * base ** -times[i]
+            value += discounted
+            slope -= times[i] * discounted / base
+        values[row] = value
+        slopes[row] = slope
+    return values, slopes
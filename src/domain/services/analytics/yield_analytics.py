@@ -0,0 +1,124 @@
+from bisect import bisect_right
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.entities.reference_rate import ReferenceRate
+from src.domain.services.analytics.irr_solver import CashFlowMatrix, solve_irr
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.value_objects.yield_report import HoldingYield, YieldReport
+
+DAYS_IN_YEAR = 365
+
+
+class YieldAnalyticsService:
+    """Domain service computing the expected return of holdings"""
+
+    def __init__(self, income_calculator: BondHolderIncomeCalculator) -> None:
+        self.income_calculator = income_calculator
+
+    def analyze(
+        self,
+        holdings: list[tuple[BondHolder, Bond]],
+        reference_rates: list[ReferenceRate],
+    ) -> YieldReport:
+        """
+        Compute the IRR of every holding and of the whole portfolio.
+
+        Each holding is modelled as buying at face value on the purchase
+        day, receiving its net monthly coupons and getting the face value
+        back at maturity. Variable-rate coupons use the reference rate in
+        force at the period start; periods past the known history keep the
+        latest rate. All holdings and the combined portfolio are solved in
+        a single batched pass.
+
+        Args:
+            holdings: Bondholders paired with their bonds
+            reference_rates: Reference rate history, at least one rate
+
+        Returns:
+            IRR per holding and for the portfolio
+        """
+        if not holdings:
+            return YieldReport(holdings=[], portfolio_irr=None)
+
+        rates = sorted(reference_rates, key=lambda r: r.start_date)
+        rate_starts = [rate.start_date for rate in rates]
+        unit_coupons: dict[tuple[UUID, Decimal | None, int], Decimal] = {}
+        schedules = [
+            self._cash_flows(bh, bond, rates, rate_starts, unit_coupons)
+            for bh, bond in holdings
+        ]
+
+        origin = min(bh.purchase_date for bh, _ in holdings)
+        portfolio_flows: dict[date, float] = {}
+        matrix = CashFlowMatrix()
+        for (bh, _), schedule in zip(holdings, schedules):
+            matrix.add_row(self._to_years(bh.purchase_date, schedule))
+            for day, amount in schedule:
+                portfolio_flows[day] = portfolio_flows.get(day, 0.0) + amount
+        matrix.add_row(self._to_years(origin, sorted(portfolio_flows.items())))
+
+        irr = solve_irr(matrix)
+        return YieldReport(
+            holdings=[
+                HoldingYield(
+                    bondholder_id=bh.id, series=bond.series, irr=self._percent(rate)
+                )
+                for (bh, bond), rate in zip(holdings, irr)
+            ],
+            portfolio_irr=self._percent(irr[-1]),
+        )
+
+    def _cash_flows(
+        self,
+        bondholder: BondHolder,
+        bond: Bond,
+        rates: list[ReferenceRate],
+        rate_starts: list[date],
+        unit_coupons: dict[tuple[UUID, Decimal | None, int], Decimal],
+    ) -> list[tuple[date, float]]:
+        """
+        Dated net flows of one holding, the purchase first.
+
+        Coupons of a single bond are cached in ``unit_coupons`` by rate and
+        period length, shared by every holding of the same bond.
+        """
+        face_value = bondholder.quantity * bond.nominal_value
+
+        flows = [(bondholder.purchase_date, -float(face_value))]
+        period_start = bondholder.purchase_date
+        for months, payment_date in enumerate(
+            bondholder.payment_dates(maturity_period=bond.maturity_period), start=1
+        ):
+            reference_rate = None
+            if months > bond.first_interest_period:
+                index = max(bisect_right(rate_starts, period_start) - 1, 0)
+                reference_rate = rates[index].value
+            length = (payment_date - period_start).days
+            key = (bond.id, reference_rate, length)
+            if key not in unit_coupons:
+                unit_coupons[key] = self.income_calculator.calculate_period_income(
+                    bond=bond,
+                    quantity=1,
+                    days_in_period=length,
+                    reference_rate=reference_rate,
+                )
+            flows.append((payment_date, float(unit_coupons[key] * bondholder.quantity)))
+            period_start = payment_date
+        flows.append((period_start, float(face_value)))
+        return flows
+
+    @staticmethod
+    def _to_years(
+        origin: date, flows: list[tuple[date, float]]
+    ) -> list[tuple[float, float]]:
+        return [((day - origin).days / DAYS_IN_YEAR, amount) for day, amount in flows]
+
+    @staticmethod
+    def _percent(rate: float | None) -> Decimal | None:
+        if rate is None:
+            return None
+        return Decimal(str(rate * 100)).quantize(Decimal("0.0001"))
@@ -1,10 +1,24 @@
 from datetime import date, datetime
 from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta  # type: ignore [import-untyped]
 
 from src.domain.entities.bond import Bond
 from src.domain.entities.bondholder import BondHolder
 from src.domain.entities.reference_rate import ReferenceRate
+from src.domain.value_objects.money import Money, Rate
+
+NET_OF_TAX_PERCENT = 81
+
+
+@lru_cache(maxsize=1024)
+def _to_money(value: Decimal) -> Money | None:
+    return Money.from_decimal_exact(value)
+
+
+@lru_cache(maxsize=1024)
+def _to_rate(percent: Decimal) -> Rate | None:
+    return Rate.from_percent_exact(percent)
 
 
 class BondHolderIncomeCalculator:
@@ -53,6 +67,37 @@ class BondHolderIncomeCalculator:
             days_in_month=days_in_period,
         )
 
+    def calculate_period_income(
+        self,
+        bond: Bond,
+        quantity: int,
+        days_in_period: int,
+        reference_rate: Decimal | None = None,
+    ) -> Decimal:
+        """
+        Calculate net income of one monthly period of known length.
+
+        Args:
+            bond: Bond object
+            quantity: Number of bonds held
+            days_in_period: Length of the monthly period in days
+            reference_rate: Reference rate as percentage for periods paying
+                the variable rate, None for the first, fixed rate period
+
+        Returns:
+            Net income after tax for all bonds in the period
+        """
+        if reference_rate is None:
+            return self._calculate_interest_income(
+                bond=bond, quantity=quantity, days_in_month=days_in_period
+            )
+        return self._calculate_regular_income(
+            bond=bond,
+            reference_rate=reference_rate,
+            quantity=quantity,
+            days_in_month=days_in_period,
+        )
+
     def _calculate_interest_income(
         self,
         bond: Bond,
@@ -71,6 +116,11 @@ class BondHolderIncomeCalculator:
         Returns:
             Total net income after 19% tax (Belka tax) for all bonds
         """
+        nominal = _to_money(bond.nominal_value)
+        rate = _to_rate(bond.initial_interest_rate)
+        if nominal is not None and rate is not None:
+            return self._net_income(rate.interest(nominal, days_in_month), quantity)
+
         daily_rate = (
             bond.nominal_value
             * self._from_percent(bond.initial_interest_rate)
@@ -102,6 +152,14 @@ class BondHolderIncomeCalculator:
         Returns:
             Total net income after 19% tax (Belka tax) for all bonds
         """
+        nominal = _to_money(bond.nominal_value)
+        ref_rate = _to_rate(reference_rate)
+        margin = _to_rate(bond.reference_rate_margin)
+        if nominal is not None and ref_rate is not None and margin is not None:
+            return self._net_income(
+                (ref_rate + margin).interest(nominal, days_in_month), quantity
+            )
+
         annual_rate = self._from_percent(reference_rate) + self._from_percent(
             bond.reference_rate_margin
         )
@@ -111,6 +169,18 @@ class BondHolderIncomeCalculator:
 
         return gross_interest_per_bond * Decimal("0.81") * quantity
 
+    @staticmethod
+    def _net_income(gross_interest_per_bond: Money, quantity: int) -> Decimal:
+        """
+        Net income after 19% tax of ``quantity`` bonds, computed on integers.
+
+        The product is held in 1/10000 PLN, the exact scale of a grosz amount
+        times 0.81, so the result equals the Decimal formula digit for digit.
+        """
+        return Decimal(
+            gross_interest_per_bond.grosze * NET_OF_TAX_PERCENT * quantity
+        ).scaleb(-4)
+
     @staticmethod
     def _from_percent(percent: Decimal) -> Decimal:
         """
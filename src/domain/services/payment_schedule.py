@@ -0,0 +1,94 @@
+import heapq
+from collections.abc import Iterator
+from datetime import date
+from itertools import islice
+
+from dateutil.relativedelta import relativedelta  # type: ignore [import-untyped]
+
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.entities.reference_rate import ReferenceRate
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.value_objects.scheduled_payment import ScheduledPayment
+
+
+class PaymentScheduleService:
+    """Domain service listing the upcoming coupon payments of a portfolio"""
+
+    def __init__(self, income_calculator: BondHolderIncomeCalculator) -> None:
+        self.income_calculator = income_calculator
+
+    def upcoming(
+        self,
+        holdings: list[tuple[BondHolder, Bond]],
+        after: date,
+        limit: int,
+        reference_rate: ReferenceRate | None = None,
+    ) -> list[ScheduledPayment]:
+        """
+        Find the next payments across all holdings.
+
+        Every holding yields its payment dates lazily and the streams are
+        merged with a heap, so only ``limit`` payments are generated and
+        priced, at O(limit * log(holdings)) after an O(holdings) heapify.
+
+        Args:
+            holdings: Bondholders paired with their bonds
+            after: Only payments strictly after this day are listed
+            limit: Maximum number of payments to return
+            reference_rate: Rate assumed for coupons paying the variable rate
+
+        Returns:
+            Payments ordered by date
+        """
+        streams = [
+            self._schedule(index, bh, bond, after)
+            for index, (bh, bond) in enumerate(holdings)
+        ]
+        return [
+            self._price(bh, bond, payment_date, reference_rate)
+            for payment_date, _, bh, bond in islice(heapq.merge(*streams), limit)
+        ]
+
+    @staticmethod
+    def _schedule(
+        index: int, bondholder: BondHolder, bond: Bond, after: date
+    ) -> Iterator[tuple[date, int, BondHolder, Bond]]:
+        """Tag each payment date with its holding; the index breaks date ties."""
+        for payment_date in bondholder.payment_dates(
+            maturity_period=bond.maturity_period, after=after
+        ):
+            yield payment_date, index, bondholder, bond
+
+    def _price(
+        self,
+        bondholder: BondHolder,
+        bond: Bond,
+        payment_date: date,
+        reference_rate: ReferenceRate | None,
+    ) -> ScheduledPayment:
+        purchase_date = bondholder.purchase_date
+        months = (
+            (payment_date.year - purchase_date.year) * 12
+            + payment_date.month
+            - purchase_date.month
+        )
+        period_start = purchase_date + relativedelta(months=months - 1)
+        fixed = months <= bond.first_interest_period
+
+        amount = None
+        if fixed or reference_rate is not None:
+            amount = self.income_calculator.calculate_period_income(
+                bond=bond,
+                quantity=bondholder.quantity,
+                days_in_period=(payment_date - period_start).days,
+                reference_rate=(
+                    None if fixed or reference_rate is None else reference_rate.value
+                ),
+            )
+        return ScheduledPayment(
+            payment_date=payment_date,
+            bondholder_id=bondholder.id,
+            series=bond.series,
+            amount=amount,
+        )
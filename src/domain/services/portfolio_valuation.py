@@ -0,0 +1,177 @@
+from bisect import bisect_right
+from calendar import monthrange
+from datetime import date, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from uuid import UUID
+
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.entities.reference_rate import ReferenceRate
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.value_objects.portfolio_snapshot import PortfolioSnapshot
+
+
+class PortfolioValuationService:
+    """Domain service valuing a portfolio day by day"""
+
+    def __init__(self, income_calculator: BondHolderIncomeCalculator) -> None:
+        self.income_calculator = income_calculator
+
+    def value_daily(
+        self,
+        user_id: UUID,
+        holdings: list[tuple[BondHolder, Bond]],
+        reference_rates: list[ReferenceRate],
+        start: date,
+        end: date,
+    ) -> list[PortfolioSnapshot]:
+        """
+        Value a user's holdings on every day of a period.
+
+        Holdings pay a coupon per monthly period counted from the purchase
+        day, at the fixed initial rate during the first interest period and
+        at the reference rate in force on the period start afterwards.
+        Periods with no applicable reference rate pay nothing. A holding
+        stops at maturity, after ``maturity_period`` periods, when its face
+        value is paid back and leaves the portfolio.
+
+        Each holding contributes its face value once and, per period, a
+        constant monthly income and a linear accrual ramp. These are
+        recorded as changes at the period bounds and turned into daily
+        values in a single sweep over the date axis, so the cost is
+        proportional to the number of periods plus days rather than their
+        product.
+
+        Args:
+            user_id: Owner of the holdings
+            holdings: Bondholders paired with their bonds
+            reference_rates: Reference rates covering the period
+            start: First day to value (inclusive)
+            end: Last day to value (inclusive)
+
+        Returns:
+            One snapshot per day, ordered by date
+        """
+        days = (end - start).days + 1
+        if days <= 0:
+            return []
+
+        face_changes = [Decimal(0)] * (days + 1)
+        income_changes = [Decimal(0)] * (days + 1)
+        slope_changes = [Decimal(0)] * (days + 1)
+        intercept_changes = [Decimal(0)] * (days + 1)
+
+        rates = sorted(reference_rates, key=lambda r: r.start_date)
+        rate_starts = [rate.start_date for rate in rates]
+        unit_coupons: dict[tuple[UUID, Decimal | None, int], Decimal] = {}
+
+        for bh, bond in holdings:
+            maturity = bh.maturity_date(bond.maturity_period)
+            if bh.purchase_date > end or maturity <= start:
+                continue
+            principal = bh.quantity * bond.nominal_value
+            face_changes[max((bh.purchase_date - start).days, 0)] += principal
+            if maturity <= end:
+                face_changes[(maturity - start).days] -= principal
+
+            months = self._months_before(bh.purchase_date, start)
+            period_start = self._add_months(bh.purchase_date, months)
+            while period_start <= end and months < bond.maturity_period:
+                months += 1
+                period_end = self._add_months(bh.purchase_date, months)
+                length = (period_end - period_start).days
+                fixed = months <= bond.first_interest_period
+                rate_value = (
+                    None if fixed else self._rate_on(rates, rate_starts, period_start)
+                )
+                if fixed or rate_value is not None:
+                    key = (bond.id, rate_value, length)
+                    if key not in unit_coupons:
+                        unit_coupons[key] = (
+                            self.income_calculator.calculate_period_income(
+                                bond=bond,
+                                quantity=1,
+                                days_in_period=length,
+                                reference_rate=rate_value,
+                            )
+                        )
+                    coupon = unit_coupons[key] * bh.quantity
+
+                    first = max((period_start - start).days, 0)
+                    last = min((period_end - start).days, days)
+                    slope = coupon / length
+                    intercept = -slope * (period_start - start).days
+                    income_changes[first] += coupon
+                    income_changes[last] -= coupon
+                    slope_changes[first] += slope
+                    slope_changes[last] -= slope
+                    intercept_changes[first] += intercept
+                    intercept_changes[last] -= intercept
+                period_start = period_end
+
+        snapshots: list[PortfolioSnapshot] = []
+        face_value = income = slope = intercept = Decimal(0)
+        for offset in range(days):
+            face_value += face_changes[offset]
+            income += income_changes[offset]
+            slope += slope_changes[offset]
+            intercept += intercept_changes[offset]
+            snapshots.append(
+                PortfolioSnapshot(
+                    user_id=user_id,
+                    snapshot_date=start + timedelta(days=offset),
+                    face_value=face_value,
+                    accrued_interest=self._round(slope * offset + intercept),
+                    monthly_income=self._round(income),
+                )
+            )
+        return snapshots
+
+    @staticmethod
+    def _rate_on(
+        rates: list[ReferenceRate], rate_starts: list[date], day: date
+    ) -> Decimal | None:
+        """
+        Find the value of the reference rate in force on a day.
+
+        Args:
+            rates: Reference rates ordered by start date
+            rate_starts: Start dates of ``rates``, for bisection
+
+        Returns:
+            Rate value as percentage, None if no rate applies
+        """
+        index = bisect_right(rate_starts, day) - 1
+        if index < 0:
+            return None
+        rate = rates[index]
+        if rate.end_date and rate.end_date < day:
+            return None
+        return rate.value
+
+    @classmethod
+    def _months_before(cls, purchase_date: date, day: date) -> int:
+        """
+        Count whole monthly periods between the purchase and a day.
+
+        Returns:
+            Index of the period containing ``day``, 0 if it precedes the purchase
+        """
+        if day <= purchase_date:
+            return 0
+        months = (day.year - purchase_date.year) * 12 + day.month - purchase_date.month
+        if cls._add_months(purchase_date, months) > day:
+            months -= 1
+        return months
+
+    @staticmethod
+    def _add_months(day: date, months: int) -> date:
+        """Shift a date by whole months, clamping to the end of shorter months."""
+        year, month = divmod(day.month - 1 + months, 12)
+        year += day.year
+        month += 1
+        return date(year, month, min(day.day, monthrange(year, month)[1]))
+
+    @staticmethod
+    def _round(value: Decimal) -> Decimal:
+        return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.entities.bondholder import BondHolder
+
+
+@dataclass(frozen=True, slots=True)
+class BondHolderChangeSet:
+    """Bondholder changes of a single user since a watermark.
+
+    Args:
+        watermark (datetime): Point in time the next sync should continue from.
+        inserted (list[BondHolder]): Holdings created after the previous watermark.
+        updated (list[BondHolder]): Older holdings modified after the previous watermark.
+        deleted (list[UUID]): Identifiers of holdings removed after the previous
+            watermark.
+    """
+
+    watermark: datetime
+    inserted: list[BondHolder] = field(default_factory=list)
+    updated: list[BondHolder] = field(default_factory=list)
+    deleted: list[UUID] = field(default_factory=list)
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from enum import StrEnum
+from uuid import UUID
+
+
+class BondHolderSortField(StrEnum):
+    """Columns a bondholder listing can be ordered by."""
+
+    PURCHASE_DATE = "purchase_date"
+    SERIES = "series"
+    QUANTITY = "quantity"
+    VALUE = "value"
+
+
+type SortValue = date | str | int | Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class BondHolderCursor:
+    """Keyset position: the sort value and id of the last row already returned.
+
+    Args:
+        sort_value (SortValue): Value of the sort column for the last returned row.
+        id (UUID): Identifier of the last returned row, used as a tie-breaker.
+    """
+
+    sort_value: SortValue
+    id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class BondHolderPageQuery:
+    """Describes one page of a user's bondholders.
+
+    Args:
+        limit (int | None): Maximum number of rows to return, None for all.
+        sort_by (BondHolderSortField): Column the rows are ordered by.
+        descending (bool): Sort direction. The id tie-breaker follows it.
+        after (BondHolderCursor | None): Keyset position to continue from.
+        series_prefix (str | None): Only bonds whose series starts with it.
+        purchased_from (date | None): Only purchases made on or after this date.
+        purchased_to (date | None): Only purchases made on or before this date.
+    """
+
+    limit: int | None
+    sort_by: BondHolderSortField = BondHolderSortField.PURCHASE_DATE
+    descending: bool = True
+    after: BondHolderCursor | None = None
+    series_prefix: str | None = None
+    purchased_from: date | None = None
+    purchased_to: date | None = None
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import date
+
+DEFAULT_MAX_POINTS = 500
+
+
+@dataclass(frozen=True, slots=True)
+class EquityHistoryQuery:
+    """Describes a window of a user's daily equity and its point budget.
+
+    Args:
+        start (date | None): First day of the window. Day of the first
+            purchase when omitted.
+        end (date | None): Last day of the window. Today when omitted.
+        max_points (int): Upper bound on the number of returned points.
+        include_accrued (bool): Add interest accrued since the last coupon
+            to the face value.
+    """
+
+    start: date | None = None
+    end: date | None = None
+    max_points: int = DEFAULT_MAX_POINTS
+    include_accrued: bool = False
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyKey:
+    """Identifies a request by the key its client sent with it.
+
+    Args:
+        operation (str): Kind of request, e.g. ``bondholder_create``.
+        user_id (UUID): User who sent the request.
+        key (str): Value of the client's ``Idempotency-Key`` header.
+    """
+
+    operation: str
+    user_id: UUID
+    key: str
+
+    def __str__(self) -> str:
+        return f"{self.operation}:{self.user_id}:{self.key}"
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyRecord:
+    """What is known of a request made earlier with the same key.
+
+    Args:
+        fingerprint (str): Digest of the request's payload, to tell a retry
+            from a different request reusing the key.
+        completed (bool): Whether the request finished; False while it is
+            still being processed.
+        result (Any): Result of the completed request.
+    """
+
+    fingerprint: str
+    completed: bool
+    result: Any = None
@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceRateChanged:
+    """A new reference rate was published, for every user.
+
+    Args:
+        value (Decimal): The new rate.
+        effective_date (date): First day the rate applies to.
+    """
+
+    value: Decimal
+    effective_date: date
+
+    @property
+    def user_id(self) -> None:
+        return None
+
+    def merged(self, newer: "ReferenceRateChanged") -> "ReferenceRateChanged":
+        return newer
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioRevalued:
+    """A user's portfolio was valued again, after its holdings or a rate changed.
+
+    Args:
+        user_id (UUID): Owner of the portfolio.
+        as_of (date): Day of the valuation.
+        equity (Decimal): Face value of the holdings.
+        monthly_income (Decimal): Net income of the running monthly periods.
+        equity_delta (Decimal): Change of ``equity`` since the last valuation.
+        monthly_income_delta (Decimal): Change of ``monthly_income`` since
+            the last valuation.
+    """
+
+    user_id: UUID
+    as_of: date
+    equity: Decimal
+    monthly_income: Decimal
+    equity_delta: Decimal
+    monthly_income_delta: Decimal
+
+    def merged(self, newer: "PortfolioRevalued") -> "PortfolioRevalued":
+        """Combine with a later revaluation, keeping the total change."""
+        return PortfolioRevalued(
+            user_id=newer.user_id,
+            as_of=newer.as_of,
+            equity=newer.equity,
+            monthly_income=newer.monthly_income,
+            equity_delta=self.equity_delta + newer.equity_delta,
+            monthly_income_delta=self.monthly_income_delta + newer.monthly_income_delta,
+        )
+
+
+LiveUpdate = ReferenceRateChanged | PortfolioRevalued
+"""Anything pushed to connected clients as it happens."""
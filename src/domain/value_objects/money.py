@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Self
+
+GROSZE_PER_ZLOTY = 100
+BASIS_POINTS_PER_UNIT = 10_000
+
+
+def round_half_up(numerator: int, denominator: int) -> int:
+    """
+    Divide two integers rounding halves away from zero, like ROUND_HALF_UP.
+
+    Args:
+        numerator: Dividend
+        denominator: Positive divisor
+
+    Returns:
+        Nearest integer to ``numerator / denominator``
+    """
+    quotient = (2 * abs(numerator) + denominator) // (2 * denominator)
+    return quotient if numerator >= 0 else -quotient
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class Money:
+    """Amount of Polish zloty held as an integer number of grosze.
+
+    Args:
+        grosze (int): Amount in grosze (1/100 PLN).
+    """
+
+    grosze: int
+
+    @classmethod
+    def from_decimal(cls, value: Decimal) -> Self:
+        """Round a zloty amount half up to whole grosze."""
+        return cls(
+            int(value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP).scaleb(2))
+        )
+
+    @classmethod
+    def from_decimal_exact(cls, value: Decimal) -> Self | None:
+        """Convert a zloty amount, None if it has a fraction of a grosz."""
+        grosze = value.scaleb(2)
+        if grosze != grosze.to_integral_value():
+            return None
+        return cls(int(grosze))
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.grosze).scaleb(-2)
+
+    def __add__(self, other: "Money") -> "Money":
+        return Money(self.grosze + other.grosze)
+
+    def __sub__(self, other: "Money") -> "Money":
+        return Money(self.grosze - other.grosze)
+
+    def __mul__(self, factor: int) -> "Money":
+        return Money(self.grosze * factor)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Money":
+        return Money(-self.grosze)
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class Rate:
+    """Annual interest rate held as an integer number of basis points.
+
+    Args:
+        basis_points (int): Rate in basis points (1/100 of a percent).
+    """
+
+    basis_points: int
+
+    @classmethod
+    def from_percent(cls, percent: Decimal) -> Self:
+        """Convert a percentage, rounding half up to whole basis points."""
+        return cls(
+            int(percent.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP).scaleb(2))
+        )
+
+    @classmethod
+    def from_percent_exact(cls, percent: Decimal) -> Self | None:
+        """Convert a percentage, None if it has a fraction of a basis point."""
+        basis_points = percent.scaleb(2)
+        if basis_points != basis_points.to_integral_value():
+            return None
+        return cls(int(basis_points))
+
+    def to_percent(self) -> Decimal:
+        return Decimal(self.basis_points).scaleb(-2)
+
+    def __add__(self, other: "Rate") -> "Rate":
+        return Rate(self.basis_points + other.basis_points)
+
+    def interest(self, principal: Money, days: int, days_in_year: int = 365) -> Money:
+        """
+        Simple interest on a principal over a number of days.
+
+        Computed exactly on integers and rounded half up to whole grosze, the
+        same as ``principal * rate * days / days_in_year`` quantized with
+        ROUND_HALF_UP.
+        """
+        return Money(
+            round_half_up(
+                principal.grosze * self.basis_points * days,
+                BASIS_POINTS_PER_UNIT * days_in_year,
+            )
+        )
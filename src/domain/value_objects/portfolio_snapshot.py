@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioSnapshot:
+    """Valuation of a user's holdings at the end of one day.
+
+    Args:
+        user_id (UUID): Owner of the holdings.
+        snapshot_date (date): Day the valuation refers to.
+        face_value (Decimal): Sum of nominal values of the held bonds.
+        accrued_interest (Decimal): Net interest accrued in the running
+            monthly periods and not paid out yet.
+        monthly_income (Decimal): Net income of the running monthly periods.
+    """
+
+    user_id: UUID
+    snapshot_date: date
+    face_value: Decimal
+    accrued_interest: Decimal
+    monthly_income: Decimal
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    """Token bucket allowing bursts of ``burst`` requests, refilled steadily.
+
+    Args:
+        burst (int): Tokens in a full bucket, i.e. requests allowed at once.
+        per_minute (int): Tokens added back per minute.
+    """
+
+    burst: int
+    per_minute: int
+
+    @property
+    def per_second(self) -> float:
+        return self.per_minute / 60
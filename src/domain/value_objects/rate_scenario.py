@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+from src.domain.exceptions import ValidationError
+
+MAX_HORIZON_MONTHS = 120
+MAX_PATHS = 100_000
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+@dataclass(frozen=True, slots=True)
+class RateScenarioQuery:
+    """Describes the reference rate paths to project income under.
+
+    Either ``shocks_bp`` lists parallel shifts of the current rate, one
+    path each, or ``paths`` asks for that many monthly random walks.
+
+    Args:
+        horizon_months (int): Number of months to project, the current one first.
+        shocks_bp (tuple[int, ...]): Parallel shifts in basis points.
+        paths (int): Number of random-walk paths.
+        volatility_bp (int): Standard deviation of a random-walk monthly step.
+        seed (int | None): Seed making random walks reproducible.
+    """
+
+    horizon_months: int = 12
+    shocks_bp: tuple[int, ...] = ()
+    paths: int = 0
+    volatility_bp: int = 25
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.horizon_months <= MAX_HORIZON_MONTHS:
+            raise ValidationError(
+                f"Horizon must be between 1 and {MAX_HORIZON_MONTHS} months"
+            )
+        if bool(self.shocks_bp) == bool(self.paths):
+            raise ValidationError("Provide either rate shocks or a number of paths")
+        if not 0 <= self.paths <= MAX_PATHS:
+            raise ValidationError(f"Number of paths must not exceed {MAX_PATHS}")
+        if self.volatility_bp < 0:
+            raise ValidationError("Volatility must not be negative")
+
+
+@dataclass(frozen=True, slots=True)
+class IncomeBand:
+    """Distribution of a month's projected income across rate paths.
+
+    Args:
+        month (date): First day of the month.
+        percentiles (dict[int, Decimal]): Net income at each percentile of
+            ``PERCENTILES``.
+    """
+
+    month: date
+    percentiles: dict[int, Decimal]
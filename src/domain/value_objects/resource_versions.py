@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceVersions:
+    """Change counters of the data a user's portfolio views are derived from.
+
+    Args:
+        portfolio (int): Bumped on every write to the user's bondholders.
+        reference_rate (int): Bumped on every write to the reference rates.
+    """
+
+    portfolio: int
+    reference_rate: int
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
+from src.domain.value_objects.resource_versions import ResourceVersions
+
+
+@dataclass(frozen=True, slots=True)
+class ResultCacheKey:
+    """Identifies a computed result by everything it was derived from.
+
+    Args:
+        namespace (str): Kind of result, e.g. ``income`` or ``equity``.
+        user_id (UUID): Owner of the portfolio the result describes.
+        versions (ResourceVersions): Data versions the result was computed at.
+        target_date (date): Date the result was computed for.
+        variant (str): Further parameters of the computation, empty if none.
+    """
+
+    namespace: str
+    user_id: UUID
+    versions: ResourceVersions
+    target_date: date
+    variant: str = ""
+
+    def __str__(self) -> str:
+        key = (
+            f"{self.namespace}:{self.user_id}:{self.versions.portfolio}:"
+            f"{self.versions.reference_rate}:{self.target_date.isoformat()}"
+        )
+        return f"{key}:{self.variant}" if self.variant else key
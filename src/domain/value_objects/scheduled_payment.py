@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduledPayment:
+    """One future coupon payment of a holding.
+
+    Args:
+        payment_date (date): Day the coupon is paid.
+        bondholder_id (UUID): Holding the coupon is paid for.
+        series (str): Series of the held bond.
+        amount (Decimal | None): Expected net amount. None when the coupon
+            depends on a reference rate that is not known yet.
+    """
+
+    payment_date: date
+    bondholder_id: UUID
+    series: str
+    amount: Decimal | None
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class HoldingYield:
+    """Expected net return of one holding held to maturity.
+
+    Args:
+        bondholder_id (UUID): Holding the figures refer to.
+        series (str): Series of the held bond.
+        irr (Decimal | None): Internal rate of return of the holding's cash
+            flows as an effective annual percentage. None if it has no rate.
+    """
+
+    bondholder_id: UUID
+    series: str
+    irr: Decimal | None
+
+
+@dataclass(frozen=True, slots=True)
+class YieldReport:
+    """Expected net returns of a portfolio held to maturity.
+
+    Args:
+        holdings (list[HoldingYield]): Figures per holding.
+        portfolio_irr (Decimal | None): Internal rate of return of all
+            holdings' cash flows combined, as an effective annual percentage.
+    """
+
+    holdings: list[HoldingYield]
+    portfolio_irr: Decimal | None
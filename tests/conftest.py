@@ -1,7 +1,8 @@
+from collections.abc import Callable
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, Mock
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -59,6 +60,46 @@ def bond_entity_mock() -> Mock:
     return bond
 
 
+@pytest.fixture
+def bond() -> BondEntity:
+    return BondEntity.create(
+        series="ROR1111",
+        nominal_value=Decimal("100"),
+        maturity_period=12,
+        initial_interest_rate=Decimal("4.75"),
+        first_interest_period=1,
+        reference_rate_margin=Decimal("0.1"),
+    )
+
+
+@pytest.fixture
+def reference_rate() -> ReferenceRateEntity:
+    return ReferenceRateEntity(
+        id=uuid4(), value=Decimal("5.75"), start_date=date(2024, 1, 1), end_date=None
+    )
+
+
+@pytest.fixture
+def make_bondholder() -> Callable[..., BondHolderEntity]:
+    """Factory of stored holdings of a bond, by default 10 bought on 1 Jan 2025."""
+
+    def make(
+        bond: BondEntity,
+        purchase_date: date = date(2025, 1, 1),
+        quantity: int = 10,
+        user_id: UUID | None = None,
+    ) -> BondHolderEntity:
+        return BondHolderEntity(
+            id=uuid4(),
+            bond_id=bond.id,
+            user_id=user_id or uuid4(),
+            quantity=quantity,
+            purchase_date=purchase_date,
+        )
+
+    return make
+
+
 @pytest.fixture
 def user_entity_mock(mock_hasher: Mock) -> Mock:
     user = Mock(spec=UserEntity)
@@ -0,0 +1,185 @@
+from datetime import date
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from src.adapters.outbound.database.models import Bond as BondModel
+from src.adapters.outbound.database.models import BondHolder as BondholderModel
+from src.adapters.outbound.database.models import (
+    BondHolderTombstone as BondHolderTombstoneModel,
+)
+from src.adapters.outbound.database.models import User as UserModel
+from src.application.events.event_publisher import EventPublisher
+from src.domain.events.bondholder_events import (
+    HOLDING_EVENTS,
+    BondHolderDeletedEvent,
+    BondHolderQuantityChangedEvent,
+)
+
+
+@pytest_asyncio.fixture
+async def second_bondholder(
+    t_session: AsyncSession, t_bondholder: BondholderModel
+) -> BondholderModel:
+    bond = BondModel(
+        id=uuid4(),
+        series="TEST002",
+        nominal_value=t_bondholder.quantity * 10,
+        maturity_period=12,
+        initial_interest_rate=5,
+        first_interest_period=1,
+        reference_rate_margin=1,
+    )
+    t_session.add(bond)
+    await t_session.commit()
+    bondholder = BondholderModel(
+        id=uuid4(),
+        bond_id=bond.id,
+        user_id=t_bondholder.user_id,
+        quantity=3,
+        purchase_date=date(2024, 1, 1),
+        last_update=None,
+    )
+    t_session.add(bondholder)
+    await t_session.commit()
+    return bondholder
+
+
+async def test_updates_and_deletes(
+    client: AsyncClient,
+    t_session: AsyncSession,
+    t_bondholder: BondholderModel,
+    second_bondholder: BondholderModel,
+    event_publisher: EventPublisher,
+) -> None:
+    handler = AsyncMock()
+    event_publisher.subscribe_batch(HOLDING_EVENTS, handler)
+
+    r = await client.post(
+        "api/bonds/batch",
+        json={
+            "quantity_changes": [{"id": str(t_bondholder.id), "new_quantity": 42}],
+            "deletions": [str(second_bondholder.id)],
+        },
+    )
+
+    assert r.status_code == status.HTTP_200_OK
+    data = r.json()
+    [updated] = data["updated"]
+    assert updated["id"] == str(t_bondholder.id)
+    assert updated["quantity"] == 42
+    assert updated["series"] == "TEST001"
+    assert updated["last_update"] is not None
+    assert data["deleted"] == [str(second_bondholder.id)]
+
+    stored = await t_session.get(
+        BondholderModel, t_bondholder.id, populate_existing=True
+    )
+    assert stored.quantity == 42
+    assert await t_session.get(BondholderModel, second_bondholder.id) is None
+    assert await t_session.get(BondModel, second_bondholder.bond_id) is None
+    assert await t_session.get(BondModel, t_bondholder.bond_id) is not None
+    tombstones = await t_session.scalars(select(BondHolderTombstoneModel.id))
+    assert list(tombstones) == [second_bondholder.id]
+
+    handler.assert_awaited_once()
+    [events] = handler.await_args.args
+    assert sorted(type(event).__name__ for event in events) == [
+        BondHolderDeletedEvent.__name__,
+        BondHolderQuantityChangedEvent.__name__,
+    ]
+
+
+async def test_missing_bondholder_applies_nothing(
+    client: AsyncClient, t_session: AsyncSession, t_bondholder: BondholderModel
+) -> None:
+    r = await client.post(
+        "api/bonds/batch",
+        json={
+            "quantity_changes": [{"id": str(t_bondholder.id), "new_quantity": 42}],
+            "deletions": [str(uuid4())],
+        },
+    )
+
+    assert r.status_code == status.HTTP_404_NOT_FOUND
+    stored = await t_session.get(
+        BondholderModel, t_bondholder.id, populate_existing=True
+    )
+    assert stored.quantity == 10
+
+
+async def test_other_users_bondholder_not_found(
+    client: AsyncClient,
+    t_session: AsyncSession,
+    t_bond: BondModel,
+    t_bondholder: BondholderModel,
+) -> None:
+    user = UserModel(
+        id=uuid4(), email="other@mail.com", password="hashed_password", name="Other"
+    )
+    t_session.add(user)
+    await t_session.commit()
+    foreign = BondholderModel(
+        id=uuid4(),
+        bond_id=t_bond.id,
+        user_id=user.id,
+        quantity=10,
+        purchase_date=date.today(),
+        last_update=None,
+    )
+    t_session.add(foreign)
+    await t_session.commit()
+
+    r = await client.post(
+        "api/bonds/batch",
+        json={
+            "quantity_changes": [{"id": str(foreign.id), "new_quantity": 1}],
+            "deletions": [str(t_bondholder.id)],
+        },
+    )
+
+    assert r.status_code == status.HTTP_404_NOT_FOUND
+    assert (
+        await t_session.get(BondholderModel, foreign.id, populate_existing=True)
+    ).quantity == 10
+    assert (
+        await t_session.get(BondholderModel, t_bondholder.id, populate_existing=True)
+        is not None
+    )
+
+
+async def test_duplicate_target(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    r = await client.post(
+        "api/bonds/batch",
+        json={
+            "quantity_changes": [{"id": str(t_bondholder.id), "new_quantity": 1}],
+            "deletions": [str(t_bondholder.id)],
+        },
+    )
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+async def test_invalid_quantity(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    r = await client.post(
+        "api/bonds/batch",
+        json={"quantity_changes": [{"id": str(t_bondholder.id), "new_quantity": 0}]},
+    )
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+async def test_empty_batch(client: AsyncClient) -> None:
+    r = await client.post("api/bonds/batch", json={})
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.json() == {"updated": [], "deleted": []}
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.outbound.repositories.bond import SQLAlchemyBondRepository
 from src.adapters.outbound.repositories.bondholder import SQLAlchemyBondHolderRepository
+from src.application.events.event_publisher import EventPublisher
 from src.application.use_cases.bondholder.bh_update_quantity import (
     UpdateBondHolderQuantityUseCase,
 )
@@ -25,9 +26,12 @@ def valid_json() -> dict[str, int]:
 def use_case(
     bond_repo: SQLAlchemyBondRepository,
     bondholder_repo: SQLAlchemyBondHolderRepository,
+    event_publisher: EventPublisher,
 ) -> UpdateBondHolderQuantityUseCase:
     return UpdateBondHolderQuantityUseCase(
-        bond_repo=bond_repo, bondholder_repo=bondholder_repo
+        bond_repo=bond_repo,
+        bondholder_repo=bondholder_repo,
+        event_publisher=event_publisher,
     )
 
 
@@ -1,14 +1,19 @@
 from decimal import Decimal
 from typing import Any
+from uuid import uuid4
 
 from datetime import date
 
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.outbound.database.models import BondHolder as BondHolderModel
 from src.adapters.outbound.repositories.bond import SQLAlchemyBondRepository
 from src.adapters.outbound.repositories.bondholder import SQLAlchemyBondHolderRepository
+from src.application.events.event_publisher import EventPublisher
 from src.application.use_cases.bondholder.bh_create import BondHolderCreateUseCase
 from src.adapters.inbound.api.main import app
 
@@ -30,11 +35,14 @@ def valid_bond_data() -> dict[str, Any]:
 
 @pytest.fixture
 def use_case(
-    bond_repo: SQLAlchemyBondRepository, bondholder_repo: SQLAlchemyBondHolderRepository
+    bond_repo: SQLAlchemyBondRepository,
+    bondholder_repo: SQLAlchemyBondHolderRepository,
+    event_publisher: EventPublisher,
 ) -> BondHolderCreateUseCase:
     return BondHolderCreateUseCase(
         bond_repo=bond_repo,
         bondholder_repo=bondholder_repo,
+        event_publisher=event_publisher,
     )
 
 
@@ -119,3 +127,43 @@ async def test_unauthorized(
 
     r = await client.post("api/bonds", json=valid_bond_data)
     assert r.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_retry_with_idempotency_key_replays_purchase(
+    client: AsyncClient,
+    t_session: AsyncSession,
+    valid_bond_data: dict[str, Any],
+) -> None:
+    headers = {"Idempotency-Key": str(uuid4())}
+
+    first = await client.post("api/bonds", json=valid_bond_data, headers=headers)
+    retry = await client.post("api/bonds", json=valid_bond_data, headers=headers)
+
+    assert first.status_code == retry.status_code == status.HTTP_201_CREATED
+    assert retry.json() == first.json()
+    count = await t_session.scalar(select(func.count()).select_from(BondHolderModel))
+    assert count == 1
+
+
+async def test_idempotency_key_reused_for_other_purchase(
+    client: AsyncClient, valid_bond_data: dict[str, Any]
+) -> None:
+    headers = {"Idempotency-Key": str(uuid4())}
+    await client.post("api/bonds", json=valid_bond_data, headers=headers)
+
+    valid_bond_data["quantity"] = 11
+    r = await client.post("api/bonds", json=valid_bond_data, headers=headers)
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+async def test_without_idempotency_key_creates_each_time(
+    client: AsyncClient,
+    t_session: AsyncSession,
+    valid_bond_data: dict[str, Any],
+) -> None:
+    await client.post("api/bonds", json=valid_bond_data)
+    await client.post("api/bonds", json=valid_bond_data)
+
+    count = await t_session.scalar(select(func.count()).select_from(BondHolderModel))
+    assert count == 2
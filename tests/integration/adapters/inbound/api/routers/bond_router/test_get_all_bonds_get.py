@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from src.adapters.inbound.api.main import app
+from src.adapters.inbound.api.msgpack_codec import unpackb
 from src.adapters.outbound.database.models import Bond as BondModel
 from src.adapters.outbound.database.models import BondHolder as BondholderModel
 from src.application.dto.user import UserDTO
@@ -33,6 +34,27 @@ async def multiple_bondholders(
     t_session.add_all(bhs)
     await t_session.commit()
     [await t_session.refresh(bhs[i]) for i in range(n)]
+    # Same purchase date: the API breaks ties by id, newest-first ordering.
+    return sorted(bhs, key=lambda bh: bh.id, reverse=True)
+
+
+@pytest_asyncio.fixture
+async def dated_bondholders(
+    t_session: AsyncSession, t_current_user: UserDTO, t_bond: BondModel
+) -> list[BondholderModel]:
+    bhs = [
+        BondholderModel(
+            id=uuid4(),
+            user_id=t_current_user.id,
+            bond_id=t_bond.id,
+            quantity=30 - 10 * i,
+            purchase_date=date.today() - timedelta(days=i),
+            last_update=None,
+        )
+        for i in range(3)
+    ]
+    t_session.add_all(bhs)
+    await t_session.commit()
     return bhs
 
 
@@ -182,3 +204,203 @@ async def test_date_serialization(
         data[0]["last_update"].replace("Z", "+00:00")
         == t_bondholder.last_update.isoformat()
     )
+
+
+async def test_pagination_walks_all_pages(
+    client: AsyncClient,
+    dated_bondholders: list[BondholderModel],
+) -> None:
+    r = await client.get("api/bonds", params={"limit": 2})
+
+    assert r.status_code == status.HTTP_200_OK
+    first_page = r.json()
+    assert [item["id"] for item in first_page] == [
+        str(bh.id) for bh in dated_bondholders[:2]
+    ]
+    cursor = r.headers["X-Next-Cursor"]
+
+    r = await client.get("api/bonds", params={"limit": 2, "cursor": cursor})
+
+    assert r.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in r.json()] == [str(dated_bondholders[2].id)]
+    assert "X-Next-Cursor" not in r.headers
+
+
+async def test_unpaged_without_limit_or_cursor(
+    client: AsyncClient,
+    t_session: AsyncSession,
+    t_current_user: UserDTO,
+    t_bond: BondModel,
+) -> None:
+    t_session.add_all(
+        BondholderModel(
+            id=uuid4(),
+            user_id=t_current_user.id,
+            bond_id=t_bond.id,
+            quantity=1,
+            purchase_date=date.today(),
+            last_update=None,
+        )
+        for _ in range(101)
+    )
+    await t_session.commit()
+
+    r = await client.get("api/bonds")
+
+    assert r.status_code == status.HTTP_200_OK
+    assert len(r.json()) == 101
+    assert "X-Next-Cursor" not in r.headers
+
+
+async def test_cursor_without_limit_uses_default_page_size(
+    client: AsyncClient,
+    dated_bondholders: list[BondholderModel],
+) -> None:
+    r = await client.get("api/bonds", params={"limit": 1})
+
+    r = await client.get("api/bonds", params={"cursor": r.headers["X-Next-Cursor"]})
+
+    assert r.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in r.json()] == [
+        str(bh.id) for bh in dated_bondholders[1:]
+    ]
+    assert "X-Next-Cursor" not in r.headers
+
+
+async def test_sort_by_quantity_ascending(
+    client: AsyncClient,
+    dated_bondholders: list[BondholderModel],
+) -> None:
+    r = await client.get("api/bonds", params={"sort_by": "quantity", "order": "asc"})
+
+    assert r.status_code == status.HTTP_200_OK
+    assert [item["quantity"] for item in r.json()] == [10, 20, 30]
+
+
+async def test_filter_by_purchase_date_range(
+    client: AsyncClient,
+    dated_bondholders: list[BondholderModel],
+) -> None:
+    r = await client.get(
+        "api/bonds",
+        params={
+            "purchased_from": (date.today() - timedelta(days=1)).isoformat(),
+            "purchased_to": date.today().isoformat(),
+        },
+    )
+
+    assert r.status_code == status.HTTP_200_OK
+    assert {item["id"] for item in r.json()} == {
+        str(bh.id) for bh in dated_bondholders[:2]
+    }
+
+
+async def test_filter_by_series_prefix(
+    client: AsyncClient,
+    dated_bondholders: list[BondholderModel],
+) -> None:
+    r = await client.get("api/bonds", params={"series_prefix": "TEST"})
+    assert len(r.json()) == 3
+
+    r = await client.get("api/bonds", params={"series_prefix": "EDO"})
+    assert r.json() == []
+
+
+async def test_invalid_cursor(client: AsyncClient) -> None:
+    r = await client.get("api/bonds", params={"cursor": "garbage"})
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+async def test_response_carries_etag(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    r = await client.get("api/bonds")
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.headers["etag"].startswith('"')
+    assert r.headers["cache-control"] == "private, no-cache"
+
+
+async def test_matching_etag_returns_not_modified(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    etag = (await client.get("api/bonds")).headers["etag"]
+
+    r = await client.get("api/bonds", headers={"If-None-Match": etag})
+
+    assert r.status_code == status.HTTP_304_NOT_MODIFIED
+    assert r.headers["etag"] == etag
+    assert r.content == b""
+
+
+async def test_etag_depends_on_query(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    etag = (await client.get("api/bonds")).headers["etag"]
+
+    r = await client.get(
+        "api/bonds", params={"limit": 5}, headers={"If-None-Match": etag}
+    )
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.headers["etag"] != etag
+
+
+async def test_write_invalidates_etag(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    bondholder_id = t_bondholder.id
+    etag = (await client.get("api/bonds")).headers["etag"]
+
+    r = await client.patch(
+        f"api/bonds/{bondholder_id}/quantity", json={"new_quantity": 99}
+    )
+    assert r.status_code == status.HTTP_200_OK
+
+    r = await client.get("api/bonds", headers={"If-None-Match": etag})
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.headers["etag"] != etag
+    assert r.json()[0]["quantity"] == 99
+
+
+async def test_equity_supports_conditional_get(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    etag = (await client.get("api/data/equity")).headers["etag"]
+
+    r = await client.get("api/data/equity", headers={"If-None-Match": etag})
+
+    assert r.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+async def test_msgpack_when_accepted(
+    client: AsyncClient, t_bondholder: BondholderModel, t_bond: BondModel
+) -> None:
+    as_json = (await client.get("api/bonds")).json()
+
+    r = await client.get("api/bonds", headers={"Accept": "application/msgpack"})
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.headers["content-type"] == "application/msgpack"
+    assert "Accept" in r.headers["vary"].split(", ")
+    [item] = unpackb(r.content)
+    assert item["id"] == t_bondholder.id
+    assert item["purchase_date"] == t_bondholder.purchase_date
+    assert item["nominal_value"] == float(t_bond.nominal_value)
+    assert list(item) == list(as_json[0])
+
+
+async def test_etag_depends_on_representation(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    etag = (await client.get("api/bonds")).headers["etag"]
+
+    r = await client.get(
+        "api/bonds",
+        headers={"Accept": "application/msgpack", "If-None-Match": etag},
+    )
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.headers["etag"] != etag
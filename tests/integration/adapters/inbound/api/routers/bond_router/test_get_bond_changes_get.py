@@ -0,0 +1,133 @@
+from datetime import UTC, date, datetime, timedelta
+from uuid import uuid4
+
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.outbound.database.models import Bond as BondModel
+from src.adapters.outbound.database.models import BondHolder as BondholderModel
+from src.adapters.outbound.database.models import (
+    BondHolderTombstone as BondHolderTombstoneModel,
+)
+
+
+def _since(delta: timedelta = timedelta(minutes=1)) -> dict[str, str]:
+    return {"since": (datetime.now(UTC) - delta).isoformat()}
+
+
+async def test_reports_inserted_bondholder(
+    client: AsyncClient, t_bondholder: BondholderModel, t_bond: BondModel
+) -> None:
+    r = await client.get("api/bonds/changes", params=_since())
+
+    assert r.status_code == status.HTTP_200_OK
+    data = r.json()
+    assert [bh["id"] for bh in data["inserted"]] == [str(t_bondholder.id)]
+    assert data["inserted"][0]["series"] == t_bond.series
+    assert data["updated"] == []
+    assert data["deleted"] == []
+    assert data["full_resync"] is False
+
+
+async def test_reports_updated_bondholder(
+    client: AsyncClient, t_session: AsyncSession, t_bondholder: BondholderModel
+) -> None:
+    bondholder_id = t_bondholder.id
+    await t_session.execute(
+        update(BondholderModel)
+        .where(BondholderModel.id == bondholder_id)
+        .values(created_at=datetime.now(UTC) - timedelta(days=1))
+    )
+    await t_session.commit()
+    await t_session.refresh(t_bondholder)
+
+    r = await client.patch(
+        f"api/bonds/{bondholder_id}/quantity", json={"new_quantity": 42}
+    )
+    assert r.status_code == status.HTTP_200_OK
+
+    r = await client.get("api/bonds/changes", params=_since())
+
+    data = r.json()
+    assert data["inserted"] == []
+    assert [bh["id"] for bh in data["updated"]] == [str(bondholder_id)]
+    assert data["updated"][0]["quantity"] == 42
+
+
+async def test_reports_deleted_bondholder(
+    client: AsyncClient, t_session: AsyncSession, t_bondholder: BondholderModel
+) -> None:
+    r = await client.delete(f"api/bonds/{t_bondholder.id}")
+    assert r.status_code == status.HTTP_204_NO_CONTENT
+
+    tombstone = await t_session.get(BondHolderTombstoneModel, t_bondholder.id)
+    assert tombstone is not None
+    assert tombstone.user_id == t_bondholder.user_id
+
+    r = await client.get("api/bonds/changes", params=_since())
+
+    data = r.json()
+    assert data["inserted"] == []
+    assert data["deleted"] == [str(t_bondholder.id)]
+
+
+async def test_unchanged_since_watermark(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    r = await client.get("api/bonds/changes", params=_since(-timedelta(minutes=1)))
+
+    data = r.json()
+    assert data["inserted"] == []
+    assert data["updated"] == []
+    assert data["deleted"] == []
+
+
+async def test_watermark_lags_behind_now(client: AsyncClient) -> None:
+    before = datetime.now(UTC) - timedelta(days=1)
+
+    r = await client.get("api/bonds/changes", params={"since": before.isoformat()})
+
+    watermark = datetime.fromisoformat(r.json()["watermark"])
+    assert before < watermark < datetime.now(UTC)
+
+
+async def test_other_users_changes_are_hidden(
+    client: AsyncClient, t_session: AsyncSession, t_bond: BondModel
+) -> None:
+    t_session.add(
+        BondHolderTombstoneModel(id=uuid4(), user_id=uuid4()),
+    )
+    await t_session.commit()
+
+    r = await client.get("api/bonds/changes", params=_since())
+
+    assert r.json()["deleted"] == []
+
+
+async def test_stale_watermark_requests_full_resync(client: AsyncClient) -> None:
+    r = await client.get("api/bonds/changes", params=_since(timedelta(days=31)))
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.json()["full_resync"] is True
+
+
+async def test_invalid_since(client: AsyncClient) -> None:
+    r = await client.get("api/bonds/changes", params={"since": "yesterday"})
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+async def test_since_is_required(client: AsyncClient) -> None:
+    r = await client.get("api/bonds/changes")
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+async def test_purchase_date_unaffected(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    r = await client.get("api/bonds/changes", params=_since())
+
+    assert r.json()["inserted"][0]["purchase_date"] == date.today().isoformat()
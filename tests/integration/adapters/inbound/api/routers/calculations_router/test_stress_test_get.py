@@ -0,0 +1,126 @@
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.inbound.api.dependencies.use_cases.calculations_deps import (
+    scenario_executor,
+)
+from src.adapters.inbound.api.main import app
+from src.adapters.outbound.database.models import BondHolder as BondholderModel
+from src.adapters.outbound.database.models import ReferenceRate as ReferenceRateModel
+
+
+@pytest_asyncio.fixture
+async def t_reference_rate(t_session: AsyncSession) -> ReferenceRateModel:
+    rate = ReferenceRateModel(
+        id=uuid4(),
+        value=Decimal("5.75"),
+        start_date=date.today() - timedelta(days=365),
+        end_date=None,
+    )
+    t_session.add(rate)
+    await t_session.commit()
+    return rate
+
+
+@pytest.fixture
+def thread_executor() -> Generator[None, None, None]:
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        app.dependency_overrides[scenario_executor] = lambda: executor
+        yield
+    app.dependency_overrides.pop(scenario_executor, None)
+
+
+async def test_shocks_bound_income(
+    client: AsyncClient,
+    t_bondholder: BondholderModel,
+    t_reference_rate: ReferenceRateModel,
+) -> None:
+    r = await client.get(
+        "api/calculations/stress-test",
+        params={"shock_bp": [-100, 0, 100], "horizon": 12},
+    )
+
+    assert r.status_code == status.HTTP_200_OK
+    body = r.json()
+    assert body["paths"] == 3
+    assert Decimal(body["base_rate"]) == Decimal("5.75")
+    assert len(body["bands"]) == 12
+    assert body["bands"][0]["month"] == date.today().replace(day=1).isoformat()
+    late = body["bands"][-1]
+    assert Decimal(late["p5"]) < Decimal(late["p50"]) < Decimal(late["p95"])
+
+
+async def test_random_walks_run_on_executor(
+    client: AsyncClient,
+    t_bondholder: BondholderModel,
+    t_reference_rate: ReferenceRateModel,
+    thread_executor: None,
+) -> None:
+    params = {"paths": 2500, "horizon": 6, "seed": 7}
+
+    first = await client.get("api/calculations/stress-test", params=params)
+    second = await client.get("api/calculations/stress-test", params=params)
+
+    assert first.status_code == status.HTTP_200_OK
+    assert first.json()["paths"] == 2500
+    assert first.json()["bands"] == second.json()["bands"]
+
+
+async def test_unseeded_random_walks_have_no_etag(
+    client: AsyncClient,
+    t_bondholder: BondholderModel,
+    t_reference_rate: ReferenceRateModel,
+    thread_executor: None,
+) -> None:
+    r = await client.get(
+        "api/calculations/stress-test",
+        params={"paths": 100, "horizon": 3},
+        headers={"If-None-Match": "*"},
+    )
+
+    assert r.status_code == status.HTTP_200_OK
+    assert "etag" not in r.headers
+
+
+async def test_seeded_random_walks_revalidate(
+    client: AsyncClient,
+    t_bondholder: BondholderModel,
+    t_reference_rate: ReferenceRateModel,
+    thread_executor: None,
+) -> None:
+    params = {"paths": 100, "horizon": 3, "seed": 7}
+    first = await client.get("api/calculations/stress-test", params=params)
+    etag = first.headers["etag"]
+
+    r = await client.get(
+        "api/calculations/stress-test", params=params, headers={"If-None-Match": etag}
+    )
+
+    assert r.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+async def test_requires_a_scenario(
+    client: AsyncClient,
+    t_bondholder: BondholderModel,
+    t_reference_rate: ReferenceRateModel,
+) -> None:
+    r = await client.get("api/calculations/stress-test")
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+async def test_without_reference_rate(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    r = await client.get("api/calculations/stress-test", params={"shock_bp": 100})
+
+    assert r.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,138 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.inbound.api.msgpack_codec import unpackb
+from src.adapters.outbound.database.models import BondHolder as BondholderModel
+from src.adapters.outbound.result_cache.in_memory_result_cache import (
+    InMemoryResultCache,
+)
+
+
+async def test_success(client: AsyncClient, t_bondholder: BondholderModel) -> None:
+    r = await client.get("api/data/equity")
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.json()["equity"]
+
+
+async def test_msgpack_matches_json(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    as_json = (await client.get("api/data/equity")).json()
+
+    r = await client.get("api/data/equity", headers={"Accept": "application/msgpack"})
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.headers["content-type"] == "application/msgpack"
+    equity = unpackb(r.content)["equity"]
+    as_text = [[day.isoformat(), str(value)] for day, value in equity]
+    assert as_text == as_json["equity"]
+
+
+async def test_result_is_cached(
+    client: AsyncClient,
+    t_bondholder: BondholderModel,
+    t_result_cache: InMemoryResultCache,
+) -> None:
+    first = await client.get("api/data/equity")
+    assert len(t_result_cache) == 1
+
+    second = await client.get("api/data/equity")
+
+    assert second.json() == first.json()
+    assert len(t_result_cache) == 1
+
+
+async def test_holding_change_recomputes(
+    client: AsyncClient,
+    t_bondholder: BondholderModel,
+    t_result_cache: InMemoryResultCache,
+) -> None:
+    bondholder_id = t_bondholder.id
+    before = (await client.get("api/data/equity")).json()
+
+    r = await client.patch(
+        f"api/bonds/{bondholder_id}/quantity", json={"new_quantity": 20}
+    )
+    assert r.status_code == status.HTTP_200_OK
+
+    after = (await client.get("api/data/equity")).json()
+
+    assert after != before
+    assert len(t_result_cache) == 2
+
+
+async def test_range_returns_daily_points(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    today = date.today()
+    start = today - timedelta(days=4)
+
+    r = await client.get(
+        "api/data/equity", params={"from": start.isoformat(), "to": today.isoformat()}
+    )
+
+    assert r.status_code == status.HTTP_200_OK
+    equity = r.json()["equity"]
+    assert [point[0] for point in equity] == [
+        (start + timedelta(days=i)).isoformat() for i in range(5)
+    ]
+    assert Decimal(equity[0][1]) == 0
+    assert Decimal(equity[-1][1]) == Decimal("10000")
+
+
+async def test_max_points_bounds_response(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    start = date.today() - timedelta(days=3650)
+
+    r = await client.get(
+        "api/data/equity", params={"from": start.isoformat(), "max_points": 50}
+    )
+
+    assert r.status_code == status.HTTP_200_OK
+    equity = r.json()["equity"]
+    assert len(equity) == 50
+    assert equity[0][0] == start.isoformat()
+    assert equity[-1][0] == date.today().isoformat()
+
+
+async def test_inverted_range_is_rejected(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    r = await client.get(
+        "api/data/equity", params={"from": "2025-02-01", "to": "2025-01-01"}
+    )
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+async def test_too_small_max_points_is_rejected(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    r = await client.get("api/data/equity", params={"max_points": 2})
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+async def test_accrued_valuation_adds_interest(
+    client: AsyncClient,
+    t_session: AsyncSession,
+    t_bondholder: BondholderModel,
+) -> None:
+    start = date.today() - timedelta(days=20)
+    t_bondholder.purchase_date = start
+    await t_session.commit()
+    params = {"from": start.isoformat(), "max_points": 100}
+
+    face = (await client.get("api/data/equity", params=params)).json()["equity"]
+    accrued = (
+        await client.get("api/data/equity", params={**params, "valuation": "accrued"})
+    ).json()["equity"]
+
+    assert Decimal(accrued[0][1]) == Decimal(face[0][1])
+    assert Decimal(accrued[-1][1]) > Decimal(face[-1][1])
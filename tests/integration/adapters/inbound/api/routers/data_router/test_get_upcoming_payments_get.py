@@ -0,0 +1,47 @@
+from datetime import date, timedelta
+
+from dateutil.relativedelta import relativedelta  # type: ignore [import-untyped]
+from fastapi import status
+from httpx import AsyncClient
+
+from src.adapters.outbound.database.models import BondHolder as BondholderModel
+
+
+async def test_success(client: AsyncClient, t_bondholder: BondholderModel) -> None:
+    r = await client.get("api/data/payments/upcoming", params={"limit": 3})
+
+    assert r.status_code == status.HTTP_200_OK
+    payments = r.json()["payments"]
+    today = date.today()
+    assert [p["payment_date"] for p in payments] == [
+        (today + relativedelta(months=i)).isoformat() for i in range(1, 4)
+    ]
+    assert all(p["bondholder_id"] == str(t_bondholder.id) for p in payments)
+    assert payments[0]["series"] == "TEST001"
+    assert payments[0]["amount"] is not None
+
+
+async def test_after_skips_earlier_payments(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    after = date.today() + timedelta(days=200)
+
+    r = await client.get(
+        "api/data/payments/upcoming", params={"after": after.isoformat()}
+    )
+
+    assert r.status_code == status.HTTP_200_OK
+    assert all(p["payment_date"] > after.isoformat() for p in r.json()["payments"])
+
+
+async def test_empty_portfolio(client: AsyncClient) -> None:
+    r = await client.get("api/data/payments/upcoming")
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.json() == {"payments": []}
+
+
+async def test_limit_validated(client: AsyncClient) -> None:
+    r = await client.get("api/data/payments/upcoming", params={"limit": 0})
+
+    assert r.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
@@ -0,0 +1,79 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+from httpx import AsyncClient
+from starlette import status
+
+from src.adapters.inbound.api.dependencies.live_update_deps import (
+    get_live_update_hub,
+)
+from src.adapters.inbound.api.main import app
+from src.application.live_updates import LiveUpdateHub
+from src.domain.value_objects.live_update import ReferenceRateChanged
+
+
+async def test_streams_updates_until_disconnect(client: AsyncClient) -> None:
+    hub = LiveUpdateHub()
+    app.dependency_overrides[get_live_update_hub] = lambda: hub
+    sent: list[dict] = []
+    disconnected = asyncio.Event()
+    requested = False
+
+    async def receive() -> dict:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+        bodies = [m["body"] for m in sent if m["type"] == "http.response.body"]
+        if len(bodies) == 1:
+            hub.dispatch(
+                ReferenceRateChanged(
+                    value=Decimal("5.75"), effective_date=date(2026, 3, 1)
+                )
+            )
+        elif len(bodies) == 2:
+            disconnected.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/live/events",
+        "raw_path": b"/api/live/events",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"test")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+    await asyncio.wait_for(app(scope, receive, send), timeout=5)
+
+    start, retry, event = sent[:3]
+    assert start["status"] == status.HTTP_200_OK
+    headers = dict(start["headers"])
+    assert headers[b"content-type"].startswith(b"text/event-stream")
+    assert headers[b"cache-control"] == b"no-cache"
+    assert retry["body"].startswith(b"retry: ")
+    assert event["body"] == (
+        b"event: rate_changed\n"
+        b'data: {"value":"5.75","effective_date":"2026-03-01"}\n\n'
+    )
+    assert len(hub) == 0
+
+
+async def test_unauthorized(client: AsyncClient) -> None:
+    from src.adapters.inbound.api.dependencies.current_user_deps import current_user
+
+    app.dependency_overrides.pop(current_user, None)
+
+    r = await client.get("api/live/events")
+
+    assert r.status_code == status.HTTP_401_UNAUTHORIZED
@@ -1,8 +1,29 @@
+from unittest.mock import Mock
+
+import pytest
 from fastapi import status
 
 from httpx import AsyncClient
 
+from src.adapters.inbound.api.dependencies.security_deps import login_throttle
+from src.adapters.inbound.api.main import app
 from src.adapters.outbound.database.models import User as UserModel
+from src.adapters.outbound.rate_limiter.in_memory_rate_limiter import (
+    InMemoryRateLimiter,
+)
+from src.application.login_throttle import LoginThrottle
+from src.domain.value_objects.rate_limit import RateLimit
+
+
+@pytest.fixture
+def throttled(client: AsyncClient) -> LoginThrottle:
+    throttle = LoginThrottle(
+        InMemoryRateLimiter(),
+        per_ip=RateLimit(burst=10, per_minute=1),
+        per_username=RateLimit(burst=2, per_minute=1),
+    )
+    app.dependency_overrides[login_throttle] = lambda: throttle
+    return throttle
 
 
 async def test_login_success(
@@ -71,3 +92,35 @@ async def test_login_response_structure(
     assert data["message"] == "Successfully authenticated"
     assert len(data) == 1
     assert isinstance(data["message"], str)
+
+
+async def test_login_throttled_before_password_check(
+    client: AsyncClient,
+    throttled: LoginThrottle,
+    t_user: UserModel,
+    plain_pass: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    form_data = {"username": t_user.email, "password": "wrong_password"}
+    for _ in range(2):
+        r = await client.post("api/login/token", data=form_data)
+        assert r.status_code == status.HTTP_401_UNAUTHORIZED
+    verify = Mock()
+    monkeypatch.setattr(
+        "src.adapters.outbound.security.bcrypt_hasher.BcryptPasswordHasher.verify",
+        verify,
+    )
+
+    r = await client.post(
+        "api/login/token", data={"username": t_user.email, "password": plain_pass}
+    )
+
+    assert r.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(r.headers["Retry-After"]) > 0
+    verify.assert_not_called()
+
+    # Another account from the same address still gets through.
+    r = await client.post(
+        "api/login/token", data={"username": "other@example.com", "password": "x"}
+    )
+    assert r.status_code == status.HTTP_401_UNAUTHORIZED
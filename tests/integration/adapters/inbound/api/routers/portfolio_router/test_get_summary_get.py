@@ -0,0 +1,71 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.outbound.database.models import BondHolder as BondholderModel
+from src.adapters.outbound.database.models import ReferenceRate as ReferenceRateModel
+
+
+async def test_success(
+    client: AsyncClient, t_session: AsyncSession, t_bondholder: BondholderModel
+) -> None:
+    t_bondholder.purchase_date = date.today() - timedelta(days=30)
+    t_session.add(
+        ReferenceRateModel(
+            id=uuid4(),
+            value=Decimal("5.75"),
+            start_date=date.today() - timedelta(days=365),
+            end_date=None,
+        )
+    )
+    await t_session.commit()
+
+    r = await client.get("api/portfolio/summary")
+
+    assert r.status_code == status.HTTP_200_OK
+    body = r.json()
+    assert [h["id"] for h in body["holdings"]] == [str(t_bondholder.id)]
+    assert body["holdings"][0]["series"] == "TEST001"
+    assert Decimal(body["month_income"][str(t_bondholder.id)]) > 0
+    [totals] = body["totals"]
+    assert totals["series"] == "TEST001"
+    assert totals["quantity"] == 10
+    assert Decimal(totals["face_value"]) == Decimal("10000")
+    assert totals["month_income"] == body["month_income"][str(t_bondholder.id)]
+    assert body["equity"][-1][0] == date.today().isoformat()
+    assert Decimal(body["equity"][-1][1]) == Decimal("10000")
+
+
+async def test_without_reference_rate_leaves_income_empty(
+    client: AsyncClient, t_bondholder: BondholderModel
+) -> None:
+    r = await client.get("api/portfolio/summary")
+
+    assert r.status_code == status.HTTP_200_OK
+    body = r.json()
+    assert body["month_income"] == {}
+    assert body["totals"][0]["month_income"] is None
+    assert len(body["holdings"]) == 1
+
+
+async def test_max_points_bounds_equity(
+    client: AsyncClient, t_session: AsyncSession, t_bondholder: BondholderModel
+) -> None:
+    t_bondholder.purchase_date = date.today() - timedelta(days=1000)
+    await t_session.commit()
+
+    r = await client.get("api/portfolio/summary", params={"max_points": 20})
+
+    assert r.status_code == status.HTTP_200_OK
+    assert len(r.json()["equity"]) == 20
+
+
+async def test_empty_portfolio(client: AsyncClient) -> None:
+    r = await client.get("api/portfolio/summary")
+
+    assert r.status_code == status.HTTP_200_OK
+    assert r.json() == {"holdings": [], "month_income": {}, "totals": [], "equity": []}
@@ -0,0 +1,171 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.outbound.database.models import (
+    IdempotencyRecord as IdempotencyRecordModel,
+)
+from src.adapters.outbound.exceptions import SQLAlchemyRepositoryError
+from src.adapters.outbound.idempotency.postgres_idempotency_store import (
+    PostgresIdempotencyStore,
+)
+from src.application.dto.calculations import MonthlyIncomeResponseDTO
+from src.domain.value_objects.idempotency import IdempotencyKey, IdempotencyRecord
+
+LEASE = timedelta(seconds=30)
+TTL = timedelta(hours=1)
+RESULT = MonthlyIncomeResponseDTO(data={uuid4(): Decimal("1.00")})
+
+
+@pytest.fixture
+def session_maker(engine: AsyncEngine) -> sessionmaker:
+    return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+def store(session_maker: sessionmaker) -> PostgresIdempotencyStore:
+    return PostgresIdempotencyStore(
+        session_maker=session_maker,
+        result_types={"op": MonthlyIncomeResponseDTO},
+    )
+
+
+@pytest.fixture
+def key() -> IdempotencyKey:
+    return IdempotencyKey("op", uuid4(), "abc")
+
+
+async def _count(session_maker: sessionmaker) -> int:
+    async with session_maker() as session:
+        stmt = select(func.count()).select_from(IdempotencyRecordModel)
+        return (await session.execute(stmt)).scalar_one()
+
+
+async def test_first_claim_owns_key(
+    store: PostgresIdempotencyStore, key: IdempotencyKey
+) -> None:
+    assert await store.claim(key, "fp", LEASE) is None
+    assert await store.claim(key, "fp", LEASE) == IdempotencyRecord(
+        fingerprint="fp", completed=False
+    )
+
+
+async def test_concurrent_claims_have_one_owner(
+    store: PostgresIdempotencyStore, key: IdempotencyKey
+) -> None:
+    records = await asyncio.gather(*(store.claim(key, "fp", LEASE) for _ in range(5)))
+
+    assert records.count(None) == 1
+
+
+async def test_completed_claim_replays_dto(
+    store: PostgresIdempotencyStore, key: IdempotencyKey
+) -> None:
+    dto = MonthlyIncomeResponseDTO(data={uuid4(): Decimal("12.34")})
+    await store.claim(key, "fp", LEASE)
+    await store.complete(key, dto, TTL)
+
+    assert await store.claim(key, "fp", LEASE) == IdempotencyRecord(
+        fingerprint="fp", completed=True, result=dto
+    )
+
+
+async def test_undecodable_result_is_an_error(
+    store: PostgresIdempotencyStore,
+    key: IdempotencyKey,
+    session_maker: sessionmaker,
+) -> None:
+    await store.claim(key, "fp", LEASE)
+    async with session_maker() as session:
+        await session.execute(
+            update(IdempotencyRecordModel).values(
+                result=b"\x80\x05N.", expires_at=func.now() + TTL
+            )
+        )
+        await session.commit()
+
+    with pytest.raises(SQLAlchemyRepositoryError):
+        await store.claim(key, "fp", LEASE)
+
+
+async def test_release_frees_key(
+    store: PostgresIdempotencyStore, key: IdempotencyKey
+) -> None:
+    await store.claim(key, "fp", LEASE)
+    await store.release(key)
+
+    assert await store.claim(key, "fp", LEASE) is None
+
+
+async def test_release_keeps_completed_result(
+    store: PostgresIdempotencyStore, key: IdempotencyKey
+) -> None:
+    await store.claim(key, "fp", LEASE)
+    await store.complete(key, RESULT, TTL)
+    await store.release(key)
+
+    assert (await store.claim(key, "fp", LEASE)).completed
+
+
+async def test_expired_record_taken_over(
+    store: PostgresIdempotencyStore, key: IdempotencyKey
+) -> None:
+    await store.claim(key, "fp", LEASE)
+    await store.complete(key, RESULT, timedelta(0))
+
+    assert await store.claim(key, "other", LEASE) is None
+    assert await store.claim(key, "other", LEASE) == IdempotencyRecord(
+        fingerprint="other", completed=False
+    )
+
+
+async def test_wait_sees_completion(
+    store: PostgresIdempotencyStore, key: IdempotencyKey
+) -> None:
+    await store.claim(key, "fp", LEASE)
+    waiter = asyncio.create_task(store.wait(key, timeout=5))
+    await asyncio.sleep(0.1)
+
+    await store.complete(key, RESULT, TTL)
+
+    record = await waiter
+    assert record.completed
+    assert record.result == RESULT
+
+
+async def test_wait_returns_none_after_release(
+    store: PostgresIdempotencyStore, key: IdempotencyKey
+) -> None:
+    await store.claim(key, "fp", LEASE)
+    waiter = asyncio.create_task(store.wait(key, timeout=5))
+    await asyncio.sleep(0.1)
+
+    await store.release(key)
+
+    assert await waiter is None
+
+
+async def test_wait_times_out(
+    store: PostgresIdempotencyStore, key: IdempotencyKey
+) -> None:
+    await store.claim(key, "fp", LEASE)
+
+    assert not (await store.wait(key, timeout=0.1)).completed
+
+
+async def test_purge_expired(
+    store: PostgresIdempotencyStore, session_maker: sessionmaker
+) -> None:
+    kept, expired = (IdempotencyKey("op", uuid4(), "abc") for _ in range(2))
+    await store.claim(kept, "fp", LEASE)
+    await store.claim(expired, "fp", LEASE)
+    await store.complete(expired, RESULT, timedelta(0))
+
+    assert await store.purge_expired(datetime.now(UTC)) == 1
+    assert await _count(session_maker) == 1
@@ -0,0 +1,48 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.outbound.live_updates.postgres_live_updates import (
+    PostgresLiveUpdateListener,
+    PostgresLiveUpdatePublisher,
+)
+from src.domain.value_objects.live_update import LiveUpdate, ReferenceRateChanged
+
+CHANNEL = "live_updates_test"
+
+
+@pytest.fixture
+def publisher(engine: AsyncEngine) -> PostgresLiveUpdatePublisher:
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    return PostgresLiveUpdatePublisher(session_maker=session_maker, channel=CHANNEL)
+
+
+async def test_published_update_reaches_listener(
+    engine: AsyncEngine, publisher: PostgresLiveUpdatePublisher
+) -> None:
+    received: asyncio.Queue[LiveUpdate] = asyncio.Queue()
+    listener = PostgresLiveUpdateListener(
+        dsn=engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        ),
+        channel=CHANNEL,
+        on_update=received.put_nowait,
+    )
+    await listener.start()
+    try:
+        await listener.wait_listening(timeout=5)
+        update = ReferenceRateChanged(
+            value=Decimal("5.75"), effective_date=date(2026, 3, 1)
+        )
+
+        await publisher.publish(update)
+
+        assert await asyncio.wait_for(received.get(), timeout=5) == update
+    finally:
+        await listener.stop()
+
+    assert not listener.listening
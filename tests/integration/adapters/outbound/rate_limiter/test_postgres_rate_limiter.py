@@ -0,0 +1,96 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.outbound.database.models import RateLimitBucket
+from src.adapters.outbound.rate_limiter.postgres_rate_limiter import (
+    PostgresRateLimiter,
+)
+from src.domain.value_objects.rate_limit import RateLimit
+
+LIMIT = RateLimit(burst=3, per_minute=6)
+
+
+@pytest.fixture
+def session_maker(engine: AsyncEngine) -> sessionmaker:
+    return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+def limiter(session_maker: sessionmaker) -> PostgresRateLimiter:
+    return PostgresRateLimiter(session_maker=session_maker)
+
+
+async def _age(session_maker: sessionmaker, key: str, seconds: float) -> None:
+    """Move the bucket's last use back in time."""
+    async with session_maker() as session:
+        await session.execute(
+            update(RateLimitBucket)
+            .where(RateLimitBucket.key == key)
+            .values(updated_at=RateLimitBucket.updated_at - timedelta(seconds=seconds))
+        )
+        await session.commit()
+
+
+async def test_burst_allowed_then_rejected(limiter: PostgresRateLimiter) -> None:
+    assert [await limiter.acquire("k", LIMIT) for _ in range(3)] == [0, 0, 0]
+
+    retry_after = await limiter.acquire("k", LIMIT)
+
+    assert 9 < retry_after <= 10
+
+
+async def test_refills_over_time(
+    limiter: PostgresRateLimiter, session_maker: sessionmaker
+) -> None:
+    for _ in range(3):
+        await limiter.acquire("k", LIMIT)
+
+    await _age(session_maker, "k", 15)
+
+    assert await limiter.acquire("k", LIMIT) == 0
+    assert 4 < await limiter.acquire("k", LIMIT) <= 5
+
+
+async def test_rejection_leaves_bucket_unchanged(
+    limiter: PostgresRateLimiter, session_maker: sessionmaker
+) -> None:
+    for _ in range(3):
+        await limiter.acquire("k", LIMIT)
+    async with session_maker() as session:
+        before = (await session.execute(select(RateLimitBucket))).scalar_one()
+
+    await limiter.acquire("k", LIMIT)
+
+    async with session_maker() as session:
+        after = (await session.execute(select(RateLimitBucket))).scalar_one()
+    assert (after.tokens, after.updated_at) == (before.tokens, before.updated_at)
+
+
+async def test_concurrent_acquires_counted_exactly(
+    limiter: PostgresRateLimiter,
+) -> None:
+    results = await asyncio.gather(
+        *(limiter.acquire("k", RateLimit(burst=5, per_minute=1)) for _ in range(12))
+    )
+
+    assert sum(result == 0 for result in results) == 5
+
+
+async def test_purge_idle(
+    limiter: PostgresRateLimiter, session_maker: sessionmaker
+) -> None:
+    await limiter.acquire("old", LIMIT)
+    await limiter.acquire("new", LIMIT)
+    await _age(session_maker, "old", 7200)
+
+    purged = await limiter.purge_idle(datetime.now(UTC) - timedelta(hours=1))
+
+    assert purged == 1
+    async with session_maker() as session:
+        keys = (await session.execute(select(RateLimitBucket.key))).scalars().all()
+    assert keys == ["new"]
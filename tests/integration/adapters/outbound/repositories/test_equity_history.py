@@ -0,0 +1,115 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.outbound.database.models import Bond as BondModel
+from src.adapters.outbound.database.models import BondHolder as BondHolderModel
+from src.adapters.outbound.repositories.bond import SQLAlchemyBondRepository
+from src.adapters.outbound.repositories.bondholder import (
+    SQLAlchemyBondHolderRepository,
+)
+from src.adapters.outbound.repositories.equity_history import (
+    SQLAlchemyEquityHistoryRepository,
+)
+from src.application.dto.user import UserDTO
+from src.domain.services.analytics.analytics_service import AnalyticsService
+
+
+async def _buy(
+    session: AsyncSession,
+    user_id,
+    bond: BondModel,
+    quantity: int,
+    days_ago: int,
+) -> None:
+    session.add(
+        BondHolderModel(
+            id=uuid4(),
+            user_id=user_id,
+            bond_id=bond.id,
+            quantity=quantity,
+            purchase_date=date.today() - timedelta(days=days_ago),
+            last_update=None,
+        )
+    )
+    await session.commit()
+
+
+async def _python_history(
+    bondholder_repo: SQLAlchemyBondHolderRepository,
+    bond_repo: SQLAlchemyBondRepository,
+    user_id,
+) -> list[tuple[date, Decimal]]:
+    bhs = await bondholder_repo.get_all(user_id=user_id)
+    bonds_dict = await bond_repo.fetch_dict_from_bondholders(bondholders=bhs)
+    return AnalyticsService().get_equity_history(
+        bondholder_data=[(bh, bonds_dict[bh.bond_id]) for bh in bhs]
+    )
+
+
+async def test_no_holdings_returns_empty_history(
+    equity_history_repo: SQLAlchemyEquityHistoryRepository,
+    t_current_user: UserDTO,
+) -> None:
+    result = await equity_history_repo.get_equity_history(
+        user_id=t_current_user.id, until=date.today()
+    )
+
+    assert result == []
+
+
+async def test_holdings_of_other_users_are_ignored(
+    t_session: AsyncSession,
+    equity_history_repo: SQLAlchemyEquityHistoryRepository,
+    t_bondholder: BondHolderModel,
+) -> None:
+    result = await equity_history_repo.get_equity_history(
+        user_id=uuid4(), until=date.today()
+    )
+
+    assert result == []
+
+
+@pytest.mark.parametrize(
+    "purchases",
+    [
+        [(10, 0)],
+        [(3, 20), (2, 7), (1, 0)],
+        [(5, 60), (5, 60), (1, 45)],
+        [(1, 170), (2, 14), (4, 3)],
+        [(2, 300), (1, 28), (1, 29)],
+        [(7, 900), (3, 365), (1, 30), (2, 1)],
+        # Bought 12-month bonds: the first two have matured.
+        [(4, 500), (2, 400), (1, 200)],
+    ],
+    ids=[
+        "today",
+        "within-30",
+        "within-90",
+        "within-180",
+        "within-365",
+        "older",
+        "matured",
+    ],
+)
+async def test_matches_python_implementation(
+    t_session: AsyncSession,
+    equity_history_repo: SQLAlchemyEquityHistoryRepository,
+    bondholder_repo: SQLAlchemyBondHolderRepository,
+    bond_repo: SQLAlchemyBondRepository,
+    t_current_user: UserDTO,
+    t_bond: BondModel,
+    purchases: list[tuple[int, int]],
+) -> None:
+    for quantity, days_ago in purchases:
+        await _buy(t_session, t_current_user.id, t_bond, quantity, days_ago)
+
+    expected = await _python_history(bondholder_repo, bond_repo, t_current_user.id)
+    result = await equity_history_repo.get_equity_history(
+        user_id=t_current_user.id, until=date.today()
+    )
+
+    assert result == expected
@@ -0,0 +1,178 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.outbound.database.models import BondHolder as BondHolderModel
+from src.adapters.outbound.database.models import ReferenceRate as ReferenceRateModel
+from src.adapters.outbound.repositories.bond import SQLAlchemyBondRepository
+from src.adapters.outbound.repositories.bondholder import (
+    SQLAlchemyBondHolderRepository,
+)
+from src.adapters.outbound.repositories.portfolio_snapshot import (
+    SQLAlchemyPortfolioSnapshotRepository,
+)
+from src.adapters.outbound.repositories.reference_rate import (
+    SQLAlchemyReferenceRateRepository,
+)
+from src.adapters.outbound.repositories.version import SQLAlchemyVersionRepository
+from src.application.dto.user import UserDTO
+from src.application.use_cases.data.portfolio_snapshot import (
+    RefreshPortfolioSnapshotUseCase,
+)
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.services.portfolio_valuation import PortfolioValuationService
+from src.domain.value_objects.portfolio_snapshot import PortfolioSnapshot
+
+
+def _snapshot(user_id: UUID, day: date, face_value: str) -> PortfolioSnapshot:
+    return PortfolioSnapshot(
+        user_id=user_id,
+        snapshot_date=day,
+        face_value=Decimal(face_value),
+        accrued_interest=Decimal("0.00"),
+        monthly_income=Decimal("0.00"),
+    )
+
+
+async def test_replace_from_keeps_earlier_days(
+    snapshot_repo: SQLAlchemyPortfolioSnapshotRepository,
+    t_current_user: UserDTO,
+) -> None:
+    user_id = t_current_user.id
+    days = [date(2026, 1, 1) + timedelta(days=i) for i in range(4)]
+    await snapshot_repo.replace_from(
+        user_id=user_id,
+        from_date=days[0],
+        snapshots=[_snapshot(user_id, day, "100") for day in days],
+    )
+
+    await snapshot_repo.replace_from(
+        user_id=user_id,
+        from_date=days[2],
+        snapshots=[_snapshot(user_id, days[2], "300")],
+    )
+
+    result = await snapshot_repo.get_range(user_id=user_id, end=days[-1])
+    assert [(s.snapshot_date, s.face_value) for s in result] == [
+        (days[0], Decimal("100")),
+        (days[1], Decimal("100")),
+        (days[2], Decimal("300")),
+    ]
+
+
+async def test_get_range_filters_by_dates(
+    snapshot_repo: SQLAlchemyPortfolioSnapshotRepository,
+    t_current_user: UserDTO,
+) -> None:
+    user_id = t_current_user.id
+    days = [date(2026, 1, 1) + timedelta(days=i) for i in range(5)]
+    await snapshot_repo.replace_from(
+        user_id=user_id,
+        from_date=days[0],
+        snapshots=[_snapshot(user_id, day, "100") for day in days],
+    )
+
+    result = await snapshot_repo.get_range(user_id=user_id, start=days[1], end=days[3])
+
+    assert [s.snapshot_date for s in result] == days[1:4]
+
+
+async def test_get_latest_on_or_before_day(
+    snapshot_repo: SQLAlchemyPortfolioSnapshotRepository,
+    t_current_user: UserDTO,
+) -> None:
+    user_id = t_current_user.id
+    days = [date(2026, 1, 1) + timedelta(days=i) for i in range(3)]
+    await snapshot_repo.replace_from(
+        user_id=user_id,
+        from_date=days[0],
+        snapshots=[_snapshot(user_id, day, "100") for day in days],
+    )
+
+    latest = await snapshot_repo.get_latest(user_id=user_id, until=days[1])
+    before_first = await snapshot_repo.get_latest(
+        user_id=user_id, until=date(2025, 12, 31)
+    )
+
+    assert latest.snapshot_date == days[1]
+    assert before_first is None
+
+
+async def test_replace_from_bumps_portfolio_version(
+    snapshot_repo: SQLAlchemyPortfolioSnapshotRepository,
+    version_repo: SQLAlchemyVersionRepository,
+    t_current_user: UserDTO,
+) -> None:
+    before = await version_repo.get_versions(t_current_user.id)
+
+    await snapshot_repo.replace_from(
+        user_id=t_current_user.id, from_date=date(2026, 1, 1), snapshots=[]
+    )
+
+    after = await version_repo.get_versions(t_current_user.id)
+    assert after.portfolio == before.portfolio + 1
+
+
+async def test_get_stale_users_reports_users_behind(
+    snapshot_repo: SQLAlchemyPortfolioSnapshotRepository,
+    t_bondholder: BondHolderModel,
+) -> None:
+    user_id = t_bondholder.user_id
+    today = date.today()
+
+    assert await snapshot_repo.get_stale_users(as_of=today) == [(user_id, None)]
+
+    yesterday = today - timedelta(days=1)
+    await snapshot_repo.replace_from(
+        user_id=user_id,
+        from_date=yesterday,
+        snapshots=[_snapshot(user_id, yesterday, "100")],
+    )
+    assert await snapshot_repo.get_stale_users(as_of=today) == [(user_id, yesterday)]
+
+    await snapshot_repo.replace_from(
+        user_id=user_id,
+        from_date=today,
+        snapshots=[_snapshot(user_id, today, "100")],
+    )
+    assert await snapshot_repo.get_stale_users(as_of=today) == []
+
+
+async def test_refresh_builds_snapshots_from_holdings(
+    t_session: AsyncSession,
+    snapshot_repo: SQLAlchemyPortfolioSnapshotRepository,
+    bondholder_repo: SQLAlchemyBondHolderRepository,
+    bond_repo: SQLAlchemyBondRepository,
+    t_bondholder: BondHolderModel,
+) -> None:
+    today = date.today()
+    purchase_date = today - timedelta(days=10)
+    t_bondholder.purchase_date = purchase_date
+    t_session.add(
+        ReferenceRateModel(
+            id=uuid4(),
+            value=Decimal("5.75"),
+            start_date=purchase_date - timedelta(days=30),
+            end_date=None,
+        )
+    )
+    await t_session.commit()
+    use_case = RefreshPortfolioSnapshotUseCase(
+        bondholder_repo=bondholder_repo,
+        bond_repo=bond_repo,
+        reference_rate_repo=SQLAlchemyReferenceRateRepository(session=t_session),
+        snapshot_repo=snapshot_repo,
+        valuation_service=PortfolioValuationService(BondHolderIncomeCalculator()),
+    )
+
+    written = await use_case.execute(
+        user_id=t_bondholder.user_id, from_date=date.min, until=today
+    )
+
+    result = await snapshot_repo.get_range(user_id=t_bondholder.user_id, end=today)
+    assert written == len(result) == 11
+    assert result[0].snapshot_date == purchase_date
+    assert all(s.face_value == Decimal("10000") for s in result)
+    assert all(s.monthly_income > 0 for s in result)
@@ -0,0 +1,136 @@
+from datetime import date
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.adapters.outbound.database.models import (
+    ResultCacheEntry as ResultCacheEntryModel,
+)
+from src.adapters.outbound.result_cache.postgres_result_cache import (
+    PostgresResultCache,
+)
+from src.application.dto.calculations import MonthlyIncomeResponseDTO
+from src.domain.value_objects.resource_versions import ResourceVersions
+from src.domain.value_objects.result_cache_key import ResultCacheKey
+
+
+@pytest.fixture
+def session_maker(engine: AsyncEngine) -> sessionmaker:
+    return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+def cache(session_maker: sessionmaker) -> PostgresResultCache:
+    return PostgresResultCache(
+        session_maker=session_maker,
+        max_entries=2,
+        value_types={"income": MonthlyIncomeResponseDTO},
+    )
+
+
+def _key(user_id: UUID, portfolio: int = 1) -> ResultCacheKey:
+    return ResultCacheKey(
+        namespace="income",
+        user_id=user_id,
+        versions=ResourceVersions(portfolio=portfolio, reference_rate=1),
+        target_date=date(2026, 3, 1),
+    )
+
+
+def _dto(amount: str) -> MonthlyIncomeResponseDTO:
+    return MonthlyIncomeResponseDTO(data={uuid4(): Decimal(amount)})
+
+
+async def _count(session_maker: sessionmaker) -> int:
+    async with session_maker() as session:
+        stmt = select(func.count()).select_from(ResultCacheEntryModel)
+        return (await session.execute(stmt)).scalar_one()
+
+
+async def test_round_trips_dto(cache: PostgresResultCache) -> None:
+    key = _key(uuid4())
+    dto = MonthlyIncomeResponseDTO(data={uuid4(): Decimal("12.34")})
+
+    await cache.set(key, dto)
+
+    assert await cache.get(key) == dto
+
+
+async def test_miss_returns_none(cache: PostgresResultCache) -> None:
+    assert await cache.get(_key(uuid4())) is None
+
+
+async def test_set_overwrites_existing_entry(cache: PostgresResultCache) -> None:
+    key = _key(uuid4())
+    new = _dto("2")
+
+    await cache.set(key, _dto("1"))
+    await cache.set(key, new)
+
+    assert await cache.get(key) == new
+
+
+async def test_invalidate_user(
+    cache: PostgresResultCache, session_maker: sessionmaker
+) -> None:
+    user_id, other_id = uuid4(), uuid4()
+    other = _dto("2")
+    await cache.set(_key(user_id), _dto("1"))
+    await cache.set(_key(other_id), other)
+
+    await cache.invalidate_user(user_id)
+
+    assert await cache.get(_key(user_id)) is None
+    assert await cache.get(_key(other_id)) == other
+    assert await _count(session_maker) == 1
+
+
+async def test_prune_keeps_most_recently_used(
+    cache: PostgresResultCache,
+    session_maker: sessionmaker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(PostgresResultCache, "PRUNE_EVERY", 3)
+    keys = [_key(uuid4()) for _ in range(3)]
+    first = _dto("0")
+    await cache.set(keys[0], first)
+    await cache.set(keys[1], _dto("1"))
+    await cache.get(keys[0])
+
+    await cache.set(keys[2], _dto("2"))
+
+    assert await _count(session_maker) == 2
+    assert await cache.get(keys[1]) is None
+    assert await cache.get(keys[0]) == first
+
+
+async def test_entry_that_does_not_decode_is_a_miss(
+    cache: PostgresResultCache, session_maker: sessionmaker
+) -> None:
+    key = _key(uuid4())
+    await cache.set(key, _dto("1"))
+    async with session_maker() as session:
+        await session.execute(update(ResultCacheEntryModel).values(value=b"\x80\x05N."))
+        await session.commit()
+
+    assert await cache.get(key) is None
+
+
+async def test_unregistered_namespace_is_not_cached(
+    cache: PostgresResultCache, session_maker: sessionmaker
+) -> None:
+    key = ResultCacheKey(
+        namespace="equity",
+        user_id=uuid4(),
+        versions=ResourceVersions(portfolio=1, reference_rate=1),
+        target_date=date(2026, 3, 1),
+    )
+
+    await cache.set(key, _dto("1"))
+
+    assert await cache.get(key) is None
+    assert await _count(session_maker) == 0
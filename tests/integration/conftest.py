@@ -20,14 +20,33 @@ from sqlalchemy.ext.asyncio import (
 from testcontainers.postgres import PostgresContainer
 
 from src.adapters.outbound.database import Base
+from src.adapters.outbound.database.engine import get_session
 from src.adapters.outbound.repositories.bond import SQLAlchemyBondRepository
+from src.adapters.outbound.result_cache.in_memory_result_cache import (
+    InMemoryResultCache,
+)
 from src.adapters.outbound.repositories.bondholder import SQLAlchemyBondHolderRepository
+from src.adapters.outbound.repositories.equity_history import (
+    SQLAlchemyEquityHistoryRepository,
+)
+from src.adapters.outbound.repositories.portfolio_snapshot import (
+    SQLAlchemyPortfolioSnapshotRepository,
+)
+from src.adapters.outbound.repositories.reference_rate import (
+    SQLAlchemyReferenceRateRepository,
+)
 from src.adapters.outbound.repositories.user import SQLAlchemyUserRepository
+from src.adapters.outbound.repositories.version import SQLAlchemyVersionRepository
 from src.adapters.outbound.security.bcrypt_hasher import BcryptPasswordHasher
 from src.application.dto.user import UserDTO
 from src.application.events.event_publisher import EventPublisher
 from src.adapters.config import set_config, reset_config
-from src.adapters.inbound.api.dependencies import SessionDep, ConfigDep
+from src.adapters.inbound.api.dependencies import (
+    SessionDep,
+    ConfigDep,
+    primary_session_maker,
+)
+from src.adapters.inbound.api.dependencies.cache_deps import result_cache
 from src.adapters.inbound.api.dependencies.current_user_deps import current_user
 from src.adapters.inbound.api.dependencies.event_publisher_deps import (
     get_event_publisher,
@@ -36,6 +55,10 @@ from src.adapters.inbound.api.dependencies.repo_deps import (
     user_repository,
     bond_repository,
     bondholder_repository,
+    version_repository,
+    equity_history_repository,
+    portfolio_snapshot_repository,
+    reference_rate_repository,
 )
 from src.adapters.inbound.api.main import app
 from src.adapters.outbound.database.models import User as UserModel
@@ -116,8 +139,45 @@ async def clean_tables(engine: AsyncEngine) -> None:
 @pytest_asyncio.fixture(scope="session", autouse=True)
 def mock_config_globally() -> Generator[Mock, None, None]:
     mock = Mock()
+    mock.DB_POOL_SIZE = 5
+    mock.DB_MAX_OVERFLOW = 10
+    mock.DB_POOL_TIMEOUT_SECONDS = 30
+    mock.DB_POOL_RECYCLE_SECONDS = 1800
+    mock.DB_POOL_PRE_PING = False
+    mock.DB_POOL_WARMUP = 5
+    mock.DB_CONNECT_TIMEOUT_SECONDS = 10
+    mock.DB_STATEMENT_TIMEOUT_MS = None
+    mock.DB_STATEMENT_CACHE_SIZE = None
+    mock.DB_PGBOUNCER = False
+    mock.DB_REPLICA_URLS = []
+    mock.DB_REPLICA_MAX_LAG_SECONDS = 5
+    mock.DB_REPLICA_LAG_CHECK_SECONDS = 2
+    mock.DB_REPLICA_STICKY_SECONDS = 10
     mock.SECRET_KEY = "test-secret-key"
     mock.ALGORITHM = "HS256"
+    mock.TOMBSTONE_RETENTION_DAYS = 30
+    mock.RESULT_CACHE_BACKEND = "memory"
+    mock.RESULT_CACHE_MAX_ENTRIES = 128
+    mock.IDEMPOTENCY_BACKEND = "memory"
+    mock.IDEMPOTENCY_TTL_HOURS = 24
+    mock.IDEMPOTENCY_LEASE_SECONDS = 30
+    mock.LIVE_UPDATES_CHANNEL = "live_updates"
+    mock.LIVE_UPDATES_HEARTBEAT_SECONDS = 15
+    mock.LOGIN_RATE_LIMIT_BACKEND = "disabled"
+    mock.LOGIN_RATE_LIMIT_IP_BURST = 20
+    mock.LOGIN_RATE_LIMIT_IP_PER_MINUTE = 10
+    mock.LOGIN_RATE_LIMIT_USERNAME_BURST = 5
+    mock.LOGIN_RATE_LIMIT_USERNAME_PER_MINUTE = 2
+    mock.ADMISSION_MAX_IN_FLIGHT = 64
+    mock.ADMISSION_AUTH_MAX_IN_FLIGHT = 8
+    mock.ADMISSION_READ_MAX_IN_FLIGHT = 32
+    mock.ADMISSION_WRITE_MAX_IN_FLIGHT = 16
+    mock.ADMISSION_CALCULATION_MAX_IN_FLIGHT = 8
+    mock.ADMISSION_MAX_QUEUE = 64
+    mock.ADMISSION_MAX_WAIT_MS = 2000
+    mock.EQUITY_HISTORY_BACKEND = "python"
+    mock.SCENARIO_WORKERS = None
+    mock.SCENARIO_SHARD_SIZE = 1000
     mock.DB_APP_USER = "test"
     mock.DB_APP_PASSWORD = "test"
     mock.DB_MIGRATION_USER = "test"
@@ -209,6 +269,31 @@ def bondholder_repo(t_session: AsyncSession) -> SQLAlchemyBondHolderRepository:
     return SQLAlchemyBondHolderRepository(session=t_session)
 
 
+@pytest.fixture
+def version_repo(t_session: AsyncSession) -> SQLAlchemyVersionRepository:
+    return SQLAlchemyVersionRepository(session=t_session)
+
+
+@pytest.fixture
+def equity_history_repo(t_session: AsyncSession) -> SQLAlchemyEquityHistoryRepository:
+    return SQLAlchemyEquityHistoryRepository(session=t_session)
+
+
+@pytest.fixture
+def snapshot_repo(t_session: AsyncSession) -> SQLAlchemyPortfolioSnapshotRepository:
+    return SQLAlchemyPortfolioSnapshotRepository(session=t_session)
+
+
+@pytest.fixture
+def reference_rate_repo(t_session: AsyncSession) -> SQLAlchemyReferenceRateRepository:
+    return SQLAlchemyReferenceRateRepository(session=t_session)
+
+
+@pytest.fixture
+def t_result_cache() -> InMemoryResultCache:
+    return InMemoryResultCache(max_entries=128)
+
+
 @pytest.fixture()
 def event_publisher() -> EventPublisher:
     return EventPublisher()
@@ -216,19 +301,34 @@ def event_publisher() -> EventPublisher:
 
 @pytest_asyncio.fixture
 async def client(
+    engine: AsyncEngine,
     t_session: AsyncSession,
     t_current_user: UserModel,
     user_repo: SQLAlchemyUserRepository,
     bond_repo: SQLAlchemyBondRepository,
     bondholder_repo: SQLAlchemyBondHolderRepository,
+    version_repo: SQLAlchemyVersionRepository,
+    equity_history_repo: SQLAlchemyEquityHistoryRepository,
+    snapshot_repo: SQLAlchemyPortfolioSnapshotRepository,
+    reference_rate_repo: SQLAlchemyReferenceRateRepository,
+    t_result_cache: InMemoryResultCache,
     event_publisher: EventPublisher,
 ) -> AsyncClient:
     app.dependency_overrides[SessionDep] = lambda: t_session
+    app.dependency_overrides[get_session] = lambda: t_session
+    app.dependency_overrides[primary_session_maker] = lambda: async_sessionmaker(
+        engine, expire_on_commit=False
+    )
     app.dependency_overrides[ConfigDep] = lambda: mock_config_globally
     app.dependency_overrides[current_user] = lambda: t_current_user
     app.dependency_overrides[user_repository] = lambda: user_repo
     app.dependency_overrides[bond_repository] = lambda: bond_repo
     app.dependency_overrides[bondholder_repository] = lambda: bondholder_repo
+    app.dependency_overrides[version_repository] = lambda: version_repo
+    app.dependency_overrides[equity_history_repository] = lambda: equity_history_repo
+    app.dependency_overrides[portfolio_snapshot_repository] = lambda: snapshot_repo
+    app.dependency_overrides[reference_rate_repository] = lambda: reference_rate_repo
+    app.dependency_overrides[result_cache] = lambda: t_result_cache
     app.dependency_overrides[get_event_publisher] = lambda: event_publisher
 
     async with AsyncClient(
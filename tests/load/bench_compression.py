@@ -0,0 +1,96 @@
+"""
+Benchmark of response compression for 1k-item portfolio payloads.
+
+Encodes the ``GET /bonds`` list as JSON and MessagePack, and compresses
+each at the levels of the default policy and a few others, reporting the
+compressed size, ratio and CPU time per response. Then measures a streamed
+NDJSON export, flushed after every record, against compressing it whole.
+
+Usage:
+    python -m tests.load.bench_compression [--items N] [--rounds N]
+"""
+
+import argparse
+import time
+import zlib
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from src.adapters.inbound.api.compression import CompressionPolicy
+from src.adapters.inbound.api.schemas.bondholder import BondHolderResponse
+from src.adapters.inbound.api.serialization import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    DTOSerializer,
+)
+from src.application.dto.bondholder import BondHolderDTO
+
+_GZIP_WBITS = zlib.MAX_WBITS | 16
+
+
+def compress(chunks: list[bytes], level: int) -> bytes:
+    """Compress like the middleware: sync flush per chunk, finish at the end."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    out = [
+        compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        for chunk in chunks[:-1]
+    ]
+    out.append(compressor.compress(chunks[-1]) + compressor.flush(zlib.Z_FINISH))
+    return b"".join(out)
+
+
+def report(label: str, chunks: list[bytes], level: int, rounds: int) -> None:
+    size = sum(map(len, chunks))
+    began = time.thread_time()
+    for _ in range(rounds):
+        compressed = compress(chunks, level)
+    cpu = (time.thread_time() - began) / rounds
+    print(
+        f"{label:<32} level {level}: {size:>7} B -> {len(compressed):>6} B "
+        f"(ratio {len(compressed) / size:.3f}), {cpu * 1000:5.2f} ms CPU"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=100)
+    args = parser.parse_args()
+
+    user_id = uuid4()
+    bondholders = [
+        BondHolderDTO(
+            id=uuid4(),
+            user_id=user_id,
+            quantity=i % 500 + 1,
+            purchase_date=date(2020, 1, 1) + timedelta(days=i),
+            bond_id=uuid4(),
+            series=f"ROR{i:04d}",
+            nominal_value=Decimal("100.00"),
+            maturity_period=12,
+            initial_interest_rate=Decimal("6.15"),
+            first_interest_period=1,
+            reference_rate_margin=Decimal("0.10"),
+        )
+        for i in range(args.items)
+    ]
+    levels = CompressionPolicy().levels
+    many = DTOSerializer(BondHolderDTO, BondHolderResponse, many=True)
+    one = DTOSerializer(BondHolderDTO, BondHolderResponse)
+
+    for media_type, body in (
+        (JSON_MEDIA_TYPE, many.to_json(bondholders)),
+        (MSGPACK_MEDIA_TYPE, many.to_msgpack(bondholders)),
+    ):
+        for level in sorted({1, levels[media_type], 9}):
+            report(f"GET /bonds {media_type}", [body], level, args.rounds)
+
+    records = [one.to_json(bh) + b"\n" for bh in bondholders]
+    level = levels["application/x-ndjson"]
+    report("NDJSON export, streamed", records, level, args.rounds)
+    report("NDJSON export, whole", [b"".join(records)], level, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
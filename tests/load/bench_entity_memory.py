@@ -0,0 +1,115 @@
+"""
+Memory benchmark of loading domain entities.
+
+Builds N bondholders, bonds and reference rates under tracemalloc, both as
+the slotted entities and as equivalent dict-backed dataclasses, and
+reports the bytes allocated per object and the creation time.
+
+Usage:
+    python -m tests.load.bench_entity_memory [--holdings N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import field, fields, make_dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.entities.reference_rate import ReferenceRate
+
+
+def dict_backed(cls: type) -> type:
+    """
+    Layout of ``cls`` before it was compacted: a plain dataclass with an
+    instance ``__dict__`` and an eagerly allocated event list.
+    """
+    return make_dataclass(
+        f"Dict{cls.__name__}",
+        [
+            (
+                f.name,
+                f.type,
+                field(default_factory=list, init=False) if f.name == "_events" else f,
+            )
+            for f in fields(cls)
+        ],
+    )
+
+
+def measure(
+    label: str, build: Callable[..., object], arguments: list[dict[str, object]]
+) -> None:
+    """Bytes allocated by the objects alone, their arguments being prebuilt."""
+    began = time.perf_counter()
+    objects = [build(**kwargs) for kwargs in arguments]
+    elapsed = time.perf_counter() - began
+    del objects
+
+    tracemalloc.start()
+    objects = [build(**kwargs) for kwargs in arguments]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    count = len(arguments)
+    print(
+        f"{label:<22} {allocated / count:6.1f} B/object  "
+        f"{allocated / 2**20:6.1f} MiB  {elapsed:.3f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--holdings", type=int, default=100_000)
+    args = parser.parse_args()
+
+    bond_ids = [uuid4() for _ in range(100)]
+    user_id = uuid4()
+    start = date(2015, 1, 1)
+    nominal = Decimal(100)
+
+    def bondholder_kwargs(i: int) -> dict[str, object]:
+        return dict(
+            id=uuid4(),
+            bond_id=bond_ids[i % len(bond_ids)],
+            user_id=user_id,
+            quantity=i % 500 + 1,
+            purchase_date=start + timedelta(days=i % 3650),
+        )
+
+    def bond_kwargs(i: int) -> dict[str, object]:
+        return dict(
+            id=uuid4(),
+            series=f"ROR{i:06d}",
+            nominal_value=nominal,
+            maturity_period=12,
+            initial_interest_rate=Decimal("5.75"),
+            first_interest_period=1,
+            reference_rate_margin=Decimal("0.10"),
+        )
+
+    def rate_kwargs(i: int) -> dict[str, object]:
+        return dict(id=uuid4(), value=Decimal("5.75"), start_date=start)
+
+    for cls, kwargs in (
+        (BondHolder, bondholder_kwargs),
+        (Bond, bond_kwargs),
+        (ReferenceRate, rate_kwargs),
+    ):
+        arguments = [kwargs(i) for i in range(args.holdings)]
+        measure(f"{cls.__name__} (dict)", dict_backed(cls), arguments)
+        measure(f"{cls.__name__} (slots)", cls, arguments)
+
+    arguments = [bond_kwargs(i) for i in range(args.holdings)]
+    for kwargs in arguments:
+        del kwargs["id"]
+    measure("Bond.create", Bond.create, arguments)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark of live update fan-out to idle SSE subscribers in one worker.
+
+Opens N event streams, each waiting for its next update with the server's
+heartbeat, under tracemalloc, and reports the memory held per idle stream.
+Then broadcasts rate changes and measures the time until every stream has
+produced its event, along with the per-user revaluation dispatch time.
+
+Usage:
+    python -m tests.load.bench_live_updates [--subscribers N] [--rounds N]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from datetime import date
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from src.adapters.inbound.api.routers.live import _event_stream
+from src.application.live_updates import LiveUpdateHub
+from src.application.metrics import Metrics
+from src.domain.value_objects.live_update import (
+    PortfolioRevalued,
+    ReferenceRateChanged,
+)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    hub = LiveUpdateHub(metrics=Metrics())
+    user_ids = [uuid4() for _ in range(args.subscribers)]
+    received = 0
+    all_received = asyncio.Event()
+
+    async def client(user_id: UUID) -> None:
+        nonlocal received
+        async for frame in _event_stream(hub, user_id, heartbeat=15):
+            if frame.startswith(b"event:"):
+                received += 1
+                if received == args.subscribers:
+                    all_received.set()
+
+    tracemalloc.start()
+    tasks = [asyncio.create_task(client(user_id)) for user_id in user_ids]
+    while len(hub) < args.subscribers:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.1)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{args.subscribers} idle streams: {allocated / args.subscribers:7.0f} "
+        f"B/stream, {allocated / 2**20:6.1f} MiB"
+    )
+
+    latencies = []
+    for i in range(args.rounds):
+        received = 0
+        all_received.clear()
+        began = time.perf_counter()
+        hub.dispatch(
+            ReferenceRateChanged(value=Decimal(i), effective_date=date(2026, 3, 1))
+        )
+        await all_received.wait()
+        latencies.append(time.perf_counter() - began)
+    latencies.sort()
+    print(
+        f"broadcast to all: median {latencies[len(latencies) // 2] * 1000:6.1f} ms, "
+        f"max {latencies[-1] * 1000:6.1f} ms"
+    )
+
+    updates = [
+        PortfolioRevalued(
+            user_id=user_id,
+            as_of=date(2026, 3, 31),
+            equity=Decimal("100"),
+            monthly_income=Decimal("1"),
+            equity_delta=Decimal("0"),
+            monthly_income_delta=Decimal("0"),
+        )
+        for user_id in user_ids
+    ]
+    began = time.perf_counter()
+    for update in updates:
+        hub.dispatch(update)
+    elapsed = time.perf_counter() - began
+    print(f"per-user dispatch: {elapsed / len(updates) * 1e6:6.2f} us/update")
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""
+Benchmark of the integer grosze income path against the Decimal formula.
+
+Prices a monthly coupon of many bonds both ways, with the same inputs and
+the same results, and reports the time of each.
+
+Usage:
+    python -m tests.load.bench_money [--coupons N]
+"""
+
+import argparse
+import random
+import time
+from decimal import ROUND_HALF_UP, Decimal
+
+from src.domain.entities.bond import Bond
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+
+
+def decimal_income(
+    bond: Bond, reference_rate: Decimal, quantity: int, days: int
+) -> Decimal:
+    annual_rate = reference_rate / 100 + bond.reference_rate_margin / 100
+    gross = (bond.nominal_value * annual_rate * days / Decimal("365")).quantize(
+        Decimal("0.01"), rounding=ROUND_HALF_UP
+    )
+    return gross * Decimal("0.81") * quantity
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--coupons", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    bonds = [
+        Bond.create(
+            series=f"ROR{i:04d}",
+            nominal_value=Decimal(100),
+            maturity_period=12,
+            initial_interest_rate=Decimal(rng.randint(100, 800)).scaleb(-2),
+            first_interest_period=1,
+            reference_rate_margin=Decimal(rng.randint(0, 200)).scaleb(-2),
+        )
+        for i in range(50)
+    ]
+    rates = [Decimal(rng.randint(0, 1000)).scaleb(-2) for _ in range(120)]
+    coupons = [
+        (rng.choice(bonds), rng.choice(rates), rng.randint(1, 500), rng.randint(28, 31))
+        for _ in range(args.coupons)
+    ]
+    calculator = BondHolderIncomeCalculator()
+
+    began = time.perf_counter()
+    reference = [decimal_income(*coupon) for coupon in coupons]
+    decimal_elapsed = time.perf_counter() - began
+
+    began = time.perf_counter()
+    integer = [
+        calculator.calculate_period_income(
+            bond=bond,
+            quantity=quantity,
+            days_in_period=days,
+            reference_rate=reference_rate,
+        )
+        for bond, reference_rate, quantity, days in coupons
+    ]
+    integer_elapsed = time.perf_counter() - began
+
+    assert integer == reference
+    print(
+        f"{args.coupons} coupons: decimal {decimal_elapsed:.3f}s, "
+        f"integer {integer_elapsed:.3f}s "
+        f"({decimal_elapsed / integer_elapsed:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
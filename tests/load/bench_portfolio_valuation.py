@@ -0,0 +1,105 @@
+"""
+Benchmark of the daily portfolio valuation engine.
+
+Values a portfolio of 1,000 positions bought over ten years, with a monthly
+reference rate timeline, on every day of that period.
+
+Usage:
+    python -m tests.load.bench_portfolio_valuation [--positions N] [--years N]
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from dateutil.relativedelta import relativedelta  # type: ignore [import-untyped]
+
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.entities.reference_rate import ReferenceRate
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.services.portfolio_valuation import PortfolioValuationService
+
+SERIES = ("ROR", "DOR", "TOS", "COI", "EDO")
+
+
+def build_portfolio(
+    positions: int, start: date, end: date, seed: int = 0
+) -> tuple[list[tuple[BondHolder, Bond]], list[ReferenceRate]]:
+    rng = random.Random(seed)
+    bonds = [
+        Bond.create(
+            series=f"{series}{i:04d}",
+            nominal_value=Decimal("100"),
+            maturity_period=12 * (1 + i % 10),
+            initial_interest_rate=Decimal(rng.randint(400, 700)) / 100,
+            first_interest_period=1 + i % 12,
+            reference_rate_margin=Decimal(rng.randint(0, 150)) / 100,
+        )
+        for i, series in enumerate(SERIES * 4)
+    ]
+    span = (end - start).days
+    user_id = uuid4()
+    holdings = []
+    for _ in range(positions):
+        bond = rng.choice(bonds)
+        bh = BondHolder.create(
+            user_id=user_id,
+            bond_id=bond.id,
+            quantity=rng.randint(1, 500),
+            purchase_date=start + timedelta(days=rng.randrange(span)),
+        )
+        holdings.append((bh, bond))
+
+    rates = []
+    month = start.replace(day=1)
+    while month <= end:
+        next_month = month + relativedelta(months=1)
+        rates.append(
+            ReferenceRate(
+                id=uuid4(),
+                value=Decimal(rng.randint(100, 700)) / 100,
+                start_date=month,
+                end_date=next_month - timedelta(days=1),
+            )
+        )
+        month = next_month
+    return holdings, rates
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--positions", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    end = date(2025, 12, 31)
+    start = end - relativedelta(years=args.years)
+    holdings, rates = build_portfolio(args.positions, start, end)
+    service = PortfolioValuationService(BondHolderIncomeCalculator())
+
+    timings = []
+    for _ in range(args.repeat):
+        began = time.perf_counter()
+        snapshots = service.value_daily(
+            user_id=uuid4(),
+            holdings=holdings,
+            reference_rates=rates,
+            start=start,
+            end=end,
+        )
+        timings.append(time.perf_counter() - began)
+
+    print(
+        f"{args.positions} positions, {len(snapshots)} days: "
+        f"best {min(timings):.3f}s, worst {max(timings):.3f}s "
+        f"over {args.repeat} runs"
+    )
+
+
+if __name__ == "__main__":
+    main()
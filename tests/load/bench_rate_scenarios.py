@@ -0,0 +1,73 @@
+"""
+Benchmark of the rate scenario Monte Carlo engine.
+
+Projects ten years of income of a 500-position portfolio under 10,000
+random-walk reference rate paths, sharded across a process pool.
+
+Usage:
+    python -m tests.load.bench_rate_scenarios [--positions N] [--paths N]
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.application.dto.user import UserDTO
+from src.application.use_cases.calculations.stress_test_income import (
+    StressTestIncomeUseCase,
+)
+from src.domain.services.analytics.rate_scenarios import RateScenarioService
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.value_objects.rate_scenario import RateScenarioQuery
+from tests.load.bench_portfolio_valuation import build_portfolio
+
+
+async def run(positions: int, paths: int, workers: int | None) -> None:
+    today = date(2025, 12, 31)
+    holdings, rates = build_portfolio(positions, date(2018, 1, 1), today)
+    bondholder_repo = AsyncMock()
+    bondholder_repo.get_all.return_value = [bh for bh, _ in holdings]
+    bond_repo = AsyncMock()
+    bond_repo.fetch_dict_from_bondholders.return_value = {
+        bond.id: bond for _, bond in holdings
+    }
+    reference_rate_repo = AsyncMock()
+    reference_rate_repo.get_latest.return_value = rates[-1]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        use_case = StressTestIncomeUseCase(
+            scenario_service=RateScenarioService(BondHolderIncomeCalculator()),
+            bondholder_repo=bondholder_repo,
+            bond_repo=bond_repo,
+            reference_rate_repo=reference_rate_repo,
+            executor=executor,
+        )
+        began = time.perf_counter()
+        result = await use_case.execute(
+            user=UserDTO(id=uuid4(), email="bench@example.com", name=None),
+            scenario=RateScenarioQuery(horizon_months=120, paths=paths, seed=1),
+            today=today,
+        )
+        elapsed = time.perf_counter() - began
+
+    print(
+        f"{positions} positions, {result.paths} paths x {len(result.bands)} months: "
+        f"{elapsed:.3f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--positions", type=int, default=500)
+    parser.add_argument("--paths", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(run(args.positions, args.paths, args.workers))
+
+
+if __name__ == "__main__":
+    main()
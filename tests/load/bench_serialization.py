@@ -0,0 +1,148 @@
+"""
+Benchmark of response serialization for 1k-item lists.
+
+Compares the DTO serializers with the path FastAPI takes for a
+``response_model``: validate the DTOs into the schema, dump them to JSON
+compatible Python and encode that with the standard JSON encoder. Also
+reports the MessagePack representation: encoding time, size and how long
+a client takes to decode each body.
+
+Usage:
+    python -m tests.load.bench_serialization [--items N] [--rounds N]
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from src.adapters.inbound.api.msgpack_codec import unpackb
+from src.adapters.inbound.api.schemas.bondholder import BondHolderResponse
+from src.adapters.inbound.api.schemas.calculations import MonthIncomeResponse
+from src.adapters.inbound.api.schemas.data import EquityResponse
+from src.adapters.inbound.api.serialization import DTOSerializer
+from src.application.dto.bondholder import BondHolderDTO
+from src.application.dto.calculations import MonthlyIncomeResponseDTO
+from src.application.dto.data import EquityDTO
+
+
+def validated_json(schema: object) -> Callable[[object], bytes]:
+    """Serializer doing what FastAPI does with a response model."""
+    adapter = TypeAdapter(schema)
+
+    def serialize(value: object) -> bytes:
+        content = adapter.dump_python(
+            adapter.validate_python(value, from_attributes=True), mode="json"
+        )
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+    return serialize
+
+
+def timed(function: Callable[[Any], object], value: Any, rounds: int) -> float:
+    began = time.perf_counter()
+    for _ in range(rounds):
+        function(value)
+    return (time.perf_counter() - began) / rounds
+
+
+def compare(
+    label: str,
+    serializer: DTOSerializer,
+    schema: object,
+    value: object,
+    rounds: int,
+    validated: object | None = None,
+) -> None:
+    """
+    Args:
+        validated: Value FastAPI would validate, when the DTO attributes are
+            named differently from the schema fields
+    """
+    slow = validated_json(schema)
+    validated = value if validated is None else validated
+    json_body = serializer.to_json(value)
+    msgpack_body = serializer.to_msgpack(value)
+    assert json.loads(json_body) == json.loads(slow(validated))
+
+    slow_time = timed(slow, validated, rounds)
+    json_time = timed(serializer.to_json, value, rounds)
+    msgpack_time = timed(serializer.to_msgpack, value, rounds)
+    print(
+        f"{label:<18} encode: response_model {slow_time * 1000:6.2f} ms, "
+        f"JSON {json_time * 1000:5.2f} ms ({slow_time / json_time:.1f}x), "
+        f"MessagePack {msgpack_time * 1000:5.2f} ms"
+    )
+    print(
+        f"{'':<18} decode: JSON {len(json_body):>7} B "
+        f"{timed(json.loads, json_body, rounds) * 1000:5.2f} ms, "
+        f"MessagePack {len(msgpack_body):>7} B "
+        f"{timed(unpackb, msgpack_body, rounds) * 1000:5.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    user_id = uuid4()
+    bondholders = [
+        BondHolderDTO(
+            id=uuid4(),
+            user_id=user_id,
+            quantity=i % 500 + 1,
+            purchase_date=date(2020, 1, 1) + timedelta(days=i),
+            bond_id=uuid4(),
+            series=f"ROR{i:04d}",
+            nominal_value=Decimal("100.00"),
+            maturity_period=12,
+            initial_interest_rate=Decimal("6.15"),
+            first_interest_period=1,
+            reference_rate_margin=Decimal("0.10"),
+        )
+        for i in range(args.items)
+    ]
+    income = MonthlyIncomeResponseDTO(
+        data={bh.id: Decimal(bh.quantity).scaleb(-2) for bh in bondholders}
+    )
+    equity = EquityDTO(
+        data=[
+            (date(2015, 1, 1) + timedelta(days=i), Decimal(100_000 + i).scaleb(-2))
+            for i in range(args.items)
+        ]
+    )
+
+    compare(
+        "GET /bonds",
+        DTOSerializer(BondHolderDTO, BondHolderResponse, many=True),
+        list[BondHolderResponse],
+        bondholders,
+        args.rounds,
+    )
+    compare(
+        "GET /month-income",
+        DTOSerializer(MonthlyIncomeResponseDTO, MonthIncomeResponse),
+        MonthIncomeResponse,
+        income,
+        args.rounds,
+    )
+    compare(
+        "GET /data/equity",
+        DTOSerializer(EquityDTO, EquityResponse, attributes={"equity": "data"}),
+        EquityResponse,
+        equity,
+        args.rounds,
+        validated={"equity": equity.data},
+    )
+
+
+if __name__ == "__main__":
+    main()
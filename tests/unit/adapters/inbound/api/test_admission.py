@@ -0,0 +1,236 @@
+import asyncio
+import json
+
+import pytest
+
+from src.adapters.inbound.api.admission import (
+    AdmissionGate,
+    AdmissionLimit,
+    AdmissionMiddleware,
+    AdmissionPolicy,
+)
+from src.application.metrics import Metrics
+
+
+class _App:
+    """Holds every request until released, counting those running."""
+
+    def __init__(self) -> None:
+        self.running = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.running += 1
+        try:
+            await self.release.wait()
+        finally:
+            self.running -= 1
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _policy(
+    max_in_flight: int = 1,
+    max_queue: int = 1,
+    max_wait: float = 1.0,
+    worker_max_in_flight: int = 10,
+) -> AdmissionPolicy:
+    limit = AdmissionLimit(max_in_flight, max_queue, max_wait)
+    return AdmissionPolicy(
+        worker=AdmissionLimit(worker_max_in_flight, max_queue, max_wait),
+        classes={name: limit for name in ("auth", "read", "write", "calculation")},
+    )
+
+
+async def _request(
+    middleware: AdmissionMiddleware, path: str = "/api/bonds", method: str = "GET"
+) -> tuple[int, dict[bytes, bytes], bytes]:
+    sent: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+    await middleware(scope, receive, send)
+    start, body = sent
+    return start["status"], dict(start["headers"]), body["body"]
+
+
+@pytest.fixture
+def metrics() -> Metrics:
+    return Metrics()
+
+
+@pytest.fixture
+def app() -> _App:
+    return _App()
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    [
+        ("POST", "/api/login/token", "auth"),
+        ("GET", "/api/login/me", "read"),
+        ("POST", "/api/users", "auth"),
+        ("DELETE", "/api/users/1", "write"),
+        ("GET", "/api/calculations/equity", "calculation"),
+        ("POST", "/api/calculations/scenarios", "calculation"),
+        ("GET", "/api/bonds", "read"),
+        ("HEAD", "/api/bonds", "read"),
+        ("PATCH", "/api/bonds/1", "write"),
+        ("POST", "/api/logout", "write"),
+        ("GET", "/health", None),
+        ("GET", "/metrics", None),
+        ("GET", "/api/live/events", None),
+        ("OPTIONS", "/api/bonds", None),
+    ],
+)
+def test_classify(method: str, path: str, expected: str | None) -> None:
+    assert _policy().classify(method, path) == expected
+
+
+async def test_gate_hands_slots_over_in_arrival_order() -> None:
+    gate = AdmissionGate(AdmissionLimit(max_in_flight=1, max_queue=2, max_wait=1))
+    deadline = asyncio.get_running_loop().time() + 1
+    order: list[str] = []
+
+    async def take(name: str) -> None:
+        assert await gate.acquire(deadline)
+        order.append(name)
+
+    assert await gate.acquire(deadline)
+    waiters = [asyncio.create_task(take(name)) for name in ("first", "second")]
+    await asyncio.sleep(0)
+    assert gate.queued == 2
+    assert gate.full
+
+    gate.release()
+    await asyncio.sleep(0)
+    gate.release()
+    await asyncio.gather(*waiters)
+
+    assert order == ["first", "second"]
+    assert gate.in_flight == 1
+    gate.release()
+    assert gate.in_flight == 0
+
+
+async def test_cancelled_waiter_passes_its_slot_on() -> None:
+    gate = AdmissionGate(AdmissionLimit(max_in_flight=1, max_queue=2, max_wait=1))
+    deadline = asyncio.get_running_loop().time() + 1
+    assert await gate.acquire(deadline)
+    cancelled = asyncio.create_task(gate.acquire(deadline))
+    waiting = asyncio.create_task(gate.acquire(deadline))
+    await asyncio.sleep(0)
+
+    # The slot is handed to the first waiter just as it gets cancelled.
+    gate.release()
+    cancelled.cancel()
+
+    assert await waiting
+    assert cancelled.cancelled()
+    assert gate.in_flight == 1
+    assert gate.queued == 0
+
+
+async def test_requests_over_limit_wait_for_a_slot(app: _App, metrics: Metrics) -> None:
+    middleware = AdmissionMiddleware(app, _policy(max_queue=4), metrics)
+
+    requests = [asyncio.create_task(_request(middleware)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    assert app.running == 1
+
+    app.release.set()
+    responses = await asyncio.gather(*requests)
+
+    assert [status for status, _, _ in responses] == [200, 200, 200]
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"] == {"admission.read.admitted": 3}
+    wait = snapshot["summaries"]["admission.read.queue_wait_ms"]
+    assert wait["count"] == 3
+    assert wait["sum"] > 0
+
+
+async def test_full_queue_sheds_at_once(app: _App, metrics: Metrics) -> None:
+    middleware = AdmissionMiddleware(app, _policy(max_wait=10), metrics)
+    running = asyncio.create_task(_request(middleware))
+    queued = asyncio.create_task(_request(middleware))
+    await asyncio.sleep(0)
+
+    status, headers, body = await _request(middleware)
+
+    assert status == 503
+    assert headers[b"retry-after"] == b"10"
+    assert json.loads(body) == {"detail": "Server is busy, retry later"}
+    assert metrics.snapshot()["counters"]["admission.read.shed_queue_full"] == 1
+    app.release.set()
+    assert [r[0] for r in await asyncio.gather(running, queued)] == [200, 200]
+
+
+async def test_shed_past_deadline(app: _App, metrics: Metrics) -> None:
+    middleware = AdmissionMiddleware(app, _policy(max_wait=0.05), metrics)
+    running = asyncio.create_task(_request(middleware))
+    await asyncio.sleep(0)
+
+    status, headers, _ = await _request(middleware)
+
+    assert status == 503
+    assert headers[b"retry-after"] == b"1"
+    assert metrics.snapshot()["counters"]["admission.read.shed_deadline"] == 1
+    app.release.set()
+    await running
+    assert middleware.gate("read").in_flight == 0
+
+
+async def test_classes_limited_apart(app: _App, metrics: Metrics) -> None:
+    middleware = AdmissionMiddleware(app, _policy(max_queue=0), metrics)
+    read = asyncio.create_task(_request(middleware, "/api/bonds"))
+    write = asyncio.create_task(_request(middleware, "/api/bonds", "POST"))
+    await asyncio.sleep(0)
+
+    assert app.running == 2
+    assert (await _request(middleware, "/api/bonds/1", "PATCH"))[0] == 503
+    app.release.set()
+    await asyncio.gather(read, write)
+
+
+async def test_worker_limit_spans_classes(app: _App, metrics: Metrics) -> None:
+    middleware = AdmissionMiddleware(
+        app, _policy(max_queue=0, worker_max_in_flight=1), metrics
+    )
+    read = asyncio.create_task(_request(middleware, "/api/bonds"))
+    await asyncio.sleep(0)
+
+    status, _, _ = await _request(middleware, "/api/bonds", "POST")
+
+    assert status == 503
+    assert metrics.snapshot()["counters"]["admission.write.shed_queue_full"] == 1
+    # The shed request gave its class slot back.
+    assert middleware.gate("write").in_flight == 0
+    app.release.set()
+    await read
+
+
+async def test_exempt_paths_not_limited(app: _App, metrics: Metrics) -> None:
+    middleware = AdmissionMiddleware(app, _policy(max_queue=0), metrics)
+    app.release.set()
+
+    assert (await _request(middleware, "/health"))[0] == 200
+    assert (await _request(middleware, "/api/live/events"))[0] == 200
+    assert metrics.snapshot()["counters"] == {}
+
+
+async def test_slot_released_when_app_fails(metrics: Metrics) -> None:
+    async def failing(scope, receive, send) -> None:
+        raise RuntimeError("boom")
+
+    middleware = AdmissionMiddleware(failing, _policy(), metrics)
+
+    with pytest.raises(RuntimeError):
+        await _request(middleware)
+
+    assert middleware.gate("read").in_flight == 0
+    assert middleware.worker_gate.in_flight == 0
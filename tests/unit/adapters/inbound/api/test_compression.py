@@ -0,0 +1,240 @@
+import gzip
+import json
+import zlib
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from src.adapters.inbound.api.compression import (
+    CompressionMiddleware,
+    CompressionPolicy,
+    choose_encoding,
+)
+from src.application.metrics import Metrics
+
+_LARGE = json.dumps([{"series": "ROR0325", "quantity": i} for i in range(200)])
+
+
+async def _large(request: Request) -> Response:
+    return Response(_LARGE, media_type="application/json", headers={"ETag": '"abc"'})
+
+
+async def _small(request: Request) -> Response:
+    return Response('{"status": "ok"}', media_type="application/json")
+
+
+async def _msgpack(request: Request) -> Response:
+    return Response(b"\x80" * 512, media_type="application/msgpack")
+
+
+async def _binary(request: Request) -> Response:
+    return Response(b"\x00" * 2048, media_type="application/octet-stream")
+
+
+async def _encoded(request: Request) -> Response:
+    return Response(
+        gzip.compress(_LARGE.encode()),
+        media_type="application/json",
+        headers={"Content-Encoding": "gzip"},
+    )
+
+
+async def _not_modified(request: Request) -> Response:
+    return Response(status_code=304, headers={"ETag": '"abc"'})
+
+
+async def _records() -> AsyncIterator[bytes]:
+    for i in range(3):
+        yield json.dumps({"line": i}).encode() + b"\n"
+
+
+@pytest.fixture
+def metrics() -> Metrics:
+    return Metrics()
+
+
+@pytest.fixture
+def client(metrics: Metrics) -> httpx.AsyncClient:
+    app = Starlette(
+        routes=[
+            Route("/large", _large),
+            Route("/small", _small),
+            Route("/msgpack", _msgpack),
+            Route("/binary", _binary),
+            Route("/encoded", _encoded),
+            Route("/not-modified", _not_modified),
+        ]
+    )
+    app.add_middleware(CompressionMiddleware, metrics=metrics)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+async def _raw(client: httpx.AsyncClient, path: str, accept_encoding: str):
+    """Send a request and return the response and its undecoded body."""
+    request = client.build_request(
+        "GET", path, headers={"Accept-Encoding": accept_encoding}
+    )
+    response = await client.send(request, stream=True)
+    body = b"".join([chunk async for chunk in response.aiter_raw()])
+    await response.aclose()
+    return response, body
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate", "deflate"),
+        ("gzip, deflate, br", "gzip"),
+        ("deflate, gzip", "gzip"),
+        ("gzip;q=0.5, deflate", "deflate"),
+        ("gzip;q=0, deflate;q=0", None),
+        ("*", "gzip"),
+        ("gzip;q=0, *;q=0.1", "deflate"),
+        ("br, zstd", None),
+        ("GZIP;q=bad, deflate;q=0.2", "deflate"),
+    ],
+)
+def test_choose_encoding(header: str | None, expected: str | None) -> None:
+    assert choose_encoding(header) == expected
+
+
+async def test_gzip_large_response(client: httpx.AsyncClient) -> None:
+    response, body = await _raw(client, "/large", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-length"] == str(len(body))
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"abc"'
+    assert len(body) < len(_LARGE)
+    assert gzip.decompress(body).decode() == _LARGE
+
+
+async def test_deflate_large_response(client: httpx.AsyncClient) -> None:
+    response, body = await _raw(client, "/large", "deflate")
+
+    assert response.headers["content-encoding"] == "deflate"
+    assert zlib.decompress(body).decode() == _LARGE
+
+
+async def test_without_accept_encoding_sent_as_is(client: httpx.AsyncClient) -> None:
+    response, body = await _raw(client, "/large", "identity")
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"abc"'
+    assert body.decode() == _LARGE
+
+
+@pytest.mark.parametrize("path", ["/small", "/msgpack"])
+async def test_below_minimum_size_sent_as_is(
+    client: httpx.AsyncClient, path: str
+) -> None:
+    response, body = await _raw(client, path, "gzip")
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len(body))
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+async def test_msgpack_above_minimum_size_compressed(metrics: Metrics) -> None:
+    app = Starlette(routes=[Route("/msgpack", _msgpack)])
+    app.add_middleware(
+        CompressionMiddleware,
+        policy=CompressionPolicy(minimum_size=100),
+        metrics=metrics,
+    )
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/msgpack", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == b"\x80" * 512
+
+
+@pytest.mark.parametrize("path", ["/binary", "/encoded", "/not-modified"])
+async def test_not_compressible_sent_as_is(
+    client: httpx.AsyncClient, metrics: Metrics, path: str
+) -> None:
+    response, _ = await _raw(client, path, "gzip")
+
+    assert "vary" not in response.headers
+    assert response.headers.get("content-encoding") != "deflate"
+    assert metrics.snapshot()["counters"] == {}
+
+
+async def test_stream_compressed_chunk_by_chunk(metrics: Metrics) -> None:
+    sent: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    middleware = CompressionMiddleware(
+        StreamingResponse(_records(), media_type="application/x-ndjson"),
+        metrics=metrics,
+    )
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    await middleware(scope, receive, send)
+
+    start, *bodies = sent
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    # Every chunk is flushed, so each decodes to its whole record on arrival.
+    assert [decompressor.decompress(body["body"]) for body in bodies[:3]] == [
+        json.dumps({"line": i}).encode() + b"\n" for i in range(3)
+    ]
+    assert decompressor.decompress(bodies[-1]["body"]) == b""
+    assert not bodies[-1]["more_body"]
+    assert decompressor.eof
+    assert metrics.snapshot()["counters"]["compression.gzip.responses"] == 1
+
+
+async def test_records_ratio_and_cpu(
+    client: httpx.AsyncClient, metrics: Metrics
+) -> None:
+    _, body = await _raw(client, "/large", "gzip")
+    await _raw(client, "/small", "gzip")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"] == {
+        "compression.gzip.responses": 1,
+        "compression.gzip.bytes_in": len(_LARGE),
+        "compression.gzip.bytes_out": len(body),
+    }
+    ratio = snapshot["summaries"]["compression.gzip.ratio"]
+    assert ratio["count"] == 1
+    assert ratio["sum"] == pytest.approx(len(body) / len(_LARGE))
+    assert snapshot["summaries"]["compression.gzip.cpu_ms"]["count"] == 1
+
+
+async def test_body_before_start_is_an_error(metrics: Metrics) -> None:
+    async def app(scope: dict, receive, send) -> None:
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    async def send(message: dict) -> None:
+        pass
+
+    middleware = CompressionMiddleware(app, metrics=metrics)
+    scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+
+    with pytest.raises(RuntimeError):
+        await middleware(scope, None, send)
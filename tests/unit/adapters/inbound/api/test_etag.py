@@ -0,0 +1,68 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.inbound.api.etag import compute_etag, etag_matches
+from src.domain.value_objects.resource_versions import ResourceVersions
+
+USER_ID = uuid4()
+TODAY = date(2026, 3, 1)
+VERSIONS = ResourceVersions(portfolio=3, reference_rate=7)
+
+
+def _etag(**overrides) -> str:
+    kwargs = {
+        "user_id": USER_ID,
+        "versions": VERSIONS,
+        "today": TODAY,
+        "path": "/api/bonds",
+        "query": [("limit", "10")],
+    }
+    kwargs.update(overrides)
+    return compute_etag(**kwargs)
+
+
+def test_etag_is_strong_and_stable() -> None:
+    etag = _etag()
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert _etag() == etag
+
+
+def test_query_order_does_not_matter() -> None:
+    first = _etag(query=[("limit", "10"), ("order", "asc")])
+    second = _etag(query=[("order", "asc"), ("limit", "10")])
+
+    assert first == second
+
+
+@pytest.mark.parametrize(
+    "override",
+    [
+        {"user_id": uuid4()},
+        {"versions": ResourceVersions(portfolio=4, reference_rate=7)},
+        {"versions": ResourceVersions(portfolio=3, reference_rate=8)},
+        {"today": date(2026, 3, 2)},
+        {"path": "/api/data/equity"},
+        {"query": [("limit", "20")]},
+    ],
+)
+def test_any_input_change_changes_etag(override: dict) -> None:
+    assert _etag(**override) != _etag()
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ("", False),
+        ('"other"', False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", "abc"', True),
+        ("*", True),
+    ],
+)
+def test_etag_matches(header: str | None, expected: bool) -> None:
+    assert etag_matches(header, '"abc"') is expected
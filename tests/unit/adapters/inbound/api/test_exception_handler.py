@@ -14,6 +14,7 @@ from src.adapters.outbound.exceptions import SQLAlchemyRepositoryError
 from src.domain.exceptions import (
     DomainError,
     NotFoundError,
+    RateLimitExceededError,
 )
 
 
@@ -37,6 +38,18 @@ async def test_domain_exception_handler_returns_correct_status_code(
     assert json.loads(response.body) == {"detail": "User not found"}
 
 
+async def test_rate_limit_exceeded_returns_429_with_retry_after(
+    mock_request: Mock,
+) -> None:
+    exc = RateLimitExceededError("Too many login attempts", retry_after=12.2)
+
+    response = await domain_exception_handler(mock_request, exc)
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "13"
+    assert json.loads(response.body) == {"detail": "Too many login attempts"}
+
+
 @patch("src.adapters.inbound.api.exception_handlers.logger")
 async def test_domain_exception_handler_logs_with_context(
     mock_logger: Mock, mock_request: Mock
@@ -0,0 +1,68 @@
+import json
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+from src.adapters.inbound.api.routers.live import RETRY_MS, _event_stream
+from src.application.live_updates import LiveUpdateHub
+from src.domain.value_objects.live_update import (
+    PortfolioRevalued,
+    ReferenceRateChanged,
+)
+
+
+def _parse(frame: bytes) -> list[tuple[str, dict]]:
+    events = []
+    for block in frame.decode().strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def test_stream_sends_updates_as_events() -> None:
+    hub = LiveUpdateHub()
+    user_id = uuid4()
+    stream = _event_stream(hub, user_id, heartbeat=5)
+
+    assert await anext(stream) == b"retry: %d\n\n" % RETRY_MS
+    assert len(hub) == 1
+    hub.dispatch(
+        ReferenceRateChanged(value=Decimal("5.75"), effective_date=date(2026, 3, 1))
+    )
+    hub.dispatch(
+        PortfolioRevalued(
+            user_id=user_id,
+            as_of=date(2026, 3, 31),
+            equity=Decimal("1200.00"),
+            monthly_income=Decimal("4.31"),
+            equity_delta=Decimal("-100.00"),
+            monthly_income_delta=Decimal("0.07"),
+        )
+    )
+
+    assert _parse(await anext(stream)) == [
+        ("rate_changed", {"value": "5.75", "effective_date": "2026-03-01"}),
+        (
+            "portfolio_revalued",
+            {
+                "as_of": "2026-03-31",
+                "equity": "1200.00",
+                "monthly_income": "4.31",
+                "equity_delta": "-100.00",
+                "monthly_income_delta": "0.07",
+            },
+        ),
+    ]
+
+    await stream.aclose()
+    assert len(hub) == 0
+
+
+async def test_stream_sends_heartbeat_when_idle() -> None:
+    hub = LiveUpdateHub()
+    stream = _event_stream(hub, uuid4(), heartbeat=0.01)
+
+    await anext(stream)
+
+    assert await anext(stream) == b": heartbeat\n\n"
+    await stream.aclose()
@@ -0,0 +1,56 @@
+import random
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.inbound.api.msgpack_codec import packb, unpackb
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["0", "0.00", "12.34", "-0.01", "1E+3", "-128.5", "5.0001", "98765432109876.54"],
+)
+def test_decimal_round_trips_with_its_exponent(value: str) -> None:
+    decoded = unpackb(packb(Decimal(value)))
+
+    assert decoded == Decimal(value)
+    assert str(decoded) == value
+
+
+def test_random_decimals_round_trip() -> None:
+    rng = random.Random(7)
+    for _ in range(1000):
+        value = Decimal(rng.randint(-(10**12), 10**12)).scaleb(-rng.randint(0, 6))
+
+        assert str(unpackb(packb(value))) == str(value)
+
+
+def test_dates_uuids_and_datetimes_round_trip() -> None:
+    payload = {
+        "dates": [date(1969, 12, 31), date(1970, 1, 1), date(2025, 3, 15)],
+        "id": uuid4(),
+        "at": datetime(2025, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc),
+        "nested": {uuid4(): Decimal("1.50")},
+    }
+
+    assert unpackb(packb(payload)) == payload
+
+
+def test_naive_datetime_is_taken_as_utc() -> None:
+    decoded = unpackb(packb(datetime(2025, 1, 2, 3, 4, 5)))
+
+    assert decoded == datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def test_encodings_are_compact() -> None:
+    assert len(packb(Decimal("12.34"))) == 6
+    assert len(packb(date(2025, 3, 15))) == 6
+    assert len(packb(uuid4())) == 18
+    assert unpackb(packb(date.today() + timedelta(days=1))) > date.today()
+
+
+def test_unsupported_type_raises() -> None:
+    with pytest.raises(TypeError):
+        packb(object())
@@ -0,0 +1,58 @@
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.inbound.api.pagination import decode_cursor, encode_cursor
+from src.domain.exceptions import ValidationError
+from src.domain.value_objects.bondholder_query import (
+    BondHolderCursor,
+    BondHolderSortField,
+)
+
+
+@pytest.mark.parametrize(
+    "sort_by, value",
+    [
+        (BondHolderSortField.PURCHASE_DATE, date(2025, 3, 1)),
+        (BondHolderSortField.SERIES, "EDO0135"),
+        (BondHolderSortField.QUANTITY, 42),
+        (BondHolderSortField.VALUE, Decimal("4200.50")),
+    ],
+)
+def test_round_trip(sort_by: BondHolderSortField, value: object) -> None:
+    cursor = BondHolderCursor(sort_value=value, id=uuid4())
+
+    token = encode_cursor(cursor, sort_by, descending=True)
+
+    assert decode_cursor(token, sort_by, descending=True) == cursor
+
+
+def test_token_is_url_safe() -> None:
+    cursor = BondHolderCursor(sort_value="a/b+c?", id=uuid4())
+
+    token = encode_cursor(cursor, BondHolderSortField.SERIES, descending=False)
+
+    assert all(c.isalnum() or c in "-_" for c in token)
+
+
+def test_rejects_garbage() -> None:
+    with pytest.raises(ValidationError, match="Invalid cursor"):
+        decode_cursor("not-a-cursor", BondHolderSortField.SERIES, descending=True)
+
+
+def test_rejects_cursor_for_other_sort_field() -> None:
+    cursor = BondHolderCursor(sort_value=5, id=uuid4())
+    token = encode_cursor(cursor, BondHolderSortField.QUANTITY, descending=True)
+
+    with pytest.raises(ValidationError, match="Invalid cursor"):
+        decode_cursor(token, BondHolderSortField.PURCHASE_DATE, descending=True)
+
+
+def test_rejects_cursor_for_other_direction() -> None:
+    cursor = BondHolderCursor(sort_value=5, id=uuid4())
+    token = encode_cursor(cursor, BondHolderSortField.QUANTITY, descending=True)
+
+    with pytest.raises(ValidationError, match="requested ordering"):
+        decode_cursor(token, BondHolderSortField.QUANTITY, descending=False)
@@ -0,0 +1,81 @@
+import pytest
+
+from src.adapters.inbound.api.read_your_writes import (
+    LAST_WRITE_COOKIE,
+    ReadYourWritesMiddleware,
+    wrote_recently,
+)
+
+
+def _app(status: int):
+    async def app(scope, receive, send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    return app
+
+
+async def _cookies(
+    middleware: ReadYourWritesMiddleware, method: str = "POST"
+) -> list[bytes]:
+    sent: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "path": "/api/bonds", "headers": []}
+    await middleware(scope, receive, send)
+    return [value for name, value in sent[0]["headers"] if name == b"set-cookie"]
+
+
+async def test_write_sets_cookie() -> None:
+    middleware = ReadYourWritesMiddleware(
+        _app(201), sticky_seconds=9.5, clock=lambda: 1700000000.25
+    )
+
+    assert await _cookies(middleware) == [
+        f"{LAST_WRITE_COOKIE}=1700000000250; Max-Age=10; Path=/; "
+        "HttpOnly; SameSite=Lax".encode()
+    ]
+
+
+@pytest.mark.parametrize(
+    "method, status, sticky_seconds",
+    [
+        ("GET", 200, 10),
+        ("HEAD", 200, 10),
+        ("OPTIONS", 200, 10),
+        ("DELETE", 404, 10),
+        ("POST", 422, 10),
+        # No replicas configured.
+        ("POST", 201, 0),
+    ],
+)
+async def test_no_cookie(method: str, status: int, sticky_seconds: float) -> None:
+    middleware = ReadYourWritesMiddleware(_app(status), sticky_seconds=sticky_seconds)
+
+    assert await _cookies(middleware, method) == []
+
+
+@pytest.mark.parametrize(
+    "last_write, expected",
+    [
+        ("1000000", True),
+        ("991000", False),
+        ("990000", False),
+        (None, False),
+        ("", False),
+        ("soon", False),
+    ],
+)
+def test_wrote_recently(last_write: str | None, expected: bool) -> None:
+    assert wrote_recently(last_write, 10, clock=lambda: 1001) is expected
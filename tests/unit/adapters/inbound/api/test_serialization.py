@@ -0,0 +1,191 @@
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from fastapi import Response
+from pydantic import BaseModel
+
+from src.adapters.inbound.api.msgpack_codec import unpackb
+from src.adapters.inbound.api.schemas.bondholder import (
+    BondHolderChangesResponse,
+    BondHolderResponse,
+)
+from src.adapters.inbound.api.schemas.calculations import (
+    MonthIncomeResponse,
+    StressTestResponse,
+    YieldResponse,
+)
+from src.adapters.inbound.api.schemas.data import EquityResponse
+from src.adapters.inbound.api.serialization import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    DTOSerializer,
+    negotiate_media_type,
+)
+from src.application.dto.bondholder import BondHolderChangesDTO, BondHolderDTO
+from src.application.dto.calculations import MonthlyIncomeResponseDTO, YieldResponseDTO
+from src.application.dto.data import EquityDTO
+from src.domain.value_objects.yield_report import HoldingYield
+
+
+def _bondholder(last_update: datetime | None = None) -> BondHolderDTO:
+    return BondHolderDTO(
+        id=uuid4(),
+        user_id=uuid4(),
+        quantity=12,
+        purchase_date=date(2024, 3, 15),
+        bond_id=uuid4(),
+        series="ROR0325",
+        nominal_value=Decimal("100.00"),
+        maturity_period=12,
+        initial_interest_rate=Decimal("6.15"),
+        first_interest_period=1,
+        reference_rate_margin=Decimal("0.10"),
+        last_update=last_update,
+    )
+
+
+def _validated(schema: type[BaseModel], value: object) -> bytes:
+    """What FastAPI sends when it validates the DTO against the schema."""
+    return schema.model_validate(value, from_attributes=True).model_dump_json().encode()
+
+
+def test_bondholder_matches_validated_schema() -> None:
+    for dto in (_bondholder(), _bondholder(datetime(2025, 1, 2, tzinfo=timezone.utc))):
+        serialized = DTOSerializer(BondHolderDTO, BondHolderResponse).to_json(dto)
+
+        assert serialized == _validated(BondHolderResponse, dto)
+
+
+def test_bondholder_omits_fields_missing_from_schema() -> None:
+    serialized = json.loads(
+        DTOSerializer(BondHolderDTO, BondHolderResponse).to_json(_bondholder())
+    )
+
+    assert "user_id" not in serialized
+    assert serialized["nominal_value"] == 100.0
+    assert list(serialized) == list(BondHolderResponse.model_fields)
+
+
+def test_list_of_bondholders() -> None:
+    dtos = [_bondholder() for _ in range(3)]
+
+    serialized = DTOSerializer(BondHolderDTO, BondHolderResponse, many=True).to_json(
+        dtos
+    )
+
+    assert json.loads(serialized) == [
+        json.loads(_validated(BondHolderResponse, dto)) for dto in dtos
+    ]
+
+
+def test_nested_dtos() -> None:
+    changes = BondHolderChangesDTO(
+        watermark=datetime(2025, 1, 2, tzinfo=timezone.utc),
+        inserted=[_bondholder()],
+        updated=[_bondholder(datetime(2025, 1, 1, tzinfo=timezone.utc))],
+        deleted=[uuid4()],
+    )
+
+    serialized = DTOSerializer(BondHolderChangesDTO, BondHolderChangesResponse).to_json(
+        changes
+    )
+
+    assert serialized == _validated(BondHolderChangesResponse, changes)
+
+
+def test_calculation_dtos() -> None:
+    income = MonthlyIncomeResponseDTO(
+        data={uuid4(): Decimal("12.34"), uuid4(): Decimal("0.00")}
+    )
+    report = YieldResponseDTO(
+        holdings=[
+            HoldingYield(bondholder_id=uuid4(), series="ROR0325", irr=Decimal("5.12")),
+            HoldingYield(bondholder_id=uuid4(), series="EDO0335", irr=None),
+        ],
+        portfolio_irr=Decimal("5.0001"),
+    )
+
+    assert DTOSerializer(MonthlyIncomeResponseDTO, MonthIncomeResponse).to_json(
+        income
+    ) == _validated(MonthIncomeResponse, income)
+    assert DTOSerializer(YieldResponseDTO, YieldResponse).to_json(report) == _validated(
+        YieldResponse, report
+    )
+
+
+def test_response_carries_injected_headers() -> None:
+    injected = Response()
+    del injected.headers["content-length"]
+    injected.headers["ETag"] = '"abc"'
+    serializer = DTOSerializer(BondHolderDTO, BondHolderResponse)
+
+    response = serializer.response(_bondholder(), injected, status_code=201)
+
+    assert response.status_code == 201
+    assert response.headers["ETag"] == '"abc"'
+    assert response.headers["content-type"] == "application/json"
+    assert int(response.headers["content-length"]) == len(response.body)
+
+
+def test_renamed_attribute() -> None:
+    equity = EquityDTO(data=[(date(2025, 1, 1), Decimal("100.00"))])
+    serializer = DTOSerializer(EquityDTO, EquityResponse, attributes={"equity": "data"})
+
+    assert serializer.to_json(equity) == _validated(
+        EquityResponse, {"equity": equity.data}
+    )
+
+
+def test_msgpack_carries_native_values() -> None:
+    dto = _bondholder(datetime(2025, 1, 2, tzinfo=timezone.utc))
+    serializer = DTOSerializer(BondHolderDTO, BondHolderResponse)
+
+    decoded = unpackb(serializer.to_msgpack(dto))
+
+    assert list(decoded) == list(BondHolderResponse.model_fields)
+    assert decoded["id"] == dto.id
+    assert decoded["purchase_date"] == dto.purchase_date
+    assert decoded["last_update"] == dto.last_update
+    assert decoded["nominal_value"] == 100.0
+
+
+def test_msgpack_response() -> None:
+    serializer = DTOSerializer(MonthlyIncomeResponseDTO, MonthIncomeResponse)
+    income = MonthlyIncomeResponseDTO(data={uuid4(): Decimal("12.34")})
+
+    response = serializer.response(income, media_type=MSGPACK_MEDIA_TYPE)
+
+    assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    assert unpackb(response.body) == {"data": income.data}
+
+
+def test_response_model_instances() -> None:
+    model = StressTestResponse(base_rate=Decimal("5.75"), paths=0, bands=[])
+
+    serialized = DTOSerializer(StressTestResponse, StressTestResponse).to_json(model)
+
+    assert serialized == model.model_dump_json().encode()
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, JSON_MEDIA_TYPE),
+        ("", JSON_MEDIA_TYPE),
+        ("*/*", JSON_MEDIA_TYPE),
+        ("application/json", JSON_MEDIA_TYPE),
+        ("application/msgpack", MSGPACK_MEDIA_TYPE),
+        ("application/x-msgpack", MSGPACK_MEDIA_TYPE),
+        ("application/msgpack, */*;q=0.8", MSGPACK_MEDIA_TYPE),
+        ("application/json, application/msgpack;q=0.5", JSON_MEDIA_TYPE),
+        ("application/json;q=0.5, application/msgpack", MSGPACK_MEDIA_TYPE),
+        ("application/msgpack;q=0", JSON_MEDIA_TYPE),
+        ("application/msgpack;q=oops", JSON_MEDIA_TYPE),
+        ("text/html", JSON_MEDIA_TYPE),
+    ],
+)
+def test_negotiate_media_type(accept: str | None, expected: str) -> None:
+    assert negotiate_media_type(accept) == expected
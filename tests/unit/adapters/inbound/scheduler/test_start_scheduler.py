@@ -1,5 +1,6 @@
 import signal
-from unittest.mock import MagicMock, Mock, patch
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -41,7 +42,7 @@ async def test_scheduler_starts_successfully(
 
         await start_scheduler.main()
 
-        mock_scheduler.schedule_every_n_days.assert_called_once()
+        assert mock_scheduler.schedule_every_n_days.call_count == 2
         mock_scheduler.add_job.assert_called_once()
         mock_scheduler.start.assert_called_once()
         mock_scheduler.shutdown.assert_called_once()
@@ -95,10 +96,12 @@ async def test_scheduler_schedules_correct_jobs(
 
         await start_scheduler.main()
 
-        mock_scheduler.schedule_every_n_days.assert_called_once()
-        call_kwargs = mock_scheduler.schedule_every_n_days.call_args[1]
-        assert call_kwargs["days"] == 3
-        assert call_kwargs["task_id"] == "nbp_reference_rate_updater"
+        assert mock_scheduler.schedule_every_n_days.call_count == 2
+        rates_call, purge_call = mock_scheduler.schedule_every_n_days.call_args_list
+        assert rates_call.kwargs["days"] == 3
+        assert rates_call.kwargs["task_id"] == "nbp_reference_rate_updater"
+        assert purge_call.kwargs["days"] == 1
+        assert purge_call.kwargs["task_id"] == "bondholder_tombstone_purge"
 
         mock_scheduler.add_job.assert_called_once()
         call_kwargs = mock_scheduler.add_job.call_args[1]
@@ -106,6 +109,121 @@ async def test_scheduler_schedules_correct_jobs(
         assert call_kwargs["hours"] == 1
 
 
+async def test_scheduler_refreshes_snapshots_for_snapshot_backend(
+    mock_scheduler: Mock,
+    mock_container: Mock,
+) -> None:
+    """Test the snapshot refresh is scheduled only for the snapshot backend."""
+    mock_container.get_config.return_value.EQUITY_HISTORY_BACKEND = "snapshot"
+    with (
+        patch(
+            "src.adapters.inbound.scheduler.start_scheduler.APScheduler",
+            return_value=mock_scheduler,
+        ),
+        patch(
+            "src.adapters.inbound.scheduler.start_scheduler.SchedulerContainer",
+            return_value=mock_container,
+        ),
+        patch("src.adapters.inbound.scheduler.start_scheduler.signal.signal"),
+        patch("asyncio.sleep", side_effect=KeyboardInterrupt),
+    ):
+
+        await start_scheduler.main()
+
+        assert mock_scheduler.schedule_every_n_days.call_count == 3
+        snapshot_call = mock_scheduler.schedule_every_n_days.call_args_list[-1]
+        assert snapshot_call.kwargs["days"] == 1
+        assert snapshot_call.kwargs["task_id"] == "portfolio_snapshot_refresh"
+
+
+@pytest.mark.parametrize(
+    "backend, revalued", [("snapshot", True), ("python", False), ("sql", False)]
+)
+async def test_rate_change_revalues_snapshots_for_snapshot_backend(
+    mock_scheduler: Mock,
+    mock_container: Mock,
+    backend: str,
+    revalued: bool,
+) -> None:
+    """Test a new reference rate revalues snapshots only where they are kept."""
+    mock_container.get_config.return_value.EQUITY_HISTORY_BACKEND = backend
+    update = mock_container.get_update_reference_rate_use_case.return_value
+    update.execute = AsyncMock(
+        return_value=Mock(rate_changed=True, effective_date=date(2025, 1, 1))
+    )
+    with (
+        patch(
+            "src.adapters.inbound.scheduler.start_scheduler.APScheduler",
+            return_value=mock_scheduler,
+        ),
+        patch(
+            "src.adapters.inbound.scheduler.start_scheduler.SchedulerContainer",
+            return_value=mock_container,
+        ),
+        patch("src.adapters.inbound.scheduler.start_scheduler.signal.signal"),
+        patch("asyncio.sleep", side_effect=KeyboardInterrupt),
+    ):
+        await start_scheduler.main()
+        rates_call = mock_scheduler.schedule_every_n_days.call_args_list[0]
+
+        await rates_call.kwargs["use_case_factory"]()
+
+    assert mock_container.get_revalue_portfolio_snapshots_use_case.called is revalued
+
+
+async def test_scheduler_purges_idempotency_records_in_postgres(
+    mock_scheduler: Mock,
+    mock_container: Mock,
+) -> None:
+    """Test the idempotency purge is scheduled only for the shared store."""
+    mock_container.get_config.return_value.IDEMPOTENCY_BACKEND = "postgres"
+    with (
+        patch(
+            "src.adapters.inbound.scheduler.start_scheduler.APScheduler",
+            return_value=mock_scheduler,
+        ),
+        patch(
+            "src.adapters.inbound.scheduler.start_scheduler.SchedulerContainer",
+            return_value=mock_container,
+        ),
+        patch("src.adapters.inbound.scheduler.start_scheduler.signal.signal"),
+        patch("asyncio.sleep", side_effect=KeyboardInterrupt),
+    ):
+
+        await start_scheduler.main()
+
+        purge_call = mock_scheduler.schedule_every_n_days.call_args_list[-1]
+        assert purge_call.kwargs["days"] == 1
+        assert purge_call.kwargs["task_id"] == "idempotency_record_purge"
+
+
+async def test_scheduler_purges_rate_limit_buckets_in_postgres(
+    mock_scheduler: Mock,
+    mock_container: Mock,
+) -> None:
+    """Test the rate limit purge is scheduled only for the shared buckets."""
+    mock_container.get_config.return_value.LOGIN_RATE_LIMIT_BACKEND = "postgres"
+    with (
+        patch(
+            "src.adapters.inbound.scheduler.start_scheduler.APScheduler",
+            return_value=mock_scheduler,
+        ),
+        patch(
+            "src.adapters.inbound.scheduler.start_scheduler.SchedulerContainer",
+            return_value=mock_container,
+        ),
+        patch("src.adapters.inbound.scheduler.start_scheduler.signal.signal"),
+        patch("asyncio.sleep", side_effect=KeyboardInterrupt),
+    ):
+
+        await start_scheduler.main()
+
+        assert mock_scheduler.schedule_every_n_days.call_count == 3
+        purge_call = mock_scheduler.schedule_every_n_days.call_args_list[-1]
+        assert purge_call.kwargs["days"] == 1
+        assert purge_call.kwargs["task_id"] == "rate_limit_bucket_purge"
+
+
 async def test_scheduler_cleans_up_on_keyboard_interrupt(
     mock_scheduler: Mock,
     mock_container: Mock,
@@ -0,0 +1,72 @@
+import pytest
+from pydantic import ValidationError
+
+from src.adapters.config import Config
+from src.adapters.outbound.database.engine import engine_options
+
+
+def _config(**settings) -> Config:
+    return Config(
+        _env_file=None,
+        APP_DATABASE_URL="postgresql+asyncpg://app:pw@db:5432/app",
+        MIGRATION_DATABASE_URL="postgresql+asyncpg://migrator:pw@db:5432/app",
+        **settings,
+    )
+
+
+def test_defaults() -> None:
+    options = engine_options(_config())
+
+    assert options["pool_size"] == 5
+    assert options["max_overflow"] == 10
+    assert options["pool_timeout"] == 30
+    assert options["pool_recycle"] == 1800
+    assert options["pool_pre_ping"] is False
+    assert options["connect_args"] == {
+        "timeout": 10,
+        "statement_cache_size": 100,
+        "prepared_statement_cache_size": 100,
+    }
+
+
+def test_tuned() -> None:
+    options = engine_options(
+        _config(
+            DB_POOL_SIZE=20,
+            DB_MAX_OVERFLOW=0,
+            DB_POOL_PRE_PING=True,
+            DB_STATEMENT_TIMEOUT_MS=5000,
+            DB_STATEMENT_CACHE_SIZE=500,
+        )
+    )
+
+    assert options["pool_size"] == 20
+    assert options["max_overflow"] == 0
+    assert options["pool_pre_ping"] is True
+    connect_args = options["connect_args"]
+    assert connect_args["statement_cache_size"] == 500
+    assert connect_args["server_settings"] == {"statement_timeout": "5000"}
+
+
+def test_pgbouncer_disables_statement_caches() -> None:
+    connect_args = engine_options(_config(DB_PGBOUNCER=True))["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    name = connect_args["prepared_statement_name_func"]
+    assert name() != name()
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"DB_PGBOUNCER": True, "DB_STATEMENT_CACHE_SIZE": 100},
+        {"DB_POOL_SIZE": 2, "DB_MAX_OVERFLOW": 1, "DB_POOL_WARMUP": 4},
+        {"DB_POOL_SIZE": 0},
+        {"DB_STATEMENT_TIMEOUT_MS": 0},
+        {"DB_REPLICA_MAX_LAG_SECONDS": 30, "DB_REPLICA_STICKY_SECONDS": 10},
+    ],
+)
+def test_invalid_settings(settings: dict) -> None:
+    with pytest.raises(ValidationError):
+        _config(**settings)
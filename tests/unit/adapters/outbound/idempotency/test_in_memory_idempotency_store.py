@@ -0,0 +1,120 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.outbound.idempotency.in_memory_idempotency_store import (
+    InMemoryIdempotencyStore,
+)
+from src.domain.value_objects.idempotency import IdempotencyKey, IdempotencyRecord
+
+LEASE = timedelta(seconds=30)
+TTL = timedelta(hours=1)
+
+
+@pytest.fixture
+def store() -> InMemoryIdempotencyStore:
+    return InMemoryIdempotencyStore()
+
+
+@pytest.fixture
+def key() -> IdempotencyKey:
+    return IdempotencyKey("bondholder_create", uuid4(), "abc")
+
+
+async def test_first_claim_owns_key(
+    store: InMemoryIdempotencyStore, key: IdempotencyKey
+) -> None:
+    assert await store.claim(key, "fp", LEASE) is None
+    assert await store.claim(key, "fp", LEASE) == IdempotencyRecord(
+        fingerprint="fp", completed=False
+    )
+
+
+async def test_completed_claim_returns_result(
+    store: InMemoryIdempotencyStore, key: IdempotencyKey
+) -> None:
+    await store.claim(key, "fp", LEASE)
+    await store.complete(key, {"id": 1}, TTL)
+
+    assert await store.claim(key, "other", LEASE) == IdempotencyRecord(
+        fingerprint="fp", completed=True, result={"id": 1}
+    )
+
+
+async def test_released_key_can_be_claimed_again(
+    store: InMemoryIdempotencyStore, key: IdempotencyKey
+) -> None:
+    await store.claim(key, "fp", LEASE)
+    await store.release(key)
+
+    assert await store.claim(key, "fp", LEASE) is None
+
+
+async def test_expired_claim_can_be_claimed_again(
+    store: InMemoryIdempotencyStore, key: IdempotencyKey
+) -> None:
+    await store.claim(key, "fp", timedelta(0))
+
+    assert await store.claim(key, "fp", LEASE) is None
+
+
+async def test_keys_are_per_user(store: InMemoryIdempotencyStore) -> None:
+    await store.claim(IdempotencyKey("op", uuid4(), "abc"), "fp", LEASE)
+
+    assert await store.claim(IdempotencyKey("op", uuid4(), "abc"), "fp", LEASE) is None
+
+
+async def test_wait_wakes_on_complete(
+    store: InMemoryIdempotencyStore, key: IdempotencyKey
+) -> None:
+    await store.claim(key, "fp", LEASE)
+    waiter = asyncio.create_task(store.wait(key, timeout=5))
+    await asyncio.sleep(0)
+
+    await store.complete(key, "result", TTL)
+
+    record = await waiter
+    assert record.completed
+    assert record.result == "result"
+
+
+async def test_wait_returns_none_on_release(
+    store: InMemoryIdempotencyStore, key: IdempotencyKey
+) -> None:
+    await store.claim(key, "fp", LEASE)
+    waiter = asyncio.create_task(store.wait(key, timeout=5))
+    await asyncio.sleep(0)
+
+    await store.release(key)
+
+    assert await waiter is None
+
+
+async def test_wait_times_out_while_in_progress(
+    store: InMemoryIdempotencyStore, key: IdempotencyKey
+) -> None:
+    await store.claim(key, "fp", LEASE)
+
+    record = await store.wait(key, timeout=0.01)
+
+    assert not record.completed
+
+
+async def test_purge_expired(store: InMemoryIdempotencyStore) -> None:
+    kept, expired = (IdempotencyKey("op", uuid4(), "abc") for _ in range(2))
+    await store.claim(kept, "fp", LEASE)
+    await store.claim(expired, "fp", LEASE)
+    await store.complete(expired, "result", timedelta(0))
+
+    assert await store.purge_expired(datetime.now(UTC)) == 1
+    assert len(store) == 1
+
+
+async def test_claims_sweep_expired_entries(store: InMemoryIdempotencyStore) -> None:
+    store.SWEEP_EVERY = 3
+    for _ in range(3):
+        await store.claim(IdempotencyKey("op", uuid4(), "abc"), "fp", timedelta(0))
+
+    assert len(store) == 1
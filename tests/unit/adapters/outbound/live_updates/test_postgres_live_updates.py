@@ -0,0 +1,54 @@
+import json
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.outbound.live_updates.postgres_live_updates import (
+    PostgresLiveUpdateListener,
+    decode_update,
+    encode_update,
+)
+from src.application.metrics import Metrics
+from src.domain.value_objects.live_update import (
+    PortfolioRevalued,
+    ReferenceRateChanged,
+)
+
+
+@pytest.mark.parametrize(
+    "update",
+    [
+        ReferenceRateChanged(value=Decimal("5.75"), effective_date=date(2026, 3, 1)),
+        PortfolioRevalued(
+            user_id=uuid4(),
+            as_of=date(2026, 3, 31),
+            equity=Decimal("1200.00"),
+            monthly_income=Decimal("4.31"),
+            equity_delta=Decimal("-100.00"),
+            monthly_income_delta=Decimal("0.07"),
+        ),
+    ],
+)
+def test_round_trip(update) -> None:
+    assert decode_update(encode_update(update)) == update
+
+
+@pytest.mark.parametrize(
+    "payload", ["not json", json.dumps({"type": "unknown"}), json.dumps({})]
+)
+def test_malformed_notification_dropped(payload: str) -> None:
+    received = []
+    metrics = Metrics()
+    listener = PostgresLiveUpdateListener(
+        dsn="postgresql://localhost/test",
+        channel="live_updates",
+        on_update=received.append,
+        metrics=metrics,
+    )
+
+    listener._notified(None, 1, "live_updates", payload)
+
+    assert received == []
+    assert metrics.snapshot()["counters"]["live_updates.listener.malformed"] == 1
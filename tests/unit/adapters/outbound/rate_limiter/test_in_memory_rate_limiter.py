@@ -0,0 +1,91 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.adapters.outbound.rate_limiter.in_memory_rate_limiter import (
+    InMemoryRateLimiter,
+)
+from src.domain.value_objects.rate_limit import RateLimit
+
+LIMIT = RateLimit(burst=3, per_minute=6)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture
+def limiter(clock: _Clock) -> InMemoryRateLimiter:
+    return InMemoryRateLimiter(clock=clock)
+
+
+async def test_burst_allowed_then_rejected(limiter: InMemoryRateLimiter) -> None:
+    assert [await limiter.acquire("k", LIMIT) for _ in range(3)] == [0, 0, 0]
+
+    # One token every 10 seconds.
+    assert await limiter.acquire("k", LIMIT) == pytest.approx(10)
+
+
+async def test_refills_over_time(limiter: InMemoryRateLimiter, clock: _Clock) -> None:
+    for _ in range(3):
+        await limiter.acquire("k", LIMIT)
+
+    clock.now += 4
+    assert await limiter.acquire("k", LIMIT) == pytest.approx(6)
+    clock.now += 6
+    assert await limiter.acquire("k", LIMIT) == 0
+    assert await limiter.acquire("k", LIMIT) == pytest.approx(10)
+
+
+async def test_refill_capped_at_burst(
+    limiter: InMemoryRateLimiter, clock: _Clock
+) -> None:
+    await limiter.acquire("k", LIMIT)
+    clock.now += 3600
+
+    assert [await limiter.acquire("k", LIMIT) for _ in range(4)] == [
+        0,
+        0,
+        0,
+        pytest.approx(10),
+    ]
+
+
+async def test_keys_limited_apart(limiter: InMemoryRateLimiter) -> None:
+    for _ in range(3):
+        await limiter.acquire("a", LIMIT)
+
+    assert await limiter.acquire("a", LIMIT) > 0
+    assert await limiter.acquire("b", LIMIT) == 0
+
+
+async def test_sweep_drops_full_buckets(
+    limiter: InMemoryRateLimiter, clock: _Clock
+) -> None:
+    limiter.SWEEP_EVERY = 3
+    await limiter.acquire("idle", LIMIT)
+    clock.now += 3600
+    await limiter.acquire("busy", LIMIT)
+    await limiter.acquire("busy", LIMIT)
+
+    assert set(limiter._buckets) == {"busy"}
+
+
+async def test_purge_idle(limiter: InMemoryRateLimiter, clock: _Clock) -> None:
+    await limiter.acquire("old", LIMIT)
+    clock.now += 120
+    await limiter.acquire("new", LIMIT)
+
+    purged = await limiter.purge_idle(datetime.now(UTC) - timedelta(seconds=60))
+
+    assert purged == 1
+    assert set(limiter._buckets) == {"new"}
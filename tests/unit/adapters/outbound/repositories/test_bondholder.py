@@ -1,15 +1,25 @@
-from datetime import datetime
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, Mock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from src.adapters.outbound.database.models import BondHolder as BondHolderModel
+from src.adapters.outbound.database.models import (
+    BondHolderTombstone as BondHolderTombstoneModel,
+)
 from src.adapters.outbound.exceptions import SQLAlchemyRepositoryError
 from src.adapters.outbound.repositories.bondholder import SQLAlchemyBondHolderRepository
 from src.domain.entities.bondholder import BondHolder as BondHolderEntity
 from src.domain.exceptions import NotFoundError
+from src.domain.value_objects.bondholder_query import (
+    BondHolderCursor,
+    BondHolderPageQuery,
+    BondHolderSortField,
+)
 
 
 @pytest.fixture
@@ -118,6 +128,8 @@ async def test_write_success(
     result = await repository.write(bondholder_entity_mock)
 
     mock_session.add.assert_called_once()
+    version_sql = _compile(mock_session.execute.call_args[0][0])
+    assert f"'portfolio:{bondholder_entity_mock.user_id}'" in version_sql
     mock_session.commit.assert_called_once()
     mock_session.refresh.assert_called_once()
     assert result.id == bondholder_entity_mock.id
@@ -298,6 +310,10 @@ async def test_delete_existing_bondholder(
 
     mock_session.get.assert_called_once_with(BondHolderModel, bondholder_id)
     mock_session.delete.assert_called_once_with(bondholder_model)
+    tombstone = mock_session.add.call_args[0][0]
+    assert isinstance(tombstone, BondHolderTombstoneModel)
+    assert tombstone.id == bondholder_model.id
+    assert tombstone.user_id == bondholder_model.user_id
     mock_session.commit.assert_called_once()
     mock_session.rollback.assert_not_called()
 
@@ -414,3 +430,295 @@ async def test_count_by_bond_id_verifies_query_structure(
 
     call_args = mock_session.execute.call_args[0][0]
     assert "count" in str(call_args).lower()
+
+
+def _compile(stmt) -> str:
+    return str(
+        stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+async def test_get_page_returns_entities(
+    repository: SQLAlchemyBondHolderRepository,
+    mock_session: AsyncMock,
+    bondholder_model: BondHolderModel,
+) -> None:
+    mock_scalars = MagicMock()
+    mock_scalars.all.return_value = [bondholder_model]
+    mock_result = MagicMock()
+    mock_result.scalars.return_value = mock_scalars
+    mock_session.execute.return_value = mock_result
+
+    result = await repository.get_page(uuid4(), BondHolderPageQuery(limit=10))
+
+    mock_session.execute.assert_called_once()
+    assert [bh.id for bh in result] == [bondholder_model.id]
+
+
+def test_page_statement_default_order(
+    repository: SQLAlchemyBondHolderRepository,
+) -> None:
+    sql = _compile(repository._page_statement(uuid4(), BondHolderPageQuery(limit=10)))
+
+    assert "ORDER BY bondholder.purchase_date DESC, bondholder.id DESC" in sql
+    assert "LIMIT 10" in sql
+
+
+def test_page_statement_without_limit(
+    repository: SQLAlchemyBondHolderRepository,
+) -> None:
+    sql = _compile(repository._page_statement(uuid4(), BondHolderPageQuery(limit=None)))
+
+    assert "LIMIT" not in sql
+
+
+def test_page_statement_keyset_ascending(
+    repository: SQLAlchemyBondHolderRepository,
+) -> None:
+    query = BondHolderPageQuery(
+        limit=5,
+        sort_by=BondHolderSortField.QUANTITY,
+        descending=False,
+        after=BondHolderCursor(sort_value=7, id=uuid4()),
+    )
+
+    sql = _compile(repository._page_statement(uuid4(), query))
+
+    assert "(bondholder.quantity, bondholder.id) > (7, " in sql
+    assert "ORDER BY bondholder.quantity ASC, bondholder.id ASC" in sql
+
+
+def test_page_statement_keyset_descending_by_value(
+    repository: SQLAlchemyBondHolderRepository,
+) -> None:
+    query = BondHolderPageQuery(
+        limit=5,
+        sort_by=BondHolderSortField.VALUE,
+        after=BondHolderCursor(sort_value=Decimal("100"), id=uuid4()),
+    )
+
+    sql = _compile(repository._page_statement(uuid4(), query))
+
+    assert "(bondholder.quantity * bond.nominal_value, bondholder.id) < (100, " in sql
+
+
+def test_page_statement_filters(
+    repository: SQLAlchemyBondHolderRepository,
+) -> None:
+    query = BondHolderPageQuery(
+        limit=5,
+        series_prefix="RO%",
+        purchased_from=date(2025, 1, 1),
+        purchased_to=date(2025, 12, 31),
+    )
+
+    sql = _compile(repository._page_statement(uuid4(), query))
+
+    assert "bond.series LIKE 'RO/%%%%' ESCAPE '/'" in sql
+    assert "bondholder.purchase_date >= '2025-01-01'" in sql
+    assert "bondholder.purchase_date <= '2025-12-31'" in sql
+
+
+def _scalars_result(rows: list) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+
+async def test_get_changes_classifies_rows(
+    repository: SQLAlchemyBondHolderRepository,
+    mock_session: AsyncMock,
+) -> None:
+    since = datetime(2026, 1, 1, tzinfo=UTC)
+    now = datetime(2026, 1, 2, tzinfo=UTC)
+    user_id = uuid4()
+
+    def _model(created_at: datetime) -> BondHolderModel:
+        model = BondHolderModel(
+            id=uuid4(),
+            bond_id=uuid4(),
+            user_id=user_id,
+            quantity=1,
+            purchase_date=date(2025, 12, 1),
+            last_update=now,
+        )
+        model.created_at = created_at
+        return model
+
+    inserted = _model(since + timedelta(hours=1))
+    updated = _model(since - timedelta(days=3))
+    deleted_id = uuid4()
+    now_result = MagicMock()
+    now_result.scalar_one.return_value = now
+    mock_session.execute.side_effect = [
+        now_result,
+        _scalars_result([inserted, updated]),
+        _scalars_result([deleted_id]),
+    ]
+
+    result = await repository.get_changes(user_id, since)
+
+    assert [bh.id for bh in result.inserted] == [inserted.id]
+    assert [bh.id for bh in result.updated] == [updated.id]
+    assert result.deleted == [deleted_id]
+    assert result.watermark == now - repository.WATERMARK_OVERLAP
+
+
+async def test_get_changes_watermark_never_moves_back(
+    repository: SQLAlchemyBondHolderRepository,
+    mock_session: AsyncMock,
+) -> None:
+    now = datetime(2026, 1, 2, tzinfo=UTC)
+    since = now - timedelta(seconds=1)
+    now_result = MagicMock()
+    now_result.scalar_one.return_value = now
+    mock_session.execute.side_effect = [
+        now_result,
+        _scalars_result([]),
+        _scalars_result([]),
+    ]
+
+    result = await repository.get_changes(uuid4(), since)
+
+    assert result.watermark == since
+
+
+async def test_purge_tombstones_returns_rowcount(
+    repository: SQLAlchemyBondHolderRepository,
+    mock_session: AsyncMock,
+) -> None:
+    mock_result = MagicMock()
+    mock_result.rowcount = 3
+    mock_session.execute.return_value = mock_result
+
+    result = await repository.purge_tombstones(datetime(2026, 1, 1, tzinfo=UTC))
+
+    assert result == 3
+    sql = _compile(mock_session.execute.call_args[0][0])
+    assert "DELETE FROM bondholdertombstone" in sql
+    assert "bondholdertombstone.deleted_at <" in sql
+    mock_session.commit.assert_called_once()
+
+
+async def test_purge_tombstones_sqlalchemy_error(
+    repository: SQLAlchemyBondHolderRepository,
+    mock_session: AsyncMock,
+) -> None:
+    mock_session.execute.side_effect = SQLAlchemyError("Database error")
+
+    with pytest.raises(SQLAlchemyRepositoryError, match="Failed to purge"):
+        await repository.purge_tombstones(datetime(2026, 1, 1, tzinfo=UTC))
+
+    mock_session.rollback.assert_called_once()
+
+
+def _entity(user_id, quantity: int = 1) -> BondHolderEntity:
+    return BondHolderEntity(
+        id=uuid4(),
+        bond_id=uuid4(),
+        user_id=user_id,
+        quantity=quantity,
+        purchase_date=date(2025, 1, 1),
+    )
+
+
+async def test_get_many_owned_uses_one_array_parameter(
+    repository: SQLAlchemyBondHolderRepository,
+    mock_session: AsyncMock,
+    bondholder_model: BondHolderModel,
+) -> None:
+    mock_scalars = MagicMock()
+    mock_scalars.all.return_value = [bondholder_model]
+    mock_session.execute.return_value = MagicMock(scalars=lambda: mock_scalars)
+    ids = [uuid4(), uuid4()]
+
+    result = await repository.get_many_owned(uuid4(), ids, for_update=True)
+
+    stmt = mock_session.execute.call_args[0][0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "bondholder.id = ANY (%(param_1)s::UUID[])" in sql
+    assert "bondholder.user_id = %(user_id_1)s" in sql
+    assert sql.endswith("FOR UPDATE")
+    assert stmt.compile().params["param_1"] == ids
+    assert [bh.id for bh in result] == [bondholder_model.id]
+
+
+def test_batch_update_statement_writes_from_values(
+    repository: SQLAlchemyBondHolderRepository,
+) -> None:
+    user_id = uuid4()
+    updated = [_entity(user_id, 3), _entity(user_id, 4)]
+
+    sql = _compile(repository._batch_update_statement(user_id, updated))
+
+    assert sql.startswith(
+        "UPDATE bondholder SET quantity=changes.quantity, last_update=now() "
+        f"FROM (VALUES ('{updated[0].id}', 3), ('{updated[1].id}', 4)) "
+        "AS changes (id, quantity)"
+    )
+    assert "bondholder.id = changes.id" in sql
+    assert f"bondholder.user_id = '{user_id}'" in sql
+    assert "RETURNING" in sql
+
+
+async def test_apply_batch_commits_once(
+    repository: SQLAlchemyBondHolderRepository, mock_session: AsyncMock
+) -> None:
+    user_id = uuid4()
+    updated, deleted = _entity(user_id, 5), _entity(user_id)
+    updated_model = repository._to_model(updated)
+    results = iter(
+        [
+            MagicMock(scalars=lambda: MagicMock(all=lambda: [updated_model])),
+            MagicMock(scalars=lambda: MagicMock(all=lambda: [deleted.id])),
+        ]
+    )
+    mock_session.execute.side_effect = lambda *args: next(results, MagicMock())
+
+    result = await repository.apply_batch(user_id, [updated], [deleted])
+
+    statements = [
+        _compile(call.args[0]) for call in mock_session.execute.call_args_list
+    ]
+    assert [sql.split()[0] for sql in statements] == [
+        "UPDATE",  # quantities
+        "DELETE",  # bondholders
+        "INSERT",  # tombstones
+        "DELETE",  # orphaned bonds
+        "INSERT",  # version bump
+    ]
+    tombstones = mock_session.execute.call_args_list[2].args[1]
+    assert tombstones == [{"id": deleted.id, "user_id": user_id}]
+    assert "NOT (EXISTS" in statements[3]
+    mock_session.commit.assert_awaited_once()
+    assert [bh.quantity for bh in result] == [5]
+
+
+async def test_apply_batch_rolls_back_when_rows_vanished(
+    repository: SQLAlchemyBondHolderRepository, mock_session: AsyncMock
+) -> None:
+    user_id = uuid4()
+    mock_session.execute.return_value = MagicMock(
+        scalars=lambda: MagicMock(all=lambda: [])
+    )
+
+    with pytest.raises(NotFoundError):
+        await repository.apply_batch(user_id, [_entity(user_id)], [])
+
+    mock_session.rollback.assert_awaited_once()
+    mock_session.commit.assert_not_awaited()
+
+
+async def test_apply_batch_sqlalchemy_error(
+    repository: SQLAlchemyBondHolderRepository, mock_session: AsyncMock
+) -> None:
+    user_id = uuid4()
+    mock_session.execute.side_effect = SQLAlchemyError("Database error")
+
+    with pytest.raises(
+        SQLAlchemyRepositoryError, match="Failed to apply BondHolder batch"
+    ):
+        await repository.apply_batch(user_id, [], [_entity(user_id)])
+    mock_session.rollback.assert_awaited_once()
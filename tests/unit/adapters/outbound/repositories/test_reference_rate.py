@@ -143,6 +143,26 @@ async def test_save_sqlalchemy_error_raises_repository_error(
     mock_session.rollback.assert_called_once()
 
 
+async def test_get_between_returns_entities(
+    mock_session: AsyncMock,
+    repository: SQLAlchemyReferenceRateRepository,
+    mock_reference_rate_model: ReferenceRateModel,
+) -> None:
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [mock_reference_rate_model]
+    mock_session.execute.return_value = mock_result
+
+    result = await repository.get_between(
+        start=mock_reference_rate_model.start_date,
+        end=mock_reference_rate_model.start_date,
+    )
+
+    mock_session.execute.assert_called_once()
+    assert len(result) == 1
+    assert isinstance(result[0], ReferenceRateEntity)
+    assert result[0].value == mock_reference_rate_model.value
+
+
 async def test_get_latest_success(
     mock_session: AsyncMock,
     repository: SQLAlchemyReferenceRateRepository,
@@ -0,0 +1,60 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.adapters.outbound.repositories.version import (
+    REFERENCE_RATE_SCOPE,
+    SQLAlchemyVersionRepository,
+    bump_version,
+    portfolio_scope,
+)
+from src.domain.value_objects.resource_versions import ResourceVersions
+
+
+@pytest.fixture
+def repository(mock_session: AsyncMock) -> SQLAlchemyVersionRepository:
+    return SQLAlchemyVersionRepository(mock_session)
+
+
+async def test_get_versions(
+    repository: SQLAlchemyVersionRepository, mock_session: AsyncMock
+) -> None:
+    user_id = uuid4()
+    mock_result = MagicMock()
+    mock_result.all.return_value = [
+        (portfolio_scope(user_id), 5),
+        (REFERENCE_RATE_SCOPE, 2),
+    ]
+    mock_session.execute.return_value = mock_result
+
+    result = await repository.get_versions(user_id)
+
+    assert result == ResourceVersions(portfolio=5, reference_rate=2)
+    mock_session.execute.assert_called_once()
+
+
+async def test_get_versions_defaults_to_zero(
+    repository: SQLAlchemyVersionRepository, mock_session: AsyncMock
+) -> None:
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute.return_value = mock_result
+
+    result = await repository.get_versions(uuid4())
+
+    assert result == ResourceVersions(portfolio=0, reference_rate=0)
+
+
+def test_bump_version_is_an_upsert() -> None:
+    sql = str(
+        bump_version("reference_rate").compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    assert (
+        "INSERT INTO versioncounter (scope, value) VALUES ('reference_rate', 1)" in sql
+    )
+    assert "ON CONFLICT (scope) DO UPDATE SET value = (versioncounter.value +" in sql
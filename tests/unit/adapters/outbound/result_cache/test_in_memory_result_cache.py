@@ -0,0 +1,68 @@
+from datetime import date
+from uuid import UUID, uuid4
+
+from src.adapters.outbound.result_cache.in_memory_result_cache import (
+    InMemoryResultCache,
+)
+from src.domain.value_objects.resource_versions import ResourceVersions
+from src.domain.value_objects.result_cache_key import ResultCacheKey
+
+
+def _key(user_id: UUID, portfolio: int = 1) -> ResultCacheKey:
+    return ResultCacheKey(
+        namespace="income",
+        user_id=user_id,
+        versions=ResourceVersions(portfolio=portfolio, reference_rate=1),
+        target_date=date(2026, 3, 1),
+    )
+
+
+async def test_get_returns_stored_value() -> None:
+    cache = InMemoryResultCache(max_entries=2)
+    key = _key(uuid4())
+
+    await cache.set(key, "value")
+
+    assert await cache.get(key) == "value"
+
+
+async def test_miss_returns_none() -> None:
+    cache = InMemoryResultCache(max_entries=2)
+
+    assert await cache.get(_key(uuid4())) is None
+
+
+async def test_evicts_least_recently_used() -> None:
+    cache = InMemoryResultCache(max_entries=2)
+    first, second, third = _key(uuid4()), _key(uuid4()), _key(uuid4())
+    await cache.set(first, 1)
+    await cache.set(second, 2)
+
+    await cache.get(first)
+    await cache.set(third, 3)
+
+    assert len(cache) == 2
+    assert await cache.get(first) == 1
+    assert await cache.get(second) is None
+    assert await cache.get(third) == 3
+
+
+async def test_newer_version_is_a_different_entry() -> None:
+    cache = InMemoryResultCache(max_entries=4)
+    user_id = uuid4()
+    await cache.set(_key(user_id, portfolio=1), "old")
+
+    assert await cache.get(_key(user_id, portfolio=2)) is None
+
+
+async def test_invalidate_user_drops_only_their_entries() -> None:
+    cache = InMemoryResultCache(max_entries=4)
+    user_id, other_id = uuid4(), uuid4()
+    await cache.set(_key(user_id, portfolio=1), "a")
+    await cache.set(_key(user_id, portfolio=2), "b")
+    await cache.set(_key(other_id), "c")
+
+    await cache.invalidate_user(user_id)
+
+    assert len(cache) == 1
+    assert await cache.get(_key(other_id)) == "c"
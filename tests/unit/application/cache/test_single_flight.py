@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from src.application.cache.single_flight import SingleFlight
+from src.application.metrics import Metrics
+
+
+@pytest.fixture
+def metrics() -> Metrics:
+    return Metrics()
+
+
+@pytest.fixture
+def single_flight(metrics: Metrics) -> SingleFlight:
+    return SingleFlight("test", metrics=metrics)
+
+
+class _Computation:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await self.release.wait()
+        return self.calls
+
+
+async def test_concurrent_calls_share_one_computation(
+    single_flight: SingleFlight, metrics: Metrics
+) -> None:
+    compute = _Computation()
+
+    waiters = [asyncio.create_task(single_flight.do("key", compute)) for _ in range(3)]
+    await asyncio.sleep(0)
+    compute.release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert results == [1, 1, 1]
+    assert compute.calls == 1
+    assert metrics.snapshot()["counters"] == {
+        "single_flight.test.calls": 3,
+        "single_flight.test.coalesced": 2,
+    }
+
+
+async def test_different_keys_run_separately(single_flight: SingleFlight) -> None:
+    compute = _Computation()
+    compute.release.set()
+
+    await asyncio.gather(single_flight.do("a", compute), single_flight.do("b", compute))
+
+    assert compute.calls == 2
+
+
+async def test_finished_computation_is_not_reused(single_flight: SingleFlight) -> None:
+    compute = _Computation()
+    compute.release.set()
+
+    await single_flight.do("key", compute)
+    await single_flight.do("key", compute)
+
+    assert compute.calls == 2
+    assert len(single_flight) == 0
+
+
+async def test_exception_reaches_every_waiter(single_flight: SingleFlight) -> None:
+    started = asyncio.Event()
+
+    async def failing() -> None:
+        started.set()
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    first = asyncio.create_task(single_flight.do("key", failing))
+    await started.wait()
+    second = asyncio.create_task(single_flight.do("key", failing))
+
+    results = await asyncio.gather(first, second, return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(single_flight) == 0
+
+
+async def test_cancelled_leader_does_not_abort_followers(
+    single_flight: SingleFlight,
+) -> None:
+    compute = _Computation()
+    leader = asyncio.create_task(single_flight.do("key", compute))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(single_flight.do("key", compute))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    compute.release.set()
+
+    assert await follower == 1
+    assert leader.cancelled()
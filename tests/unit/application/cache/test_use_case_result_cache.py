@@ -0,0 +1,114 @@
+from datetime import date
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.cache.use_case_result_cache import UseCaseResultCache
+from src.application.metrics import Metrics
+from src.domain.value_objects.resource_versions import ResourceVersions
+from src.domain.value_objects.result_cache_key import ResultCacheKey
+
+VERSIONS = ResourceVersions(portfolio=2, reference_rate=5)
+TARGET_DATE = date(2026, 3, 1)
+
+
+@pytest.fixture
+def mock_cache() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_version_repo() -> AsyncMock:
+    repo = AsyncMock()
+    repo.get_versions.return_value = VERSIONS
+    return repo
+
+
+@pytest.fixture
+def metrics() -> Metrics:
+    return Metrics()
+
+
+@pytest.fixture
+def result_cache(
+    mock_cache: AsyncMock, mock_version_repo: AsyncMock, metrics: Metrics
+) -> UseCaseResultCache:
+    return UseCaseResultCache(
+        cache=mock_cache,
+        version_repo=mock_version_repo,
+        namespace="income",
+        metrics=metrics,
+    )
+
+
+async def test_hit_skips_computation(
+    result_cache: UseCaseResultCache, mock_cache: AsyncMock, metrics: Metrics
+) -> None:
+    user_id = uuid4()
+    mock_cache.get.return_value = "cached"
+    compute = AsyncMock()
+
+    result = await result_cache.get_or_compute(user_id, TARGET_DATE, compute)
+
+    assert result == "cached"
+    compute.assert_not_called()
+    mock_cache.get.assert_called_once_with(
+        ResultCacheKey(
+            namespace="income",
+            user_id=user_id,
+            versions=VERSIONS,
+            target_date=TARGET_DATE,
+        )
+    )
+    assert metrics.snapshot()["counters"] == {"result_cache.income.hit": 1}
+
+
+async def test_miss_computes_and_stores(
+    result_cache: UseCaseResultCache, mock_cache: AsyncMock, metrics: Metrics
+) -> None:
+    mock_cache.get.return_value = None
+    compute = AsyncMock(return_value="fresh")
+
+    result = await result_cache.get_or_compute(uuid4(), TARGET_DATE, compute)
+
+    assert result == "fresh"
+    compute.assert_awaited_once()
+    stored_key, stored_value = mock_cache.set.call_args[0]
+    assert stored_key.versions == VERSIONS
+    assert stored_value == "fresh"
+    assert metrics.snapshot()["counters"] == {"result_cache.income.miss": 1}
+
+
+async def test_failed_computation_is_not_cached(
+    result_cache: UseCaseResultCache, mock_cache: AsyncMock
+) -> None:
+    mock_cache.get.return_value = None
+    compute = AsyncMock(side_effect=ValueError("boom"))
+
+    with pytest.raises(ValueError):
+        await result_cache.get_or_compute(uuid4(), TARGET_DATE, compute)
+
+    mock_cache.set.assert_not_called()
+
+
+def test_key_string_contains_every_component() -> None:
+    user_id = uuid4()
+    key = ResultCacheKey(
+        namespace="equity", user_id=user_id, versions=VERSIONS, target_date=TARGET_DATE
+    )
+
+    assert str(key) == f"equity:{user_id}:2:5:2026-03-01"
+
+
+def test_key_string_ends_with_variant() -> None:
+    user_id = uuid4()
+    key = ResultCacheKey(
+        namespace="equity",
+        user_id=user_id,
+        versions=VERSIONS,
+        target_date=TARGET_DATE,
+        variant="None:None:500",
+    )
+
+    assert str(key) == f"equity:{user_id}:2:5:2026-03-01:None:None:500"
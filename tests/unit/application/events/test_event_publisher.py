@@ -204,3 +204,72 @@ async def test_event_inheritance(publisher: EventPublisher) -> None:
 
     derived_handler.assert_awaited_once()
     base_handler.assert_not_awaited()
+
+
+async def test_publish_all_calls_batch_handler_once(publisher: EventPublisher) -> None:
+    batch_handler = AsyncMock()
+    publisher.subscribe_batch((UserCreatedEvent, OrderPlacedEvent), batch_handler)
+
+    events = [
+        UserCreatedEvent(user_id=uuid4(), email="a@example.com"),
+        OrderPlacedEvent(order_id=uuid4(), amount=10.0),
+        UserCreatedEvent(user_id=uuid4(), email="b@example.com"),
+    ]
+    await publisher.publish_all(events)
+
+    batch_handler.assert_awaited_once_with(events)
+
+
+async def test_publish_all_batch_handler_gets_only_its_types(
+    publisher: EventPublisher,
+) -> None:
+    batch_handler = AsyncMock()
+    event_handler = AsyncMock()
+    publisher.subscribe_batch((UserCreatedEvent,), batch_handler)
+    publisher.subscribe(OrderPlacedEvent, event_handler)
+
+    user_event = UserCreatedEvent(user_id=uuid4(), email="a@example.com")
+    order_event = OrderPlacedEvent(order_id=uuid4(), amount=10.0)
+    await publisher.publish_all([user_event, order_event])
+
+    batch_handler.assert_awaited_once_with([user_event])
+    event_handler.assert_awaited_once_with(order_event)
+
+
+async def test_publish_all_skips_batch_handler_without_events(
+    publisher: EventPublisher,
+) -> None:
+    batch_handler = AsyncMock()
+    publisher.subscribe_batch((UserCreatedEvent,), batch_handler)
+
+    await publisher.publish_all([OrderPlacedEvent(order_id=uuid4(), amount=1.0)])
+
+    batch_handler.assert_not_awaited()
+
+
+async def test_publish_calls_batch_handler_with_single_event(
+    publisher: EventPublisher,
+) -> None:
+    batch_handler = AsyncMock()
+    publisher.subscribe_batch((UserCreatedEvent,), batch_handler)
+
+    event = UserCreatedEvent(user_id=uuid4(), email="a@example.com")
+    await publisher.publish(event)
+
+    batch_handler.assert_awaited_once_with([event])
+
+
+async def test_batch_handler_exception_continues(
+    publisher: EventPublisher, caplog: LogCaptureFixture
+) -> None:
+    failing = AsyncMock(side_effect=RuntimeError("boom"))
+    failing.__name__ = "failing"
+    succeeding = AsyncMock()
+    publisher.subscribe_batch((UserCreatedEvent,), failing)
+    publisher.subscribe_batch((UserCreatedEvent,), succeeding)
+
+    event = UserCreatedEvent(user_id=uuid4(), email="a@example.com")
+    await publisher.publish_all([event])
+
+    succeeding.assert_awaited_once_with([event])
+    assert "Batch event handler failed" in caplog.text
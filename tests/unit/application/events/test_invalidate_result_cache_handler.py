@@ -0,0 +1,49 @@
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.application.events.handlers.cache.invalidate_result_cache import (
+    InvalidateResultCacheHandler,
+)
+from src.domain.events.bondholder_events import BondHolderQuantityChangedEvent
+
+
+async def test_handle_invalidates_event_user() -> None:
+    cache = AsyncMock()
+    handler = InvalidateResultCacheHandler(cache)
+    event = BondHolderQuantityChangedEvent(
+        bondholder_id=uuid4(),
+        user_id=uuid4(),
+        old_quantity=1,
+        new_quantity=2,
+        purchase_date=date(2025, 1, 1),
+        occurred_at=datetime.now(timezone.utc),
+    )
+
+    await handler.handle(event)
+
+    cache.invalidate_user.assert_awaited_once_with(event.user_id)
+
+
+async def test_handle_all_invalidates_each_user_once() -> None:
+    cache = AsyncMock()
+    handler = InvalidateResultCacheHandler(cache)
+    first_user, second_user = uuid4(), uuid4()
+    events = [
+        BondHolderQuantityChangedEvent(
+            bondholder_id=uuid4(),
+            user_id=user_id,
+            old_quantity=1,
+            new_quantity=2,
+            purchase_date=date(2025, 1, 1),
+            occurred_at=datetime.now(timezone.utc),
+        )
+        for user_id in (first_user, second_user, first_user)
+    ]
+
+    await handler.handle_all(events)
+
+    assert [call.args for call in cache.invalidate_user.await_args_list] == [
+        (first_user,),
+        (second_user,),
+    ]
@@ -0,0 +1,132 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, call
+from uuid import uuid4
+
+from src.application.events.handlers.snapshot.refresh_portfolio_snapshot import (
+    RefreshPortfolioSnapshotHandler,
+)
+from src.domain.events.bondholder_events import BondHolderCreatedEvent
+
+
+async def test_handle_refreshes_from_purchase_date() -> None:
+    use_case = AsyncMock()
+    use_case.execute.return_value = 3
+    opened = []
+
+    @asynccontextmanager
+    async def factory():
+        opened.append(True)
+        yield use_case
+
+    handler = RefreshPortfolioSnapshotHandler(factory)
+    event = BondHolderCreatedEvent(
+        bondholder_id=uuid4(),
+        bond_id=uuid4(),
+        user_id=uuid4(),
+        purchase_date=date(2025, 1, 1),
+        occurred_at=datetime.now(timezone.utc),
+    )
+
+    await handler.handle(event)
+    await handler.join()
+
+    assert opened == [True]
+    use_case.execute.assert_awaited_once_with(
+        user_id=event.user_id, from_date=date(2025, 1, 1), until=date.today()
+    )
+
+
+async def test_handle_all_refreshes_each_user_from_earliest_purchase() -> None:
+    use_case = AsyncMock()
+    use_case.execute.return_value = 1
+    opened = []
+
+    @asynccontextmanager
+    async def factory():
+        opened.append(True)
+        yield use_case
+
+    handler = RefreshPortfolioSnapshotHandler(factory)
+    user_id = uuid4()
+    events = [
+        BondHolderCreatedEvent(
+            bondholder_id=uuid4(),
+            bond_id=uuid4(),
+            user_id=user_id,
+            purchase_date=purchase_date,
+            occurred_at=datetime.now(timezone.utc),
+        )
+        for purchase_date in (date(2025, 3, 1), date(2024, 6, 1), date(2025, 1, 1))
+    ]
+
+    await handler.handle_all(events)
+    await handler.join()
+
+    assert opened == [True]
+    use_case.execute.assert_awaited_once_with(
+        user_id=user_id, from_date=date(2024, 6, 1), until=date.today()
+    )
+
+
+def _event(user_id, purchase_date: date) -> BondHolderCreatedEvent:
+    return BondHolderCreatedEvent(
+        bondholder_id=uuid4(),
+        bond_id=uuid4(),
+        user_id=user_id,
+        purchase_date=purchase_date,
+        occurred_at=datetime.now(timezone.utc),
+    )
+
+
+async def test_handle_all_returns_before_refresh_and_folds_later_changes() -> None:
+    use_case = AsyncMock()
+    release = asyncio.Event()
+
+    async def execute(**kwargs) -> int:
+        await release.wait()
+        return 1
+
+    use_case.execute.side_effect = execute
+
+    @asynccontextmanager
+    async def factory():
+        yield use_case
+
+    handler = RefreshPortfolioSnapshotHandler(factory)
+    user_id = uuid4()
+
+    await handler.handle(_event(user_id, date(2025, 1, 1)))
+    await asyncio.sleep(0)
+    assert use_case.execute.await_count == 1
+
+    # Arrive while the first refresh runs: one more pass, from the earliest.
+    await handler.handle(_event(user_id, date(2025, 3, 1)))
+    await handler.handle(_event(user_id, date(2024, 6, 1)))
+    release.set()
+    await handler.join()
+
+    assert use_case.execute.await_args_list == [
+        call(user_id=user_id, from_date=date(2025, 1, 1), until=date.today()),
+        call(user_id=user_id, from_date=date(2024, 6, 1), until=date.today()),
+    ]
+
+
+async def test_failed_refresh_does_not_stop_later_ones() -> None:
+    use_case = AsyncMock()
+    use_case.execute.side_effect = [RuntimeError("db down"), 1]
+
+    @asynccontextmanager
+    async def factory():
+        yield use_case
+
+    handler = RefreshPortfolioSnapshotHandler(factory)
+    user_id = uuid4()
+
+    await handler.handle(_event(user_id, date(2025, 1, 1)))
+    await handler.join()
+    await handler.handle(_event(user_id, date(2025, 2, 1)))
+    await handler.join()
+
+    assert use_case.execute.await_count == 2
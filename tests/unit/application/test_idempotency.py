@@ -0,0 +1,150 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.outbound.idempotency.in_memory_idempotency_store import (
+    InMemoryIdempotencyStore,
+)
+from src.application.idempotency import IdempotentExecution
+from src.application.metrics import Metrics
+from src.domain.exceptions import ConflictError, ValidationError
+from src.domain.value_objects.idempotency import IdempotencyKey
+
+
+@pytest.fixture
+def metrics() -> Metrics:
+    return Metrics()
+
+
+@pytest.fixture
+def store() -> InMemoryIdempotencyStore:
+    return InMemoryIdempotencyStore()
+
+
+@pytest.fixture
+def execution(store: InMemoryIdempotencyStore, metrics: Metrics) -> IdempotentExecution:
+    return IdempotentExecution(
+        store=store,
+        operation="create",
+        ttl=timedelta(hours=1),
+        lease=timedelta(seconds=1),
+        metrics=metrics,
+    )
+
+
+async def test_retry_replays_result(
+    execution: IdempotentExecution, metrics: Metrics
+) -> None:
+    user_id = uuid4()
+    execute = AsyncMock(return_value="created")
+
+    first = await execution.run(user_id, "key", "fp", execute)
+    retry = await execution.run(user_id, "key", "fp", execute)
+
+    assert first == retry == "created"
+    execute.assert_awaited_once()
+    assert metrics.snapshot()["counters"] == {
+        "idempotency.create.executed": 1,
+        "idempotency.create.replayed": 1,
+    }
+
+
+async def test_concurrent_duplicate_waits_for_first(
+    execution: IdempotentExecution,
+) -> None:
+    user_id = uuid4()
+    started = asyncio.Event()
+    finish = asyncio.Event()
+    calls = 0
+
+    async def execute() -> str:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await finish.wait()
+        return "created"
+
+    first = asyncio.create_task(execution.run(user_id, "key", "fp", execute))
+    await started.wait()
+    duplicate = asyncio.create_task(execution.run(user_id, "key", "fp", execute))
+    await asyncio.sleep(0)
+    finish.set()
+
+    assert await asyncio.gather(first, duplicate) == ["created", "created"]
+    assert calls == 1
+
+
+async def test_key_reused_for_different_payload(
+    execution: IdempotentExecution,
+) -> None:
+    user_id = uuid4()
+    await execution.run(user_id, "key", "fp", AsyncMock(return_value="created"))
+    execute = AsyncMock()
+
+    with pytest.raises(ValidationError):
+        await execution.run(user_id, "key", "other", execute)
+
+    execute.assert_not_awaited()
+
+
+async def test_failure_releases_key(execution: IdempotentExecution) -> None:
+    user_id = uuid4()
+    failing = AsyncMock(side_effect=RuntimeError("db down"))
+
+    with pytest.raises(RuntimeError):
+        await execution.run(user_id, "key", "fp", failing)
+
+    assert (
+        await execution.run(user_id, "key", "fp", AsyncMock(return_value="created"))
+        == "created"
+    )
+
+
+async def test_duplicate_of_failed_request_runs_it_again(
+    execution: IdempotentExecution,
+) -> None:
+    user_id = uuid4()
+    started = asyncio.Event()
+    fail = asyncio.Event()
+
+    async def failing() -> str:
+        started.set()
+        await fail.wait()
+        raise RuntimeError("db down")
+
+    first = asyncio.create_task(execution.run(user_id, "key", "fp", failing))
+    await started.wait()
+    duplicate = asyncio.create_task(
+        execution.run(user_id, "key", "fp", AsyncMock(return_value="created"))
+    )
+    await asyncio.sleep(0)
+    fail.set()
+
+    with pytest.raises(RuntimeError):
+        await first
+    assert await duplicate == "created"
+
+
+async def test_still_in_progress_after_lease(
+    store: InMemoryIdempotencyStore,
+) -> None:
+    execution = IdempotentExecution(
+        store=store,
+        operation="create",
+        ttl=timedelta(hours=1),
+        lease=timedelta(milliseconds=10),
+    )
+    user_id = uuid4()
+    # Claimed by a request that outlives the lease waited for by duplicates.
+    await store.claim(
+        IdempotencyKey("create", user_id, "key"), "fp", timedelta(hours=1)
+    )
+    execute = AsyncMock()
+
+    with pytest.raises(ConflictError):
+        await execution.run(user_id, "key", "fp", execute)
+
+    execute.assert_not_awaited()
@@ -0,0 +1,104 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.application.live_updates import LiveUpdateHub
+from src.application.metrics import Metrics
+from src.domain.value_objects.live_update import (
+    PortfolioRevalued,
+    ReferenceRateChanged,
+)
+
+RATE = ReferenceRateChanged(value=Decimal("5.75"), effective_date=date(2026, 3, 1))
+
+
+@pytest.fixture
+def metrics() -> Metrics:
+    return Metrics()
+
+
+@pytest.fixture
+def hub(metrics: Metrics) -> LiveUpdateHub:
+    return LiveUpdateHub(metrics=metrics)
+
+
+def _revalued(user_id: UUID, equity: str, delta: str) -> PortfolioRevalued:
+    return PortfolioRevalued(
+        user_id=user_id,
+        as_of=date(2026, 3, 31),
+        equity=Decimal(equity),
+        monthly_income=Decimal("1.00"),
+        equity_delta=Decimal(delta),
+        monthly_income_delta=Decimal("0.50"),
+    )
+
+
+async def test_rate_change_broadcast_to_everyone(hub: LiveUpdateHub) -> None:
+    first, second = hub.subscribe(uuid4()), hub.subscribe(uuid4())
+
+    hub.dispatch(RATE)
+
+    assert await first.next(timeout=1) == [RATE]
+    assert await second.next(timeout=1) == [RATE]
+
+
+async def test_revaluation_sent_to_its_user_only(hub: LiveUpdateHub) -> None:
+    user_id = uuid4()
+    own, other = hub.subscribe(user_id), hub.subscribe(uuid4())
+    update = _revalued(user_id, "100", "100")
+
+    hub.dispatch(update)
+
+    assert await own.next(timeout=1) == [update]
+    assert await other.next(timeout=0.01) == []
+
+
+async def test_next_waits_for_dispatch(hub: LiveUpdateHub) -> None:
+    subscription = hub.subscribe(uuid4())
+    waiter = asyncio.create_task(subscription.next(timeout=5))
+    await asyncio.sleep(0)
+
+    hub.dispatch(RATE)
+
+    assert await waiter == [RATE]
+
+
+async def test_pending_updates_coalesced(hub: LiveUpdateHub, metrics: Metrics) -> None:
+    user_id = uuid4()
+    subscription = hub.subscribe(user_id)
+
+    hub.dispatch(_revalued(user_id, "100", "100"))
+    hub.dispatch(RATE)
+    hub.dispatch(_revalued(user_id, "250", "150"))
+
+    revalued, rate = await subscription.next(timeout=1)
+    assert rate == RATE
+    assert revalued.equity == Decimal("250")
+    assert revalued.equity_delta == Decimal("250")
+    assert revalued.monthly_income_delta == Decimal("1.00")
+    assert metrics.snapshot()["counters"]["live_updates.coalesced"] == 1
+    assert await subscription.next(timeout=0.01) == []
+
+
+async def test_unsubscribed_gets_nothing(hub: LiveUpdateHub) -> None:
+    subscription = hub.subscribe(uuid4())
+
+    hub.unsubscribe(subscription)
+    hub.unsubscribe(subscription)
+    hub.dispatch(RATE)
+
+    assert len(hub) == 0
+    assert await subscription.next(timeout=0.01) == []
+
+
+async def test_many_idle_subscribers(hub: LiveUpdateHub, metrics: Metrics) -> None:
+    subscriptions = [hub.subscribe(uuid4()) for _ in range(5000)]
+
+    hub.dispatch(RATE)
+
+    assert len(hub) == 5000
+    assert all([await s.next(timeout=0) for s in subscriptions])
+    assert metrics.snapshot()["counters"]["live_updates.delivered"] == 5000
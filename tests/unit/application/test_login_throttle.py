@@ -0,0 +1,80 @@
+import hashlib
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.login_throttle import LoginThrottle
+from src.application.metrics import Metrics
+from src.domain.exceptions import RateLimitExceededError
+from src.domain.ports.services.rate_limiter import RateLimiter
+from src.domain.value_objects.rate_limit import RateLimit
+
+PER_IP = RateLimit(burst=20, per_minute=10)
+PER_USERNAME = RateLimit(burst=5, per_minute=2)
+
+
+@pytest.fixture
+def limiter() -> AsyncMock:
+    limiter = AsyncMock(spec=RateLimiter)
+    limiter.acquire.return_value = 0.0
+    return limiter
+
+
+@pytest.fixture
+def metrics() -> Metrics:
+    return Metrics()
+
+
+@pytest.fixture
+def throttle(limiter: AsyncMock, metrics: Metrics) -> LoginThrottle:
+    return LoginThrottle(limiter, PER_IP, PER_USERNAME, metrics)
+
+
+def _username_key(username: str) -> str:
+    return f"login:username:{hashlib.sha256(username.encode()).hexdigest()}"
+
+
+async def test_spends_ip_and_username_tokens(
+    throttle: LoginThrottle, limiter: AsyncMock, metrics: Metrics
+) -> None:
+    await throttle.check("10.0.0.1", " User@Example.com ")
+
+    assert [call.args for call in limiter.acquire.await_args_list] == [
+        ("login:ip:10.0.0.1", PER_IP),
+        (_username_key("user@example.com"), PER_USERNAME),
+    ]
+    assert metrics.snapshot()["counters"] == {"login_throttle.allowed": 1}
+
+
+async def test_ip_over_limit_spares_username(
+    throttle: LoginThrottle, limiter: AsyncMock, metrics: Metrics
+) -> None:
+    limiter.acquire.return_value = 2.5
+
+    with pytest.raises(RateLimitExceededError) as exc_info:
+        await throttle.check("10.0.0.1", "user@example.com")
+
+    assert exc_info.value.retry_after == 3
+    limiter.acquire.assert_awaited_once()
+    assert metrics.snapshot()["counters"] == {"login_throttle.ip.rejected": 1}
+
+
+async def test_username_over_limit(
+    throttle: LoginThrottle, limiter: AsyncMock, metrics: Metrics
+) -> None:
+    limiter.acquire.side_effect = [0.0, 30.0]
+
+    with pytest.raises(RateLimitExceededError):
+        await throttle.check("10.0.0.1", "user@example.com")
+
+    assert metrics.snapshot()["counters"] == {"login_throttle.username.rejected": 1}
+
+
+async def test_unknown_client_limited_by_username_only(
+    throttle: LoginThrottle, limiter: AsyncMock
+) -> None:
+    await throttle.check(None, "user@example.com")
+
+    limiter.acquire.assert_awaited_once_with(
+        _username_key("user@example.com"), PER_USERNAME
+    )
@@ -0,0 +1,35 @@
+from src.application.metrics import Metrics, get_metrics
+
+
+def test_increment_counts() -> None:
+    metrics = Metrics()
+
+    metrics.increment("requests")
+    metrics.increment("requests", 2)
+
+    assert metrics.snapshot()["counters"] == {"requests": 3}
+
+
+def test_observe_summarises_values() -> None:
+    metrics = Metrics()
+
+    metrics.observe("latency", 0.5)
+    metrics.observe("latency", 1.5)
+
+    assert metrics.snapshot()["summaries"] == {
+        "latency": {"count": 2, "sum": 2.0, "max": 1.5}
+    }
+
+
+def test_reset_clears_everything() -> None:
+    metrics = Metrics()
+    metrics.increment("requests")
+    metrics.observe("latency", 1.0)
+
+    metrics.reset()
+
+    assert metrics.snapshot() == {"counters": {}, "summaries": {}}
+
+
+def test_get_metrics_is_a_singleton() -> None:
+    assert get_metrics() is get_metrics()
@@ -17,10 +17,12 @@ from src.domain.exceptions import AuthorizationError, NotFoundError
 async def use_case(
     mock_bond_repo: AsyncMock,
     mock_bondholder_repo: AsyncMock,
+    mock_event_publisher: AsyncMock,
 ) -> UpdateBondHolderQuantityUseCase:
     return UpdateBondHolderQuantityUseCase(
         bond_repo=mock_bond_repo,
         bondholder_repo=mock_bondholder_repo,
+        event_publisher=mock_event_publisher,
     )
 
 
@@ -56,6 +58,28 @@ async def test_change_quantity_success(
     assert isinstance(result, BondHolderDTO)
 
 
+async def test_change_quantity_publishes_events(
+    use_case: UpdateBondHolderQuantityUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_event_publisher: AsyncMock,
+    bondholder_entity_mock: Mock,
+    bond_entity_mock: Mock,
+    user_dto: UserDTO,
+) -> None:
+    bondholder_entity_mock.user_id = user_dto.id
+    dto = BondHolderUpdateQuantityDTO(id=uuid4(), user=user_dto, new_quantity=5)
+    mock_bondholder_repo.get_one.return_value = bondholder_entity_mock
+    mock_bondholder_repo.update.return_value = bondholder_entity_mock
+    mock_bond_repo.get_one.return_value = bond_entity_mock
+
+    await use_case.execute(dto)
+
+    mock_event_publisher.publish_all.assert_awaited_once_with(
+        bondholder_entity_mock.collect_events.return_value
+    )
+
+
 async def test_bondholder_not_found(
     use_case: UpdateBondHolderQuantityUseCase,
     mock_bondholder_repo: AsyncMock,
@@ -0,0 +1,151 @@
+from collections.abc import Callable
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dto.bondholder import (
+    BondHolderBatchDTO,
+    BondHolderQuantityChangeDTO,
+)
+from src.application.dto.user import UserDTO
+from src.application.use_cases.bondholder.bh_batch import BondHolderBatchUseCase
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.events.bondholder_events import (
+    BondHolderDeletedEvent,
+    BondHolderQuantityChangedEvent,
+)
+from src.domain.exceptions import NotFoundError, ValidationError
+
+
+@pytest.fixture
+def use_case(
+    mock_bond_repo: AsyncMock,
+    mock_bondholder_repo: AsyncMock,
+    mock_event_publisher: AsyncMock,
+) -> BondHolderBatchUseCase:
+    return BondHolderBatchUseCase(
+        bond_repo=mock_bond_repo,
+        bondholder_repo=mock_bondholder_repo,
+        event_publisher=mock_event_publisher,
+    )
+
+
+async def test_applies_changes_and_deletions_together(
+    use_case: BondHolderBatchUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_event_publisher: AsyncMock,
+    user_dto: UserDTO,
+    bond: Bond,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    first, second, removed = (
+        make_bondholder(bond, user_id=user_dto.id) for _ in range(3)
+    )
+    mock_bondholder_repo.get_many_owned.return_value = [removed, second, first]
+    mock_bondholder_repo.apply_batch.side_effect = (
+        lambda user_id, updated, deleted: updated
+    )
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+    dto = BondHolderBatchDTO(
+        user=user_dto,
+        quantity_changes=[
+            BondHolderQuantityChangeDTO(id=first.id, new_quantity=5),
+            BondHolderQuantityChangeDTO(id=second.id, new_quantity=10),
+        ],
+        deletions=[removed.id],
+    )
+
+    result = await use_case.execute(dto)
+
+    mock_bondholder_repo.get_many_owned.assert_awaited_once_with(
+        user_id=user_dto.id,
+        bondholder_ids=[first.id, second.id, removed.id],
+        for_update=True,
+    )
+    mock_bondholder_repo.apply_batch.assert_awaited_once_with(
+        user_id=user_dto.id, updated=[second, first], deleted=[removed]
+    )
+    mock_bond_repo.fetch_dict_from_bondholders.assert_awaited_once()
+    assert [item.id for item in result.updated] == [first.id, second.id]
+    assert [item.quantity for item in result.updated] == [5, 10]
+    assert result.deleted == [removed.id]
+
+    # Only the deletion and the actual change raise events, published at once.
+    mock_event_publisher.publish_all.assert_awaited_once()
+    [events] = mock_event_publisher.publish_all.await_args.args
+    assert [type(event) for event in events] == [
+        BondHolderDeletedEvent,
+        BondHolderQuantityChangedEvent,
+    ]
+    assert events[0].email == user_dto.email
+
+
+async def test_missing_or_foreign_bondholder_writes_nothing(
+    use_case: BondHolderBatchUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_event_publisher: AsyncMock,
+    user_dto: UserDTO,
+    bond: Bond,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    found = make_bondholder(bond, user_id=user_dto.id)
+    mock_bondholder_repo.get_many_owned.return_value = [found]
+    dto = BondHolderBatchDTO(
+        user=user_dto,
+        quantity_changes=[BondHolderQuantityChangeDTO(id=found.id, new_quantity=5)],
+        deletions=[uuid4()],
+    )
+
+    with pytest.raises(NotFoundError):
+        await use_case.execute(dto)
+
+    mock_bondholder_repo.apply_batch.assert_not_awaited()
+    mock_event_publisher.publish_all.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    "quantity_changes, deletions",
+    [
+        (lambda i: [(i, 1), (i, 2)], lambda i: []),
+        (lambda i: [], lambda i: [i, i]),
+        (lambda i: [(i, 1)], lambda i: [i]),
+    ],
+)
+async def test_target_repeated(
+    use_case: BondHolderBatchUseCase,
+    mock_bondholder_repo: AsyncMock,
+    user_dto: UserDTO,
+    quantity_changes,
+    deletions,
+) -> None:
+    bondholder_id = uuid4()
+    dto = BondHolderBatchDTO(
+        user=user_dto,
+        quantity_changes=[
+            BondHolderQuantityChangeDTO(id=i, new_quantity=q)
+            for i, q in quantity_changes(bondholder_id)
+        ],
+        deletions=deletions(bondholder_id),
+    )
+
+    with pytest.raises(ValidationError):
+        await use_case.execute(dto)
+
+    mock_bondholder_repo.get_many_owned.assert_not_awaited()
+
+
+async def test_empty_batch(
+    use_case: BondHolderBatchUseCase,
+    mock_bondholder_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    dto = BondHolderBatchDTO(user=user_dto, quantity_changes=[], deletions=[])
+
+    result = await use_case.execute(dto)
+
+    assert result.updated == []
+    assert result.deleted == []
+    mock_bondholder_repo.get_many_owned.assert_not_awaited()
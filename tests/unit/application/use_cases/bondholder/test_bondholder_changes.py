@@ -0,0 +1,146 @@
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dto.user import UserDTO
+from src.application.use_cases.bondholder.bh_changes import (
+    BondHolderGetChangesUseCase,
+    PurgeBondHolderTombstonesUseCase,
+)
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.value_objects.bondholder_changes import BondHolderChangeSet
+
+RETENTION = timedelta(days=30)
+WATERMARK = datetime(2026, 1, 31, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def use_case(
+    mock_bondholder_repo: AsyncMock, mock_bond_repo: AsyncMock
+) -> BondHolderGetChangesUseCase:
+    return BondHolderGetChangesUseCase(
+        bondholder_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        tombstone_retention=RETENTION,
+    )
+
+
+@pytest.fixture
+def bond() -> Bond:
+    return Bond(
+        id=uuid4(),
+        series="ROR0126",
+        nominal_value=Decimal("100.00"),
+        maturity_period=12,
+        initial_interest_rate=Decimal("5.0"),
+        first_interest_period=1,
+        reference_rate_margin=Decimal("0.0"),
+    )
+
+
+def _bondholder(bond: Bond, user_id) -> BondHolder:
+    return BondHolder(
+        id=uuid4(),
+        bond_id=bond.id,
+        user_id=user_id,
+        quantity=3,
+        purchase_date=date(2026, 1, 10),
+    )
+
+
+async def test_splits_changes_into_inserted_updated_and_deleted(
+    use_case: BondHolderGetChangesUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    user_dto: UserDTO,
+    bond: Bond,
+) -> None:
+    inserted = _bondholder(bond, user_dto.id)
+    updated = _bondholder(bond, user_dto.id)
+    deleted_id = uuid4()
+    mock_bondholder_repo.get_changes.return_value = BondHolderChangeSet(
+        watermark=WATERMARK,
+        inserted=[inserted],
+        updated=[updated],
+        deleted=[deleted_id],
+    )
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+
+    result = await use_case.execute(user=user_dto, since=WATERMARK - timedelta(hours=1))
+
+    assert [dto.id for dto in result.inserted] == [inserted.id]
+    assert [dto.id for dto in result.updated] == [updated.id]
+    assert result.deleted == [deleted_id]
+    assert result.watermark == WATERMARK
+    assert result.full_resync is False
+    assert result.inserted[0].series == bond.series
+
+
+async def test_no_changes_skips_bond_lookup(
+    use_case: BondHolderGetChangesUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    mock_bondholder_repo.get_changes.return_value = BondHolderChangeSet(
+        watermark=WATERMARK
+    )
+
+    result = await use_case.execute(user=user_dto, since=WATERMARK)
+
+    assert result.inserted == []
+    assert result.updated == []
+    assert result.deleted == []
+    mock_bond_repo.fetch_dict_from_bondholders.assert_not_called()
+
+
+async def test_watermark_older_than_retention_requests_full_resync(
+    use_case: BondHolderGetChangesUseCase,
+    mock_bondholder_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    mock_bondholder_repo.get_changes.return_value = BondHolderChangeSet(
+        watermark=WATERMARK
+    )
+
+    result = await use_case.execute(
+        user=user_dto, since=WATERMARK - RETENTION - timedelta(seconds=1)
+    )
+
+    assert result.full_resync is True
+
+
+async def test_naive_since_is_treated_as_utc(
+    use_case: BondHolderGetChangesUseCase,
+    mock_bondholder_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    mock_bondholder_repo.get_changes.return_value = BondHolderChangeSet(
+        watermark=WATERMARK
+    )
+
+    await use_case.execute(user=user_dto, since=datetime(2026, 1, 31, 11, 0))
+
+    mock_bondholder_repo.get_changes.assert_called_once_with(
+        user_id=user_dto.id, since=datetime(2026, 1, 31, 11, 0, tzinfo=UTC)
+    )
+
+
+async def test_purge_removes_tombstones_outside_retention(
+    mock_bondholder_repo: AsyncMock,
+) -> None:
+    mock_bondholder_repo.purge_tombstones.return_value = 4
+    use_case = PurgeBondHolderTombstonesUseCase(
+        bondholder_repo=mock_bondholder_repo, tombstone_retention=RETENTION
+    )
+
+    purged = await use_case.execute(now=WATERMARK)
+
+    assert purged == 4
+    mock_bondholder_repo.purge_tombstones.assert_called_once_with(
+        before=WATERMARK - RETENTION
+    )
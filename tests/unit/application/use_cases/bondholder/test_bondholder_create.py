@@ -1,26 +1,36 @@
-from datetime import date
+from dataclasses import replace
+from datetime import date, timedelta
 from decimal import Decimal
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 import pytest
 
+from src.adapters.outbound.idempotency.in_memory_idempotency_store import (
+    InMemoryIdempotencyStore,
+)
 from src.application.dto.bond import BondCreateDTO
 from src.application.dto.bondholder import BondHolderCreateDTO, BondHolderDTO
+from src.application.idempotency import IdempotentExecution
 from src.application.use_cases.bondholder.bh_create import (
     BondHolderCreateUseCase,
 )
 from src.domain.entities.bond import Bond as BondEntity
 from src.domain.entities.bondholder import BondHolder as BondHolderEntity
+from src.domain.events.bondholder_events import BondHolderCreatedEvent
 from src.domain.exceptions import ValidationError
 
 
 @pytest.fixture
 def use_case(
-    mock_bond_repo: AsyncMock, mock_bondholder_repo: AsyncMock
+    mock_bond_repo: AsyncMock,
+    mock_bondholder_repo: AsyncMock,
+    mock_event_publisher: AsyncMock,
 ) -> BondHolderCreateUseCase:
     return BondHolderCreateUseCase(
-        bond_repo=mock_bond_repo, bondholder_repo=mock_bondholder_repo
+        bond_repo=mock_bond_repo,
+        bondholder_repo=mock_bondholder_repo,
+        event_publisher=mock_event_publisher,
     )
 
 
@@ -91,6 +101,28 @@ async def test_with_existing_bond(
     assert result == sample_bondholder_dto
 
 
+async def test_publishes_created_event(
+    use_case: BondHolderCreateUseCase,
+    mock_bond_repo: AsyncMock,
+    mock_bondholder_repo: AsyncMock,
+    mock_event_publisher: AsyncMock,
+    bondholder_create_dto: BondHolderCreateDTO,
+    bond_create_dto: BondCreateDTO,
+    bond_entity_mock: Mock,
+    sample_bondholder_dto: BondHolderDTO,
+) -> None:
+    mock_bond_repo.get_by_series.return_value = bond_entity_mock
+    mock_bondholder_repo.write.return_value = Mock(spec=BondHolderEntity)
+    use_case.to_dto = Mock(return_value=sample_bondholder_dto)
+
+    await use_case.execute(bondholder_create_dto, bond_create_dto)
+
+    [events] = mock_event_publisher.publish_all.call_args[0]
+    [event] = events
+    assert isinstance(event, BondHolderCreatedEvent)
+    assert event.user_id == bondholder_create_dto.user_id
+
+
 async def test_with_new_bond(
     use_case: BondHolderCreateUseCase,
     mock_bond_repo: AsyncMock,
@@ -266,3 +298,40 @@ async def test_calls_to_dto_with_correct_params(
     assert call_args[1]["bond"] == bond_entity_mock
 
     assert call_args[1]["bondholder"] == bondholder_entity_mock
+
+
+async def test_with_idempotency_key_runs_once(
+    mock_bond_repo: AsyncMock,
+    mock_bondholder_repo: AsyncMock,
+    mock_event_publisher: AsyncMock,
+    bondholder_create_dto: BondHolderCreateDTO,
+    bond_create_dto: BondCreateDTO,
+    bond_entity_mock: Mock,
+    sample_bondholder_dto: BondHolderDTO,
+) -> None:
+    use_case = BondHolderCreateUseCase(
+        bond_repo=mock_bond_repo,
+        bondholder_repo=mock_bondholder_repo,
+        event_publisher=mock_event_publisher,
+        idempotency=IdempotentExecution(
+            store=InMemoryIdempotencyStore(),
+            operation="bondholder_create",
+            ttl=timedelta(hours=1),
+            lease=timedelta(seconds=1),
+        ),
+    )
+    mock_bond_repo.get_by_series.return_value = bond_entity_mock
+    mock_bondholder_repo.write.return_value = Mock(spec=BondHolderEntity)
+    use_case.to_dto = Mock(return_value=sample_bondholder_dto)
+
+    first = await use_case.execute(bondholder_create_dto, bond_create_dto, "key")
+    retry = await use_case.execute(bondholder_create_dto, bond_create_dto, "key")
+
+    assert first == retry == sample_bondholder_dto
+    mock_bondholder_repo.write.assert_awaited_once()
+    mock_event_publisher.publish_all.assert_awaited_once()
+
+    with pytest.raises(ValidationError):
+        await use_case.execute(
+            replace(bondholder_create_dto, quantity=51), bond_create_dto, "key"
+        )
@@ -0,0 +1,239 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.cache.single_flight import SingleFlight
+from src.application.dto.bondholder import BondHolderPageDTO
+from src.application.dto.user import UserDTO
+from src.application.metrics import Metrics
+from src.application.use_cases.bondholder.bh_get import BondHolderGetPageUseCase
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.value_objects.bondholder_query import (
+    BondHolderCursor,
+    BondHolderPageQuery,
+    BondHolderSortField,
+)
+
+
+@pytest.fixture
+def use_case(
+    mock_bondholder_repo: AsyncMock, mock_bond_repo: AsyncMock
+) -> BondHolderGetPageUseCase:
+    return BondHolderGetPageUseCase(mock_bondholder_repo, mock_bond_repo)
+
+
+@pytest.fixture
+def bond() -> Bond:
+    return Bond(
+        id=uuid4(),
+        series="ROR0126",
+        nominal_value=Decimal("100.00"),
+        maturity_period=12,
+        initial_interest_rate=Decimal("5.0"),
+        first_interest_period=1,
+        reference_rate_margin=Decimal("0.0"),
+    )
+
+
+def _bondholders(bond: Bond, user_id, n: int) -> list[BondHolder]:
+    return [
+        BondHolder(
+            id=uuid4(),
+            bond_id=bond.id,
+            user_id=user_id,
+            quantity=i + 1,
+            purchase_date=date(2025, 1, n - i),
+        )
+        for i in range(n)
+    ]
+
+
+async def test_requests_one_extra_row(
+    use_case: BondHolderGetPageUseCase,
+    mock_bondholder_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    mock_bondholder_repo.get_page.return_value = []
+    query = BondHolderPageQuery(limit=10)
+
+    await use_case.execute(user=user_dto, query=query)
+
+    mock_bondholder_repo.get_page.assert_called_once_with(
+        user_id=user_dto.id, query=BondHolderPageQuery(limit=11)
+    )
+
+
+async def test_empty_page(
+    use_case: BondHolderGetPageUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    mock_bondholder_repo.get_page.return_value = []
+
+    result = await use_case.execute(user=user_dto, query=BondHolderPageQuery(limit=5))
+
+    assert result == BondHolderPageDTO(items=[])
+    mock_bond_repo.fetch_dict_from_bondholders.assert_not_called()
+
+
+async def test_last_page_has_no_cursor(
+    use_case: BondHolderGetPageUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    user_dto: UserDTO,
+    bond: Bond,
+) -> None:
+    bondholders = _bondholders(bond, user_dto.id, 3)
+    mock_bondholder_repo.get_page.return_value = bondholders
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+
+    result = await use_case.execute(user=user_dto, query=BondHolderPageQuery(limit=3))
+
+    assert [dto.id for dto in result.items] == [bh.id for bh in bondholders]
+    assert result.next_cursor is None
+
+
+async def test_full_page_returns_cursor_of_last_item(
+    use_case: BondHolderGetPageUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    user_dto: UserDTO,
+    bond: Bond,
+) -> None:
+    bondholders = _bondholders(bond, user_dto.id, 4)
+    mock_bondholder_repo.get_page.return_value = bondholders
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+
+    result = await use_case.execute(user=user_dto, query=BondHolderPageQuery(limit=3))
+
+    assert len(result.items) == 3
+    assert result.next_cursor == BondHolderCursor(
+        sort_value=bondholders[2].purchase_date, id=bondholders[2].id
+    )
+    mock_bond_repo.fetch_dict_from_bondholders.assert_called_once_with(
+        bondholders=bondholders[:3]
+    )
+
+
+async def test_cursor_follows_last_row_even_when_left_out(
+    use_case: BondHolderGetPageUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    user_dto: UserDTO,
+    bond: Bond,
+) -> None:
+    bondholders = _bondholders(bond, user_dto.id, 4)
+    bondholders[2].bond_id = uuid4()
+    mock_bondholder_repo.get_page.return_value = bondholders
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+
+    result = await use_case.execute(user=user_dto, query=BondHolderPageQuery(limit=3))
+
+    assert [dto.id for dto in result.items] == [bh.id for bh in bondholders[:2]]
+    assert result.next_cursor == BondHolderCursor(
+        sort_value=bondholders[2].purchase_date, id=bondholders[2].id
+    )
+
+
+async def test_without_limit_returns_all_rows(
+    use_case: BondHolderGetPageUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    user_dto: UserDTO,
+    bond: Bond,
+) -> None:
+    bondholders = _bondholders(bond, user_dto.id, 3)
+    mock_bondholder_repo.get_page.return_value = bondholders
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+
+    result = await use_case.execute(
+        user=user_dto, query=BondHolderPageQuery(limit=None)
+    )
+
+    mock_bondholder_repo.get_page.assert_called_once_with(
+        user_id=user_dto.id, query=BondHolderPageQuery(limit=None)
+    )
+    assert [dto.id for dto in result.items] == [bh.id for bh in bondholders]
+    assert result.next_cursor is None
+
+
+@pytest.mark.parametrize(
+    "sort_by, expected",
+    [
+        (BondHolderSortField.SERIES, "ROR0126"),
+        (BondHolderSortField.QUANTITY, 1),
+        (BondHolderSortField.VALUE, Decimal("100.00")),
+    ],
+)
+async def test_cursor_uses_sort_column_value(
+    use_case: BondHolderGetPageUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    user_dto: UserDTO,
+    bond: Bond,
+    sort_by: BondHolderSortField,
+    expected: object,
+) -> None:
+    bondholders = _bondholders(bond, user_dto.id, 2)
+    mock_bondholder_repo.get_page.return_value = bondholders
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+
+    result = await use_case.execute(
+        user=user_dto, query=BondHolderPageQuery(limit=1, sort_by=sort_by)
+    )
+
+    assert result.next_cursor is not None
+    assert result.next_cursor.sort_value == expected
+
+
+async def test_shared_page_outlives_leader_on_own_repositories(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    user_dto: UserDTO,
+    bond: Bond,
+) -> None:
+    bondholders = _bondholders(bond, user_dto.id, 2)
+    release = asyncio.Event()
+    own_bondholder_repo, own_bond_repo = AsyncMock(), AsyncMock()
+
+    async def slow_get_page(user_id, query) -> list[BondHolder]:
+        await release.wait()
+        return bondholders
+
+    own_bondholder_repo.get_page.side_effect = slow_get_page
+    own_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+    closed: list[bool] = []
+
+    @asynccontextmanager
+    async def detached():
+        yield BondHolderGetPageUseCase(own_bondholder_repo, own_bond_repo)
+        closed.append(True)
+
+    use_case = BondHolderGetPageUseCase(
+        mock_bondholder_repo,
+        mock_bond_repo,
+        single_flight=SingleFlight("bondholder_page", metrics=Metrics()),
+        detached=detached,
+    )
+    query = BondHolderPageQuery(limit=None)
+    leader = asyncio.create_task(use_case.execute(user=user_dto, query=query))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(use_case.execute(user=user_dto, query=query))
+    await asyncio.sleep(0)
+
+    # The leader's client goes away; its request session goes with it.
+    leader.cancel()
+    release.set()
+    result = await follower
+
+    assert [dto.id for dto in result.items] == [bh.id for bh in bondholders]
+    assert closed == [True]
+    mock_bondholder_repo.get_page.assert_not_called()
+    mock_bond_repo.fetch_dict_from_bondholders.assert_not_called()
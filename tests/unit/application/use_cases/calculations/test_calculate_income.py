@@ -224,3 +224,29 @@ async def test_to_dto_method(use_case: CalculateIncomeUseCase) -> None:
 
     assert isinstance(result, MonthlyIncomeResponseDTO)
     assert result.data == income_dict
+
+
+async def test_cached_result_skips_repositories(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    user_mock: Mock,
+) -> None:
+    cached = MonthlyIncomeResponseDTO(data={uuid4(): Decimal("1.00")})
+    result_cache = AsyncMock()
+    result_cache.get_or_compute.return_value = cached
+    use_case = CalculateIncomeUseCase(
+        bh_income_calculator=BondHolderIncomeCalculator(),
+        bondholder_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        reference_rate_repo=mock_reference_rate_repo,
+        result_cache=result_cache,
+    )
+
+    result = await use_case.execute(user=user_mock, target_date=date(2026, 3, 1))
+
+    assert result is cached
+    call = result_cache.get_or_compute.call_args
+    assert call.kwargs["user_id"] == user_mock.id
+    assert call.kwargs["target_date"] == date(2026, 3, 1)
+    mock_bondholder_repo.get_all.assert_not_called()
@@ -0,0 +1,113 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dto.user import UserDTO
+from src.application.use_cases.calculations.calculate_yield import (
+    CalculateYieldUseCase,
+)
+from src.domain.exceptions import NotFoundError
+from src.domain.value_objects.yield_report import HoldingYield, YieldReport
+
+TODAY = date(2026, 3, 31)
+
+
+@pytest.fixture
+def mock_yield_service() -> Mock:
+    return Mock()
+
+
+@pytest.fixture
+def use_case(
+    mock_yield_service: Mock,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+) -> CalculateYieldUseCase:
+    return CalculateYieldUseCase(
+        yield_service=mock_yield_service,
+        bondholder_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        reference_rate_repo=mock_reference_rate_repo,
+    )
+
+
+@pytest.fixture
+def user_dto() -> UserDTO:
+    return UserDTO(id=uuid4(), email="test@example.com", name=None)
+
+
+async def test_execute_analyzes_holdings_with_rate_history(
+    use_case: CalculateYieldUseCase,
+    mock_yield_service: Mock,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    bh = Mock(bond_id=uuid4(), purchase_date=date(2025, 1, 10))
+    bond = Mock()
+    rates = [Mock()]
+    holding = HoldingYield(bondholder_id=uuid4(), series="ROR", irr=Decimal("5.1"))
+    mock_bondholder_repo.get_all.return_value = [bh]
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bh.bond_id: bond}
+    mock_reference_rate_repo.get_between.return_value = rates
+    mock_yield_service.analyze.return_value = YieldReport(
+        holdings=[holding], portfolio_irr=Decimal("5.1")
+    )
+
+    result = await use_case.execute(user_dto, today=TODAY)
+
+    mock_reference_rate_repo.get_between.assert_awaited_once_with(
+        start=date(2025, 1, 10), end=TODAY
+    )
+    mock_yield_service.analyze.assert_called_once_with(
+        holdings=[(bh, bond)], reference_rates=rates
+    )
+    assert result.holdings == [holding]
+    assert result.portfolio_irr == Decimal("5.1")
+
+
+async def test_execute_falls_back_to_latest_rate(
+    use_case: CalculateYieldUseCase,
+    mock_yield_service: Mock,
+    mock_bondholder_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    latest = Mock()
+    mock_bondholder_repo.get_all.return_value = [Mock(purchase_date=TODAY)]
+    mock_reference_rate_repo.get_between.return_value = []
+    mock_reference_rate_repo.get_latest.return_value = latest
+
+    await use_case.execute(user_dto, today=TODAY)
+
+    assert mock_yield_service.analyze.call_args.kwargs["reference_rates"] == [latest]
+
+
+async def test_execute_without_reference_rate(
+    use_case: CalculateYieldUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    mock_bondholder_repo.get_all.return_value = [Mock(purchase_date=TODAY)]
+    mock_reference_rate_repo.get_between.return_value = []
+    mock_reference_rate_repo.get_latest.return_value = None
+
+    with pytest.raises(NotFoundError):
+        await use_case.execute(user_dto, today=TODAY)
+
+
+async def test_execute_without_bondholders(
+    use_case: CalculateYieldUseCase,
+    mock_bondholder_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    mock_bondholder_repo.get_all.return_value = []
+
+    with pytest.raises(NotFoundError):
+        await use_case.execute(user_dto, today=TODAY)
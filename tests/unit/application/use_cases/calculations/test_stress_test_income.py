@@ -0,0 +1,137 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dto.user import UserDTO
+from src.application.use_cases.calculations.stress_test_income import (
+    StressTestIncomeUseCase,
+)
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.entities.reference_rate import ReferenceRate
+from src.domain.exceptions import NotFoundError, ValidationError
+from src.domain.services.analytics.rate_scenarios import RateScenarioService
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.value_objects.rate_scenario import RateScenarioQuery
+
+TODAY = date(2026, 3, 31)
+
+
+@pytest.fixture
+def bond() -> Bond:
+    return Bond(
+        id=uuid4(),
+        series="ROR0126",
+        nominal_value=Decimal("100.00"),
+        maturity_period=24,
+        initial_interest_rate=Decimal("5.0"),
+        first_interest_period=1,
+        reference_rate_margin=Decimal("0.5"),
+    )
+
+
+@pytest.fixture
+def use_case(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    bond: Bond,
+) -> StressTestIncomeUseCase:
+    bh = BondHolder(
+        id=uuid4(),
+        bond_id=bond.id,
+        user_id=uuid4(),
+        quantity=10,
+        purchase_date=date(2026, 1, 15),
+    )
+    mock_bondholder_repo.get_all.return_value = [bh]
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+    mock_reference_rate_repo.get_latest.return_value = ReferenceRate(
+        id=uuid4(), value=Decimal("5.75"), start_date=date(2025, 1, 1)
+    )
+    return StressTestIncomeUseCase(
+        scenario_service=RateScenarioService(BondHolderIncomeCalculator()),
+        bondholder_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        reference_rate_repo=mock_reference_rate_repo,
+        shard_size=100,
+    )
+
+
+@pytest.fixture
+def user_dto() -> UserDTO:
+    return UserDTO(id=uuid4(), email="test@example.com", name=None)
+
+
+async def test_shocks_order_income(
+    use_case: StressTestIncomeUseCase, user_dto: UserDTO
+) -> None:
+    result = await use_case.execute(
+        user_dto, RateScenarioQuery(horizon_months=6, shocks_bp=(-200, 200)), TODAY
+    )
+
+    assert result.base_rate == Decimal("5.75")
+    assert result.paths == 2
+    assert [band.month for band in result.bands] == [
+        date(2026, 3, 1),
+        date(2026, 4, 1),
+        date(2026, 5, 1),
+        date(2026, 6, 1),
+        date(2026, 7, 1),
+        date(2026, 8, 1),
+    ]
+    band = result.bands[-1]
+    assert band.percentiles[5] < band.percentiles[95]
+
+
+async def test_random_walks_are_sharded_across_executor(
+    use_case: StressTestIncomeUseCase, user_dto: UserDTO
+) -> None:
+    scenario = RateScenarioQuery(horizon_months=6, paths=250, seed=11)
+    executor = Mock(wraps=ThreadPoolExecutor(max_workers=2))
+    use_case.executor = executor
+
+    result = await use_case.execute(user_dto, scenario, TODAY)
+
+    assert result.paths == 250
+    assert executor.submit.call_count == 3
+
+
+async def test_random_walks_are_reproducible_with_seed(
+    use_case: StressTestIncomeUseCase, user_dto: UserDTO
+) -> None:
+    scenario = RateScenarioQuery(horizon_months=6, paths=250, seed=11)
+
+    first = await use_case.execute(user_dto, scenario, TODAY)
+    second = await use_case.execute(user_dto, scenario, TODAY)
+
+    assert first.bands == second.bands
+
+
+async def test_requires_reference_rate(
+    use_case: StressTestIncomeUseCase,
+    mock_reference_rate_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    mock_reference_rate_repo.get_latest.return_value = None
+
+    with pytest.raises(NotFoundError):
+        await use_case.execute(user_dto, RateScenarioQuery(shocks_bp=(100,)), TODAY)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"shocks_bp": (100,), "paths": 10},
+        {"shocks_bp": (100,), "horizon_months": 0},
+        {"paths": 10, "volatility_bp": -1},
+    ],
+)
+def test_scenario_query_validation(kwargs: dict) -> None:
+    with pytest.raises(ValidationError):
+        RateScenarioQuery(**kwargs)
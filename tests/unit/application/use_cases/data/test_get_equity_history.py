@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date
 from decimal import Decimal
 from unittest.mock import AsyncMock, Mock
@@ -5,9 +6,15 @@ from uuid import UUID, uuid4
 
 import pytest
 
+from src.application.cache.single_flight import SingleFlight
 from src.application.dto.data import EquityDTO
+from src.application.metrics import Metrics
 from src.application.dto.user import UserDTO
 from src.application.use_cases.data.get_equity_history import GetEquityHistoryUseCase
+from src.domain.exceptions import ValidationError
+from src.domain.value_objects.equity_history_query import EquityHistoryQuery
+from src.domain.value_objects.portfolio_snapshot import PortfolioSnapshot
+from src.domain.value_objects.resource_versions import ResourceVersions
 
 
 @pytest.fixture
@@ -89,8 +96,8 @@ async def test_execute_passes_bondholder_data_to_service(
     bondholder_data = call_args["bondholder_data"]
 
     assert len(bondholder_data) == 2
-    assert bondholder_data[0][1] == nominal_value
-    assert bondholder_data[1][1] == nominal_value
+    assert bondholder_data[0][1].nominal_value == nominal_value
+    assert bondholder_data[1][1].nominal_value == nominal_value
 
 
 async def test_execute_returns_history_data_from_service(
@@ -190,3 +197,314 @@ def test_to_dto_handles_empty_data(
 
     assert isinstance(result, EquityDTO)
     assert result.data == []
+
+
+async def test_concurrent_calls_are_coalesced(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_analytics_service: Mock,
+    user_dto: UserDTO,
+) -> None:
+    release = asyncio.Event()
+
+    async def slow_get_all(user_id: UUID) -> list:
+        await release.wait()
+        return []
+
+    mock_bondholder_repo.get_all.side_effect = slow_get_all
+    use_case = GetEquityHistoryUseCase(
+        bh_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        service=mock_analytics_service,
+        single_flight=SingleFlight("equity", metrics=Metrics()),
+    )
+
+    calls = [asyncio.create_task(use_case.execute(user_dto)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+    first, second = await asyncio.gather(*calls)
+
+    assert first is second
+    mock_bondholder_repo.get_all.assert_called_once_with(user_id=user_dto.id)
+
+
+async def test_calls_on_different_versions_are_not_coalesced(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_analytics_service: Mock,
+    user_dto: UserDTO,
+) -> None:
+    release = asyncio.Event()
+
+    async def slow_get_all(user_id: UUID) -> list:
+        await release.wait()
+        return []
+
+    mock_bondholder_repo.get_all.side_effect = slow_get_all
+    single_flight = SingleFlight("equity", metrics=Metrics())
+    use_cases = [
+        GetEquityHistoryUseCase(
+            bh_repo=mock_bondholder_repo,
+            bond_repo=mock_bond_repo,
+            service=mock_analytics_service,
+            single_flight=single_flight,
+            versions=ResourceVersions(portfolio=portfolio, reference_rate=1),
+        )
+        for portfolio in (1, 2)
+    ]
+
+    calls = [asyncio.create_task(uc.execute(user_dto)) for uc in use_cases]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*calls)
+
+    assert mock_bondholder_repo.get_all.await_count == 2
+
+
+async def test_history_repo_replaces_python_computation(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_analytics_service: Mock,
+    user_dto: UserDTO,
+) -> None:
+    points = [(date(2024, 1, 1), Decimal("1000")), (date.today(), Decimal("3000"))]
+    history_repo = AsyncMock()
+    history_repo.get_equity_history.return_value = points
+    use_case = GetEquityHistoryUseCase(
+        bh_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        service=mock_analytics_service,
+        history_repo=history_repo,
+    )
+
+    result = await use_case.execute(user_dto)
+
+    assert result.data == points
+    history_repo.get_equity_history.assert_awaited_once_with(
+        user_id=user_dto.id, until=date.today()
+    )
+    mock_bondholder_repo.get_all.assert_not_called()
+    mock_analytics_service.get_equity_history.assert_not_called()
+
+
+async def test_snapshots_replace_python_computation(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_analytics_service: Mock,
+    user_dto: UserDTO,
+) -> None:
+    snapshot = PortfolioSnapshot(
+        user_id=user_dto.id,
+        snapshot_date=date(2024, 1, 1),
+        face_value=Decimal("1000"),
+        accrued_interest=Decimal("1.50"),
+        monthly_income=Decimal("4.00"),
+    )
+    points = [(date(2024, 1, 1), Decimal("1000"))]
+    snapshot_repo = AsyncMock()
+    snapshot_repo.get_range.return_value = [snapshot]
+    mock_analytics_service.get_equity_history_from_snapshots.return_value = points
+    use_case = GetEquityHistoryUseCase(
+        bh_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        service=mock_analytics_service,
+        snapshot_repo=snapshot_repo,
+    )
+
+    result = await use_case.execute(user_dto)
+
+    assert result.data == points
+    snapshot_repo.get_range.assert_awaited_once_with(
+        user_id=user_dto.id, end=date.today()
+    )
+    mock_analytics_service.get_equity_history_from_snapshots.assert_called_once_with(
+        face_values=[(date(2024, 1, 1), Decimal("1000"))]
+    )
+    mock_bondholder_repo.get_all.assert_not_called()
+
+
+async def test_missing_snapshots_fall_back_to_holdings(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_analytics_service: Mock,
+    user_dto: UserDTO,
+) -> None:
+    snapshot_repo = AsyncMock()
+    snapshot_repo.get_range.return_value = []
+    mock_bondholder_repo.get_all.return_value = []
+    use_case = GetEquityHistoryUseCase(
+        bh_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        service=mock_analytics_service,
+        snapshot_repo=snapshot_repo,
+    )
+
+    result = await use_case.execute(user_dto)
+
+    assert result.data == []
+    mock_bondholder_repo.get_all.assert_called_once_with(user_id=user_dto.id)
+
+
+async def test_window_is_computed_daily_and_downsampled(
+    use_case: GetEquityHistoryUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_analytics_service: Mock,
+    user_dto: UserDTO,
+) -> None:
+    bh = Mock(bond_id=uuid4(), purchase_date=date(2024, 1, 10))
+    bond = Mock(nominal_value=Decimal("100"))
+    daily = [(date(2024, 1, 10), Decimal("100"))]
+    mock_bondholder_repo.get_all.return_value = [bh]
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bh.bond_id: bond}
+    mock_analytics_service.get_daily_equity.return_value = daily
+    mock_analytics_service.downsample_lttb.return_value = daily
+    query = EquityHistoryQuery(end=date(2024, 3, 1), max_points=50)
+
+    result = await use_case.execute(user_dto, query=query)
+
+    assert result.data == daily
+    mock_analytics_service.get_daily_equity.assert_called_once_with(
+        bondholder_data=[(bh, bond)],
+        start=date(2024, 1, 10),
+        end=date(2024, 3, 1),
+    )
+    mock_analytics_service.downsample_lttb.assert_called_once_with(
+        daily, max_points=50
+    )
+    mock_analytics_service.get_equity_history.assert_not_called()
+
+
+async def test_window_reads_snapshots_in_range(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_analytics_service: Mock,
+    user_dto: UserDTO,
+) -> None:
+    snapshot = PortfolioSnapshot(
+        user_id=user_dto.id,
+        snapshot_date=date(2024, 2, 1),
+        face_value=Decimal("1000"),
+        accrued_interest=Decimal("0"),
+        monthly_income=Decimal("0"),
+    )
+    snapshot_repo = AsyncMock()
+    snapshot_repo.get_range.return_value = [snapshot]
+    mock_analytics_service.downsample_lttb.side_effect = lambda points, max_points: (
+        points
+    )
+    use_case = GetEquityHistoryUseCase(
+        bh_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        service=mock_analytics_service,
+        snapshot_repo=snapshot_repo,
+    )
+    query = EquityHistoryQuery(start=date(2024, 1, 1), end=date(2024, 3, 1))
+
+    await use_case.execute(user_dto, query=query)
+
+    snapshot_repo.get_range.assert_awaited_once_with(
+        user_id=user_dto.id, end=date(2024, 3, 1), start=date(2024, 1, 1)
+    )
+    mock_analytics_service.get_daily_equity_from_snapshots.assert_called_once_with(
+        face_values=[(date(2024, 2, 1), Decimal("1000"))],
+        start=date(2024, 1, 1),
+        end=date(2024, 3, 1),
+    )
+    mock_bondholder_repo.get_all.assert_not_called()
+
+
+async def test_inverted_window_raises_validation_error(
+    use_case: GetEquityHistoryUseCase,
+    user_dto: UserDTO,
+) -> None:
+    query = EquityHistoryQuery(start=date(2024, 3, 1), end=date(2024, 1, 1))
+
+    with pytest.raises(ValidationError):
+        await use_case.execute(user_dto, query=query)
+
+
+async def test_window_is_cached_separately(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_analytics_service: Mock,
+    user_dto: UserDTO,
+) -> None:
+    result_cache = AsyncMock()
+    use_case = GetEquityHistoryUseCase(
+        bh_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        service=mock_analytics_service,
+        result_cache=result_cache,
+    )
+    query = EquityHistoryQuery(start=date(2024, 1, 1), max_points=10)
+
+    await use_case.execute(user_dto, query=query)
+
+    assert result_cache.get_or_compute.call_args.kwargs["variant"] == (
+        "2024-01-01:None:10:0"
+    )
+
+
+async def test_accrued_window_uses_valuation_engine(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    mock_analytics_service: Mock,
+    user_dto: UserDTO,
+) -> None:
+    bh = Mock(bond_id=uuid4(), purchase_date=date(2024, 1, 10))
+    bond = Mock(nominal_value=Decimal("100"))
+    snapshot = PortfolioSnapshot(
+        user_id=user_dto.id,
+        snapshot_date=date(2024, 2, 1),
+        face_value=Decimal("1000"),
+        accrued_interest=Decimal("2.50"),
+        monthly_income=Decimal("4.00"),
+    )
+    valuation_service = Mock()
+    valuation_service.value_daily.return_value = [snapshot]
+    mock_bondholder_repo.get_all.return_value = [bh]
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bh.bond_id: bond}
+    mock_reference_rate_repo.get_between.return_value = []
+    mock_analytics_service.downsample_lttb.side_effect = lambda points, max_points: (
+        points
+    )
+    use_case = GetEquityHistoryUseCase(
+        bh_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        service=mock_analytics_service,
+        reference_rate_repo=mock_reference_rate_repo,
+        valuation_service=valuation_service,
+    )
+    query = EquityHistoryQuery(
+        start=date(2024, 2, 1), end=date(2024, 2, 1), include_accrued=True
+    )
+
+    result = await use_case.execute(user_dto, query=query)
+
+    assert result.data == [(date(2024, 2, 1), Decimal("1002.50"))]
+    mock_reference_rate_repo.get_between.assert_awaited_once_with(
+        start=date(2024, 1, 10), end=date(2024, 2, 1)
+    )
+    valuation_service.value_daily.assert_called_once_with(
+        user_id=user_dto.id,
+        holdings=[(bh, bond)],
+        reference_rates=[],
+        start=date(2024, 2, 1),
+        end=date(2024, 2, 1),
+    )
+
+
+async def test_accrued_window_requires_valuation_engine(
+    use_case: GetEquityHistoryUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    bh = Mock(bond_id=uuid4(), purchase_date=date(2024, 1, 10))
+    mock_bondholder_repo.get_all.return_value = [bh]
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bh.bond_id: Mock()}
+
+    with pytest.raises(ValidationError):
+        await use_case.execute(user_dto, query=EquityHistoryQuery(include_accrued=True))
@@ -0,0 +1,89 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dto.user import UserDTO
+from src.application.use_cases.data.get_upcoming_payments import (
+    GetUpcomingPaymentsUseCase,
+)
+from src.domain.exceptions import ValidationError
+from src.domain.value_objects.scheduled_payment import ScheduledPayment
+
+
+@pytest.fixture
+def mock_schedule_service() -> Mock:
+    return Mock()
+
+
+@pytest.fixture
+def use_case(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    mock_schedule_service: Mock,
+) -> GetUpcomingPaymentsUseCase:
+    return GetUpcomingPaymentsUseCase(
+        bh_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        reference_rate_repo=mock_reference_rate_repo,
+        service=mock_schedule_service,
+    )
+
+
+@pytest.fixture
+def user_dto() -> UserDTO:
+    return UserDTO(id=uuid4(), email="test@example.com", name=None)
+
+
+async def test_execute_returns_empty_when_no_bondholders(
+    use_case: GetUpcomingPaymentsUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_schedule_service: Mock,
+    user_dto: UserDTO,
+) -> None:
+    mock_bondholder_repo.get_all.return_value = []
+
+    result = await use_case.execute(user_dto, limit=5)
+
+    assert result.payments == []
+    mock_schedule_service.upcoming.assert_not_called()
+
+
+async def test_execute_merges_holdings_at_latest_rate(
+    use_case: GetUpcomingPaymentsUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    mock_schedule_service: Mock,
+    user_dto: UserDTO,
+) -> None:
+    bh = Mock(bond_id=uuid4())
+    bond = Mock()
+    rate = Mock()
+    payment = ScheduledPayment(
+        payment_date=date(2024, 2, 15),
+        bondholder_id=uuid4(),
+        series="ROR0126",
+        amount=Decimal("3.24"),
+    )
+    mock_bondholder_repo.get_all.return_value = [bh]
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bh.bond_id: bond}
+    mock_reference_rate_repo.get_latest.return_value = rate
+    mock_schedule_service.upcoming.return_value = [payment]
+
+    result = await use_case.execute(user_dto, limit=5, after=date(2024, 2, 1))
+
+    assert result.payments == [payment]
+    mock_schedule_service.upcoming.assert_called_once_with(
+        holdings=[(bh, bond)], after=date(2024, 2, 1), limit=5, reference_rate=rate
+    )
+
+
+async def test_execute_rejects_non_positive_limit(
+    use_case: GetUpcomingPaymentsUseCase, user_dto: UserDTO
+) -> None:
+    with pytest.raises(ValidationError):
+        await use_case.execute(user_dto, limit=0)
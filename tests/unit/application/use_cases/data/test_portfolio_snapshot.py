@@ -0,0 +1,308 @@
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.data.portfolio_snapshot import (
+    RefreshPortfolioSnapshotUseCase,
+    RefreshStalePortfolioSnapshotsUseCase,
+    RevaluePortfolioSnapshotsUseCase,
+)
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.entities.reference_rate import ReferenceRate
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.services.portfolio_valuation import PortfolioValuationService
+from src.domain.value_objects.live_update import PortfolioRevalued
+from src.domain.value_objects.portfolio_snapshot import PortfolioSnapshot
+
+TODAY = date(2026, 3, 31)
+
+
+@pytest.fixture
+def mock_snapshot_repo() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_valuation_service() -> Mock:
+    return Mock()
+
+
+@pytest.fixture
+def use_case(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    mock_snapshot_repo: AsyncMock,
+    mock_valuation_service: Mock,
+) -> RefreshPortfolioSnapshotUseCase:
+    return RefreshPortfolioSnapshotUseCase(
+        bondholder_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        reference_rate_repo=mock_reference_rate_repo,
+        snapshot_repo=mock_snapshot_repo,
+        valuation_service=mock_valuation_service,
+    )
+
+
+def _snapshot(day: date) -> PortfolioSnapshot:
+    return PortfolioSnapshot(
+        user_id=uuid4(),
+        snapshot_date=day,
+        face_value=Decimal("100"),
+        accrued_interest=Decimal("0"),
+        monthly_income=Decimal("0"),
+    )
+
+
+async def test_refresh_rewrites_from_affected_date(
+    use_case: RefreshPortfolioSnapshotUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    mock_snapshot_repo: AsyncMock,
+    mock_valuation_service: Mock,
+    bond: Bond,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    user_id = uuid4()
+    bh = make_bondholder(bond, date(2026, 1, 10))
+    snapshots = [_snapshot(date(2026, 3, 1)), _snapshot(date(2026, 3, 2))]
+    mock_bondholder_repo.get_all.return_value = [bh]
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+    mock_reference_rate_repo.get_between.return_value = []
+    mock_valuation_service.value_daily.return_value = snapshots
+
+    written = await use_case.execute(
+        user_id=user_id, from_date=date(2026, 3, 1), until=TODAY
+    )
+
+    assert written == 2
+    mock_valuation_service.value_daily.assert_called_once_with(
+        user_id=user_id,
+        holdings=[(bh, bond)],
+        reference_rates=[],
+        start=date(2026, 3, 1),
+        end=TODAY,
+    )
+    mock_reference_rate_repo.get_between.assert_awaited_once_with(
+        start=date(2026, 1, 10), end=TODAY
+    )
+    mock_snapshot_repo.replace_from.assert_awaited_once_with(
+        user_id=user_id, from_date=date(2026, 3, 1), snapshots=snapshots
+    )
+
+
+async def test_refresh_starts_at_first_purchase(
+    use_case: RefreshPortfolioSnapshotUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    mock_snapshot_repo: AsyncMock,
+    mock_valuation_service: Mock,
+    bond: Bond,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    mock_bondholder_repo.get_all.return_value = [
+        make_bondholder(bond, date(2026, 2, 1))
+    ]
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+    mock_reference_rate_repo.get_between.return_value = []
+    mock_valuation_service.value_daily.return_value = []
+
+    await use_case.execute(user_id=uuid4(), from_date=date(2026, 1, 1), until=TODAY)
+
+    assert mock_valuation_service.value_daily.call_args.kwargs["start"] == date(
+        2026, 2, 1
+    )
+    mock_reference_rate_repo.get_between.assert_awaited_once_with(
+        start=date(2026, 2, 1), end=TODAY
+    )
+    assert mock_snapshot_repo.replace_from.call_args.kwargs["from_date"] == date(
+        2026, 1, 1
+    )
+
+
+async def test_refresh_mid_period_uses_rate_of_period_start(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    mock_snapshot_repo: AsyncMock,
+    bond: Bond,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    # The period from 10 Feb pays the rate replaced on 15 Feb.
+    rates = [
+        ReferenceRate.create(
+            value=Decimal("5.0"),
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 2, 14),
+        ),
+        ReferenceRate.create(
+            value=Decimal("6.0"), start_date=date(2026, 2, 15), end_date=None
+        ),
+    ]
+
+    async def get_between(start: date, end: date) -> list[ReferenceRate]:
+        return [
+            r
+            for r in rates
+            if r.start_date <= end and (r.end_date is None or r.end_date >= start)
+        ]
+
+    bh = make_bondholder(bond, date(2026, 1, 10))
+    mock_bondholder_repo.get_all.return_value = [bh]
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+    mock_reference_rate_repo.get_between.side_effect = get_between
+    valuation_service = PortfolioValuationService(BondHolderIncomeCalculator())
+    use_case = RefreshPortfolioSnapshotUseCase(
+        bondholder_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        reference_rate_repo=mock_reference_rate_repo,
+        snapshot_repo=mock_snapshot_repo,
+        valuation_service=valuation_service,
+    )
+
+    await use_case.execute(user_id=bh.user_id, from_date=date(2026, 3, 1), until=TODAY)
+
+    snapshots = mock_snapshot_repo.replace_from.call_args.kwargs["snapshots"]
+    expected = valuation_service.value_daily(
+        user_id=bh.user_id,
+        holdings=[(bh, bond)],
+        reference_rates=rates,
+        start=date(2026, 1, 10),
+        end=TODAY,
+    )
+    assert snapshots[0].monthly_income > 0
+    assert snapshots[0].accrued_interest > 0
+    assert snapshots == expected[-len(snapshots) :]
+
+
+async def test_refresh_without_holdings_clears_snapshots(
+    use_case: RefreshPortfolioSnapshotUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_snapshot_repo: AsyncMock,
+    mock_valuation_service: Mock,
+) -> None:
+    user_id = uuid4()
+    mock_bondholder_repo.get_all.return_value = []
+
+    written = await use_case.execute(
+        user_id=user_id, from_date=date(2026, 3, 1), until=TODAY
+    )
+
+    assert written == 0
+    mock_snapshot_repo.replace_from.assert_awaited_once_with(
+        user_id=user_id, from_date=date.min, snapshots=[]
+    )
+    mock_valuation_service.value_daily.assert_not_called()
+
+
+async def test_refresh_stale_extends_each_user(
+    mock_snapshot_repo: AsyncMock,
+) -> None:
+    refresh_use_case = AsyncMock()
+    known, new = uuid4(), uuid4()
+    mock_snapshot_repo.get_stale_users.return_value = [
+        (known, date(2026, 3, 29)),
+        (new, None),
+    ]
+    use_case = RefreshStalePortfolioSnapshotsUseCase(
+        snapshot_repo=mock_snapshot_repo, refresh_use_case=refresh_use_case
+    )
+
+    refreshed = await use_case.execute(today=TODAY)
+
+    assert refreshed == 2
+    mock_snapshot_repo.get_stale_users.assert_awaited_once_with(as_of=TODAY)
+    assert [c.kwargs for c in refresh_use_case.execute.await_args_list] == [
+        {"user_id": known, "from_date": date(2026, 3, 30), "until": TODAY},
+        {"user_id": new, "from_date": date.min, "until": TODAY},
+    ]
+
+
+async def test_refresh_announces_revaluation(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    mock_snapshot_repo: AsyncMock,
+    mock_valuation_service: Mock,
+    bond: Bond,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    publisher = AsyncMock()
+    use_case = RefreshPortfolioSnapshotUseCase(
+        bondholder_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        reference_rate_repo=mock_reference_rate_repo,
+        snapshot_repo=mock_snapshot_repo,
+        valuation_service=mock_valuation_service,
+        update_publisher=publisher,
+    )
+    user_id = uuid4()
+    mock_snapshot_repo.get_latest.return_value = _snapshot(date(2026, 3, 30))
+    latest = PortfolioSnapshot(
+        user_id=user_id,
+        snapshot_date=TODAY,
+        face_value=Decimal("300"),
+        accrued_interest=Decimal("1.50"),
+        monthly_income=Decimal("2.25"),
+    )
+    mock_bondholder_repo.get_all.return_value = [
+        make_bondholder(bond, date(2026, 1, 1))
+    ]
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+    mock_reference_rate_repo.get_between.return_value = []
+    mock_valuation_service.value_daily.return_value = [latest]
+
+    await use_case.execute(user_id=user_id, from_date=date(2026, 3, 1), until=TODAY)
+
+    mock_snapshot_repo.get_latest.assert_awaited_once_with(user_id=user_id, until=TODAY)
+    publisher.publish.assert_awaited_once_with(
+        PortfolioRevalued(
+            user_id=user_id,
+            as_of=TODAY,
+            equity=Decimal("300"),
+            monthly_income=Decimal("2.25"),
+            equity_delta=Decimal("200"),
+            monthly_income_delta=Decimal("2.25"),
+        )
+    )
+
+
+async def test_refresh_without_publisher_skips_latest_lookup(
+    use_case: RefreshPortfolioSnapshotUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_snapshot_repo: AsyncMock,
+) -> None:
+    mock_bondholder_repo.get_all.return_value = []
+
+    await use_case.execute(user_id=uuid4(), from_date=date(2026, 3, 1), until=TODAY)
+
+    mock_snapshot_repo.get_latest.assert_not_awaited()
+
+
+async def test_revalue_refreshes_every_holder_from_rate_date(
+    mock_snapshot_repo: AsyncMock,
+) -> None:
+    refresh_use_case = AsyncMock()
+    first, second = uuid4(), uuid4()
+    mock_snapshot_repo.get_stale_users.return_value = [
+        (first, TODAY),
+        (second, None),
+    ]
+    use_case = RevaluePortfolioSnapshotsUseCase(
+        snapshot_repo=mock_snapshot_repo, refresh_use_case=refresh_use_case
+    )
+
+    revalued = await use_case.execute(from_date=date(2026, 3, 15), today=TODAY)
+
+    assert revalued == 2
+    assert [c.kwargs for c in refresh_use_case.execute.await_args_list] == [
+        {"user_id": first, "from_date": date(2026, 3, 15), "until": TODAY},
+        {"user_id": second, "from_date": date(2026, 3, 15), "until": TODAY},
+    ]
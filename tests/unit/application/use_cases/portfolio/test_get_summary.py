@@ -0,0 +1,149 @@
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dto.user import UserDTO
+from src.application.use_cases.portfolio.get_summary import GetPortfolioSummaryUseCase
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.services.analytics.analytics_service import AnalyticsService
+
+TODAY = date(2026, 3, 31)
+
+
+@pytest.fixture
+def mock_income_calculator() -> Mock:
+    calculator = Mock()
+    calculator.calculate_monthly_bh_income.return_value = Decimal("4.125")
+    return calculator
+
+
+@pytest.fixture
+def use_case(
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    mock_income_calculator: Mock,
+) -> GetPortfolioSummaryUseCase:
+    return GetPortfolioSummaryUseCase(
+        bh_repo=mock_bondholder_repo,
+        bond_repo=mock_bond_repo,
+        reference_rate_repo=mock_reference_rate_repo,
+        income_calculator=mock_income_calculator,
+        analytics_service=AnalyticsService(),
+    )
+
+
+@pytest.fixture
+def user_dto() -> UserDTO:
+    return UserDTO(id=uuid4(), email="test@example.com", name=None)
+
+
+def _bond(series: str) -> Bond:
+    return Bond(
+        id=uuid4(),
+        series=series,
+        nominal_value=Decimal("100.00"),
+        maturity_period=12,
+        initial_interest_rate=Decimal("5.0"),
+        first_interest_period=1,
+        reference_rate_margin=Decimal("0.0"),
+    )
+
+
+async def test_execute_loads_holdings_once(
+    use_case: GetPortfolioSummaryUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    user_dto: UserDTO,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    ror, dor = _bond("ROR0126"), _bond("DOR0128")
+    bhs = [
+        make_bondholder(ror, date(2026, 1, 1), 10),
+        make_bondholder(ror, date(2026, 2, 1), 5),
+        make_bondholder(dor, date(2026, 3, 1), 2),
+    ]
+    mock_bondholder_repo.get_all.return_value = bhs
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {
+        ror.id: ror,
+        dor.id: dor,
+    }
+
+    result = await use_case.execute(user_dto, target_date=TODAY, max_points=500)
+
+    mock_bondholder_repo.get_all.assert_awaited_once_with(user_id=user_dto.id)
+    mock_bond_repo.fetch_dict_from_bondholders.assert_awaited_once()
+    mock_reference_rate_repo.get_by_date.assert_awaited_once_with(target_date=TODAY)
+    assert [h.id for h in result.holdings] == [bh.id for bh in bhs]
+    assert result.month_income == {bh.id: Decimal("4.13") for bh in bhs}
+    assert [
+        (t.series, t.quantity, t.face_value, t.month_income) for t in result.totals
+    ] == [
+        ("DOR0128", 2, Decimal("200.00"), Decimal("4.13")),
+        ("ROR0126", 15, Decimal("1500.00"), Decimal("8.26")),
+    ]
+    assert result.equity[0] == (date(2026, 1, 1), Decimal("1000.00"))
+    assert result.equity[-1] == (TODAY, Decimal("1700.00"))
+
+
+async def test_execute_without_reference_rate_skips_income(
+    use_case: GetPortfolioSummaryUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    mock_reference_rate_repo: AsyncMock,
+    mock_income_calculator: Mock,
+    user_dto: UserDTO,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    bond = _bond("ROR0126")
+    mock_bondholder_repo.get_all.return_value = [
+        make_bondholder(bond, date(2026, 1, 1), 10)
+    ]
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+    mock_reference_rate_repo.get_by_date.return_value = None
+
+    result = await use_case.execute(user_dto, target_date=TODAY, max_points=500)
+
+    assert result.month_income == {}
+    assert result.totals[0].month_income is None
+    mock_income_calculator.calculate_monthly_bh_income.assert_not_called()
+
+
+async def test_execute_downsamples_equity(
+    use_case: GetPortfolioSummaryUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    user_dto: UserDTO,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    bond = _bond("ROR0126")
+    mock_bondholder_repo.get_all.return_value = [
+        make_bondholder(bond, date(2024, 1, 1), 10),
+        make_bondholder(bond, date(2025, 1, 1), 10),
+    ]
+    mock_bond_repo.fetch_dict_from_bondholders.return_value = {bond.id: bond}
+
+    result = await use_case.execute(user_dto, target_date=TODAY, max_points=10)
+
+    assert len(result.equity) == 10
+
+
+async def test_execute_empty_portfolio(
+    use_case: GetPortfolioSummaryUseCase,
+    mock_bondholder_repo: AsyncMock,
+    mock_bond_repo: AsyncMock,
+    user_dto: UserDTO,
+) -> None:
+    mock_bondholder_repo.get_all.return_value = []
+
+    result = await use_case.execute(user_dto, target_date=TODAY, max_points=500)
+
+    assert result.holdings == []
+    assert result.equity == []
+    mock_bond_repo.fetch_dict_from_bondholders.assert_not_awaited()
@@ -12,6 +12,7 @@ from src.adapters.outbound.external_services.nbp.nbp_data_provider import (
 from src.adapters.outbound.external_services.nbp.parser import NBPXMLParser
 from src.application.use_cases.reference_rate.update import UpdateReferenceRateUseCase
 from src.domain.entities.reference_rate import ReferenceRate as ReferenceRateEntity
+from src.domain.value_objects.live_update import ReferenceRateChanged
 
 
 @pytest.fixture
@@ -62,6 +63,38 @@ async def test_no_rate_in_db_saves_new_rate(
     mock_reference_rate_repo.update.assert_not_called()
 
 
+async def test_new_rate_announced(
+    mock_reference_rate_repo: AsyncMock,
+    nbp_provider_mock: AsyncMock,
+) -> None:
+    publisher = AsyncMock()
+    use_case = UpdateReferenceRateUseCase(
+        reference_rate_repo=mock_reference_rate_repo,
+        rate_provider=nbp_provider_mock,
+        update_publisher=publisher,
+    )
+    nbp_provider_mock.get_current_rate.return_value = (
+        Decimal("5.75"),
+        date(2025, 1, 15),
+    )
+    mock_reference_rate_repo.get_latest.return_value = None
+
+    await use_case.execute()
+
+    publisher.publish.assert_awaited_once_with(
+        ReferenceRateChanged(value=Decimal("5.75"), effective_date=date(2025, 1, 15))
+    )
+
+    publisher.reset_mock()
+    mock_reference_rate_repo.get_latest.return_value = ReferenceRateEntity(
+        id=uuid4(), value=Decimal("5.75"), start_date=date(2025, 1, 15), end_date=None
+    )
+
+    await use_case.execute()
+
+    publisher.publish.assert_not_awaited()
+
+
 async def test_rate_not_changed(
     use_case: UpdateReferenceRateUseCase,
     nbp_provider_mock: AsyncMock,
@@ -3,8 +3,9 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 
 from src.application.dto.token import TokenDTO
+from src.application.login_throttle import LoginThrottle
 from src.application.use_cases.user.login import UserLoginUseCase
-from src.domain.exceptions import AuthenticationError
+from src.domain.exceptions import AuthenticationError, RateLimitExceededError
 from src.domain.ports.services.password_hasher import PasswordHasher
 
 
@@ -194,3 +195,43 @@ async def test_pass_hasher_to_verify_password(
     user_entity_mock.verify_password.assert_called_once_with(
         hasher=custom_hasher, plain_password=sample_form_data.password
     )
+
+
+async def test_throttle_checked_with_client_ip(
+    mock_user_repo: AsyncMock,
+    mock_hasher: AsyncMock,
+    mock_token_handler: Mock,
+    sample_form_data: Mock,
+    user_entity_mock: Mock,
+    sample_token: Mock,
+) -> None:
+    throttle = AsyncMock(spec=LoginThrottle)
+    use_case = UserLoginUseCase(
+        mock_user_repo, mock_hasher, mock_token_handler, throttle=throttle
+    )
+    mock_user_repo.get_user_by_email.return_value = user_entity_mock
+    user_entity_mock.verify_password.return_value = True
+    mock_token_handler.create_token.return_value = sample_token
+
+    await use_case.execute(sample_form_data, client_ip="10.0.0.1")
+
+    throttle.check.assert_awaited_once_with("10.0.0.1", sample_form_data.username)
+
+
+async def test_throttled_login_skips_password_check(
+    mock_user_repo: AsyncMock,
+    mock_hasher: AsyncMock,
+    mock_token_handler: Mock,
+    sample_form_data: Mock,
+) -> None:
+    throttle = AsyncMock(spec=LoginThrottle)
+    throttle.check.side_effect = RateLimitExceededError("Too many", retry_after=30)
+    use_case = UserLoginUseCase(
+        mock_user_repo, mock_hasher, mock_token_handler, throttle=throttle
+    )
+
+    with pytest.raises(RateLimitExceededError):
+        await use_case.execute(sample_form_data, client_ip="10.0.0.1")
+
+    mock_user_repo.get_user_by_email.assert_not_called()
+    mock_hasher.verify.assert_not_called()
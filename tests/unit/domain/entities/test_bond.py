@@ -89,18 +89,14 @@ def test_bond_validate(monkeypatch: pytest.MonkeyPatch, local_bond: Bond) -> Non
     mock_validate_initial_interest_rate = MagicMock()
     mock_validate_types = MagicMock()
 
+    monkeypatch.setattr(Bond, "_validate_nominal_value", mock_validate_nominal_value)
     monkeypatch.setattr(
-        local_bond, "_validate_nominal_value", mock_validate_nominal_value
+        Bond, "_validate_maturity_period", mock_validate_maturity_period
     )
     monkeypatch.setattr(
-        local_bond, "_validate_maturity_period", mock_validate_maturity_period
+        Bond, "_validate_initial_interest_rate", mock_validate_initial_interest_rate
     )
-    monkeypatch.setattr(
-        local_bond,
-        "_validate_initial_interest_rate",
-        mock_validate_initial_interest_rate,
-    )
-    monkeypatch.setattr(local_bond, "_validate_types", mock_validate_types)
+    monkeypatch.setattr(Bond, "_validate_types", mock_validate_types)
 
     local_bond.validate()
 
@@ -165,3 +161,9 @@ def test_validate_initial_interest_rate_failure(local_bond: Bond) -> None:
         ValidationError, match="Bond initial_interest_rate must be greater than 0."
     ):
         local_bond._validate_initial_interest_rate()
+
+
+def test_bond_is_slotted(local_bond: Bond) -> None:
+    assert not hasattr(local_bond, "__dict__")
+    with pytest.raises(AttributeError):
+        local_bond.coupon = Decimal(1)  # type: ignore[attr-defined]
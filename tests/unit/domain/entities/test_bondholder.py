@@ -5,7 +5,11 @@ from uuid import uuid4, UUID
 import pytest
 
 from src.domain.entities.bondholder import BondHolder as BondHolderEntity
-from src.domain.events.bondholder_events import BondHolderDeletedEvent
+from src.domain.events.bondholder_events import (
+    BondHolderCreatedEvent,
+    BondHolderDeletedEvent,
+    BondHolderQuantityChangedEvent,
+)
 from src.domain.exceptions import ValidationError
 
 
@@ -28,6 +32,27 @@ def test_bondholder_change_quantity_success(
     assert local_bondholder.quantity == new_quantity
 
 
+def test_bondholder_change_quantity_records_event(
+    local_bondholder: BondHolderEntity,
+) -> None:
+    local_bondholder.change_quantity(300)
+
+    [event] = local_bondholder.collect_events()
+    assert isinstance(event, BondHolderQuantityChangedEvent)
+    assert event.bondholder_id == local_bondholder.id
+    assert event.user_id == local_bondholder.user_id
+    assert event.old_quantity == 100
+    assert event.new_quantity == 300
+
+
+def test_bondholder_change_quantity_same_value_records_no_event(
+    local_bondholder: BondHolderEntity,
+) -> None:
+    local_bondholder.change_quantity(local_bondholder.quantity)
+
+    assert local_bondholder.collect_events() == []
+
+
 def test_bondholder_change_quantity_type_error(
     local_bondholder: BondHolderEntity,
 ) -> None:
@@ -56,6 +81,7 @@ def test_bondholder_mark_as_deleted(
     assert local_bondholder.bond_id == event.bond_id
     assert local_bondholder.user_id == event.user_id
     assert user_email == event.email
+    assert local_bondholder.purchase_date == event.purchase_date
 
 
 def test_bondholder_collect_events(local_bondholder: BondHolderEntity) -> None:
@@ -64,9 +90,10 @@ def test_bondholder_collect_events(local_bondholder: BondHolderEntity) -> None:
         bond_id=uuid4(),
         user_id=uuid4(),
         email="test_user_email@email.com",
+        purchase_date=date(2025, 1, 1),
         occurred_at=datetime.now(timezone.utc),
     )
-    local_bondholder._events.append(bh_event)
+    local_bondholder._record(bh_event)
 
     events = local_bondholder.collect_events()
     assert len(events) == 1
@@ -99,12 +126,17 @@ def test_bondholder_create(
 
     mock_validate.assert_called_once()
 
+    [event] = new_bh.collect_events()
+    assert isinstance(event, BondHolderCreatedEvent)
+    assert event.bondholder_id == new_bh.id
+    assert event.user_id == new_bh.user_id
+
 
 def test_bondholder_validate(
     local_bondholder: BondHolderEntity, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     mock_validate_quantity = MagicMock()
-    monkeypatch.setattr(local_bondholder, "_validate_quantity", mock_validate_quantity)
+    monkeypatch.setattr(BondHolderEntity, "_validate_quantity", mock_validate_quantity)
 
     local_bondholder.validate()
 
@@ -126,3 +158,50 @@ def test_validate_quantity_zero_quantity(local_bondholder: BondHolderEntity) ->
     local_bondholder.quantity = 0
     with pytest.raises(ValidationError, match="Quantity must be positive"):
         local_bondholder._validate_quantity()
+
+
+def test_payment_dates_are_monthly_until_maturity(
+    local_bondholder: BondHolderEntity,
+) -> None:
+    local_bondholder.purchase_date = date(2024, 1, 31)
+
+    dates = list(local_bondholder.payment_dates(maturity_period=3))
+
+    assert dates == [date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30)]
+
+
+def test_payment_dates_skip_payments_up_to_after(
+    local_bondholder: BondHolderEntity,
+) -> None:
+    local_bondholder.purchase_date = date(2024, 1, 15)
+
+    dates = local_bondholder.payment_dates(
+        maturity_period=120, after=date(2030, 6, 15)
+    )
+
+    assert next(dates) == date(2030, 7, 15)
+    assert next(dates) == date(2030, 8, 15)
+
+
+def test_payment_dates_empty_after_maturity(
+    local_bondholder: BondHolderEntity,
+) -> None:
+    local_bondholder.purchase_date = date(2024, 1, 15)
+
+    dates = local_bondholder.payment_dates(maturity_period=12, after=date(2025, 1, 15))
+
+    assert list(dates) == []
+
+
+def test_bondholder_is_slotted_and_keeps_events_per_instance() -> None:
+    first = BondHolderEntity.create(
+        bond_id=uuid4(), user_id=uuid4(), quantity=1, purchase_date=date(2024, 1, 1)
+    )
+    second = BondHolderEntity.create(
+        bond_id=uuid4(), user_id=uuid4(), quantity=1, purchase_date=date(2024, 1, 1)
+    )
+
+    assert not hasattr(first, "__dict__")
+    assert len(first.collect_events()) == 1
+    assert first.collect_events() == []
+    assert len(second.collect_events()) == 1
@@ -5,8 +5,23 @@ from uuid import uuid4
 
 import pytest
 
+from src.domain.entities.bond import Bond
 from src.domain.entities.bondholder import BondHolder
 from src.domain.services.analytics.analytics_service import AnalyticsService
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.services.portfolio_valuation import PortfolioValuationService
+
+def _bond(nominal_value: Decimal, maturity_period: int = 12) -> Bond:
+    return Bond(
+        id=uuid4(),
+        series="ROR1111",
+        nominal_value=nominal_value,
+        maturity_period=maturity_period,
+        initial_interest_rate=Decimal("4.75"),
+        first_interest_period=1,
+        reference_rate_margin=Decimal("0.1"),
+    )
+
 
 def _create_bondholder(purchase_date: date, quantity: int) -> BondHolder:
     return BondHolder(
@@ -140,7 +155,7 @@ def test_get_equity_history_returns_zero_equity_before_any_purchase(
 
     with patch("src.domain.services.analytics.analytics_service.datetime") as mock_dt:
         mock_dt.now.return_value.date.return_value = today
-        result = service.get_equity_history([(bh, face_value)])
+        result = service.get_equity_history([(bh, _bond(face_value))])
 
     # первая точка — дата покупки, equity уже включает её
     assert result[0][1] == Decimal("10000")
@@ -157,7 +172,7 @@ def test_get_equity_history_equity_grows_when_bondholder_added_later(
     with patch("src.domain.services.analytics.analytics_service.datetime") as mock_dt:
         mock_dt.now.return_value.date.return_value = today
         result = service.get_equity_history(
-            [(early_bh, face_value), (late_bh, face_value)]
+            [(early_bh, _bond(face_value)), (late_bh, _bond(face_value))]
         )
 
     first_equity = result[0][1]
@@ -176,7 +191,7 @@ def test_get_equity_history_equity_never_decreases(
     with patch("src.domain.services.analytics.analytics_service.datetime") as mock_dt:
         mock_dt.now.return_value.date.return_value = today
         result = service.get_equity_history(
-            [(bh1, face_value), (bh2, face_value)]
+            [(bh1, _bond(face_value)), (bh2, _bond(face_value))]
         )
 
     equities = [equity for _, equity in result]
@@ -194,7 +209,7 @@ def test_get_equity_history_total_equity_equals_sum_of_all_bondholders(
     with patch("src.domain.services.analytics.analytics_service.datetime") as mock_dt:
         mock_dt.now.return_value.date.return_value = today
         result = service.get_equity_history(
-            [(bh1, face_value), (bh2, face_value)]
+            [(bh1, _bond(face_value)), (bh2, _bond(face_value))]
         )
 
     expected_total = (bh1.quantity + bh2.quantity) * face_value
@@ -213,7 +228,7 @@ def test_get_equity_history_bondholders_with_same_purchase_date_accumulated_in_o
     with patch("src.domain.services.analytics.analytics_service.datetime") as mock_dt:
         mock_dt.now.return_value.date.return_value = today
         result = service.get_equity_history(
-            [(bh1, face_value), (bh2, face_value)]
+            [(bh1, _bond(face_value)), (bh2, _bond(face_value))]
         )
     assert result[0][1] == Decimal("500")
 
@@ -229,8 +244,208 @@ def test_get_equity_history_result_is_sorted_by_date(
     with patch("src.domain.services.analytics.analytics_service.datetime") as mock_dt:
         mock_dt.now.return_value.date.return_value = today
         result = service.get_equity_history(
-            [(bh1, face_value), (bh2, face_value)]
+            [(bh1, _bond(face_value)), (bh2, _bond(face_value))]
         )
 
     dates = [d for d, _ in result]
     assert dates == sorted(dates)
+
+
+def test_get_equity_history_from_snapshots_returns_empty_without_snapshots(
+    service: AnalyticsService,
+) -> None:
+    assert service.get_equity_history_from_snapshots([]) == []
+
+
+def test_get_equity_history_from_snapshots_matches_holdings_history(
+    service: AnalyticsService,
+) -> None:
+    today = date(2025, 6, 30)
+    first = today - timedelta(days=100)
+    second = today - timedelta(days=40)
+    bh1 = _create_bondholder(purchase_date=first, quantity=2)
+    bh2 = _create_bondholder(purchase_date=second, quantity=3)
+    face_values = [
+        (first + timedelta(days=offset), Decimal("200"))
+        for offset in range((second - first).days)
+    ] + [
+        (second + timedelta(days=offset), Decimal("500"))
+        for offset in range((today - second).days + 1)
+    ]
+
+    with patch("src.domain.services.analytics.analytics_service.datetime") as mock_dt:
+        mock_dt.now.return_value.date.return_value = today
+        expected = service.get_equity_history(
+            [(bh1, _bond(Decimal("100"))), (bh2, _bond(Decimal("100")))]
+        )
+        result = service.get_equity_history_from_snapshots(face_values)
+
+    assert result == expected
+
+
+def test_get_equity_history_from_snapshots_carries_last_value_forward(
+    service: AnalyticsService,
+) -> None:
+    today = date(2025, 6, 30)
+    face_values = [(today - timedelta(days=3), Decimal("100"))]
+
+    with patch("src.domain.services.analytics.analytics_service.datetime") as mock_dt:
+        mock_dt.now.return_value.date.return_value = today
+        result = service.get_equity_history_from_snapshots(face_values)
+
+    assert result[-1] == (today, Decimal("100"))
+
+
+def test_get_daily_equity_returns_value_for_every_day(
+    service: AnalyticsService,
+) -> None:
+    start = date(2025, 1, 1)
+    bh1 = _create_bondholder(purchase_date=date(2024, 12, 1), quantity=1)
+    bh2 = _create_bondholder(purchase_date=date(2025, 1, 3), quantity=2)
+    bh3 = _create_bondholder(purchase_date=date(2025, 2, 1), quantity=5)
+
+    result = service.get_daily_equity(
+        [(bh, _bond(Decimal("100"))) for bh in (bh1, bh2, bh3)],
+        start=start,
+        end=date(2025, 1, 5),
+    )
+
+    assert result == [
+        (date(2025, 1, 1), Decimal("100")),
+        (date(2025, 1, 2), Decimal("100")),
+        (date(2025, 1, 3), Decimal("300")),
+        (date(2025, 1, 4), Decimal("300")),
+        (date(2025, 1, 5), Decimal("300")),
+    ]
+
+
+def test_get_daily_equity_drops_matured_holdings(
+    service: AnalyticsService,
+) -> None:
+    matured = _create_bondholder(purchase_date=date(2024, 1, 15), quantity=2)
+    held = _create_bondholder(purchase_date=date(2024, 6, 1), quantity=1)
+    bond = _bond(Decimal("100"))
+
+    result = service.get_daily_equity(
+        [(matured, bond), (held, bond)],
+        start=date(2025, 1, 13),
+        end=date(2025, 1, 16),
+    )
+
+    assert [value for _, value in result] == [
+        Decimal("300"),
+        Decimal("300"),
+        Decimal("100"),
+        Decimal("100"),
+    ]
+
+
+def test_get_daily_equity_matches_valuation_past_maturity(
+    service: AnalyticsService,
+) -> None:
+    bond = _bond(Decimal("100"))
+    bhs = [
+        _create_bondholder(purchase_date=date(2023, 11, 30), quantity=3),
+        _create_bondholder(purchase_date=date(2024, 1, 31), quantity=2),
+        _create_bondholder(purchase_date=date(2024, 9, 1), quantity=1),
+    ]
+    start, end = date(2024, 10, 1), date(2025, 3, 31)
+
+    face_only = service.get_daily_equity([(bh, bond) for bh in bhs], start, end)
+    valued = PortfolioValuationService(BondHolderIncomeCalculator()).value_daily(
+        user_id=uuid4(),
+        holdings=[(bh, bond) for bh in bhs],
+        reference_rates=[],
+        start=start,
+        end=end,
+    )
+
+    assert face_only == [(s.snapshot_date, s.face_value) for s in valued]
+
+
+def test_get_equity_history_drops_matured_holdings(
+    service: AnalyticsService,
+) -> None:
+    today = date(2025, 6, 30)
+    matured = _create_bondholder(purchase_date=today - timedelta(days=400), quantity=2)
+    held = _create_bondholder(purchase_date=today - timedelta(days=100), quantity=1)
+    bond = _bond(Decimal("100"))
+
+    with patch("src.domain.services.analytics.analytics_service.datetime") as mock_dt:
+        mock_dt.now.return_value.date.return_value = today
+        result = service.get_equity_history([(matured, bond), (held, bond)])
+
+    assert max(equity for _, equity in result) == Decimal("300")
+    assert result[-1] == (today, Decimal("100"))
+
+
+def test_get_daily_equity_from_snapshots_fills_gaps(
+    service: AnalyticsService,
+) -> None:
+    face_values = [
+        (date(2025, 1, 2), Decimal("100")),
+        (date(2025, 1, 3), Decimal("300")),
+    ]
+
+    result = service.get_daily_equity_from_snapshots(
+        face_values, start=date(2025, 1, 1), end=date(2025, 1, 5)
+    )
+
+    assert [value for _, value in result] == [
+        Decimal("0"),
+        Decimal("100"),
+        Decimal("300"),
+        Decimal("300"),
+        Decimal("300"),
+    ]
+
+
+def test_get_daily_equity_from_snapshots_starts_from_earlier_value(
+    service: AnalyticsService,
+) -> None:
+    face_values = [
+        (date(2025, 1, 1), Decimal("100")),
+        (date(2025, 1, 2), Decimal("200")),
+        (date(2025, 1, 3), Decimal("200")),
+    ]
+
+    result = service.get_daily_equity_from_snapshots(
+        face_values, start=date(2025, 1, 2), end=date(2025, 1, 3)
+    )
+
+    assert [value for _, value in result] == [Decimal("200"), Decimal("200")]
+
+
+def test_downsample_lttb_returns_short_series_unchanged(
+    service: AnalyticsService,
+) -> None:
+    points = [(date(2025, 1, d), Decimal(d)) for d in range(1, 6)]
+
+    assert service.downsample_lttb(points, max_points=10) == points
+
+
+def test_downsample_lttb_bounds_points_and_keeps_ends(
+    service: AnalyticsService,
+) -> None:
+    start = date(1995, 1, 1)
+    points = [
+        (start + timedelta(days=i), Decimal(i % 97)) for i in range(30 * 365)
+    ]
+
+    result = service.downsample_lttb(points, max_points=200)
+
+    assert len(result) == 200
+    assert result[0] == points[0]
+    assert result[-1] == points[-1]
+    assert result == sorted(result)
+    assert set(result) <= set(points)
+
+
+def test_downsample_lttb_keeps_spike(service: AnalyticsService) -> None:
+    start = date(2025, 1, 1)
+    points = [(start + timedelta(days=i), Decimal(0)) for i in range(100)]
+    points[42] = (points[42][0], Decimal(1000))
+
+    result = service.downsample_lttb(points, max_points=10)
+
+    assert points[42] in result
@@ -0,0 +1,55 @@
+import pytest
+
+from src.domain.services.analytics.irr_solver import CashFlowMatrix, solve_irr
+
+
+def _matrix(*rows: list[tuple[float, float]]) -> CashFlowMatrix:
+    matrix = CashFlowMatrix()
+    for row in rows:
+        matrix.add_row(row)
+    return matrix
+
+
+def test_add_row_stores_flows_back_to_back() -> None:
+    matrix = CashFlowMatrix()
+
+    first = matrix.add_row([(0, -100), (1, 110)])
+    second = matrix.add_row([(0, -50), (0.5, 1), (1, 51)])
+
+    assert (first, second) == (0, 1)
+    assert matrix.rows == 2
+    assert matrix.offsets == [0, 2, 5]
+    assert matrix.amounts == [-100, 110, -50, 1, 51]
+
+
+def test_solve_irr_single_period() -> None:
+    [irr] = solve_irr(_matrix([(0, -100), (1, 110)]))
+
+    assert irr == pytest.approx(0.10)
+
+
+def test_solve_irr_solves_rows_independently() -> None:
+    result = solve_irr(
+        _matrix(
+            [(0, -100), (1, 110)],
+            [(0, -100), (0.5, 3), (1, 103)],
+            [(0, -100), (2, 121)],
+            [(0, -100), (1, 90)],
+        )
+    )
+
+    assert result == pytest.approx([0.10, 0.0609, 0.10, -0.10])
+
+
+def test_solve_irr_without_sign_change_has_no_rate() -> None:
+    assert solve_irr(_matrix([(0, 100), (1, 10)])) == [None]
+
+
+def test_solve_irr_converges_far_from_initial_guess() -> None:
+    [irr] = solve_irr(_matrix([(0, -100), (1, 500)]))
+
+    assert irr == pytest.approx(4.0)
+
+
+def test_solve_irr_empty_matrix() -> None:
+    assert solve_irr(CashFlowMatrix()) == []
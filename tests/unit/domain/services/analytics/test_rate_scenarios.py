@@ -0,0 +1,107 @@
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.services.analytics.rate_scenarios import (
+    IncomeSensitivity,
+    RateScenarioService,
+    percentile_bands,
+    project_income,
+    random_walk_paths,
+    shock_paths,
+    simulate_random_walks,
+)
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+
+
+@pytest.fixture
+def service() -> RateScenarioService:
+    return RateScenarioService(BondHolderIncomeCalculator())
+
+
+def test_sensitivity_matches_income_calculator(
+    service: RateScenarioService, bond: Bond, make_bondholder: Callable[..., BondHolder]
+) -> None:
+    bh = make_bondholder(bond, date(2024, 1, 15))
+    calculator = BondHolderIncomeCalculator()
+
+    sensitivity = service.sensitivity([(bh, bond)], date(2024, 2, 3), 3)
+
+    assert sensitivity.months == [date(2024, 2, 1), date(2024, 3, 1), date(2024, 4, 1)]
+    # February pays the fixed first period, later months the reference rate.
+    assert sensitivity.slope[0] == 0
+    assert sensitivity.fixed[0] == pytest.approx(
+        float(calculator.calculate_period_income(bond, 10, 31))
+    )
+    expected = calculator.calculate_period_income(
+        bond, 10, 29, reference_rate=Decimal("5.75")
+    )
+    projected = sensitivity.fixed[1] + sensitivity.slope[1] * 5.75
+    assert projected == pytest.approx(float(expected), abs=0.01 * 10)
+
+
+def test_sensitivity_ignores_payments_outside_horizon(
+    service: RateScenarioService, bond: Bond, make_bondholder: Callable[..., BondHolder]
+) -> None:
+    matured = make_bondholder(bond, date(2020, 1, 15))
+    future = make_bondholder(bond, date(2030, 1, 15))
+
+    sensitivity = service.sensitivity(
+        [(matured, bond), (future, bond)], date(2024, 2, 1), 12
+    )
+
+    assert sensitivity.fixed == [0.0] * 12
+    assert sensitivity.slope == [0.0] * 12
+
+
+def test_project_income_uses_rate_at_period_start() -> None:
+    sensitivity = IncomeSensitivity(
+        months=[date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)],
+        fixed=[1.0, 1.0, 1.0],
+        slope=[2.0, 2.0, 2.0],
+    )
+
+    incomes = project_income(sensitivity, [[1.0, 2.0, 3.0], [0.0, 0.0, 0.0]])
+
+    assert incomes == [[3.0, 1.0], [3.0, 1.0], [5.0, 1.0]]
+
+
+def test_shock_paths_shift_and_floor() -> None:
+    assert shock_paths(0.5, (-100, 0, 100), 2) == [[0.0, 0.0], [0.5, 0.5], [1.5, 1.5]]
+
+
+def test_random_walk_paths_are_seeded_and_non_negative() -> None:
+    first = random_walk_paths(1.0, 50, 24, 50, seed=3)
+    second = random_walk_paths(1.0, 50, 24, 50, seed=3)
+
+    assert first == second
+    assert all(path[0] == 1.0 and len(path) == 24 for path in first)
+    assert min(min(path) for path in first) >= 0.0
+
+
+def test_simulate_random_walks_shape() -> None:
+    sensitivity = IncomeSensitivity(
+        months=[date(2024, 1, 1), date(2024, 2, 1)], fixed=[0.0, 0.0], slope=[1.0, 1.0]
+    )
+
+    incomes = simulate_random_walks(sensitivity, 5.0, 7, 25, seed=1)
+
+    assert len(incomes) == 2
+    assert all(len(row) == 7 for row in incomes)
+
+
+def test_percentile_bands_interpolate() -> None:
+    bands = percentile_bands([date(2024, 1, 1)], [[float(v) for v in range(101)]])
+
+    assert bands[0].month == date(2024, 1, 1)
+    assert bands[0].percentiles == {
+        5: Decimal("5.00"),
+        25: Decimal("25.00"),
+        50: Decimal("50.00"),
+        75: Decimal("75.00"),
+        95: Decimal("95.00"),
+    }
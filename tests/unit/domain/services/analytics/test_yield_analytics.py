@@ -0,0 +1,96 @@
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.entities.reference_rate import ReferenceRate
+from src.domain.services.analytics.yield_analytics import YieldAnalyticsService
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+
+
+@pytest.fixture
+def service() -> YieldAnalyticsService:
+    return YieldAnalyticsService(BondHolderIncomeCalculator())
+
+
+def _bond(rate: str, first_interest_period: int = 12, margin: str = "0") -> Bond:
+    return Bond.create(
+        series="ROR1111",
+        nominal_value=Decimal("100"),
+        maturity_period=12,
+        initial_interest_rate=Decimal(rate),
+        first_interest_period=first_interest_period,
+        reference_rate_margin=Decimal(margin),
+    )
+
+
+def _rate(value: str, start_date: date) -> ReferenceRate:
+    return ReferenceRate(id=uuid4(), value=Decimal(value), start_date=start_date)
+
+
+def test_fixed_rate_holding_earns_net_monthly_compounded_rate(
+    service: YieldAnalyticsService, make_bondholder: Callable[..., BondHolder]
+) -> None:
+    bond = _bond("6")
+    bh = make_bondholder(bond, date(2024, 1, 15))
+
+    report = service.analyze([(bh, bond)], [_rate("5", date(2020, 1, 1))])
+
+    [holding] = report.holdings
+    assert holding.bondholder_id == bh.id
+    assert holding.series == "ROR1111"
+    # 6% gross less 19% tax, paid monthly: roughly (1 + 0.0486 / 12) ** 12 - 1
+    assert holding.irr == pytest.approx(Decimal("4.96"), abs=Decimal("0.02"))
+    assert report.portfolio_irr == holding.irr
+
+
+def test_variable_periods_use_reference_rate(
+    service: YieldAnalyticsService, make_bondholder: Callable[..., BondHolder]
+) -> None:
+    bond = _bond("6", first_interest_period=1, margin="1")
+    bh = make_bondholder(bond, date(2024, 1, 15))
+
+    low = service.analyze([(bh, bond)], [_rate("1", date(2020, 1, 1))])
+    high = service.analyze([(bh, bond)], [_rate("9", date(2020, 1, 1))])
+
+    assert low.holdings[0].irr < high.holdings[0].irr
+
+
+def test_rate_history_applies_from_period_start(
+    service: YieldAnalyticsService, make_bondholder: Callable[..., BondHolder]
+) -> None:
+    bond = _bond("5", first_interest_period=1)
+    bh = make_bondholder(bond, date(2024, 1, 15))
+    flat = [_rate("5", date(2020, 1, 1))]
+    rising = [*flat, _rate("10", date(2024, 7, 1))]
+
+    before = service.analyze([(bh, bond)], flat)
+    after = service.analyze([(bh, bond)], rising)
+
+    assert after.holdings[0].irr > before.holdings[0].irr
+
+
+def test_portfolio_irr_lies_between_holdings(
+    service: YieldAnalyticsService, make_bondholder: Callable[..., BondHolder]
+) -> None:
+    low_bond, high_bond = _bond("3"), _bond("8")
+    holdings = [
+        (make_bondholder(low_bond, date(2024, 1, 15)), low_bond),
+        (make_bondholder(high_bond, date(2024, 3, 1)), high_bond),
+    ]
+
+    report = service.analyze(holdings, [_rate("5", date(2020, 1, 1))])
+
+    low, high = (holding.irr for holding in report.holdings)
+    assert low < report.portfolio_irr < high
+
+
+def test_empty_portfolio(service: YieldAnalyticsService) -> None:
+    report = service.analyze([], [])
+
+    assert report.holdings == []
+    assert report.portfolio_irr is None
@@ -1,3 +1,4 @@
+import random
 from datetime import date, timedelta
 from decimal import ROUND_HALF_UP, Decimal
 from uuid import uuid4
@@ -375,3 +376,62 @@ def test_days_in_period() -> None:
     days = BondHolderIncomeCalculator._days_in_period(purchase_date, today)
 
     assert days == 31
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_integer_income_path_matches_decimal_formula(
+    seed: int, calculator: BondHolderIncomeCalculator
+) -> None:
+    rng = random.Random(seed)
+    for _ in range(200):
+        bond = Bond.create(
+            series="ROR1111",
+            nominal_value=Decimal(rng.choice([100, 500, 1000])),
+            maturity_period=12,
+            initial_interest_rate=Decimal(rng.randint(1, 1200)).scaleb(-2),
+            first_interest_period=1,
+            reference_rate_margin=Decimal(rng.randint(0, 300)).scaleb(-2),
+        )
+        reference_rate = Decimal(rng.randint(0, 1500)).scaleb(-2)
+        quantity = rng.randint(0, 5000)
+        days = rng.randint(28, 31)
+
+        fixed = calculator.calculate_period_income(
+            bond=bond, quantity=quantity, days_in_period=days
+        )
+        variable = calculator.calculate_period_income(
+            bond=bond,
+            quantity=quantity,
+            days_in_period=days,
+            reference_rate=reference_rate,
+        )
+
+        expected_fixed = (
+            _calculate_interest_gross_bond_income(bond, calculator, days)
+            * Decimal("0.81")
+            * quantity
+        )
+        expected_variable = (
+            _calculate_regular_gross_bond_income(bond, calculator, days, reference_rate)
+            * Decimal("0.81")
+            * quantity
+        )
+        assert str(fixed) == str(expected_fixed)
+        assert str(variable) == str(expected_variable)
+
+
+def test_income_falls_back_to_decimal_for_sub_basis_point_rates(
+    sample_bond: Bond, calculator: BondHolderIncomeCalculator
+) -> None:
+    reference_rate = Decimal("5.755")
+
+    income = calculator.calculate_period_income(
+        bond=sample_bond, quantity=10, days_in_period=31, reference_rate=reference_rate
+    )
+
+    expected = (
+        _calculate_regular_gross_bond_income(sample_bond, calculator, 31, reference_rate)
+        * Decimal("0.81")
+        * 10
+    )
+    assert income == expected
@@ -0,0 +1,127 @@
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.entities.reference_rate import ReferenceRate
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.services.payment_schedule import PaymentScheduleService
+
+
+@pytest.fixture
+def service() -> PaymentScheduleService:
+    return PaymentScheduleService(BondHolderIncomeCalculator())
+
+
+def test_upcoming_merges_holdings_in_date_order(
+    service: PaymentScheduleService,
+    bond: Bond,
+    reference_rate: ReferenceRate,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    first = make_bondholder(bond, date(2024, 1, 10))
+    second = make_bondholder(bond, date(2024, 1, 20))
+
+    result = service.upcoming(
+        holdings=[(second, bond), (first, bond)],
+        after=date(2024, 3, 1),
+        limit=4,
+        reference_rate=reference_rate,
+    )
+
+    assert [(p.payment_date, p.bondholder_id) for p in result] == [
+        (date(2024, 3, 10), first.id),
+        (date(2024, 3, 20), second.id),
+        (date(2024, 4, 10), first.id),
+        (date(2024, 4, 20), second.id),
+    ]
+    assert all(p.series == "ROR1111" for p in result)
+
+
+def test_upcoming_prices_fixed_and_variable_periods(
+    service: PaymentScheduleService,
+    bond: Bond,
+    reference_rate: ReferenceRate,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    bh = make_bondholder(bond, date(2024, 1, 15))
+    calculator = BondHolderIncomeCalculator()
+
+    result = service.upcoming(
+        holdings=[(bh, bond)],
+        after=date(2024, 1, 15),
+        limit=2,
+        reference_rate=reference_rate,
+    )
+
+    assert result[0].amount == calculator.calculate_period_income(
+        bond=bond, quantity=10, days_in_period=31
+    )
+    assert result[1].amount == calculator.calculate_period_income(
+        bond=bond, quantity=10, days_in_period=29, reference_rate=Decimal("5.75")
+    )
+
+
+def test_upcoming_leaves_variable_amount_unknown_without_rate(
+    service: PaymentScheduleService,
+    bond: Bond,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    bh = make_bondholder(bond, date(2024, 1, 15))
+
+    result = service.upcoming(holdings=[(bh, bond)], after=date(2024, 1, 15), limit=2)
+
+    assert result[0].amount is not None
+    assert result[1].amount is None
+
+
+def test_upcoming_stops_at_maturity(
+    service: PaymentScheduleService,
+    bond: Bond,
+    reference_rate: ReferenceRate,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    bh = make_bondholder(bond, date(2024, 1, 15))
+
+    result = service.upcoming(
+        holdings=[(bh, bond)],
+        after=date(2024, 11, 1),
+        limit=5,
+        reference_rate=reference_rate,
+    )
+
+    assert [p.payment_date for p in result] == [
+        date(2024, 11, 15),
+        date(2024, 12, 15),
+        date(2025, 1, 15),
+    ]
+
+
+def test_upcoming_prices_only_returned_payments(
+    service: PaymentScheduleService,
+    bond: Bond,
+    reference_rate: ReferenceRate,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    holdings = [
+        (make_bondholder(bond, date(2024, 1, day)), bond) for day in range(1, 29)
+    ]
+
+    with patch.object(
+        service.income_calculator,
+        "calculate_period_income",
+        wraps=service.income_calculator.calculate_period_income,
+    ) as calculate:
+        result = service.upcoming(
+            holdings=holdings,
+            after=date(2024, 6, 1),
+            limit=3,
+            reference_rate=reference_rate,
+        )
+
+    assert len(result) == 3
+    assert calculate.call_count == 3
@@ -0,0 +1,266 @@
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from dateutil.relativedelta import relativedelta  # type: ignore [import-untyped]
+
+from src.domain.entities.bond import Bond
+from src.domain.entities.bondholder import BondHolder
+from src.domain.entities.reference_rate import ReferenceRate
+from src.domain.services.bondholder_income_calculator import BondHolderIncomeCalculator
+from src.domain.services.portfolio_valuation import PortfolioValuationService
+
+
+@pytest.fixture
+def service() -> PortfolioValuationService:
+    return PortfolioValuationService(BondHolderIncomeCalculator())
+
+
+def test_value_daily_returns_one_snapshot_per_day(
+    service: PortfolioValuationService,
+    bond: Bond,
+    reference_rate: ReferenceRate,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    user_id = uuid4()
+    bh = make_bondholder(bond, date(2024, 1, 15), 10)
+
+    result = service.value_daily(
+        user_id=user_id,
+        holdings=[(bh, bond)],
+        reference_rates=[reference_rate],
+        start=date(2024, 1, 15),
+        end=date(2024, 2, 14),
+    )
+
+    assert len(result) == 31
+    assert result[0].snapshot_date == date(2024, 1, 15)
+    assert result[-1].snapshot_date == date(2024, 2, 14)
+    assert all(s.user_id == user_id for s in result)
+
+
+def test_value_daily_face_value_grows_with_purchases(
+    service: PortfolioValuationService,
+    bond: Bond,
+    reference_rate: ReferenceRate,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    holdings = [
+        (make_bondholder(bond, date(2024, 1, 15), 10), bond),
+        (make_bondholder(bond, date(2024, 1, 20), 5), bond),
+    ]
+
+    result = service.value_daily(
+        user_id=uuid4(),
+        holdings=holdings,
+        reference_rates=[reference_rate],
+        start=date(2024, 1, 15),
+        end=date(2024, 1, 25),
+    )
+
+    face_values = {s.snapshot_date: s.face_value for s in result}
+    assert face_values[date(2024, 1, 19)] == Decimal("1000")
+    assert face_values[date(2024, 1, 20)] == Decimal("1500")
+    assert face_values[date(2024, 1, 25)] == Decimal("1500")
+
+
+def test_value_daily_monthly_income_uses_period_length(
+    service: PortfolioValuationService,
+    bond: Bond,
+    reference_rate: ReferenceRate,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    bh = make_bondholder(bond, date(2024, 1, 15), 10)
+    expected = BondHolderIncomeCalculator().calculate_period_income(
+        bond=bond, quantity=10, days_in_period=31
+    )
+
+    result = service.value_daily(
+        user_id=uuid4(),
+        holdings=[(bh, bond)],
+        reference_rates=[reference_rate],
+        start=date(2024, 1, 20),
+        end=date(2024, 1, 20),
+    )
+
+    assert result[0].monthly_income == expected.quantize(Decimal("0.01"))
+
+
+def test_value_daily_uses_reference_rate_after_first_period(
+    service: PortfolioValuationService,
+    bond: Bond,
+    reference_rate: ReferenceRate,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    bh = make_bondholder(bond, date(2024, 1, 15), 10)
+    expected = BondHolderIncomeCalculator().calculate_period_income(
+        bond=bond,
+        quantity=10,
+        days_in_period=29,
+        reference_rate=reference_rate.value,
+    )
+
+    result = service.value_daily(
+        user_id=uuid4(),
+        holdings=[(bh, bond)],
+        reference_rates=[reference_rate],
+        start=date(2024, 2, 20),
+        end=date(2024, 2, 20),
+    )
+
+    assert result[0].monthly_income == expected.quantize(Decimal("0.01"))
+
+
+def test_value_daily_accrued_interest_resets_each_period(
+    service: PortfolioValuationService,
+    bond: Bond,
+    reference_rate: ReferenceRate,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    bh = make_bondholder(bond, date(2024, 1, 15), 10)
+
+    result = service.value_daily(
+        user_id=uuid4(),
+        holdings=[(bh, bond)],
+        reference_rates=[reference_rate],
+        start=date(2024, 1, 15),
+        end=date(2024, 2, 15),
+    )
+
+    accrued = {s.snapshot_date: s.accrued_interest for s in result}
+    assert accrued[date(2024, 1, 15)] == Decimal("0.00")
+    assert accrued[date(2024, 1, 16)] < accrued[date(2024, 2, 14)]
+    assert accrued[date(2024, 2, 14)] < result[0].monthly_income
+    assert accrued[date(2024, 2, 15)] == Decimal("0.00")
+
+
+def test_value_daily_period_without_reference_rate_has_no_income(
+    service: PortfolioValuationService,
+    bond: Bond,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    bh = make_bondholder(bond, date(2024, 1, 15), 10)
+    late_rate = ReferenceRate(
+        id=uuid4(),
+        value=Decimal("5.75"),
+        start_date=date(2024, 2, 20),
+        end_date=None,
+    )
+
+    result = service.value_daily(
+        user_id=uuid4(),
+        holdings=[(bh, bond)],
+        reference_rates=[late_rate],
+        start=date(2024, 2, 14),
+        end=date(2024, 3, 15),
+    )
+
+    income = {s.snapshot_date: s.monthly_income for s in result}
+    assert income[date(2024, 2, 14)] > 0
+    assert income[date(2024, 2, 15)] == 0
+    assert income[date(2024, 3, 14)] == 0
+    assert income[date(2024, 3, 15)] > 0
+    assert all(s.face_value == Decimal("1000") for s in result)
+
+
+def test_value_daily_accrual_matches_per_day_computation(
+    service: PortfolioValuationService,
+    bond: Bond,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    reference_rate = ReferenceRate(
+        id=uuid4(), value=Decimal("5.75"), start_date=date(2023, 1, 1), end_date=None
+    )
+    holdings = [
+        (make_bondholder(bond, date(2023, 11, 30), 3), bond),
+        (make_bondholder(bond, date(2024, 1, 31), 7), bond),
+    ]
+    calculator = BondHolderIncomeCalculator()
+
+    result = service.value_daily(
+        user_id=uuid4(),
+        holdings=holdings,
+        reference_rates=[reference_rate],
+        start=date(2024, 1, 1),
+        end=date(2024, 4, 30),
+    )
+
+    for snapshot in result:
+        expected = Decimal(0)
+        for bh, _ in holdings:
+            if bh.purchase_date > snapshot.snapshot_date:
+                continue
+            period_start, period_end = _period(bh.purchase_date, snapshot.snapshot_date)
+            length = (period_end - period_start).days
+            fixed = period_start < bh.purchase_date + relativedelta(
+                months=bond.first_interest_period
+            )
+            coupon = calculator.calculate_period_income(
+                bond=bond,
+                quantity=bh.quantity,
+                days_in_period=length,
+                reference_rate=None if fixed else reference_rate.value,
+            )
+            expected += coupon * (snapshot.snapshot_date - period_start).days / length
+        assert snapshot.accrued_interest == expected.quantize(Decimal("0.01"))
+
+
+def test_value_daily_stops_at_maturity(
+    service: PortfolioValuationService,
+    bond: Bond,
+    reference_rate: ReferenceRate,
+    make_bondholder: Callable[..., BondHolder],
+) -> None:
+    matured = make_bondholder(bond, date(2024, 1, 15), 10)
+    held = make_bondholder(bond, date(2024, 6, 1), 5)
+
+    result = service.value_daily(
+        user_id=uuid4(),
+        holdings=[(matured, bond), (held, bond)],
+        reference_rates=[reference_rate],
+        start=date(2024, 12, 1),
+        end=date(2025, 2, 10),
+    )
+
+    by_date = {s.snapshot_date: s for s in result}
+    before, at = by_date[date(2025, 1, 14)], by_date[date(2025, 1, 15)]
+    assert before.face_value == Decimal("1500")
+    assert at.face_value == Decimal("500")
+    assert at.monthly_income < before.monthly_income
+    only_held = service.value_daily(
+        user_id=uuid4(),
+        holdings=[(held, bond)],
+        reference_rates=[reference_rate],
+        start=date(2025, 1, 15),
+        end=date(2025, 2, 10),
+    )
+    assert [
+        (s.face_value, s.monthly_income, s.accrued_interest)
+        for s in result[-len(only_held) :]
+    ] == [(s.face_value, s.monthly_income, s.accrued_interest) for s in only_held]
+
+
+def test_value_daily_returns_empty_for_inverted_period(
+    service: PortfolioValuationService,
+) -> None:
+    result = service.value_daily(
+        user_id=uuid4(),
+        holdings=[],
+        reference_rates=[],
+        start=date(2024, 2, 1),
+        end=date(2024, 1, 1),
+    )
+
+    assert result == []
+
+
+def _period(purchase_date: date, day: date) -> tuple[date, date]:
+    months = 0
+    while purchase_date + relativedelta(months=months + 1) <= day:
+        months += 1
+    return (
+        purchase_date + relativedelta(months=months),
+        purchase_date + relativedelta(months=months + 1),
+    )
@@ -0,0 +1,94 @@
+import random
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+
+from src.domain.value_objects.money import Money, Rate, round_half_up
+
+SEEDS = range(20)
+CASES_PER_SEED = 200
+
+
+def _cases(seed: int) -> random.Random:
+    return random.Random(seed)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_round_half_up_matches_decimal(seed: int) -> None:
+    rng = _cases(seed)
+    for _ in range(CASES_PER_SEED):
+        numerator = rng.randint(-(10**9), 10**9)
+        denominator = rng.choice([2, 4, 10, 365, 3_650_000, rng.randint(1, 10**6)])
+
+        expected = (Decimal(numerator) / Decimal(denominator)).quantize(
+            Decimal(1), rounding=ROUND_HALF_UP
+        )
+
+        assert round_half_up(numerator, denominator) == int(expected)
+
+
+@pytest.mark.parametrize(
+    ("numerator", "denominator", "expected"),
+    [(5, 10, 1), (-5, 10, -1), (15, 10, 2), (14, 10, 1), (-15, 10, -2), (0, 7, 0)],
+)
+def test_round_half_up_ties_go_away_from_zero(
+    numerator: int, denominator: int, expected: int
+) -> None:
+    assert round_half_up(numerator, denominator) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_rate_interest_matches_decimal_formula(seed: int) -> None:
+    rng = _cases(seed)
+    for _ in range(CASES_PER_SEED):
+        principal = Decimal(rng.randint(1, 10**7)).scaleb(-2)
+        percent = Decimal(rng.randint(0, 2000)).scaleb(-2)
+        days = rng.randint(1, 366)
+
+        expected = (principal * (percent / 100) * days / Decimal("365")).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
+        )
+        interest = Rate.from_percent(percent).interest(
+            Money.from_decimal(principal), days
+        )
+
+        assert interest.to_decimal() == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_money_round_trips_through_decimal(seed: int) -> None:
+    rng = _cases(seed)
+    for _ in range(CASES_PER_SEED):
+        value = Decimal(rng.randint(-(10**9), 10**9)).scaleb(-2)
+
+        money = Money.from_decimal(value)
+
+        assert money.to_decimal() == value
+        assert Money.from_decimal_exact(value) == money
+
+
+def test_money_from_decimal_rounds_half_up() -> None:
+    assert Money.from_decimal(Decimal("1.005")) == Money(101)
+    assert Money.from_decimal(Decimal("-1.005")) == Money(-101)
+    assert Money.from_decimal(Decimal("1.004")) == Money(100)
+
+
+def test_exact_conversions_reject_fractions() -> None:
+    assert Money.from_decimal_exact(Decimal("1.005")) is None
+    assert Money.from_decimal_exact(Decimal("100")) == Money(10000)
+    assert Rate.from_percent_exact(Decimal("4.755")) is None
+    assert Rate.from_percent_exact(Decimal("4.75")) == Rate(475)
+
+
+def test_money_arithmetic() -> None:
+    assert Money(150) + Money(50) == Money(200)
+    assert Money(150) - Money(200) == Money(-50)
+    assert Money(150) * 3 == 3 * Money(150) == Money(450)
+    assert -Money(5) == Money(-5)
+    assert Money(1) < Money(2)
+
+
+def test_rate_arithmetic_and_conversion() -> None:
+    assert Rate(575) + Rate(10) == Rate(585)
+    assert Rate(585).to_percent() == Decimal("5.85")
+    assert Rate.from_percent(Decimal("5.755")) == Rate(576)